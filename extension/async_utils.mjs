@@ -12,8 +12,27 @@ export { fetchExtFile, wxGetUrl } from "./wxfetch.mjs"
 export const HLJS_STYLES_PATH = "/highlightjs/styles"
 const FALLBACK_HLJS_CSS = "nnfx-light.css"
 
+// styles.json maps style names to {file, hash, size}, it does not change while the
+// extension runs.
+let hljsStyleInfo = null
+// Stylesheet text by content hash, so each style is fetched once.
+const hljsStylesheets = new Map()
+
+export async function getHljsStyleInfo() {
+  hljsStyleInfo ??= fetchExtFile(`${HLJS_STYLES_PATH}/styles.json`, true).catch(
+    (e) => {
+      hljsStyleInfo = null
+      throw e
+    }
+  )
+  return hljsStyleInfo
+}
+
 export async function getHljsStyles() {
-  return fetchExtFile(`${HLJS_STYLES_PATH}/styles.json`, true)
+  const style_info = await getHljsStyleInfo()
+  return Object.fromEntries(
+    Object.entries(style_info).map(([name, { file }]) => [name, file])
+  )
 }
 
 export async function getHljsStylesheetURL(syntax_css) {
@@ -27,7 +46,19 @@ export async function getHljsStylesheetURL(syntax_css) {
 }
 
 export async function getHljsStylesheet(syntax_css) {
-  return fetchExtFile(await getHljsStylesheetURL(syntax_css))
+  const url = await getHljsStylesheetURL(syntax_css)
+  const style_info = Object.values(await getHljsStyleInfo())
+  const hash = style_info.find(({ file }) => url.endsWith(`/${file}`))?.hash ?? url
+  if (!hljsStylesheets.has(hash)) {
+    hljsStylesheets.set(
+      hash,
+      fetchExtFile(url).catch((e) => {
+        hljsStylesheets.delete(hash)
+        throw e
+      })
+    )
+  }
+  return hljsStylesheets.get(hash)
 }
 
 export async function getSyntaxCSS() {
@@ -6,28 +6,42 @@
 import { Textcomplete, ContenteditableEditor } from "./vendor/textcomplete.esm.js"
 import Fuse from "./vendor/fuse.basic.mjs"
 
+import { getEmojiPrefixIndex } from "./data/emoji_prefix.mjs"
+
 let _fuse = null
 
 const loadEmoji = async () => {
   if (_fuse == null) {
-    const url = messenger.runtime.getURL("./data/emoji_codes.json")
-    const response = await fetch(url)
-    if (!response.ok) {
-      throw new Error(`Error fetching Emojis: ${response.status}`)
-    }
-    // emojis = Object.entries(await response.json())
-    const _emojis = Object.entries(await response.json()).map(
-      ([k, v]) => new Object({ key: k.replaceAll("_", " "), value: v }),
+    const index = await getEmojiPrefixIndex()
+    const _emojis = index.keys.map(
+      (k, i) => new Object({ key: k.replaceAll("_", " "), value: index.values[i] }),
     )
     _fuse = new Fuse(_emojis, { keys: ["key"], includeMatches: true, includeScore: true })
   }
   return _fuse
 }
 
-async function gatherCandidates(term, limit = 10) {
-  const fuse = await loadEmoji()
-  const results = fuse.search(term)
-  return results.slice(0, limit).map((obj) => [obj.item.key, obj.item.value])
+// Shortcodes starting with the term come first, in alphabetical order, from the
+// prefix index. Fuzzy matches fill the rest of the list, so the Fuse index is only
+// built when there are fewer than limit prefix matches.
+export async function gatherCandidates(term, limit = 10) {
+  const index = await getEmojiPrefixIndex()
+  const candidates = index
+    .lookup(term, limit)
+    .map(([key, value]) => [key.replaceAll("_", " "), value])
+  if (candidates.length < limit) {
+    const seen = new Set(candidates.map(([key]) => key))
+    const fuse = await loadEmoji()
+    for (const { item } of fuse.search(term)) {
+      if (candidates.length >= limit) {
+        break
+      }
+      if (!seen.has(item.key)) {
+        candidates.push([item.key, item.value])
+      }
+    }
+  }
+  return candidates
 }
 
 const CODEBLOCK = /`{3}/g
@@ -0,0 +1,72 @@
+/*
+ * Copyright JFX 2024
+ * MIT License
+ */
+
+import { fetchExtFile } from "../wxfetch.mjs"
+
+const EMOJI_PREFIX_INDEX = "/data/emoji_prefix.json"
+
+// First index in [lo, hi) for which pred is true, pred must be monotonic.
+function bisect(lo, hi, pred) {
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1
+    if (pred(mid)) {
+      hi = mid
+    } else {
+      lo = mid + 1
+    }
+  }
+  return lo
+}
+
+/**
+ * Shortcode prefix lookup over the index tools/emoji-grab.py writes: the sorted
+ * shortcodes, their characters, and [start, end) offsets for every prefix of up
+ * to prefix_len characters.
+ */
+export class EmojiPrefixIndex {
+  constructor({ prefix_len, keys, values, buckets }) {
+    this.prefix_len = prefix_len
+    this.keys = keys
+    this.values = values
+    this.buckets = buckets
+  }
+
+  // [start, end) of the shortcodes starting with prefix.
+  range(prefix) {
+    if (prefix === "") {
+      return [0, this.keys.length]
+    }
+    const bucket = this.buckets[prefix.slice(0, this.prefix_len)]
+    if (bucket === undefined) {
+      return [0, 0]
+    }
+    let [start, end] = bucket
+    if (prefix.length > this.prefix_len) {
+      const keys = this.keys
+      start = bisect(start, end, (i) => keys[i] >= prefix)
+      end = bisect(start, end, (i) => !keys[i].startsWith(prefix))
+    }
+    return [start, end]
+  }
+
+  // [shortcode, character] pairs for up to limit shortcodes starting with prefix.
+  lookup(prefix, limit = Infinity) {
+    const [start, end] = this.range(prefix)
+    const results = []
+    for (let i = start; i < Math.min(end, start + limit); i++) {
+      results.push([this.keys[i], this.values[i]])
+    }
+    return results
+  }
+}
+
+let emoji_prefix_index = null
+
+export async function getEmojiPrefixIndex() {
+  emoji_prefix_index ??= fetchExtFile(EMOJI_PREFIX_INDEX, true).then(
+    (data) => new EmojiPrefixIndex(data)
+  )
+  return emoji_prefix_index
+}
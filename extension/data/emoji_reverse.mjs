@@ -0,0 +1,42 @@
+/*
+ * Copyright JFX 2024
+ * MIT License
+ */
+
+import { fetchExtFile } from "../wxfetch.mjs"
+
+const EMOJI_REVERSE_INDEX = "/data/emoji_reverse.json"
+const VARIATION_SELECTOR = "\uFE0F"
+
+/**
+ * Emoji character sequences to shortcodes, from the index tools/emoji-grab.py
+ * writes: the preferred shortcode of each sequence and one pattern that
+ * matches any of them, longest first.
+ */
+export class EmojiReverseIndex {
+  constructor({ pattern, shortcodes }) {
+    this.pattern = new RegExp(pattern, "gu")
+    this.shortcodes = shortcodes
+  }
+
+  shortcode(emoji) {
+    return (
+      this.shortcodes[emoji] ??
+      (emoji.endsWith(VARIATION_SELECTOR) ? this.shortcodes[emoji.slice(0, -1)] : undefined)
+    )
+  }
+
+  // Replace the emoji in text with :shortcodes: in one pass.
+  unrender(text) {
+    return text.replace(this.pattern, (emoji) => `:${this.shortcode(emoji)}:`)
+  }
+}
+
+let emoji_reverse_index = null
+
+export async function getEmojiReverseIndex() {
+  emoji_reverse_index ??= fetchExtFile(EMOJI_REVERSE_INDEX, true).then(
+    (data) => new EmojiReverseIndex(data)
+  )
+  return emoji_reverse_index
+}
@@ -0,0 +1,50 @@
+/*
+Language: Backus–Naur Form
+Website: https://en.wikipedia.org/wiki/Backus–Naur_form
+Author: Oleg Efimov <efimovov@gmail.com>
+*/
+
+var bnf_1;
+var hasRequiredBnf;
+
+function requireBnf () {
+	if (hasRequiredBnf) return bnf_1;
+	hasRequiredBnf = 1;
+	/** @type LanguageFn */
+	function bnf(hljs) {
+	  return {
+	    name: 'Backus–Naur Form',
+	    contains: [
+	      // Attribute
+	      {
+	        className: 'attribute',
+	        begin: /</,
+	        end: />/
+	      },
+	      // Specific
+	      {
+	        begin: /::=/,
+	        end: /$/,
+	        contains: [
+	          {
+	            begin: /</,
+	            end: />/
+	          },
+	          // Common
+	          hljs.C_LINE_COMMENT_MODE,
+	          hljs.C_BLOCK_COMMENT_MODE,
+	          hljs.APOS_STRING_MODE,
+	          hljs.QUOTE_STRING_MODE
+	        ]
+	      }
+	    ]
+	  };
+	}
+
+	bnf_1 = bnf;
+	return bnf_1;
+}
+
+var requireBnfExports = requireBnf();
+
+export { requireBnfExports as default };
@@ -0,0 +1,39 @@
+/*
+Language: Clojure REPL
+Description: Clojure REPL sessions
+Author: Ivan Sagalaev <maniac@softwaremaniacs.org>
+Requires: clojure.js
+Website: https://clojure.org
+Category: lisp
+*/
+
+var clojureRepl_1;
+var hasRequiredClojureRepl;
+
+function requireClojureRepl () {
+	if (hasRequiredClojureRepl) return clojureRepl_1;
+	hasRequiredClojureRepl = 1;
+	/** @type LanguageFn */
+	function clojureRepl(hljs) {
+	  return {
+	    name: 'Clojure REPL',
+	    contains: [
+	      {
+	        className: 'meta.prompt',
+	        begin: /^([\w.-]+|\s*#_)?=>/,
+	        starts: {
+	          end: /$/,
+	          subLanguage: 'clojure'
+	        }
+	      }
+	    ]
+	  };
+	}
+
+	clojureRepl_1 = clojureRepl;
+	return clojureRepl_1;
+}
+
+var requireClojureReplExports = requireClojureRepl();
+
+export { requireClojureReplExports as default };
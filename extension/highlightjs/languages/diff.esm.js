@@ -0,0 +1,74 @@
+/*
+Language: Diff
+Description: Unified and context diff
+Author: Vasily Polovnyov <vast@whiteants.net>
+Website: https://www.gnu.org/software/diffutils/
+Category: common
+*/
+
+var diff_1;
+var hasRequiredDiff;
+
+function requireDiff () {
+	if (hasRequiredDiff) return diff_1;
+	hasRequiredDiff = 1;
+	/** @type LanguageFn */
+	function diff(hljs) {
+	  const regex = hljs.regex;
+	  return {
+	    name: 'Diff',
+	    aliases: [ 'patch' ],
+	    contains: [
+	      {
+	        className: 'meta',
+	        relevance: 10,
+	        match: regex.either(
+	          /^@@ +-\d+,\d+ +\+\d+,\d+ +@@/,
+	          /^\*\*\* +\d+,\d+ +\*\*\*\*$/,
+	          /^--- +\d+,\d+ +----$/
+	        )
+	      },
+	      {
+	        className: 'comment',
+	        variants: [
+	          {
+	            begin: regex.either(
+	              /Index: /,
+	              /^index/,
+	              /={3,}/,
+	              /^-{3}/,
+	              /^\*{3} /,
+	              /^\+{3}/,
+	              /^diff --git/
+	            ),
+	            end: /$/
+	          },
+	          { match: /^\*{15}$/ }
+	        ]
+	      },
+	      {
+	        className: 'addition',
+	        begin: /^\+/,
+	        end: /$/
+	      },
+	      {
+	        className: 'deletion',
+	        begin: /^-/,
+	        end: /$/
+	      },
+	      {
+	        className: 'addition',
+	        begin: /^!/,
+	        end: /$/
+	      }
+	    ]
+	  };
+	}
+
+	diff_1 = diff;
+	return diff_1;
+}
+
+var requireDiffExports = requireDiff();
+
+export { requireDiffExports as default };
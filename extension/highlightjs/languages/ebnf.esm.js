@@ -0,0 +1,65 @@
+/*
+Language: Extended Backus-Naur Form
+Author: Alex McKibben <alex@nullscope.net>
+Website: https://en.wikipedia.org/wiki/Extended_Backus–Naur_form
+*/
+
+var ebnf_1;
+var hasRequiredEbnf;
+
+function requireEbnf () {
+	if (hasRequiredEbnf) return ebnf_1;
+	hasRequiredEbnf = 1;
+	/** @type LanguageFn */
+	function ebnf(hljs) {
+	  const commentMode = hljs.COMMENT(/\(\*/, /\*\)/);
+
+	  const nonTerminalMode = {
+	    className: "attribute",
+	    begin: /^[ ]*[a-zA-Z]+([\s_-]+[a-zA-Z]+)*/
+	  };
+
+	  const specialSequenceMode = {
+	    className: "meta",
+	    begin: /\?.*\?/
+	  };
+
+	  const ruleBodyMode = {
+	    begin: /=/,
+	    end: /[.;]/,
+	    contains: [
+	      commentMode,
+	      specialSequenceMode,
+	      {
+	        // terminals
+	        className: 'string',
+	        variants: [
+	          hljs.APOS_STRING_MODE,
+	          hljs.QUOTE_STRING_MODE,
+	          {
+	            begin: '`',
+	            end: '`'
+	          }
+	        ]
+	      }
+	    ]
+	  };
+
+	  return {
+	    name: 'Extended Backus-Naur Form',
+	    illegal: /\S/,
+	    contains: [
+	      commentMode,
+	      nonTerminalMode,
+	      ruleBodyMode
+	    ]
+	  };
+	}
+
+	ebnf_1 = ebnf;
+	return ebnf_1;
+}
+
+var requireEbnfExports = requireEbnf();
+
+export { requireEbnfExports as default };
@@ -0,0 +1,41 @@
+/*
+Language: ERB (Embedded Ruby)
+Requires: xml.js, ruby.js
+Author: Lucas Mazza <lucastmazza@gmail.com>
+Contributors: Kassio Borges <kassioborgesm@gmail.com>
+Description: "Bridge" language defining fragments of Ruby in HTML within <% .. %>
+Website: https://ruby-doc.org/stdlib-2.6.5/libdoc/erb/rdoc/ERB.html
+Category: template
+*/
+
+var erb_1;
+var hasRequiredErb;
+
+function requireErb () {
+	if (hasRequiredErb) return erb_1;
+	hasRequiredErb = 1;
+	/** @type LanguageFn */
+	function erb(hljs) {
+	  return {
+	    name: 'ERB',
+	    subLanguage: 'xml',
+	    contains: [
+	      hljs.COMMENT('<%#', '%>'),
+	      {
+	        begin: '<%[%=-]?',
+	        end: '[%-]?%>',
+	        subLanguage: 'ruby',
+	        excludeBegin: true,
+	        excludeEnd: true
+	      }
+	    ]
+	  };
+	}
+
+	erb_1 = erb;
+	return erb_1;
+}
+
+var requireErbExports = requireErb();
+
+export { requireErbExports as default };
@@ -0,0 +1,61 @@
+/*
+ Language: Gherkin
+ Author: Sam Pikesley (@pikesley) <sam.pikesley@theodi.org>
+ Description: Gherkin is the format for cucumber specifications. It is a domain specific language which helps you to describe business behavior without the need to go into detail of implementation.
+ Website: https://cucumber.io/docs/gherkin/
+ */
+
+var gherkin_1;
+var hasRequiredGherkin;
+
+function requireGherkin () {
+	if (hasRequiredGherkin) return gherkin_1;
+	hasRequiredGherkin = 1;
+	function gherkin(hljs) {
+	  return {
+	    name: 'Gherkin',
+	    aliases: [ 'feature' ],
+	    keywords: 'Feature Background Ability Business\ Need Scenario Scenarios Scenario\ Outline Scenario\ Template Examples Given And Then But When',
+	    contains: [
+	      {
+	        className: 'symbol',
+	        begin: '\\*',
+	        relevance: 0
+	      },
+	      {
+	        className: 'meta',
+	        begin: '@[^@\\s]+'
+	      },
+	      {
+	        begin: '\\|',
+	        end: '\\|\\w*$',
+	        contains: [
+	          {
+	            className: 'string',
+	            begin: '[^|]+'
+	          }
+	        ]
+	      },
+	      {
+	        className: 'variable',
+	        begin: '<',
+	        end: '>'
+	      },
+	      hljs.HASH_COMMENT_MODE,
+	      {
+	        className: 'string',
+	        begin: '"""',
+	        end: '"""'
+	      },
+	      hljs.QUOTE_STRING_MODE
+	    ]
+	  };
+	}
+
+	gherkin_1 = gherkin;
+	return gherkin_1;
+}
+
+var requireGherkinExports = requireGherkin();
+
+export { requireGherkinExports as default };
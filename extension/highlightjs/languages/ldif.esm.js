@@ -0,0 +1,43 @@
+/*
+Language: LDIF
+Contributors: Jacob Childress <jacobc@gmail.com>
+Category: enterprise, config
+Website: https://en.wikipedia.org/wiki/LDAP_Data_Interchange_Format
+*/
+
+var ldif_1;
+var hasRequiredLdif;
+
+function requireLdif () {
+	if (hasRequiredLdif) return ldif_1;
+	hasRequiredLdif = 1;
+	/** @type LanguageFn */
+	function ldif(hljs) {
+	  return {
+	    name: 'LDIF',
+	    contains: [
+	      {
+	        className: 'attribute',
+	        match: '^dn(?=:)',
+	        relevance: 10
+	      },
+	      {
+	        className: 'attribute',
+	        match: '^\\w+(?=:)'
+	      },
+	      {
+	        className: 'literal',
+	        match: '^-'
+	      },
+	      hljs.HASH_COMMENT_MODE
+	    ]
+	  };
+	}
+
+	ldif_1 = ldif;
+	return ldif_1;
+}
+
+var requireLdifExports = requireLdif();
+
+export { requireLdifExports as default };
@@ -0,0 +1,7371 @@
+var mathematica_1;
+var hasRequiredMathematica;
+
+function requireMathematica () {
+	if (hasRequiredMathematica) return mathematica_1;
+	hasRequiredMathematica = 1;
+	const SYSTEM_SYMBOLS = [
+	  "AASTriangle",
+	  "AbelianGroup",
+	  "Abort",
+	  "AbortKernels",
+	  "AbortProtect",
+	  "AbortScheduledTask",
+	  "Above",
+	  "Abs",
+	  "AbsArg",
+	  "AbsArgPlot",
+	  "Absolute",
+	  "AbsoluteCorrelation",
+	  "AbsoluteCorrelationFunction",
+	  "AbsoluteCurrentValue",
+	  "AbsoluteDashing",
+	  "AbsoluteFileName",
+	  "AbsoluteOptions",
+	  "AbsolutePointSize",
+	  "AbsoluteThickness",
+	  "AbsoluteTime",
+	  "AbsoluteTiming",
+	  "AcceptanceThreshold",
+	  "AccountingForm",
+	  "Accumulate",
+	  "Accuracy",
+	  "AccuracyGoal",
+	  "AcousticAbsorbingValue",
+	  "AcousticImpedanceValue",
+	  "AcousticNormalVelocityValue",
+	  "AcousticPDEComponent",
+	  "AcousticPressureCondition",
+	  "AcousticRadiationValue",
+	  "AcousticSoundHardValue",
+	  "AcousticSoundSoftCondition",
+	  "ActionDelay",
+	  "ActionMenu",
+	  "ActionMenuBox",
+	  "ActionMenuBoxOptions",
+	  "Activate",
+	  "Active",
+	  "ActiveClassification",
+	  "ActiveClassificationObject",
+	  "ActiveItem",
+	  "ActivePrediction",
+	  "ActivePredictionObject",
+	  "ActiveStyle",
+	  "AcyclicGraphQ",
+	  "AddOnHelpPath",
+	  "AddSides",
+	  "AddTo",
+	  "AddToSearchIndex",
+	  "AddUsers",
+	  "AdjacencyGraph",
+	  "AdjacencyList",
+	  "AdjacencyMatrix",
+	  "AdjacentMeshCells",
+	  "Adjugate",
+	  "AdjustmentBox",
+	  "AdjustmentBoxOptions",
+	  "AdjustTimeSeriesForecast",
+	  "AdministrativeDivisionData",
+	  "AffineHalfSpace",
+	  "AffineSpace",
+	  "AffineStateSpaceModel",
+	  "AffineTransform",
+	  "After",
+	  "AggregatedEntityClass",
+	  "AggregationLayer",
+	  "AircraftData",
+	  "AirportData",
+	  "AirPressureData",
+	  "AirSoundAttenuation",
+	  "AirTemperatureData",
+	  "AiryAi",
+	  "AiryAiPrime",
+	  "AiryAiZero",
+	  "AiryBi",
+	  "AiryBiPrime",
+	  "AiryBiZero",
+	  "AlgebraicIntegerQ",
+	  "AlgebraicNumber",
+	  "AlgebraicNumberDenominator",
+	  "AlgebraicNumberNorm",
+	  "AlgebraicNumberPolynomial",
+	  "AlgebraicNumberTrace",
+	  "AlgebraicRules",
+	  "AlgebraicRulesData",
+	  "Algebraics",
+	  "AlgebraicUnitQ",
+	  "Alignment",
+	  "AlignmentMarker",
+	  "AlignmentPoint",
+	  "All",
+	  "AllowAdultContent",
+	  "AllowChatServices",
+	  "AllowedCloudExtraParameters",
+	  "AllowedCloudParameterExtensions",
+	  "AllowedDimensions",
+	  "AllowedFrequencyRange",
+	  "AllowedHeads",
+	  "AllowGroupClose",
+	  "AllowIncomplete",
+	  "AllowInlineCells",
+	  "AllowKernelInitialization",
+	  "AllowLooseGrammar",
+	  "AllowReverseGroupClose",
+	  "AllowScriptLevelChange",
+	  "AllowVersionUpdate",
+	  "AllTrue",
+	  "Alphabet",
+	  "AlphabeticOrder",
+	  "AlphabeticSort",
+	  "AlphaChannel",
+	  "AlternateImage",
+	  "AlternatingFactorial",
+	  "AlternatingGroup",
+	  "AlternativeHypothesis",
+	  "Alternatives",
+	  "AltitudeMethod",
+	  "AmbientLight",
+	  "AmbiguityFunction",
+	  "AmbiguityList",
+	  "Analytic",
+	  "AnatomyData",
+	  "AnatomyForm",
+	  "AnatomyPlot3D",
+	  "AnatomySkinStyle",
+	  "AnatomyStyling",
+	  "AnchoredSearch",
+	  "And",
+	  "AndersonDarlingTest",
+	  "AngerJ",
+	  "AngleBisector",
+	  "AngleBracket",
+	  "AnglePath",
+	  "AnglePath3D",
+	  "AngleVector",
+	  "AngularGauge",
+	  "Animate",
+	  "AnimatedImage",
+	  "AnimationCycleOffset",
+	  "AnimationCycleRepetitions",
+	  "AnimationDirection",
+	  "AnimationDisplayTime",
+	  "AnimationRate",
+	  "AnimationRepetitions",
+	  "AnimationRunning",
+	  "AnimationRunTime",
+	  "AnimationTimeIndex",
+	  "AnimationVideo",
+	  "Animator",
+	  "AnimatorBox",
+	  "AnimatorBoxOptions",
+	  "AnimatorElements",
+	  "Annotate",
+	  "Annotation",
+	  "AnnotationDelete",
+	  "AnnotationKeys",
+	  "AnnotationRules",
+	  "AnnotationValue",
+	  "Annuity",
+	  "AnnuityDue",
+	  "Annulus",
+	  "AnomalyDetection",
+	  "AnomalyDetector",
+	  "AnomalyDetectorFunction",
+	  "Anonymous",
+	  "Antialiasing",
+	  "Antihermitian",
+	  "AntihermitianMatrixQ",
+	  "Antisymmetric",
+	  "AntisymmetricMatrixQ",
+	  "Antonyms",
+	  "AnyOrder",
+	  "AnySubset",
+	  "AnyTrue",
+	  "Apart",
+	  "ApartSquareFree",
+	  "APIFunction",
+	  "Appearance",
+	  "AppearanceElements",
+	  "AppearanceRules",
+	  "AppellF1",
+	  "Append",
+	  "AppendCheck",
+	  "AppendLayer",
+	  "AppendTo",
+	  "Application",
+	  "Apply",
+	  "ApplyReaction",
+	  "ApplySides",
+	  "ApplyTo",
+	  "ArcCos",
+	  "ArcCosh",
+	  "ArcCot",
+	  "ArcCoth",
+	  "ArcCsc",
+	  "ArcCsch",
+	  "ArcCurvature",
+	  "ARCHProcess",
+	  "ArcLength",
+	  "ArcSec",
+	  "ArcSech",
+	  "ArcSin",
+	  "ArcSinDistribution",
+	  "ArcSinh",
+	  "ArcTan",
+	  "ArcTanh",
+	  "Area",
+	  "Arg",
+	  "ArgMax",
+	  "ArgMin",
+	  "ArgumentCountQ",
+	  "ArgumentsOptions",
+	  "ARIMAProcess",
+	  "ArithmeticGeometricMean",
+	  "ARMAProcess",
+	  "Around",
+	  "AroundReplace",
+	  "ARProcess",
+	  "Array",
+	  "ArrayComponents",
+	  "ArrayDepth",
+	  "ArrayFilter",
+	  "ArrayFlatten",
+	  "ArrayMesh",
+	  "ArrayPad",
+	  "ArrayPlot",
+	  "ArrayPlot3D",
+	  "ArrayQ",
+	  "ArrayReduce",
+	  "ArrayResample",
+	  "ArrayReshape",
+	  "ArrayRules",
+	  "Arrays",
+	  "Arrow",
+	  "Arrow3DBox",
+	  "ArrowBox",
+	  "Arrowheads",
+	  "ASATriangle",
+	  "Ask",
+	  "AskAppend",
+	  "AskConfirm",
+	  "AskDisplay",
+	  "AskedQ",
+	  "AskedValue",
+	  "AskFunction",
+	  "AskState",
+	  "AskTemplateDisplay",
+	  "AspectRatio",
+	  "AspectRatioFixed",
+	  "Assert",
+	  "AssessmentFunction",
+	  "AssessmentResultObject",
+	  "AssociateTo",
+	  "Association",
+	  "AssociationFormat",
+	  "AssociationMap",
+	  "AssociationQ",
+	  "AssociationThread",
+	  "AssumeDeterministic",
+	  "Assuming",
+	  "Assumptions",
+	  "AstroAngularSeparation",
+	  "AstroBackground",
+	  "AstroCenter",
+	  "AstroDistance",
+	  "AstroGraphics",
+	  "AstroGridLines",
+	  "AstroGridLinesStyle",
+	  "AstronomicalData",
+	  "AstroPosition",
+	  "AstroProjection",
+	  "AstroRange",
+	  "AstroRangePadding",
+	  "AstroReferenceFrame",
+	  "AstroStyling",
+	  "AstroZoomLevel",
+	  "Asymptotic",
+	  "AsymptoticDSolveValue",
+	  "AsymptoticEqual",
+	  "AsymptoticEquivalent",
+	  "AsymptoticExpectation",
+	  "AsymptoticGreater",
+	  "AsymptoticGreaterEqual",
+	  "AsymptoticIntegrate",
+	  "AsymptoticLess",
+	  "AsymptoticLessEqual",
+	  "AsymptoticOutputTracker",
+	  "AsymptoticProbability",
+	  "AsymptoticProduct",
+	  "AsymptoticRSolveValue",
+	  "AsymptoticSolve",
+	  "AsymptoticSum",
+	  "Asynchronous",
+	  "AsynchronousTaskObject",
+	  "AsynchronousTasks",
+	  "Atom",
+	  "AtomCoordinates",
+	  "AtomCount",
+	  "AtomDiagramCoordinates",
+	  "AtomLabels",
+	  "AtomLabelStyle",
+	  "AtomList",
+	  "AtomQ",
+	  "AttachCell",
+	  "AttachedCell",
+	  "AttentionLayer",
+	  "Attributes",
+	  "Audio",
+	  "AudioAmplify",
+	  "AudioAnnotate",
+	  "AudioAnnotationLookup",
+	  "AudioBlockMap",
+	  "AudioCapture",
+	  "AudioChannelAssignment",
+	  "AudioChannelCombine",
+	  "AudioChannelMix",
+	  "AudioChannels",
+	  "AudioChannelSeparate",
+	  "AudioData",
+	  "AudioDelay",
+	  "AudioDelete",
+	  "AudioDevice",
+	  "AudioDistance",
+	  "AudioEncoding",
+	  "AudioFade",
+	  "AudioFrequencyShift",
+	  "AudioGenerator",
+	  "AudioIdentify",
+	  "AudioInputDevice",
+	  "AudioInsert",
+	  "AudioInstanceQ",
+	  "AudioIntervals",
+	  "AudioJoin",
+	  "AudioLabel",
+	  "AudioLength",
+	  "AudioLocalMeasurements",
+	  "AudioLooping",
+	  "AudioLoudness",
+	  "AudioMeasurements",
+	  "AudioNormalize",
+	  "AudioOutputDevice",
+	  "AudioOverlay",
+	  "AudioPad",
+	  "AudioPan",
+	  "AudioPartition",
+	  "AudioPause",
+	  "AudioPitchShift",
+	  "AudioPlay",
+	  "AudioPlot",
+	  "AudioQ",
+	  "AudioRecord",
+	  "AudioReplace",
+	  "AudioResample",
+	  "AudioReverb",
+	  "AudioReverse",
+	  "AudioSampleRate",
+	  "AudioSpectralMap",
+	  "AudioSpectralTransformation",
+	  "AudioSplit",
+	  "AudioStop",
+	  "AudioStream",
+	  "AudioStreams",
+	  "AudioTimeStretch",
+	  "AudioTrackApply",
+	  "AudioTrackSelection",
+	  "AudioTrim",
+	  "AudioType",
+	  "AugmentedPolyhedron",
+	  "AugmentedSymmetricPolynomial",
+	  "Authenticate",
+	  "Authentication",
+	  "AuthenticationDialog",
+	  "AutoAction",
+	  "Autocomplete",
+	  "AutocompletionFunction",
+	  "AutoCopy",
+	  "AutocorrelationTest",
+	  "AutoDelete",
+	  "AutoEvaluateEvents",
+	  "AutoGeneratedPackage",
+	  "AutoIndent",
+	  "AutoIndentSpacings",
+	  "AutoItalicWords",
+	  "AutoloadPath",
+	  "AutoMatch",
+	  "Automatic",
+	  "AutomaticImageSize",
+	  "AutoMultiplicationSymbol",
+	  "AutoNumberFormatting",
+	  "AutoOpenNotebooks",
+	  "AutoOpenPalettes",
+	  "AutoOperatorRenderings",
+	  "AutoQuoteCharacters",
+	  "AutoRefreshed",
+	  "AutoRemove",
+	  "AutorunSequencing",
+	  "AutoScaling",
+	  "AutoScroll",
+	  "AutoSpacing",
+	  "AutoStyleOptions",
+	  "AutoStyleWords",
+	  "AutoSubmitting",
+	  "Axes",
+	  "AxesEdge",
+	  "AxesLabel",
+	  "AxesOrigin",
+	  "AxesStyle",
+	  "AxiomaticTheory",
+	  "Axis",
+	  "Axis3DBox",
+	  "Axis3DBoxOptions",
+	  "AxisBox",
+	  "AxisBoxOptions",
+	  "AxisLabel",
+	  "AxisObject",
+	  "AxisStyle",
+	  "BabyMonsterGroupB",
+	  "Back",
+	  "BackFaceColor",
+	  "BackFaceGlowColor",
+	  "BackFaceOpacity",
+	  "BackFaceSpecularColor",
+	  "BackFaceSpecularExponent",
+	  "BackFaceSurfaceAppearance",
+	  "BackFaceTexture",
+	  "Background",
+	  "BackgroundAppearance",
+	  "BackgroundTasksSettings",
+	  "Backslash",
+	  "Backsubstitution",
+	  "Backward",
+	  "Ball",
+	  "Band",
+	  "BandpassFilter",
+	  "BandstopFilter",
+	  "BarabasiAlbertGraphDistribution",
+	  "BarChart",
+	  "BarChart3D",
+	  "BarcodeImage",
+	  "BarcodeRecognize",
+	  "BaringhausHenzeTest",
+	  "BarLegend",
+	  "BarlowProschanImportance",
+	  "BarnesG",
+	  "BarOrigin",
+	  "BarSpacing",
+	  "BartlettHannWindow",
+	  "BartlettWindow",
+	  "BaseDecode",
+	  "BaseEncode",
+	  "BaseForm",
+	  "Baseline",
+	  "BaselinePosition",
+	  "BaseStyle",
+	  "BasicRecurrentLayer",
+	  "BatchNormalizationLayer",
+	  "BatchSize",
+	  "BatesDistribution",
+	  "BattleLemarieWavelet",
+	  "BayesianMaximization",
+	  "BayesianMaximizationObject",
+	  "BayesianMinimization",
+	  "BayesianMinimizationObject",
+	  "Because",
+	  "BeckmannDistribution",
+	  "Beep",
+	  "Before",
+	  "Begin",
+	  "BeginDialogPacket",
+	  "BeginPackage",
+	  "BellB",
+	  "BellY",
+	  "Below",
+	  "BenfordDistribution",
+	  "BeniniDistribution",
+	  "BenktanderGibratDistribution",
+	  "BenktanderWeibullDistribution",
+	  "BernoulliB",
+	  "BernoulliDistribution",
+	  "BernoulliGraphDistribution",
+	  "BernoulliProcess",
+	  "BernsteinBasis",
+	  "BesagL",
+	  "BesselFilterModel",
+	  "BesselI",
+	  "BesselJ",
+	  "BesselJZero",
+	  "BesselK",
+	  "BesselY",
+	  "BesselYZero",
+	  "Beta",
+	  "BetaBinomialDistribution",
+	  "BetaDistribution",
+	  "BetaNegativeBinomialDistribution",
+	  "BetaPrimeDistribution",
+	  "BetaRegularized",
+	  "Between",
+	  "BetweennessCentrality",
+	  "Beveled",
+	  "BeveledPolyhedron",
+	  "BezierCurve",
+	  "BezierCurve3DBox",
+	  "BezierCurve3DBoxOptions",
+	  "BezierCurveBox",
+	  "BezierCurveBoxOptions",
+	  "BezierFunction",
+	  "BilateralFilter",
+	  "BilateralLaplaceTransform",
+	  "BilateralZTransform",
+	  "Binarize",
+	  "BinaryDeserialize",
+	  "BinaryDistance",
+	  "BinaryFormat",
+	  "BinaryImageQ",
+	  "BinaryRead",
+	  "BinaryReadList",
+	  "BinarySerialize",
+	  "BinaryWrite",
+	  "BinCounts",
+	  "BinLists",
+	  "BinnedVariogramList",
+	  "Binomial",
+	  "BinomialDistribution",
+	  "BinomialPointProcess",
+	  "BinomialProcess",
+	  "BinormalDistribution",
+	  "BiorthogonalSplineWavelet",
+	  "BioSequence",
+	  "BioSequenceBackTranslateList",
+	  "BioSequenceComplement",
+	  "BioSequenceInstances",
+	  "BioSequenceModify",
+	  "BioSequencePlot",
+	  "BioSequenceQ",
+	  "BioSequenceReverseComplement",
+	  "BioSequenceTranscribe",
+	  "BioSequenceTranslate",
+	  "BipartiteGraphQ",
+	  "BiquadraticFilterModel",
+	  "BirnbaumImportance",
+	  "BirnbaumSaundersDistribution",
+	  "BitAnd",
+	  "BitClear",
+	  "BitGet",
+	  "BitLength",
+	  "BitNot",
+	  "BitOr",
+	  "BitRate",
+	  "BitSet",
+	  "BitShiftLeft",
+	  "BitShiftRight",
+	  "BitXor",
+	  "BiweightLocation",
+	  "BiweightMidvariance",
+	  "Black",
+	  "BlackmanHarrisWindow",
+	  "BlackmanNuttallWindow",
+	  "BlackmanWindow",
+	  "Blank",
+	  "BlankForm",
+	  "BlankNullSequence",
+	  "BlankSequence",
+	  "Blend",
+	  "Block",
+	  "BlockchainAddressData",
+	  "BlockchainBase",
+	  "BlockchainBlockData",
+	  "BlockchainContractValue",
+	  "BlockchainData",
+	  "BlockchainGet",
+	  "BlockchainKeyEncode",
+	  "BlockchainPut",
+	  "BlockchainTokenData",
+	  "BlockchainTransaction",
+	  "BlockchainTransactionData",
+	  "BlockchainTransactionSign",
+	  "BlockchainTransactionSubmit",
+	  "BlockDiagonalMatrix",
+	  "BlockLowerTriangularMatrix",
+	  "BlockMap",
+	  "BlockRandom",
+	  "BlockUpperTriangularMatrix",
+	  "BlomqvistBeta",
+	  "BlomqvistBetaTest",
+	  "Blue",
+	  "Blur",
+	  "Blurring",
+	  "BodePlot",
+	  "BohmanWindow",
+	  "Bold",
+	  "Bond",
+	  "BondCount",
+	  "BondLabels",
+	  "BondLabelStyle",
+	  "BondList",
+	  "BondQ",
+	  "Bookmarks",
+	  "Boole",
+	  "BooleanConsecutiveFunction",
+	  "BooleanConvert",
+	  "BooleanCountingFunction",
+	  "BooleanFunction",
+	  "BooleanGraph",
+	  "BooleanMaxterms",
+	  "BooleanMinimize",
+	  "BooleanMinterms",
+	  "BooleanQ",
+	  "BooleanRegion",
+	  "Booleans",
+	  "BooleanStrings",
+	  "BooleanTable",
+	  "BooleanVariables",
+	  "BorderDimensions",
+	  "BorelTannerDistribution",
+	  "Bottom",
+	  "BottomHatTransform",
+	  "BoundaryDiscretizeGraphics",
+	  "BoundaryDiscretizeRegion",
+	  "BoundaryMesh",
+	  "BoundaryMeshRegion",
+	  "BoundaryMeshRegionQ",
+	  "BoundaryStyle",
+	  "BoundedRegionQ",
+	  "BoundingRegion",
+	  "Bounds",
+	  "Box",
+	  "BoxBaselineShift",
+	  "BoxData",
+	  "BoxDimensions",
+	  "Boxed",
+	  "Boxes",
+	  "BoxForm",
+	  "BoxFormFormatTypes",
+	  "BoxFrame",
+	  "BoxID",
+	  "BoxMargins",
+	  "BoxMatrix",
+	  "BoxObject",
+	  "BoxRatios",
+	  "BoxRotation",
+	  "BoxRotationPoint",
+	  "BoxStyle",
+	  "BoxWhiskerChart",
+	  "Bra",
+	  "BracketingBar",
+	  "BraKet",
+	  "BrayCurtisDistance",
+	  "BreadthFirstScan",
+	  "Break",
+	  "BridgeData",
+	  "BrightnessEqualize",
+	  "BroadcastStationData",
+	  "Brown",
+	  "BrownForsytheTest",
+	  "BrownianBridgeProcess",
+	  "BrowserCategory",
+	  "BSplineBasis",
+	  "BSplineCurve",
+	  "BSplineCurve3DBox",
+	  "BSplineCurve3DBoxOptions",
+	  "BSplineCurveBox",
+	  "BSplineCurveBoxOptions",
+	  "BSplineFunction",
+	  "BSplineSurface",
+	  "BSplineSurface3DBox",
+	  "BSplineSurface3DBoxOptions",
+	  "BubbleChart",
+	  "BubbleChart3D",
+	  "BubbleScale",
+	  "BubbleSizes",
+	  "BuckyballGraph",
+	  "BuildCompiledComponent",
+	  "BuildingData",
+	  "BulletGauge",
+	  "BusinessDayQ",
+	  "ButterflyGraph",
+	  "ButterworthFilterModel",
+	  "Button",
+	  "ButtonBar",
+	  "ButtonBox",
+	  "ButtonBoxOptions",
+	  "ButtonCell",
+	  "ButtonContents",
+	  "ButtonData",
+	  "ButtonEvaluator",
+	  "ButtonExpandable",
+	  "ButtonFrame",
+	  "ButtonFunction",
+	  "ButtonMargins",
+	  "ButtonMinHeight",
+	  "ButtonNote",
+	  "ButtonNotebook",
+	  "ButtonSource",
+	  "ButtonStyle",
+	  "ButtonStyleMenuListing",
+	  "Byte",
+	  "ByteArray",
+	  "ByteArrayFormat",
+	  "ByteArrayFormatQ",
+	  "ByteArrayQ",
+	  "ByteArrayToString",
+	  "ByteCount",
+	  "ByteOrdering",
+	  "C",
+	  "CachedValue",
+	  "CacheGraphics",
+	  "CachePersistence",
+	  "CalendarConvert",
+	  "CalendarData",
+	  "CalendarType",
+	  "Callout",
+	  "CalloutMarker",
+	  "CalloutStyle",
+	  "CallPacket",
+	  "CanberraDistance",
+	  "Cancel",
+	  "CancelButton",
+	  "CandlestickChart",
+	  "CanonicalGraph",
+	  "CanonicalizePolygon",
+	  "CanonicalizePolyhedron",
+	  "CanonicalizeRegion",
+	  "CanonicalName",
+	  "CanonicalWarpingCorrespondence",
+	  "CanonicalWarpingDistance",
+	  "CantorMesh",
+	  "CantorStaircase",
+	  "Canvas",
+	  "Cap",
+	  "CapForm",
+	  "CapitalDifferentialD",
+	  "Capitalize",
+	  "CapsuleShape",
+	  "CaptureRunning",
+	  "CaputoD",
+	  "CardinalBSplineBasis",
+	  "CarlemanLinearize",
+	  "CarlsonRC",
+	  "CarlsonRD",
+	  "CarlsonRE",
+	  "CarlsonRF",
+	  "CarlsonRG",
+	  "CarlsonRJ",
+	  "CarlsonRK",
+	  "CarlsonRM",
+	  "CarmichaelLambda",
+	  "CaseOrdering",
+	  "Cases",
+	  "CaseSensitive",
+	  "Cashflow",
+	  "Casoratian",
+	  "Cast",
+	  "Catalan",
+	  "CatalanNumber",
+	  "Catch",
+	  "CategoricalDistribution",
+	  "Catenate",
+	  "CatenateLayer",
+	  "CauchyDistribution",
+	  "CauchyMatrix",
+	  "CauchyPointProcess",
+	  "CauchyWindow",
+	  "CayleyGraph",
+	  "CDF",
+	  "CDFDeploy",
+	  "CDFInformation",
+	  "CDFWavelet",
+	  "Ceiling",
+	  "CelestialSystem",
+	  "Cell",
+	  "CellAutoOverwrite",
+	  "CellBaseline",
+	  "CellBoundingBox",
+	  "CellBracketOptions",
+	  "CellChangeTimes",
+	  "CellContents",
+	  "CellContext",
+	  "CellDingbat",
+	  "CellDingbatMargin",
+	  "CellDynamicExpression",
+	  "CellEditDuplicate",
+	  "CellElementsBoundingBox",
+	  "CellElementSpacings",
+	  "CellEpilog",
+	  "CellEvaluationDuplicate",
+	  "CellEvaluationFunction",
+	  "CellEvaluationLanguage",
+	  "CellEventActions",
+	  "CellFrame",
+	  "CellFrameColor",
+	  "CellFrameLabelMargins",
+	  "CellFrameLabels",
+	  "CellFrameMargins",
+	  "CellFrameStyle",
+	  "CellGroup",
+	  "CellGroupData",
+	  "CellGrouping",
+	  "CellGroupingRules",
+	  "CellHorizontalScrolling",
+	  "CellID",
+	  "CellInsertionPointCell",
+	  "CellLabel",
+	  "CellLabelAutoDelete",
+	  "CellLabelMargins",
+	  "CellLabelPositioning",
+	  "CellLabelStyle",
+	  "CellLabelTemplate",
+	  "CellMargins",
+	  "CellObject",
+	  "CellOpen",
+	  "CellPrint",
+	  "CellProlog",
+	  "Cells",
+	  "CellSize",
+	  "CellStyle",
+	  "CellTags",
+	  "CellTrayPosition",
+	  "CellTrayWidgets",
+	  "CellularAutomaton",
+	  "CensoredDistribution",
+	  "Censoring",
+	  "Center",
+	  "CenterArray",
+	  "CenterDot",
+	  "CenteredInterval",
+	  "CentralFeature",
+	  "CentralMoment",
+	  "CentralMomentGeneratingFunction",
+	  "Cepstrogram",
+	  "CepstrogramArray",
+	  "CepstrumArray",
+	  "CForm",
+	  "ChampernowneNumber",
+	  "ChangeOptions",
+	  "ChannelBase",
+	  "ChannelBrokerAction",
+	  "ChannelDatabin",
+	  "ChannelHistoryLength",
+	  "ChannelListen",
+	  "ChannelListener",
+	  "ChannelListeners",
+	  "ChannelListenerWait",
+	  "ChannelObject",
+	  "ChannelPreSendFunction",
+	  "ChannelReceiverFunction",
+	  "ChannelSend",
+	  "ChannelSubscribers",
+	  "ChanVeseBinarize",
+	  "Character",
+	  "CharacterCounts",
+	  "CharacterEncoding",
+	  "CharacterEncodingsPath",
+	  "CharacteristicFunction",
+	  "CharacteristicPolynomial",
+	  "CharacterName",
+	  "CharacterNormalize",
+	  "CharacterRange",
+	  "Characters",
+	  "ChartBaseStyle",
+	  "ChartElementData",
+	  "ChartElementDataFunction",
+	  "ChartElementFunction",
+	  "ChartElements",
+	  "ChartLabels",
+	  "ChartLayout",
+	  "ChartLegends",
+	  "ChartStyle",
+	  "Chebyshev1FilterModel",
+	  "Chebyshev2FilterModel",
+	  "ChebyshevDistance",
+	  "ChebyshevT",
+	  "ChebyshevU",
+	  "Check",
+	  "CheckAbort",
+	  "CheckAll",
+	  "CheckArguments",
+	  "Checkbox",
+	  "CheckboxBar",
+	  "CheckboxBox",
+	  "CheckboxBoxOptions",
+	  "ChemicalConvert",
+	  "ChemicalData",
+	  "ChemicalFormula",
+	  "ChemicalInstance",
+	  "ChemicalReaction",
+	  "ChessboardDistance",
+	  "ChiDistribution",
+	  "ChineseRemainder",
+	  "ChiSquareDistribution",
+	  "ChoiceButtons",
+	  "ChoiceDialog",
+	  "CholeskyDecomposition",
+	  "Chop",
+	  "ChromaticityPlot",
+	  "ChromaticityPlot3D",
+	  "ChromaticPolynomial",
+	  "Circle",
+	  "CircleBox",
+	  "CircleDot",
+	  "CircleMinus",
+	  "CirclePlus",
+	  "CirclePoints",
+	  "CircleThrough",
+	  "CircleTimes",
+	  "CirculantGraph",
+	  "CircularArcThrough",
+	  "CircularOrthogonalMatrixDistribution",
+	  "CircularQuaternionMatrixDistribution",
+	  "CircularRealMatrixDistribution",
+	  "CircularSymplecticMatrixDistribution",
+	  "CircularUnitaryMatrixDistribution",
+	  "Circumsphere",
+	  "CityData",
+	  "ClassifierFunction",
+	  "ClassifierInformation",
+	  "ClassifierMeasurements",
+	  "ClassifierMeasurementsObject",
+	  "Classify",
+	  "ClassPriors",
+	  "Clear",
+	  "ClearAll",
+	  "ClearAttributes",
+	  "ClearCookies",
+	  "ClearPermissions",
+	  "ClearSystemCache",
+	  "ClebschGordan",
+	  "ClickPane",
+	  "ClickToCopy",
+	  "ClickToCopyEnabled",
+	  "Clip",
+	  "ClipboardNotebook",
+	  "ClipFill",
+	  "ClippingStyle",
+	  "ClipPlanes",
+	  "ClipPlanesStyle",
+	  "ClipRange",
+	  "Clock",
+	  "ClockGauge",
+	  "ClockwiseContourIntegral",
+	  "Close",
+	  "Closed",
+	  "CloseKernels",
+	  "ClosenessCentrality",
+	  "Closing",
+	  "ClosingAutoSave",
+	  "ClosingEvent",
+	  "CloudAccountData",
+	  "CloudBase",
+	  "CloudConnect",
+	  "CloudConnections",
+	  "CloudDeploy",
+	  "CloudDirectory",
+	  "CloudDisconnect",
+	  "CloudEvaluate",
+	  "CloudExport",
+	  "CloudExpression",
+	  "CloudExpressions",
+	  "CloudFunction",
+	  "CloudGet",
+	  "CloudImport",
+	  "CloudLoggingData",
+	  "CloudObject",
+	  "CloudObjectInformation",
+	  "CloudObjectInformationData",
+	  "CloudObjectNameFormat",
+	  "CloudObjects",
+	  "CloudObjectURLType",
+	  "CloudPublish",
+	  "CloudPut",
+	  "CloudRenderingMethod",
+	  "CloudSave",
+	  "CloudShare",
+	  "CloudSubmit",
+	  "CloudSymbol",
+	  "CloudUnshare",
+	  "CloudUserID",
+	  "ClusterClassify",
+	  "ClusterDissimilarityFunction",
+	  "ClusteringComponents",
+	  "ClusteringMeasurements",
+	  "ClusteringTree",
+	  "CMYKColor",
+	  "Coarse",
+	  "CodeAssistOptions",
+	  "Coefficient",
+	  "CoefficientArrays",
+	  "CoefficientDomain",
+	  "CoefficientList",
+	  "CoefficientRules",
+	  "CoifletWavelet",
+	  "Collect",
+	  "CollinearPoints",
+	  "Colon",
+	  "ColonForm",
+	  "ColorBalance",
+	  "ColorCombine",
+	  "ColorConvert",
+	  "ColorCoverage",
+	  "ColorData",
+	  "ColorDataFunction",
+	  "ColorDetect",
+	  "ColorDistance",
+	  "ColorFunction",
+	  "ColorFunctionBinning",
+	  "ColorFunctionScaling",
+	  "Colorize",
+	  "ColorNegate",
+	  "ColorOutput",
+	  "ColorProfileData",
+	  "ColorQ",
+	  "ColorQuantize",
+	  "ColorReplace",
+	  "ColorRules",
+	  "ColorSelectorSettings",
+	  "ColorSeparate",
+	  "ColorSetter",
+	  "ColorSetterBox",
+	  "ColorSetterBoxOptions",
+	  "ColorSlider",
+	  "ColorsNear",
+	  "ColorSpace",
+	  "ColorToneMapping",
+	  "Column",
+	  "ColumnAlignments",
+	  "ColumnBackgrounds",
+	  "ColumnForm",
+	  "ColumnLines",
+	  "ColumnsEqual",
+	  "ColumnSpacings",
+	  "ColumnWidths",
+	  "CombinatorB",
+	  "CombinatorC",
+	  "CombinatorI",
+	  "CombinatorK",
+	  "CombinatorS",
+	  "CombinatorW",
+	  "CombinatorY",
+	  "CombinedEntityClass",
+	  "CombinerFunction",
+	  "CometData",
+	  "CommonDefaultFormatTypes",
+	  "Commonest",
+	  "CommonestFilter",
+	  "CommonName",
+	  "CommonUnits",
+	  "CommunityBoundaryStyle",
+	  "CommunityGraphPlot",
+	  "CommunityLabels",
+	  "CommunityRegionStyle",
+	  "CompanyData",
+	  "CompatibleUnitQ",
+	  "CompilationOptions",
+	  "CompilationTarget",
+	  "Compile",
+	  "Compiled",
+	  "CompiledCodeFunction",
+	  "CompiledComponent",
+	  "CompiledExpressionDeclaration",
+	  "CompiledFunction",
+	  "CompiledLayer",
+	  "CompilerCallback",
+	  "CompilerEnvironment",
+	  "CompilerEnvironmentAppend",
+	  "CompilerEnvironmentAppendTo",
+	  "CompilerEnvironmentObject",
+	  "CompilerOptions",
+	  "Complement",
+	  "ComplementedEntityClass",
+	  "CompleteGraph",
+	  "CompleteGraphQ",
+	  "CompleteIntegral",
+	  "CompleteKaryTree",
+	  "CompletionsListPacket",
+	  "Complex",
+	  "ComplexArrayPlot",
+	  "ComplexContourPlot",
+	  "Complexes",
+	  "ComplexExpand",
+	  "ComplexInfinity",
+	  "ComplexityFunction",
+	  "ComplexListPlot",
+	  "ComplexPlot",
+	  "ComplexPlot3D",
+	  "ComplexRegionPlot",
+	  "ComplexStreamPlot",
+	  "ComplexVectorPlot",
+	  "ComponentMeasurements",
+	  "ComponentwiseContextMenu",
+	  "Compose",
+	  "ComposeList",
+	  "ComposeSeries",
+	  "CompositeQ",
+	  "Composition",
+	  "CompoundElement",
+	  "CompoundExpression",
+	  "CompoundPoissonDistribution",
+	  "CompoundPoissonProcess",
+	  "CompoundRenewalProcess",
+	  "Compress",
+	  "CompressedData",
+	  "CompressionLevel",
+	  "ComputeUncertainty",
+	  "ConcaveHullMesh",
+	  "Condition",
+	  "ConditionalExpression",
+	  "Conditioned",
+	  "Cone",
+	  "ConeBox",
+	  "ConfidenceLevel",
+	  "ConfidenceRange",
+	  "ConfidenceTransform",
+	  "ConfigurationPath",
+	  "Confirm",
+	  "ConfirmAssert",
+	  "ConfirmBy",
+	  "ConfirmMatch",
+	  "ConfirmQuiet",
+	  "ConformationMethod",
+	  "ConformAudio",
+	  "ConformImages",
+	  "Congruent",
+	  "ConicGradientFilling",
+	  "ConicHullRegion",
+	  "ConicHullRegion3DBox",
+	  "ConicHullRegion3DBoxOptions",
+	  "ConicHullRegionBox",
+	  "ConicHullRegionBoxOptions",
+	  "ConicOptimization",
+	  "Conjugate",
+	  "ConjugateTranspose",
+	  "Conjunction",
+	  "Connect",
+	  "ConnectedComponents",
+	  "ConnectedGraphComponents",
+	  "ConnectedGraphQ",
+	  "ConnectedMeshComponents",
+	  "ConnectedMoleculeComponents",
+	  "ConnectedMoleculeQ",
+	  "ConnectionSettings",
+	  "ConnectLibraryCallbackFunction",
+	  "ConnectSystemModelComponents",
+	  "ConnectSystemModelController",
+	  "ConnesWindow",
+	  "ConoverTest",
+	  "ConservativeConvectionPDETerm",
+	  "ConsoleMessage",
+	  "Constant",
+	  "ConstantArray",
+	  "ConstantArrayLayer",
+	  "ConstantImage",
+	  "ConstantPlusLayer",
+	  "ConstantRegionQ",
+	  "Constants",
+	  "ConstantTimesLayer",
+	  "ConstellationData",
+	  "ConstrainedMax",
+	  "ConstrainedMin",
+	  "Construct",
+	  "Containing",
+	  "ContainsAll",
+	  "ContainsAny",
+	  "ContainsExactly",
+	  "ContainsNone",
+	  "ContainsOnly",
+	  "ContentDetectorFunction",
+	  "ContentFieldOptions",
+	  "ContentLocationFunction",
+	  "ContentObject",
+	  "ContentPadding",
+	  "ContentsBoundingBox",
+	  "ContentSelectable",
+	  "ContentSize",
+	  "Context",
+	  "ContextMenu",
+	  "Contexts",
+	  "ContextToFileName",
+	  "Continuation",
+	  "Continue",
+	  "ContinuedFraction",
+	  "ContinuedFractionK",
+	  "ContinuousAction",
+	  "ContinuousMarkovProcess",
+	  "ContinuousTask",
+	  "ContinuousTimeModelQ",
+	  "ContinuousWaveletData",
+	  "ContinuousWaveletTransform",
+	  "ContourDetect",
+	  "ContourGraphics",
+	  "ContourIntegral",
+	  "ContourLabels",
+	  "ContourLines",
+	  "ContourPlot",
+	  "ContourPlot3D",
+	  "Contours",
+	  "ContourShading",
+	  "ContourSmoothing",
+	  "ContourStyle",
+	  "ContraharmonicMean",
+	  "ContrastiveLossLayer",
+	  "Control",
+	  "ControlActive",
+	  "ControlAlignment",
+	  "ControlGroupContentsBox",
+	  "ControllabilityGramian",
+	  "ControllabilityMatrix",
+	  "ControllableDecomposition",
+	  "ControllableModelQ",
+	  "ControllerDuration",
+	  "ControllerInformation",
+	  "ControllerInformationData",
+	  "ControllerLinking",
+	  "ControllerManipulate",
+	  "ControllerMethod",
+	  "ControllerPath",
+	  "ControllerState",
+	  "ControlPlacement",
+	  "ControlsRendering",
+	  "ControlType",
+	  "ConvectionPDETerm",
+	  "Convergents",
+	  "ConversionOptions",
+	  "ConversionRules",
+	  "ConvertToPostScript",
+	  "ConvertToPostScriptPacket",
+	  "ConvexHullMesh",
+	  "ConvexHullRegion",
+	  "ConvexOptimization",
+	  "ConvexPolygonQ",
+	  "ConvexPolyhedronQ",
+	  "ConvexRegionQ",
+	  "ConvolutionLayer",
+	  "Convolve",
+	  "ConwayGroupCo1",
+	  "ConwayGroupCo2",
+	  "ConwayGroupCo3",
+	  "CookieFunction",
+	  "Cookies",
+	  "CoordinateBoundingBox",
+	  "CoordinateBoundingBoxArray",
+	  "CoordinateBounds",
+	  "CoordinateBoundsArray",
+	  "CoordinateChartData",
+	  "CoordinatesToolOptions",
+	  "CoordinateTransform",
+	  "CoordinateTransformData",
+	  "CoplanarPoints",
+	  "CoprimeQ",
+	  "Coproduct",
+	  "CopulaDistribution",
+	  "Copyable",
+	  "CopyDatabin",
+	  "CopyDirectory",
+	  "CopyFile",
+	  "CopyFunction",
+	  "CopyTag",
+	  "CopyToClipboard",
+	  "CoreNilpotentDecomposition",
+	  "CornerFilter",
+	  "CornerNeighbors",
+	  "Correlation",
+	  "CorrelationDistance",
+	  "CorrelationFunction",
+	  "CorrelationTest",
+	  "Cos",
+	  "Cosh",
+	  "CoshIntegral",
+	  "CosineDistance",
+	  "CosineWindow",
+	  "CosIntegral",
+	  "Cot",
+	  "Coth",
+	  "CoulombF",
+	  "CoulombG",
+	  "CoulombH1",
+	  "CoulombH2",
+	  "Count",
+	  "CountDistinct",
+	  "CountDistinctBy",
+	  "CounterAssignments",
+	  "CounterBox",
+	  "CounterBoxOptions",
+	  "CounterClockwiseContourIntegral",
+	  "CounterEvaluator",
+	  "CounterFunction",
+	  "CounterIncrements",
+	  "CounterStyle",
+	  "CounterStyleMenuListing",
+	  "CountRoots",
+	  "CountryData",
+	  "Counts",
+	  "CountsBy",
+	  "Covariance",
+	  "CovarianceEstimatorFunction",
+	  "CovarianceFunction",
+	  "CoxianDistribution",
+	  "CoxIngersollRossProcess",
+	  "CoxModel",
+	  "CoxModelFit",
+	  "CramerVonMisesTest",
+	  "CreateArchive",
+	  "CreateCellID",
+	  "CreateChannel",
+	  "CreateCloudExpression",
+	  "CreateCompilerEnvironment",
+	  "CreateDatabin",
+	  "CreateDataStructure",
+	  "CreateDataSystemModel",
+	  "CreateDialog",
+	  "CreateDirectory",
+	  "CreateDocument",
+	  "CreateFile",
+	  "CreateIntermediateDirectories",
+	  "CreateLicenseEntitlement",
+	  "CreateManagedLibraryExpression",
+	  "CreateNotebook",
+	  "CreatePacletArchive",
+	  "CreatePalette",
+	  "CreatePermissionsGroup",
+	  "CreateScheduledTask",
+	  "CreateSearchIndex",
+	  "CreateSystemModel",
+	  "CreateTemporary",
+	  "CreateTypeInstance",
+	  "CreateUUID",
+	  "CreateWindow",
+	  "CriterionFunction",
+	  "CriticalityFailureImportance",
+	  "CriticalitySuccessImportance",
+	  "CriticalSection",
+	  "Cross",
+	  "CrossEntropyLossLayer",
+	  "CrossingCount",
+	  "CrossingDetect",
+	  "CrossingPolygon",
+	  "CrossMatrix",
+	  "Csc",
+	  "Csch",
+	  "CSGRegion",
+	  "CSGRegionQ",
+	  "CSGRegionTree",
+	  "CTCLossLayer",
+	  "Cube",
+	  "CubeRoot",
+	  "Cubics",
+	  "Cuboid",
+	  "CuboidBox",
+	  "CuboidBoxOptions",
+	  "Cumulant",
+	  "CumulantGeneratingFunction",
+	  "CumulativeFeatureImpactPlot",
+	  "Cup",
+	  "CupCap",
+	  "Curl",
+	  "CurlyDoubleQuote",
+	  "CurlyQuote",
+	  "CurrencyConvert",
+	  "CurrentDate",
+	  "CurrentImage",
+	  "CurrentNotebookImage",
+	  "CurrentScreenImage",
+	  "CurrentValue",
+	  "Curry",
+	  "CurryApplied",
+	  "CurvatureFlowFilter",
+	  "CurveClosed",
+	  "Cyan",
+	  "CycleGraph",
+	  "CycleIndexPolynomial",
+	  "Cycles",
+	  "CyclicGroup",
+	  "Cyclotomic",
+	  "Cylinder",
+	  "CylinderBox",
+	  "CylinderBoxOptions",
+	  "CylindricalDecomposition",
+	  "CylindricalDecompositionFunction",
+	  "D",
+	  "DagumDistribution",
+	  "DamData",
+	  "DamerauLevenshteinDistance",
+	  "DampingFactor",
+	  "Darker",
+	  "Dashed",
+	  "Dashing",
+	  "DatabaseConnect",
+	  "DatabaseDisconnect",
+	  "DatabaseReference",
+	  "Databin",
+	  "DatabinAdd",
+	  "DatabinRemove",
+	  "Databins",
+	  "DatabinSubmit",
+	  "DatabinUpload",
+	  "DataCompression",
+	  "DataDistribution",
+	  "DataRange",
+	  "DataReversed",
+	  "Dataset",
+	  "DatasetDisplayPanel",
+	  "DatasetTheme",
+	  "DataStructure",
+	  "DataStructureQ",
+	  "Date",
+	  "DateBounds",
+	  "Dated",
+	  "DateDelimiters",
+	  "DateDifference",
+	  "DatedUnit",
+	  "DateFormat",
+	  "DateFunction",
+	  "DateGranularity",
+	  "DateHistogram",
+	  "DateInterval",
+	  "DateList",
+	  "DateListLogPlot",
+	  "DateListPlot",
+	  "DateListStepPlot",
+	  "DateObject",
+	  "DateObjectQ",
+	  "DateOverlapsQ",
+	  "DatePattern",
+	  "DatePlus",
+	  "DateRange",
+	  "DateReduction",
+	  "DateScale",
+	  "DateSelect",
+	  "DateString",
+	  "DateTicksFormat",
+	  "DateValue",
+	  "DateWithinQ",
+	  "DaubechiesWavelet",
+	  "DavisDistribution",
+	  "DawsonF",
+	  "DayCount",
+	  "DayCountConvention",
+	  "DayHemisphere",
+	  "DaylightQ",
+	  "DayMatchQ",
+	  "DayName",
+	  "DayNightTerminator",
+	  "DayPlus",
+	  "DayRange",
+	  "DayRound",
+	  "DeBruijnGraph",
+	  "DeBruijnSequence",
+	  "Debug",
+	  "DebugTag",
+	  "Decapitalize",
+	  "Decimal",
+	  "DecimalForm",
+	  "DeclareCompiledComponent",
+	  "DeclareKnownSymbols",
+	  "DeclarePackage",
+	  "Decompose",
+	  "DeconvolutionLayer",
+	  "Decrement",
+	  "Decrypt",
+	  "DecryptFile",
+	  "DedekindEta",
+	  "DeepSpaceProbeData",
+	  "Default",
+	  "Default2DTool",
+	  "Default3DTool",
+	  "DefaultAttachedCellStyle",
+	  "DefaultAxesStyle",
+	  "DefaultBaseStyle",
+	  "DefaultBoxStyle",
+	  "DefaultButton",
+	  "DefaultColor",
+	  "DefaultControlPlacement",
+	  "DefaultDockedCellStyle",
+	  "DefaultDuplicateCellStyle",
+	  "DefaultDuration",
+	  "DefaultElement",
+	  "DefaultFaceGridsStyle",
+	  "DefaultFieldHintStyle",
+	  "DefaultFont",
+	  "DefaultFontProperties",
+	  "DefaultFormatType",
+	  "DefaultFrameStyle",
+	  "DefaultFrameTicksStyle",
+	  "DefaultGridLinesStyle",
+	  "DefaultInlineFormatType",
+	  "DefaultInputFormatType",
+	  "DefaultLabelStyle",
+	  "DefaultMenuStyle",
+	  "DefaultNaturalLanguage",
+	  "DefaultNewCellStyle",
+	  "DefaultNewInlineCellStyle",
+	  "DefaultNotebook",
+	  "DefaultOptions",
+	  "DefaultOutputFormatType",
+	  "DefaultPrintPrecision",
+	  "DefaultStyle",
+	  "DefaultStyleDefinitions",
+	  "DefaultTextFormatType",
+	  "DefaultTextInlineFormatType",
+	  "DefaultTicksStyle",
+	  "DefaultTooltipStyle",
+	  "DefaultValue",
+	  "DefaultValues",
+	  "Defer",
+	  "DefineExternal",
+	  "DefineInputStreamMethod",
+	  "DefineOutputStreamMethod",
+	  "DefineResourceFunction",
+	  "Definition",
+	  "Degree",
+	  "DegreeCentrality",
+	  "DegreeGraphDistribution",
+	  "DegreeLexicographic",
+	  "DegreeReverseLexicographic",
+	  "DEigensystem",
+	  "DEigenvalues",
+	  "Deinitialization",
+	  "Del",
+	  "DelaunayMesh",
+	  "Delayed",
+	  "Deletable",
+	  "Delete",
+	  "DeleteAdjacentDuplicates",
+	  "DeleteAnomalies",
+	  "DeleteBorderComponents",
+	  "DeleteCases",
+	  "DeleteChannel",
+	  "DeleteCloudExpression",
+	  "DeleteContents",
+	  "DeleteDirectory",
+	  "DeleteDuplicates",
+	  "DeleteDuplicatesBy",
+	  "DeleteElements",
+	  "DeleteFile",
+	  "DeleteMissing",
+	  "DeleteObject",
+	  "DeletePermissionsKey",
+	  "DeleteSearchIndex",
+	  "DeleteSmallComponents",
+	  "DeleteStopwords",
+	  "DeleteWithContents",
+	  "DeletionWarning",
+	  "DelimitedArray",
+	  "DelimitedSequence",
+	  "Delimiter",
+	  "DelimiterAutoMatching",
+	  "DelimiterFlashTime",
+	  "DelimiterMatching",
+	  "Delimiters",
+	  "DeliveryFunction",
+	  "Dendrogram",
+	  "Denominator",
+	  "DensityGraphics",
+	  "DensityHistogram",
+	  "DensityPlot",
+	  "DensityPlot3D",
+	  "DependentVariables",
+	  "Deploy",
+	  "Deployed",
+	  "Depth",
+	  "DepthFirstScan",
+	  "Derivative",
+	  "DerivativeFilter",
+	  "DerivativePDETerm",
+	  "DerivedKey",
+	  "DescriptorStateSpace",
+	  "DesignMatrix",
+	  "DestroyAfterEvaluation",
+	  "Det",
+	  "DeviceClose",
+	  "DeviceConfigure",
+	  "DeviceExecute",
+	  "DeviceExecuteAsynchronous",
+	  "DeviceObject",
+	  "DeviceOpen",
+	  "DeviceOpenQ",
+	  "DeviceRead",
+	  "DeviceReadBuffer",
+	  "DeviceReadLatest",
+	  "DeviceReadList",
+	  "DeviceReadTimeSeries",
+	  "Devices",
+	  "DeviceStreams",
+	  "DeviceWrite",
+	  "DeviceWriteBuffer",
+	  "DGaussianWavelet",
+	  "DiacriticalPositioning",
+	  "Diagonal",
+	  "DiagonalizableMatrixQ",
+	  "DiagonalMatrix",
+	  "DiagonalMatrixQ",
+	  "Dialog",
+	  "DialogIndent",
+	  "DialogInput",
+	  "DialogLevel",
+	  "DialogNotebook",
+	  "DialogProlog",
+	  "DialogReturn",
+	  "DialogSymbols",
+	  "Diamond",
+	  "DiamondMatrix",
+	  "DiceDissimilarity",
+	  "DictionaryLookup",
+	  "DictionaryWordQ",
+	  "DifferenceDelta",
+	  "DifferenceOrder",
+	  "DifferenceQuotient",
+	  "DifferenceRoot",
+	  "DifferenceRootReduce",
+	  "Differences",
+	  "DifferentialD",
+	  "DifferentialRoot",
+	  "DifferentialRootReduce",
+	  "DifferentiatorFilter",
+	  "DiffusionPDETerm",
+	  "DiggleGatesPointProcess",
+	  "DiggleGrattonPointProcess",
+	  "DigitalSignature",
+	  "DigitBlock",
+	  "DigitBlockMinimum",
+	  "DigitCharacter",
+	  "DigitCount",
+	  "DigitQ",
+	  "DihedralAngle",
+	  "DihedralGroup",
+	  "Dilation",
+	  "DimensionalCombinations",
+	  "DimensionalMeshComponents",
+	  "DimensionReduce",
+	  "DimensionReducerFunction",
+	  "DimensionReduction",
+	  "Dimensions",
+	  "DiracComb",
+	  "DiracDelta",
+	  "DirectedEdge",
+	  "DirectedEdges",
+	  "DirectedGraph",
+	  "DirectedGraphQ",
+	  "DirectedInfinity",
+	  "Direction",
+	  "DirectionalLight",
+	  "Directive",
+	  "Directory",
+	  "DirectoryName",
+	  "DirectoryQ",
+	  "DirectoryStack",
+	  "DirichletBeta",
+	  "DirichletCharacter",
+	  "DirichletCondition",
+	  "DirichletConvolve",
+	  "DirichletDistribution",
+	  "DirichletEta",
+	  "DirichletL",
+	  "DirichletLambda",
+	  "DirichletTransform",
+	  "DirichletWindow",
+	  "DisableConsolePrintPacket",
+	  "DisableFormatting",
+	  "DiscreteAsymptotic",
+	  "DiscreteChirpZTransform",
+	  "DiscreteConvolve",
+	  "DiscreteDelta",
+	  "DiscreteHadamardTransform",
+	  "DiscreteIndicator",
+	  "DiscreteInputOutputModel",
+	  "DiscreteLimit",
+	  "DiscreteLQEstimatorGains",
+	  "DiscreteLQRegulatorGains",
+	  "DiscreteLyapunovSolve",
+	  "DiscreteMarkovProcess",
+	  "DiscreteMaxLimit",
+	  "DiscreteMinLimit",
+	  "DiscretePlot",
+	  "DiscretePlot3D",
+	  "DiscreteRatio",
+	  "DiscreteRiccatiSolve",
+	  "DiscreteShift",
+	  "DiscreteTimeModelQ",
+	  "DiscreteUniformDistribution",
+	  "DiscreteVariables",
+	  "DiscreteWaveletData",
+	  "DiscreteWaveletPacketTransform",
+	  "DiscreteWaveletTransform",
+	  "DiscretizeGraphics",
+	  "DiscretizeRegion",
+	  "Discriminant",
+	  "DisjointQ",
+	  "Disjunction",
+	  "Disk",
+	  "DiskBox",
+	  "DiskBoxOptions",
+	  "DiskMatrix",
+	  "DiskSegment",
+	  "Dispatch",
+	  "DispatchQ",
+	  "DispersionEstimatorFunction",
+	  "Display",
+	  "DisplayAllSteps",
+	  "DisplayEndPacket",
+	  "DisplayForm",
+	  "DisplayFunction",
+	  "DisplayPacket",
+	  "DisplayRules",
+	  "DisplayString",
+	  "DisplayTemporary",
+	  "DisplayWith",
+	  "DisplayWithRef",
+	  "DisplayWithVariable",
+	  "DistanceFunction",
+	  "DistanceMatrix",
+	  "DistanceTransform",
+	  "Distribute",
+	  "Distributed",
+	  "DistributedContexts",
+	  "DistributeDefinitions",
+	  "DistributionChart",
+	  "DistributionDomain",
+	  "DistributionFitTest",
+	  "DistributionParameterAssumptions",
+	  "DistributionParameterQ",
+	  "Dithering",
+	  "Div",
+	  "Divergence",
+	  "Divide",
+	  "DivideBy",
+	  "Dividers",
+	  "DivideSides",
+	  "Divisible",
+	  "Divisors",
+	  "DivisorSigma",
+	  "DivisorSum",
+	  "DMSList",
+	  "DMSString",
+	  "Do",
+	  "DockedCell",
+	  "DockedCells",
+	  "DocumentGenerator",
+	  "DocumentGeneratorInformation",
+	  "DocumentGeneratorInformationData",
+	  "DocumentGenerators",
+	  "DocumentNotebook",
+	  "DocumentWeightingRules",
+	  "Dodecahedron",
+	  "DomainRegistrationInformation",
+	  "DominantColors",
+	  "DominatorTreeGraph",
+	  "DominatorVertexList",
+	  "DOSTextFormat",
+	  "Dot",
+	  "DotDashed",
+	  "DotEqual",
+	  "DotLayer",
+	  "DotPlusLayer",
+	  "Dotted",
+	  "DoubleBracketingBar",
+	  "DoubleContourIntegral",
+	  "DoubleDownArrow",
+	  "DoubleLeftArrow",
+	  "DoubleLeftRightArrow",
+	  "DoubleLeftTee",
+	  "DoubleLongLeftArrow",
+	  "DoubleLongLeftRightArrow",
+	  "DoubleLongRightArrow",
+	  "DoubleRightArrow",
+	  "DoubleRightTee",
+	  "DoubleUpArrow",
+	  "DoubleUpDownArrow",
+	  "DoubleVerticalBar",
+	  "DoublyInfinite",
+	  "Down",
+	  "DownArrow",
+	  "DownArrowBar",
+	  "DownArrowUpArrow",
+	  "DownLeftRightVector",
+	  "DownLeftTeeVector",
+	  "DownLeftVector",
+	  "DownLeftVectorBar",
+	  "DownRightTeeVector",
+	  "DownRightVector",
+	  "DownRightVectorBar",
+	  "Downsample",
+	  "DownTee",
+	  "DownTeeArrow",
+	  "DownValues",
+	  "DownValuesFunction",
+	  "DragAndDrop",
+	  "DrawBackFaces",
+	  "DrawEdges",
+	  "DrawFrontFaces",
+	  "DrawHighlighted",
+	  "DrazinInverse",
+	  "Drop",
+	  "DropoutLayer",
+	  "DropShadowing",
+	  "DSolve",
+	  "DSolveChangeVariables",
+	  "DSolveValue",
+	  "Dt",
+	  "DualLinearProgramming",
+	  "DualPlanarGraph",
+	  "DualPolyhedron",
+	  "DualSystemsModel",
+	  "DumpGet",
+	  "DumpSave",
+	  "DuplicateFreeQ",
+	  "Duration",
+	  "Dynamic",
+	  "DynamicBox",
+	  "DynamicBoxOptions",
+	  "DynamicEvaluationTimeout",
+	  "DynamicGeoGraphics",
+	  "DynamicImage",
+	  "DynamicLocation",
+	  "DynamicModule",
+	  "DynamicModuleBox",
+	  "DynamicModuleBoxOptions",
+	  "DynamicModuleParent",
+	  "DynamicModuleValues",
+	  "DynamicName",
+	  "DynamicNamespace",
+	  "DynamicReference",
+	  "DynamicSetting",
+	  "DynamicUpdating",
+	  "DynamicWrapper",
+	  "DynamicWrapperBox",
+	  "DynamicWrapperBoxOptions",
+	  "E",
+	  "EarthImpactData",
+	  "EarthquakeData",
+	  "EccentricityCentrality",
+	  "Echo",
+	  "EchoEvaluation",
+	  "EchoFunction",
+	  "EchoLabel",
+	  "EchoTiming",
+	  "EclipseType",
+	  "EdgeAdd",
+	  "EdgeBetweennessCentrality",
+	  "EdgeCapacity",
+	  "EdgeCapForm",
+	  "EdgeChromaticNumber",
+	  "EdgeColor",
+	  "EdgeConnectivity",
+	  "EdgeContract",
+	  "EdgeCost",
+	  "EdgeCount",
+	  "EdgeCoverQ",
+	  "EdgeCycleMatrix",
+	  "EdgeDashing",
+	  "EdgeDelete",
+	  "EdgeDetect",
+	  "EdgeForm",
+	  "EdgeIndex",
+	  "EdgeJoinForm",
+	  "EdgeLabeling",
+	  "EdgeLabels",
+	  "EdgeLabelStyle",
+	  "EdgeList",
+	  "EdgeOpacity",
+	  "EdgeQ",
+	  "EdgeRenderingFunction",
+	  "EdgeRules",
+	  "EdgeShapeFunction",
+	  "EdgeStyle",
+	  "EdgeTaggedGraph",
+	  "EdgeTaggedGraphQ",
+	  "EdgeTags",
+	  "EdgeThickness",
+	  "EdgeTransitiveGraphQ",
+	  "EdgeValueRange",
+	  "EdgeValueSizes",
+	  "EdgeWeight",
+	  "EdgeWeightedGraphQ",
+	  "Editable",
+	  "EditButtonSettings",
+	  "EditCellTagsSettings",
+	  "EditDistance",
+	  "EffectiveInterest",
+	  "Eigensystem",
+	  "Eigenvalues",
+	  "EigenvectorCentrality",
+	  "Eigenvectors",
+	  "Element",
+	  "ElementData",
+	  "ElementwiseLayer",
+	  "ElidedForms",
+	  "Eliminate",
+	  "EliminationOrder",
+	  "Ellipsoid",
+	  "EllipticE",
+	  "EllipticExp",
+	  "EllipticExpPrime",
+	  "EllipticF",
+	  "EllipticFilterModel",
+	  "EllipticK",
+	  "EllipticLog",
+	  "EllipticNomeQ",
+	  "EllipticPi",
+	  "EllipticReducedHalfPeriods",
+	  "EllipticTheta",
+	  "EllipticThetaPrime",
+	  "EmbedCode",
+	  "EmbeddedHTML",
+	  "EmbeddedService",
+	  "EmbeddedSQLEntityClass",
+	  "EmbeddedSQLExpression",
+	  "EmbeddingLayer",
+	  "EmbeddingObject",
+	  "EmitSound",
+	  "EmphasizeSyntaxErrors",
+	  "EmpiricalDistribution",
+	  "Empty",
+	  "EmptyGraphQ",
+	  "EmptyRegion",
+	  "EmptySpaceF",
+	  "EnableConsolePrintPacket",
+	  "Enabled",
+	  "Enclose",
+	  "Encode",
+	  "Encrypt",
+	  "EncryptedObject",
+	  "EncryptFile",
+	  "End",
+	  "EndAdd",
+	  "EndDialogPacket",
+	  "EndOfBuffer",
+	  "EndOfFile",
+	  "EndOfLine",
+	  "EndOfString",
+	  "EndPackage",
+	  "EngineEnvironment",
+	  "EngineeringForm",
+	  "Enter",
+	  "EnterExpressionPacket",
+	  "EnterTextPacket",
+	  "Entity",
+	  "EntityClass",
+	  "EntityClassList",
+	  "EntityCopies",
+	  "EntityFunction",
+	  "EntityGroup",
+	  "EntityInstance",
+	  "EntityList",
+	  "EntityPrefetch",
+	  "EntityProperties",
+	  "EntityProperty",
+	  "EntityPropertyClass",
+	  "EntityRegister",
+	  "EntityStore",
+	  "EntityStores",
+	  "EntityTypeName",
+	  "EntityUnregister",
+	  "EntityValue",
+	  "Entropy",
+	  "EntropyFilter",
+	  "Environment",
+	  "Epilog",
+	  "EpilogFunction",
+	  "Equal",
+	  "EqualColumns",
+	  "EqualRows",
+	  "EqualTilde",
+	  "EqualTo",
+	  "EquatedTo",
+	  "Equilibrium",
+	  "EquirippleFilterKernel",
+	  "Equivalent",
+	  "Erf",
+	  "Erfc",
+	  "Erfi",
+	  "ErlangB",
+	  "ErlangC",
+	  "ErlangDistribution",
+	  "Erosion",
+	  "ErrorBox",
+	  "ErrorBoxOptions",
+	  "ErrorNorm",
+	  "ErrorPacket",
+	  "ErrorsDialogSettings",
+	  "EscapeRadius",
+	  "EstimatedBackground",
+	  "EstimatedDistribution",
+	  "EstimatedPointNormals",
+	  "EstimatedPointProcess",
+	  "EstimatedProcess",
+	  "EstimatedVariogramModel",
+	  "EstimatorGains",
+	  "EstimatorRegulator",
+	  "EuclideanDistance",
+	  "EulerAngles",
+	  "EulerCharacteristic",
+	  "EulerE",
+	  "EulerGamma",
+	  "EulerianGraphQ",
+	  "EulerMatrix",
+	  "EulerPhi",
+	  "Evaluatable",
+	  "Evaluate",
+	  "Evaluated",
+	  "EvaluatePacket",
+	  "EvaluateScheduledTask",
+	  "EvaluationBox",
+	  "EvaluationCell",
+	  "EvaluationCompletionAction",
+	  "EvaluationData",
+	  "EvaluationElements",
+	  "EvaluationEnvironment",
+	  "EvaluationMode",
+	  "EvaluationMonitor",
+	  "EvaluationNotebook",
+	  "EvaluationObject",
+	  "EvaluationOrder",
+	  "EvaluationPrivileges",
+	  "EvaluationRateLimit",
+	  "Evaluator",
+	  "EvaluatorNames",
+	  "EvenQ",
+	  "EventData",
+	  "EventEvaluator",
+	  "EventHandler",
+	  "EventHandlerTag",
+	  "EventLabels",
+	  "EventSeries",
+	  "ExactBlackmanWindow",
+	  "ExactNumberQ",
+	  "ExactRootIsolation",
+	  "ExampleData",
+	  "Except",
+	  "ExcludedContexts",
+	  "ExcludedForms",
+	  "ExcludedLines",
+	  "ExcludedPhysicalQuantities",
+	  "ExcludePods",
+	  "Exclusions",
+	  "ExclusionsStyle",
+	  "Exists",
+	  "Exit",
+	  "ExitDialog",
+	  "ExoplanetData",
+	  "Exp",
+	  "Expand",
+	  "ExpandAll",
+	  "ExpandDenominator",
+	  "ExpandFileName",
+	  "ExpandNumerator",
+	  "Expectation",
+	  "ExpectationE",
+	  "ExpectedValue",
+	  "ExpGammaDistribution",
+	  "ExpIntegralE",
+	  "ExpIntegralEi",
+	  "ExpirationDate",
+	  "Exponent",
+	  "ExponentFunction",
+	  "ExponentialDistribution",
+	  "ExponentialFamily",
+	  "ExponentialGeneratingFunction",
+	  "ExponentialMovingAverage",
+	  "ExponentialPowerDistribution",
+	  "ExponentPosition",
+	  "ExponentStep",
+	  "Export",
+	  "ExportAutoReplacements",
+	  "ExportByteArray",
+	  "ExportForm",
+	  "ExportPacket",
+	  "ExportString",
+	  "Expression",
+	  "ExpressionCell",
+	  "ExpressionGraph",
+	  "ExpressionPacket",
+	  "ExpressionTree",
+	  "ExpressionUUID",
+	  "ExpToTrig",
+	  "ExtendedEntityClass",
+	  "ExtendedGCD",
+	  "Extension",
+	  "ExtentElementFunction",
+	  "ExtentMarkers",
+	  "ExtentSize",
+	  "ExternalBundle",
+	  "ExternalCall",
+	  "ExternalDataCharacterEncoding",
+	  "ExternalEvaluate",
+	  "ExternalFunction",
+	  "ExternalFunctionName",
+	  "ExternalIdentifier",
+	  "ExternalObject",
+	  "ExternalOptions",
+	  "ExternalSessionObject",
+	  "ExternalSessions",
+	  "ExternalStorageBase",
+	  "ExternalStorageDownload",
+	  "ExternalStorageGet",
+	  "ExternalStorageObject",
+	  "ExternalStoragePut",
+	  "ExternalStorageUpload",
+	  "ExternalTypeSignature",
+	  "ExternalValue",
+	  "Extract",
+	  "ExtractArchive",
+	  "ExtractLayer",
+	  "ExtractPacletArchive",
+	  "ExtremeValueDistribution",
+	  "FaceAlign",
+	  "FaceForm",
+	  "FaceGrids",
+	  "FaceGridsStyle",
+	  "FaceRecognize",
+	  "FacialFeatures",
+	  "Factor",
+	  "FactorComplete",
+	  "Factorial",
+	  "Factorial2",
+	  "FactorialMoment",
+	  "FactorialMomentGeneratingFunction",
+	  "FactorialPower",
+	  "FactorInteger",
+	  "FactorList",
+	  "FactorSquareFree",
+	  "FactorSquareFreeList",
+	  "FactorTerms",
+	  "FactorTermsList",
+	  "Fail",
+	  "Failure",
+	  "FailureAction",
+	  "FailureDistribution",
+	  "FailureQ",
+	  "False",
+	  "FareySequence",
+	  "FARIMAProcess",
+	  "FeatureDistance",
+	  "FeatureExtract",
+	  "FeatureExtraction",
+	  "FeatureExtractor",
+	  "FeatureExtractorFunction",
+	  "FeatureImpactPlot",
+	  "FeatureNames",
+	  "FeatureNearest",
+	  "FeatureSpacePlot",
+	  "FeatureSpacePlot3D",
+	  "FeatureTypes",
+	  "FeatureValueDependencyPlot",
+	  "FeatureValueImpactPlot",
+	  "FEDisableConsolePrintPacket",
+	  "FeedbackLinearize",
+	  "FeedbackSector",
+	  "FeedbackSectorStyle",
+	  "FeedbackType",
+	  "FEEnableConsolePrintPacket",
+	  "FetalGrowthData",
+	  "Fibonacci",
+	  "Fibonorial",
+	  "FieldCompletionFunction",
+	  "FieldHint",
+	  "FieldHintStyle",
+	  "FieldMasked",
+	  "FieldSize",
+	  "File",
+	  "FileBaseName",
+	  "FileByteCount",
+	  "FileConvert",
+	  "FileDate",
+	  "FileExistsQ",
+	  "FileExtension",
+	  "FileFormat",
+	  "FileFormatProperties",
+	  "FileFormatQ",
+	  "FileHandler",
+	  "FileHash",
+	  "FileInformation",
+	  "FileName",
+	  "FileNameDepth",
+	  "FileNameDialogSettings",
+	  "FileNameDrop",
+	  "FileNameForms",
+	  "FileNameJoin",
+	  "FileNames",
+	  "FileNameSetter",
+	  "FileNameSplit",
+	  "FileNameTake",
+	  "FileNameToFormatList",
+	  "FilePrint",
+	  "FileSize",
+	  "FileSystemMap",
+	  "FileSystemScan",
+	  "FileSystemTree",
+	  "FileTemplate",
+	  "FileTemplateApply",
+	  "FileType",
+	  "FilledCurve",
+	  "FilledCurveBox",
+	  "FilledCurveBoxOptions",
+	  "FilledTorus",
+	  "FillForm",
+	  "Filling",
+	  "FillingStyle",
+	  "FillingTransform",
+	  "FilteredEntityClass",
+	  "FilterRules",
+	  "FinancialBond",
+	  "FinancialData",
+	  "FinancialDerivative",
+	  "FinancialIndicator",
+	  "Find",
+	  "FindAnomalies",
+	  "FindArgMax",
+	  "FindArgMin",
+	  "FindChannels",
+	  "FindClique",
+	  "FindClusters",
+	  "FindCookies",
+	  "FindCurvePath",
+	  "FindCycle",
+	  "FindDevices",
+	  "FindDistribution",
+	  "FindDistributionParameters",
+	  "FindDivisions",
+	  "FindEdgeColoring",
+	  "FindEdgeCover",
+	  "FindEdgeCut",
+	  "FindEdgeIndependentPaths",
+	  "FindEquationalProof",
+	  "FindEulerianCycle",
+	  "FindExternalEvaluators",
+	  "FindFaces",
+	  "FindFile",
+	  "FindFit",
+	  "FindFormula",
+	  "FindFundamentalCycles",
+	  "FindGeneratingFunction",
+	  "FindGeoLocation",
+	  "FindGeometricConjectures",
+	  "FindGeometricTransform",
+	  "FindGraphCommunities",
+	  "FindGraphIsomorphism",
+	  "FindGraphPartition",
+	  "FindHamiltonianCycle",
+	  "FindHamiltonianPath",
+	  "FindHiddenMarkovStates",
+	  "FindImageText",
+	  "FindIndependentEdgeSet",
+	  "FindIndependentVertexSet",
+	  "FindInstance",
+	  "FindIntegerNullVector",
+	  "FindIsomers",
+	  "FindIsomorphicSubgraph",
+	  "FindKClan",
+	  "FindKClique",
+	  "FindKClub",
+	  "FindKPlex",
+	  "FindLibrary",
+	  "FindLinearRecurrence",
+	  "FindList",
+	  "FindMatchingColor",
+	  "FindMaximum",
+	  "FindMaximumCut",
+	  "FindMaximumFlow",
+	  "FindMaxValue",
+	  "FindMeshDefects",
+	  "FindMinimum",
+	  "FindMinimumCostFlow",
+	  "FindMinimumCut",
+	  "FindMinValue",
+	  "FindMoleculeSubstructure",
+	  "FindPath",
+	  "FindPeaks",
+	  "FindPermutation",
+	  "FindPlanarColoring",
+	  "FindPointProcessParameters",
+	  "FindPostmanTour",
+	  "FindProcessParameters",
+	  "FindRegionTransform",
+	  "FindRepeat",
+	  "FindRoot",
+	  "FindSequenceFunction",
+	  "FindSettings",
+	  "FindShortestPath",
+	  "FindShortestTour",
+	  "FindSpanningTree",
+	  "FindSubgraphIsomorphism",
+	  "FindSystemModelEquilibrium",
+	  "FindTextualAnswer",
+	  "FindThreshold",
+	  "FindTransientRepeat",
+	  "FindVertexColoring",
+	  "FindVertexCover",
+	  "FindVertexCut",
+	  "FindVertexIndependentPaths",
+	  "Fine",
+	  "FinishDynamic",
+	  "FiniteAbelianGroupCount",
+	  "FiniteGroupCount",
+	  "FiniteGroupData",
+	  "First",
+	  "FirstCase",
+	  "FirstPassageTimeDistribution",
+	  "FirstPosition",
+	  "FischerGroupFi22",
+	  "FischerGroupFi23",
+	  "FischerGroupFi24Prime",
+	  "FisherHypergeometricDistribution",
+	  "FisherRatioTest",
+	  "FisherZDistribution",
+	  "Fit",
+	  "FitAll",
+	  "FitRegularization",
+	  "FittedModel",
+	  "FixedOrder",
+	  "FixedPoint",
+	  "FixedPointList",
+	  "FlashSelection",
+	  "Flat",
+	  "FlatShading",
+	  "Flatten",
+	  "FlattenAt",
+	  "FlattenLayer",
+	  "FlatTopWindow",
+	  "FlightData",
+	  "FlipView",
+	  "Floor",
+	  "FlowPolynomial",
+	  "Fold",
+	  "FoldList",
+	  "FoldPair",
+	  "FoldPairList",
+	  "FoldWhile",
+	  "FoldWhileList",
+	  "FollowRedirects",
+	  "Font",
+	  "FontColor",
+	  "FontFamily",
+	  "FontForm",
+	  "FontName",
+	  "FontOpacity",
+	  "FontPostScriptName",
+	  "FontProperties",
+	  "FontReencoding",
+	  "FontSize",
+	  "FontSlant",
+	  "FontSubstitutions",
+	  "FontTracking",
+	  "FontVariations",
+	  "FontWeight",
+	  "For",
+	  "ForAll",
+	  "ForAllType",
+	  "ForceVersionInstall",
+	  "Format",
+	  "FormatRules",
+	  "FormatType",
+	  "FormatTypeAutoConvert",
+	  "FormatValues",
+	  "FormBox",
+	  "FormBoxOptions",
+	  "FormControl",
+	  "FormFunction",
+	  "FormLayoutFunction",
+	  "FormObject",
+	  "FormPage",
+	  "FormProtectionMethod",
+	  "FormTheme",
+	  "FormulaData",
+	  "FormulaLookup",
+	  "FortranForm",
+	  "Forward",
+	  "ForwardBackward",
+	  "ForwardCloudCredentials",
+	  "Fourier",
+	  "FourierCoefficient",
+	  "FourierCosCoefficient",
+	  "FourierCosSeries",
+	  "FourierCosTransform",
+	  "FourierDCT",
+	  "FourierDCTFilter",
+	  "FourierDCTMatrix",
+	  "FourierDST",
+	  "FourierDSTMatrix",
+	  "FourierMatrix",
+	  "FourierParameters",
+	  "FourierSequenceTransform",
+	  "FourierSeries",
+	  "FourierSinCoefficient",
+	  "FourierSinSeries",
+	  "FourierSinTransform",
+	  "FourierTransform",
+	  "FourierTrigSeries",
+	  "FoxH",
+	  "FoxHReduce",
+	  "FractionalBrownianMotionProcess",
+	  "FractionalD",
+	  "FractionalGaussianNoiseProcess",
+	  "FractionalPart",
+	  "FractionBox",
+	  "FractionBoxOptions",
+	  "FractionLine",
+	  "Frame",
+	  "FrameBox",
+	  "FrameBoxOptions",
+	  "Framed",
+	  "FrameInset",
+	  "FrameLabel",
+	  "Frameless",
+	  "FrameListVideo",
+	  "FrameMargins",
+	  "FrameRate",
+	  "FrameStyle",
+	  "FrameTicks",
+	  "FrameTicksStyle",
+	  "FRatioDistribution",
+	  "FrechetDistribution",
+	  "FreeQ",
+	  "FrenetSerretSystem",
+	  "FrequencySamplingFilterKernel",
+	  "FresnelC",
+	  "FresnelF",
+	  "FresnelG",
+	  "FresnelS",
+	  "Friday",
+	  "FrobeniusNumber",
+	  "FrobeniusSolve",
+	  "FromAbsoluteTime",
+	  "FromCharacterCode",
+	  "FromCoefficientRules",
+	  "FromContinuedFraction",
+	  "FromDate",
+	  "FromDateString",
+	  "FromDigits",
+	  "FromDMS",
+	  "FromEntity",
+	  "FromJulianDate",
+	  "FromLetterNumber",
+	  "FromPolarCoordinates",
+	  "FromRawPointer",
+	  "FromRomanNumeral",
+	  "FromSphericalCoordinates",
+	  "FromUnixTime",
+	  "Front",
+	  "FrontEndDynamicExpression",
+	  "FrontEndEventActions",
+	  "FrontEndExecute",
+	  "FrontEndObject",
+	  "FrontEndResource",
+	  "FrontEndResourceString",
+	  "FrontEndStackSize",
+	  "FrontEndToken",
+	  "FrontEndTokenExecute",
+	  "FrontEndValueCache",
+	  "FrontEndVersion",
+	  "FrontFaceColor",
+	  "FrontFaceGlowColor",
+	  "FrontFaceOpacity",
+	  "FrontFaceSpecularColor",
+	  "FrontFaceSpecularExponent",
+	  "FrontFaceSurfaceAppearance",
+	  "FrontFaceTexture",
+	  "Full",
+	  "FullAxes",
+	  "FullDefinition",
+	  "FullForm",
+	  "FullGraphics",
+	  "FullInformationOutputRegulator",
+	  "FullOptions",
+	  "FullRegion",
+	  "FullSimplify",
+	  "Function",
+	  "FunctionAnalytic",
+	  "FunctionBijective",
+	  "FunctionCompile",
+	  "FunctionCompileExport",
+	  "FunctionCompileExportByteArray",
+	  "FunctionCompileExportLibrary",
+	  "FunctionCompileExportString",
+	  "FunctionContinuous",
+	  "FunctionConvexity",
+	  "FunctionDeclaration",
+	  "FunctionDiscontinuities",
+	  "FunctionDomain",
+	  "FunctionExpand",
+	  "FunctionInjective",
+	  "FunctionInterpolation",
+	  "FunctionLayer",
+	  "FunctionMeromorphic",
+	  "FunctionMonotonicity",
+	  "FunctionPeriod",
+	  "FunctionPoles",
+	  "FunctionRange",
+	  "FunctionSign",
+	  "FunctionSingularities",
+	  "FunctionSpace",
+	  "FunctionSurjective",
+	  "FussellVeselyImportance",
+	  "GaborFilter",
+	  "GaborMatrix",
+	  "GaborWavelet",
+	  "GainMargins",
+	  "GainPhaseMargins",
+	  "GalaxyData",
+	  "GalleryView",
+	  "Gamma",
+	  "GammaDistribution",
+	  "GammaRegularized",
+	  "GapPenalty",
+	  "GARCHProcess",
+	  "GatedRecurrentLayer",
+	  "Gather",
+	  "GatherBy",
+	  "GaugeFaceElementFunction",
+	  "GaugeFaceStyle",
+	  "GaugeFrameElementFunction",
+	  "GaugeFrameSize",
+	  "GaugeFrameStyle",
+	  "GaugeLabels",
+	  "GaugeMarkers",
+	  "GaugeStyle",
+	  "GaussianFilter",
+	  "GaussianIntegers",
+	  "GaussianMatrix",
+	  "GaussianOrthogonalMatrixDistribution",
+	  "GaussianSymplecticMatrixDistribution",
+	  "GaussianUnitaryMatrixDistribution",
+	  "GaussianWindow",
+	  "GCD",
+	  "GegenbauerC",
+	  "General",
+	  "GeneralizedLinearModelFit",
+	  "GenerateAsymmetricKeyPair",
+	  "GenerateConditions",
+	  "GeneratedAssetFormat",
+	  "GeneratedAssetLocation",
+	  "GeneratedCell",
+	  "GeneratedCellStyles",
+	  "GeneratedDocumentBinding",
+	  "GenerateDerivedKey",
+	  "GenerateDigitalSignature",
+	  "GenerateDocument",
+	  "GeneratedParameters",
+	  "GeneratedQuantityMagnitudes",
+	  "GenerateFileSignature",
+	  "GenerateHTTPResponse",
+	  "GenerateSecuredAuthenticationKey",
+	  "GenerateSymmetricKey",
+	  "GeneratingFunction",
+	  "GeneratorDescription",
+	  "GeneratorHistoryLength",
+	  "GeneratorOutputType",
+	  "Generic",
+	  "GenericCylindricalDecomposition",
+	  "GenomeData",
+	  "GenomeLookup",
+	  "GeoAntipode",
+	  "GeoArea",
+	  "GeoArraySize",
+	  "GeoBackground",
+	  "GeoBoundary",
+	  "GeoBoundingBox",
+	  "GeoBounds",
+	  "GeoBoundsRegion",
+	  "GeoBoundsRegionBoundary",
+	  "GeoBubbleChart",
+	  "GeoCenter",
+	  "GeoCircle",
+	  "GeoContourPlot",
+	  "GeoDensityPlot",
+	  "GeodesicClosing",
+	  "GeodesicDilation",
+	  "GeodesicErosion",
+	  "GeodesicOpening",
+	  "GeodesicPolyhedron",
+	  "GeoDestination",
+	  "GeodesyData",
+	  "GeoDirection",
+	  "GeoDisk",
+	  "GeoDisplacement",
+	  "GeoDistance",
+	  "GeoDistanceList",
+	  "GeoElevationData",
+	  "GeoEntities",
+	  "GeoGraphics",
+	  "GeoGraphPlot",
+	  "GeoGraphValuePlot",
+	  "GeogravityModelData",
+	  "GeoGridDirectionDifference",
+	  "GeoGridLines",
+	  "GeoGridLinesStyle",
+	  "GeoGridPosition",
+	  "GeoGridRange",
+	  "GeoGridRangePadding",
+	  "GeoGridUnitArea",
+	  "GeoGridUnitDistance",
+	  "GeoGridVector",
+	  "GeoGroup",
+	  "GeoHemisphere",
+	  "GeoHemisphereBoundary",
+	  "GeoHistogram",
+	  "GeoIdentify",
+	  "GeoImage",
+	  "GeoLabels",
+	  "GeoLength",
+	  "GeoListPlot",
+	  "GeoLocation",
+	  "GeologicalPeriodData",
+	  "GeomagneticModelData",
+	  "GeoMarker",
+	  "GeometricAssertion",
+	  "GeometricBrownianMotionProcess",
+	  "GeometricDistribution",
+	  "GeometricMean",
+	  "GeometricMeanFilter",
+	  "GeometricOptimization",
+	  "GeometricScene",
+	  "GeometricStep",
+	  "GeometricStylingRules",
+	  "GeometricTest",
+	  "GeometricTransformation",
+	  "GeometricTransformation3DBox",
+	  "GeometricTransformation3DBoxOptions",
+	  "GeometricTransformationBox",
+	  "GeometricTransformationBoxOptions",
+	  "GeoModel",
+	  "GeoNearest",
+	  "GeoOrientationData",
+	  "GeoPath",
+	  "GeoPolygon",
+	  "GeoPosition",
+	  "GeoPositionENU",
+	  "GeoPositionXYZ",
+	  "GeoProjection",
+	  "GeoProjectionData",
+	  "GeoRange",
+	  "GeoRangePadding",
+	  "GeoRegionValuePlot",
+	  "GeoResolution",
+	  "GeoScaleBar",
+	  "GeoServer",
+	  "GeoSmoothHistogram",
+	  "GeoStreamPlot",
+	  "GeoStyling",
+	  "GeoStylingImageFunction",
+	  "GeoVariant",
+	  "GeoVector",
+	  "GeoVectorENU",
+	  "GeoVectorPlot",
+	  "GeoVectorXYZ",
+	  "GeoVisibleRegion",
+	  "GeoVisibleRegionBoundary",
+	  "GeoWithinQ",
+	  "GeoZoomLevel",
+	  "GestureHandler",
+	  "GestureHandlerTag",
+	  "Get",
+	  "GetContext",
+	  "GetEnvironment",
+	  "GetFileName",
+	  "GetLinebreakInformationPacket",
+	  "GibbsPointProcess",
+	  "Glaisher",
+	  "GlobalClusteringCoefficient",
+	  "GlobalPreferences",
+	  "GlobalSession",
+	  "Glow",
+	  "GoldenAngle",
+	  "GoldenRatio",
+	  "GompertzMakehamDistribution",
+	  "GoochShading",
+	  "GoodmanKruskalGamma",
+	  "GoodmanKruskalGammaTest",
+	  "Goto",
+	  "GouraudShading",
+	  "Grad",
+	  "Gradient",
+	  "GradientFilter",
+	  "GradientFittedMesh",
+	  "GradientOrientationFilter",
+	  "GrammarApply",
+	  "GrammarRules",
+	  "GrammarToken",
+	  "Graph",
+	  "Graph3D",
+	  "GraphAssortativity",
+	  "GraphAutomorphismGroup",
+	  "GraphCenter",
+	  "GraphComplement",
+	  "GraphData",
+	  "GraphDensity",
+	  "GraphDiameter",
+	  "GraphDifference",
+	  "GraphDisjointUnion",
+	  "GraphDistance",
+	  "GraphDistanceMatrix",
+	  "GraphEmbedding",
+	  "GraphHighlight",
+	  "GraphHighlightStyle",
+	  "GraphHub",
+	  "Graphics",
+	  "Graphics3D",
+	  "Graphics3DBox",
+	  "Graphics3DBoxOptions",
+	  "GraphicsArray",
+	  "GraphicsBaseline",
+	  "GraphicsBox",
+	  "GraphicsBoxOptions",
+	  "GraphicsColor",
+	  "GraphicsColumn",
+	  "GraphicsComplex",
+	  "GraphicsComplex3DBox",
+	  "GraphicsComplex3DBoxOptions",
+	  "GraphicsComplexBox",
+	  "GraphicsComplexBoxOptions",
+	  "GraphicsContents",
+	  "GraphicsData",
+	  "GraphicsGrid",
+	  "GraphicsGridBox",
+	  "GraphicsGroup",
+	  "GraphicsGroup3DBox",
+	  "GraphicsGroup3DBoxOptions",
+	  "GraphicsGroupBox",
+	  "GraphicsGroupBoxOptions",
+	  "GraphicsGrouping",
+	  "GraphicsHighlightColor",
+	  "GraphicsRow",
+	  "GraphicsSpacing",
+	  "GraphicsStyle",
+	  "GraphIntersection",
+	  "GraphJoin",
+	  "GraphLayerLabels",
+	  "GraphLayers",
+	  "GraphLayerStyle",
+	  "GraphLayout",
+	  "GraphLinkEfficiency",
+	  "GraphPeriphery",
+	  "GraphPlot",
+	  "GraphPlot3D",
+	  "GraphPower",
+	  "GraphProduct",
+	  "GraphPropertyDistribution",
+	  "GraphQ",
+	  "GraphRadius",
+	  "GraphReciprocity",
+	  "GraphRoot",
+	  "GraphStyle",
+	  "GraphSum",
+	  "GraphTree",
+	  "GraphUnion",
+	  "Gray",
+	  "GrayLevel",
+	  "Greater",
+	  "GreaterEqual",
+	  "GreaterEqualLess",
+	  "GreaterEqualThan",
+	  "GreaterFullEqual",
+	  "GreaterGreater",
+	  "GreaterLess",
+	  "GreaterSlantEqual",
+	  "GreaterThan",
+	  "GreaterTilde",
+	  "GreekStyle",
+	  "Green",
+	  "GreenFunction",
+	  "Grid",
+	  "GridBaseline",
+	  "GridBox",
+	  "GridBoxAlignment",
+	  "GridBoxBackground",
+	  "GridBoxDividers",
+	  "GridBoxFrame",
+	  "GridBoxItemSize",
+	  "GridBoxItemStyle",
+	  "GridBoxOptions",
+	  "GridBoxSpacings",
+	  "GridCreationSettings",
+	  "GridDefaultElement",
+	  "GridElementStyleOptions",
+	  "GridFrame",
+	  "GridFrameMargins",
+	  "GridGraph",
+	  "GridLines",
+	  "GridLinesStyle",
+	  "GridVideo",
+	  "GroebnerBasis",
+	  "GroupActionBase",
+	  "GroupBy",
+	  "GroupCentralizer",
+	  "GroupElementFromWord",
+	  "GroupElementPosition",
+	  "GroupElementQ",
+	  "GroupElements",
+	  "GroupElementToWord",
+	  "GroupGenerators",
+	  "Groupings",
+	  "GroupMultiplicationTable",
+	  "GroupOpenerColor",
+	  "GroupOpenerInsideFrame",
+	  "GroupOrbits",
+	  "GroupOrder",
+	  "GroupPageBreakWithin",
+	  "GroupSetwiseStabilizer",
+	  "GroupStabilizer",
+	  "GroupStabilizerChain",
+	  "GroupTogetherGrouping",
+	  "GroupTogetherNestedGrouping",
+	  "GrowCutComponents",
+	  "Gudermannian",
+	  "GuidedFilter",
+	  "GumbelDistribution",
+	  "HaarWavelet",
+	  "HadamardMatrix",
+	  "HalfLine",
+	  "HalfNormalDistribution",
+	  "HalfPlane",
+	  "HalfSpace",
+	  "HalftoneShading",
+	  "HamiltonianGraphQ",
+	  "HammingDistance",
+	  "HammingWindow",
+	  "HandlerFunctions",
+	  "HandlerFunctionsKeys",
+	  "HankelH1",
+	  "HankelH2",
+	  "HankelMatrix",
+	  "HankelTransform",
+	  "HannPoissonWindow",
+	  "HannWindow",
+	  "HaradaNortonGroupHN",
+	  "HararyGraph",
+	  "HardcorePointProcess",
+	  "HarmonicMean",
+	  "HarmonicMeanFilter",
+	  "HarmonicNumber",
+	  "Hash",
+	  "HatchFilling",
+	  "HatchShading",
+	  "Haversine",
+	  "HazardFunction",
+	  "Head",
+	  "HeadCompose",
+	  "HeaderAlignment",
+	  "HeaderBackground",
+	  "HeaderDisplayFunction",
+	  "HeaderLines",
+	  "Headers",
+	  "HeaderSize",
+	  "HeaderStyle",
+	  "Heads",
+	  "HeatFluxValue",
+	  "HeatInsulationValue",
+	  "HeatOutflowValue",
+	  "HeatRadiationValue",
+	  "HeatSymmetryValue",
+	  "HeatTemperatureCondition",
+	  "HeatTransferPDEComponent",
+	  "HeatTransferValue",
+	  "HeavisideLambda",
+	  "HeavisidePi",
+	  "HeavisideTheta",
+	  "HeldGroupHe",
+	  "HeldPart",
+	  "HelmholtzPDEComponent",
+	  "HelpBrowserLookup",
+	  "HelpBrowserNotebook",
+	  "HelpBrowserSettings",
+	  "HelpViewerSettings",
+	  "Here",
+	  "HermiteDecomposition",
+	  "HermiteH",
+	  "Hermitian",
+	  "HermitianMatrixQ",
+	  "HessenbergDecomposition",
+	  "Hessian",
+	  "HeunB",
+	  "HeunBPrime",
+	  "HeunC",
+	  "HeunCPrime",
+	  "HeunD",
+	  "HeunDPrime",
+	  "HeunG",
+	  "HeunGPrime",
+	  "HeunT",
+	  "HeunTPrime",
+	  "HexadecimalCharacter",
+	  "Hexahedron",
+	  "HexahedronBox",
+	  "HexahedronBoxOptions",
+	  "HiddenItems",
+	  "HiddenMarkovProcess",
+	  "HiddenSurface",
+	  "Highlighted",
+	  "HighlightGraph",
+	  "HighlightImage",
+	  "HighlightMesh",
+	  "HighlightString",
+	  "HighpassFilter",
+	  "HigmanSimsGroupHS",
+	  "HilbertCurve",
+	  "HilbertFilter",
+	  "HilbertMatrix",
+	  "Histogram",
+	  "Histogram3D",
+	  "HistogramDistribution",
+	  "HistogramList",
+	  "HistogramPointDensity",
+	  "HistogramTransform",
+	  "HistogramTransformInterpolation",
+	  "HistoricalPeriodData",
+	  "HitMissTransform",
+	  "HITSCentrality",
+	  "HjorthDistribution",
+	  "HodgeDual",
+	  "HoeffdingD",
+	  "HoeffdingDTest",
+	  "Hold",
+	  "HoldAll",
+	  "HoldAllComplete",
+	  "HoldComplete",
+	  "HoldFirst",
+	  "HoldForm",
+	  "HoldPattern",
+	  "HoldRest",
+	  "HolidayCalendar",
+	  "HomeDirectory",
+	  "HomePage",
+	  "Horizontal",
+	  "HorizontalForm",
+	  "HorizontalGauge",
+	  "HorizontalScrollPosition",
+	  "HornerForm",
+	  "HostLookup",
+	  "HotellingTSquareDistribution",
+	  "HoytDistribution",
+	  "HTMLSave",
+	  "HTTPErrorResponse",
+	  "HTTPRedirect",
+	  "HTTPRequest",
+	  "HTTPRequestData",
+	  "HTTPResponse",
+	  "Hue",
+	  "HumanGrowthData",
+	  "HumpDownHump",
+	  "HumpEqual",
+	  "HurwitzLerchPhi",
+	  "HurwitzZeta",
+	  "HyperbolicDistribution",
+	  "HypercubeGraph",
+	  "HyperexponentialDistribution",
+	  "Hyperfactorial",
+	  "Hypergeometric0F1",
+	  "Hypergeometric0F1Regularized",
+	  "Hypergeometric1F1",
+	  "Hypergeometric1F1Regularized",
+	  "Hypergeometric2F1",
+	  "Hypergeometric2F1Regularized",
+	  "HypergeometricDistribution",
+	  "HypergeometricPFQ",
+	  "HypergeometricPFQRegularized",
+	  "HypergeometricU",
+	  "Hyperlink",
+	  "HyperlinkAction",
+	  "HyperlinkCreationSettings",
+	  "Hyperplane",
+	  "Hyphenation",
+	  "HyphenationOptions",
+	  "HypoexponentialDistribution",
+	  "HypothesisTestData",
+	  "I",
+	  "IconData",
+	  "Iconize",
+	  "IconizedObject",
+	  "IconRules",
+	  "Icosahedron",
+	  "Identity",
+	  "IdentityMatrix",
+	  "If",
+	  "IfCompiled",
+	  "IgnoreCase",
+	  "IgnoreDiacritics",
+	  "IgnoreIsotopes",
+	  "IgnorePunctuation",
+	  "IgnoreSpellCheck",
+	  "IgnoreStereochemistry",
+	  "IgnoringInactive",
+	  "Im",
+	  "Image",
+	  "Image3D",
+	  "Image3DProjection",
+	  "Image3DSlices",
+	  "ImageAccumulate",
+	  "ImageAdd",
+	  "ImageAdjust",
+	  "ImageAlign",
+	  "ImageApply",
+	  "ImageApplyIndexed",
+	  "ImageAspectRatio",
+	  "ImageAssemble",
+	  "ImageAugmentationLayer",
+	  "ImageBoundingBoxes",
+	  "ImageCache",
+	  "ImageCacheValid",
+	  "ImageCapture",
+	  "ImageCaptureFunction",
+	  "ImageCases",
+	  "ImageChannels",
+	  "ImageClip",
+	  "ImageCollage",
+	  "ImageColorSpace",
+	  "ImageCompose",
+	  "ImageContainsQ",
+	  "ImageContents",
+	  "ImageConvolve",
+	  "ImageCooccurrence",
+	  "ImageCorners",
+	  "ImageCorrelate",
+	  "ImageCorrespondingPoints",
+	  "ImageCrop",
+	  "ImageData",
+	  "ImageDeconvolve",
+	  "ImageDemosaic",
+	  "ImageDifference",
+	  "ImageDimensions",
+	  "ImageDisplacements",
+	  "ImageDistance",
+	  "ImageEditMode",
+	  "ImageEffect",
+	  "ImageExposureCombine",
+	  "ImageFeatureTrack",
+	  "ImageFileApply",
+	  "ImageFileFilter",
+	  "ImageFileScan",
+	  "ImageFilter",
+	  "ImageFocusCombine",
+	  "ImageForestingComponents",
+	  "ImageFormattingWidth",
+	  "ImageForwardTransformation",
+	  "ImageGraphics",
+	  "ImageHistogram",
+	  "ImageIdentify",
+	  "ImageInstanceQ",
+	  "ImageKeypoints",
+	  "ImageLabels",
+	  "ImageLegends",
+	  "ImageLevels",
+	  "ImageLines",
+	  "ImageMargins",
+	  "ImageMarker",
+	  "ImageMarkers",
+	  "ImageMeasurements",
+	  "ImageMesh",
+	  "ImageMultiply",
+	  "ImageOffset",
+	  "ImagePad",
+	  "ImagePadding",
+	  "ImagePartition",
+	  "ImagePeriodogram",
+	  "ImagePerspectiveTransformation",
+	  "ImagePosition",
+	  "ImagePreviewFunction",
+	  "ImagePyramid",
+	  "ImagePyramidApply",
+	  "ImageQ",
+	  "ImageRangeCache",
+	  "ImageRecolor",
+	  "ImageReflect",
+	  "ImageRegion",
+	  "ImageResize",
+	  "ImageResolution",
+	  "ImageRestyle",
+	  "ImageRotate",
+	  "ImageRotated",
+	  "ImageSaliencyFilter",
+	  "ImageScaled",
+	  "ImageScan",
+	  "ImageSize",
+	  "ImageSizeAction",
+	  "ImageSizeCache",
+	  "ImageSizeMultipliers",
+	  "ImageSizeRaw",
+	  "ImageStitch",
+	  "ImageSubtract",
+	  "ImageTake",
+	  "ImageTransformation",
+	  "ImageTrim",
+	  "ImageType",
+	  "ImageValue",
+	  "ImageValuePositions",
+	  "ImageVectorscopePlot",
+	  "ImageWaveformPlot",
+	  "ImagingDevice",
+	  "ImplicitD",
+	  "ImplicitRegion",
+	  "Implies",
+	  "Import",
+	  "ImportAutoReplacements",
+	  "ImportByteArray",
+	  "ImportedObject",
+	  "ImportOptions",
+	  "ImportString",
+	  "ImprovementImportance",
+	  "In",
+	  "Inactivate",
+	  "Inactive",
+	  "InactiveStyle",
+	  "IncidenceGraph",
+	  "IncidenceList",
+	  "IncidenceMatrix",
+	  "IncludeAromaticBonds",
+	  "IncludeConstantBasis",
+	  "IncludedContexts",
+	  "IncludeDefinitions",
+	  "IncludeDirectories",
+	  "IncludeFileExtension",
+	  "IncludeGeneratorTasks",
+	  "IncludeHydrogens",
+	  "IncludeInflections",
+	  "IncludeMetaInformation",
+	  "IncludePods",
+	  "IncludeQuantities",
+	  "IncludeRelatedTables",
+	  "IncludeSingularSolutions",
+	  "IncludeSingularTerm",
+	  "IncludeWindowTimes",
+	  "Increment",
+	  "IndefiniteMatrixQ",
+	  "Indent",
+	  "IndentingNewlineSpacings",
+	  "IndentMaxFraction",
+	  "IndependenceTest",
+	  "IndependentEdgeSetQ",
+	  "IndependentPhysicalQuantity",
+	  "IndependentUnit",
+	  "IndependentUnitDimension",
+	  "IndependentVertexSetQ",
+	  "Indeterminate",
+	  "IndeterminateThreshold",
+	  "IndexCreationOptions",
+	  "Indexed",
+	  "IndexEdgeTaggedGraph",
+	  "IndexGraph",
+	  "IndexTag",
+	  "Inequality",
+	  "InertEvaluate",
+	  "InertExpression",
+	  "InexactNumberQ",
+	  "InexactNumbers",
+	  "InfiniteFuture",
+	  "InfiniteLine",
+	  "InfiniteLineThrough",
+	  "InfinitePast",
+	  "InfinitePlane",
+	  "Infinity",
+	  "Infix",
+	  "InflationAdjust",
+	  "InflationMethod",
+	  "Information",
+	  "InformationData",
+	  "InformationDataGrid",
+	  "Inherited",
+	  "InheritScope",
+	  "InhomogeneousPoissonPointProcess",
+	  "InhomogeneousPoissonProcess",
+	  "InitialEvaluationHistory",
+	  "Initialization",
+	  "InitializationCell",
+	  "InitializationCellEvaluation",
+	  "InitializationCellWarning",
+	  "InitializationObject",
+	  "InitializationObjects",
+	  "InitializationValue",
+	  "Initialize",
+	  "InitialSeeding",
+	  "InlineCounterAssignments",
+	  "InlineCounterIncrements",
+	  "InlineRules",
+	  "Inner",
+	  "InnerPolygon",
+	  "InnerPolyhedron",
+	  "Inpaint",
+	  "Input",
+	  "InputAliases",
+	  "InputAssumptions",
+	  "InputAutoReplacements",
+	  "InputField",
+	  "InputFieldBox",
+	  "InputFieldBoxOptions",
+	  "InputForm",
+	  "InputGrouping",
+	  "InputNamePacket",
+	  "InputNotebook",
+	  "InputPacket",
+	  "InputPorts",
+	  "InputSettings",
+	  "InputStream",
+	  "InputString",
+	  "InputStringPacket",
+	  "InputToBoxFormPacket",
+	  "Insert",
+	  "InsertionFunction",
+	  "InsertionPointObject",
+	  "InsertLinebreaks",
+	  "InsertResults",
+	  "Inset",
+	  "Inset3DBox",
+	  "Inset3DBoxOptions",
+	  "InsetBox",
+	  "InsetBoxOptions",
+	  "Insphere",
+	  "Install",
+	  "InstallService",
+	  "InstanceNormalizationLayer",
+	  "InString",
+	  "Integer",
+	  "IntegerDigits",
+	  "IntegerExponent",
+	  "IntegerLength",
+	  "IntegerName",
+	  "IntegerPart",
+	  "IntegerPartitions",
+	  "IntegerQ",
+	  "IntegerReverse",
+	  "Integers",
+	  "IntegerString",
+	  "Integral",
+	  "Integrate",
+	  "IntegrateChangeVariables",
+	  "Interactive",
+	  "InteractiveTradingChart",
+	  "InterfaceSwitched",
+	  "Interlaced",
+	  "Interleaving",
+	  "InternallyBalancedDecomposition",
+	  "InterpolatingFunction",
+	  "InterpolatingPolynomial",
+	  "Interpolation",
+	  "InterpolationOrder",
+	  "InterpolationPoints",
+	  "InterpolationPrecision",
+	  "Interpretation",
+	  "InterpretationBox",
+	  "InterpretationBoxOptions",
+	  "InterpretationFunction",
+	  "Interpreter",
+	  "InterpretTemplate",
+	  "InterquartileRange",
+	  "Interrupt",
+	  "InterruptSettings",
+	  "IntersectedEntityClass",
+	  "IntersectingQ",
+	  "Intersection",
+	  "Interval",
+	  "IntervalIntersection",
+	  "IntervalMarkers",
+	  "IntervalMarkersStyle",
+	  "IntervalMemberQ",
+	  "IntervalSlider",
+	  "IntervalUnion",
+	  "Into",
+	  "Inverse",
+	  "InverseBetaRegularized",
+	  "InverseBilateralLaplaceTransform",
+	  "InverseBilateralZTransform",
+	  "InverseCDF",
+	  "InverseChiSquareDistribution",
+	  "InverseContinuousWaveletTransform",
+	  "InverseDistanceTransform",
+	  "InverseEllipticNomeQ",
+	  "InverseErf",
+	  "InverseErfc",
+	  "InverseFourier",
+	  "InverseFourierCosTransform",
+	  "InverseFourierSequenceTransform",
+	  "InverseFourierSinTransform",
+	  "InverseFourierTransform",
+	  "InverseFunction",
+	  "InverseFunctions",
+	  "InverseGammaDistribution",
+	  "InverseGammaRegularized",
+	  "InverseGaussianDistribution",
+	  "InverseGudermannian",
+	  "InverseHankelTransform",
+	  "InverseHaversine",
+	  "InverseImagePyramid",
+	  "InverseJacobiCD",
+	  "InverseJacobiCN",
+	  "InverseJacobiCS",
+	  "InverseJacobiDC",
+	  "InverseJacobiDN",
+	  "InverseJacobiDS",
+	  "InverseJacobiNC",
+	  "InverseJacobiND",
+	  "InverseJacobiNS",
+	  "InverseJacobiSC",
+	  "InverseJacobiSD",
+	  "InverseJacobiSN",
+	  "InverseLaplaceTransform",
+	  "InverseMellinTransform",
+	  "InversePermutation",
+	  "InverseRadon",
+	  "InverseRadonTransform",
+	  "InverseSeries",
+	  "InverseShortTimeFourier",
+	  "InverseSpectrogram",
+	  "InverseSurvivalFunction",
+	  "InverseTransformedRegion",
+	  "InverseWaveletTransform",
+	  "InverseWeierstrassP",
+	  "InverseWishartMatrixDistribution",
+	  "InverseZTransform",
+	  "Invisible",
+	  "InvisibleApplication",
+	  "InvisibleTimes",
+	  "IPAddress",
+	  "IrreduciblePolynomialQ",
+	  "IslandData",
+	  "IsolatingInterval",
+	  "IsomorphicGraphQ",
+	  "IsomorphicSubgraphQ",
+	  "IsotopeData",
+	  "Italic",
+	  "Item",
+	  "ItemAspectRatio",
+	  "ItemBox",
+	  "ItemBoxOptions",
+	  "ItemDisplayFunction",
+	  "ItemSize",
+	  "ItemStyle",
+	  "ItoProcess",
+	  "JaccardDissimilarity",
+	  "JacobiAmplitude",
+	  "Jacobian",
+	  "JacobiCD",
+	  "JacobiCN",
+	  "JacobiCS",
+	  "JacobiDC",
+	  "JacobiDN",
+	  "JacobiDS",
+	  "JacobiEpsilon",
+	  "JacobiNC",
+	  "JacobiND",
+	  "JacobiNS",
+	  "JacobiP",
+	  "JacobiSC",
+	  "JacobiSD",
+	  "JacobiSN",
+	  "JacobiSymbol",
+	  "JacobiZeta",
+	  "JacobiZN",
+	  "JankoGroupJ1",
+	  "JankoGroupJ2",
+	  "JankoGroupJ3",
+	  "JankoGroupJ4",
+	  "JarqueBeraALMTest",
+	  "JohnsonDistribution",
+	  "Join",
+	  "JoinAcross",
+	  "Joined",
+	  "JoinedCurve",
+	  "JoinedCurveBox",
+	  "JoinedCurveBoxOptions",
+	  "JoinForm",
+	  "JordanDecomposition",
+	  "JordanModelDecomposition",
+	  "JulianDate",
+	  "JuliaSetBoettcher",
+	  "JuliaSetIterationCount",
+	  "JuliaSetPlot",
+	  "JuliaSetPoints",
+	  "K",
+	  "KagiChart",
+	  "KaiserBesselWindow",
+	  "KaiserWindow",
+	  "KalmanEstimator",
+	  "KalmanFilter",
+	  "KarhunenLoeveDecomposition",
+	  "KaryTree",
+	  "KatzCentrality",
+	  "KCoreComponents",
+	  "KDistribution",
+	  "KEdgeConnectedComponents",
+	  "KEdgeConnectedGraphQ",
+	  "KeepExistingVersion",
+	  "KelvinBei",
+	  "KelvinBer",
+	  "KelvinKei",
+	  "KelvinKer",
+	  "KendallTau",
+	  "KendallTauTest",
+	  "KernelConfiguration",
+	  "KernelExecute",
+	  "KernelFunction",
+	  "KernelMixtureDistribution",
+	  "KernelObject",
+	  "Kernels",
+	  "Ket",
+	  "Key",
+	  "KeyCollisionFunction",
+	  "KeyComplement",
+	  "KeyDrop",
+	  "KeyDropFrom",
+	  "KeyExistsQ",
+	  "KeyFreeQ",
+	  "KeyIntersection",
+	  "KeyMap",
+	  "KeyMemberQ",
+	  "KeypointStrength",
+	  "Keys",
+	  "KeySelect",
+	  "KeySort",
+	  "KeySortBy",
+	  "KeyTake",
+	  "KeyUnion",
+	  "KeyValueMap",
+	  "KeyValuePattern",
+	  "Khinchin",
+	  "KillProcess",
+	  "KirchhoffGraph",
+	  "KirchhoffMatrix",
+	  "KleinInvariantJ",
+	  "KnapsackSolve",
+	  "KnightTourGraph",
+	  "KnotData",
+	  "KnownUnitQ",
+	  "KochCurve",
+	  "KolmogorovSmirnovTest",
+	  "KroneckerDelta",
+	  "KroneckerModelDecomposition",
+	  "KroneckerProduct",
+	  "KroneckerSymbol",
+	  "KuiperTest",
+	  "KumaraswamyDistribution",
+	  "Kurtosis",
+	  "KuwaharaFilter",
+	  "KVertexConnectedComponents",
+	  "KVertexConnectedGraphQ",
+	  "LABColor",
+	  "Label",
+	  "Labeled",
+	  "LabeledSlider",
+	  "LabelingFunction",
+	  "LabelingSize",
+	  "LabelStyle",
+	  "LabelVisibility",
+	  "LaguerreL",
+	  "LakeData",
+	  "LambdaComponents",
+	  "LambertW",
+	  "LameC",
+	  "LameCPrime",
+	  "LameEigenvalueA",
+	  "LameEigenvalueB",
+	  "LameS",
+	  "LameSPrime",
+	  "LaminaData",
+	  "LanczosWindow",
+	  "LandauDistribution",
+	  "Language",
+	  "LanguageCategory",
+	  "LanguageData",
+	  "LanguageIdentify",
+	  "LanguageOptions",
+	  "LaplaceDistribution",
+	  "LaplaceTransform",
+	  "Laplacian",
+	  "LaplacianFilter",
+	  "LaplacianGaussianFilter",
+	  "LaplacianPDETerm",
+	  "Large",
+	  "Larger",
+	  "Last",
+	  "Latitude",
+	  "LatitudeLongitude",
+	  "LatticeData",
+	  "LatticeReduce",
+	  "Launch",
+	  "LaunchKernels",
+	  "LayeredGraphPlot",
+	  "LayeredGraphPlot3D",
+	  "LayerSizeFunction",
+	  "LayoutInformation",
+	  "LCHColor",
+	  "LCM",
+	  "LeaderSize",
+	  "LeafCount",
+	  "LeapVariant",
+	  "LeapYearQ",
+	  "LearnDistribution",
+	  "LearnedDistribution",
+	  "LearningRate",
+	  "LearningRateMultipliers",
+	  "LeastSquares",
+	  "LeastSquaresFilterKernel",
+	  "Left",
+	  "LeftArrow",
+	  "LeftArrowBar",
+	  "LeftArrowRightArrow",
+	  "LeftDownTeeVector",
+	  "LeftDownVector",
+	  "LeftDownVectorBar",
+	  "LeftRightArrow",
+	  "LeftRightVector",
+	  "LeftTee",
+	  "LeftTeeArrow",
+	  "LeftTeeVector",
+	  "LeftTriangle",
+	  "LeftTriangleBar",
+	  "LeftTriangleEqual",
+	  "LeftUpDownVector",
+	  "LeftUpTeeVector",
+	  "LeftUpVector",
+	  "LeftUpVectorBar",
+	  "LeftVector",
+	  "LeftVectorBar",
+	  "LegendAppearance",
+	  "Legended",
+	  "LegendFunction",
+	  "LegendLabel",
+	  "LegendLayout",
+	  "LegendMargins",
+	  "LegendMarkers",
+	  "LegendMarkerSize",
+	  "LegendreP",
+	  "LegendreQ",
+	  "LegendreType",
+	  "Length",
+	  "LengthWhile",
+	  "LerchPhi",
+	  "Less",
+	  "LessEqual",
+	  "LessEqualGreater",
+	  "LessEqualThan",
+	  "LessFullEqual",
+	  "LessGreater",
+	  "LessLess",
+	  "LessSlantEqual",
+	  "LessThan",
+	  "LessTilde",
+	  "LetterCharacter",
+	  "LetterCounts",
+	  "LetterNumber",
+	  "LetterQ",
+	  "Level",
+	  "LeveneTest",
+	  "LeviCivitaTensor",
+	  "LevyDistribution",
+	  "Lexicographic",
+	  "LexicographicOrder",
+	  "LexicographicSort",
+	  "LibraryDataType",
+	  "LibraryFunction",
+	  "LibraryFunctionDeclaration",
+	  "LibraryFunctionError",
+	  "LibraryFunctionInformation",
+	  "LibraryFunctionLoad",
+	  "LibraryFunctionUnload",
+	  "LibraryLoad",
+	  "LibraryUnload",
+	  "LicenseEntitlementObject",
+	  "LicenseEntitlements",
+	  "LicenseID",
+	  "LicensingSettings",
+	  "LiftingFilterData",
+	  "LiftingWaveletTransform",
+	  "LightBlue",
+	  "LightBrown",
+	  "LightCyan",
+	  "Lighter",
+	  "LightGray",
+	  "LightGreen",
+	  "Lighting",
+	  "LightingAngle",
+	  "LightMagenta",
+	  "LightOrange",
+	  "LightPink",
+	  "LightPurple",
+	  "LightRed",
+	  "LightSources",
+	  "LightYellow",
+	  "Likelihood",
+	  "Limit",
+	  "LimitsPositioning",
+	  "LimitsPositioningTokens",
+	  "LindleyDistribution",
+	  "Line",
+	  "Line3DBox",
+	  "Line3DBoxOptions",
+	  "LinearFilter",
+	  "LinearFractionalOptimization",
+	  "LinearFractionalTransform",
+	  "LinearGradientFilling",
+	  "LinearGradientImage",
+	  "LinearizingTransformationData",
+	  "LinearLayer",
+	  "LinearModelFit",
+	  "LinearOffsetFunction",
+	  "LinearOptimization",
+	  "LinearProgramming",
+	  "LinearRecurrence",
+	  "LinearSolve",
+	  "LinearSolveFunction",
+	  "LineBox",
+	  "LineBoxOptions",
+	  "LineBreak",
+	  "LinebreakAdjustments",
+	  "LineBreakChart",
+	  "LinebreakSemicolonWeighting",
+	  "LineBreakWithin",
+	  "LineColor",
+	  "LineGraph",
+	  "LineIndent",
+	  "LineIndentMaxFraction",
+	  "LineIntegralConvolutionPlot",
+	  "LineIntegralConvolutionScale",
+	  "LineLegend",
+	  "LineOpacity",
+	  "LineSpacing",
+	  "LineWrapParts",
+	  "LinkActivate",
+	  "LinkClose",
+	  "LinkConnect",
+	  "LinkConnectedQ",
+	  "LinkCreate",
+	  "LinkError",
+	  "LinkFlush",
+	  "LinkFunction",
+	  "LinkHost",
+	  "LinkInterrupt",
+	  "LinkLaunch",
+	  "LinkMode",
+	  "LinkObject",
+	  "LinkOpen",
+	  "LinkOptions",
+	  "LinkPatterns",
+	  "LinkProtocol",
+	  "LinkRankCentrality",
+	  "LinkRead",
+	  "LinkReadHeld",
+	  "LinkReadyQ",
+	  "Links",
+	  "LinkService",
+	  "LinkWrite",
+	  "LinkWriteHeld",
+	  "LiouvilleLambda",
+	  "List",
+	  "Listable",
+	  "ListAnimate",
+	  "ListContourPlot",
+	  "ListContourPlot3D",
+	  "ListConvolve",
+	  "ListCorrelate",
+	  "ListCurvePathPlot",
+	  "ListDeconvolve",
+	  "ListDensityPlot",
+	  "ListDensityPlot3D",
+	  "Listen",
+	  "ListFormat",
+	  "ListFourierSequenceTransform",
+	  "ListInterpolation",
+	  "ListLineIntegralConvolutionPlot",
+	  "ListLinePlot",
+	  "ListLinePlot3D",
+	  "ListLogLinearPlot",
+	  "ListLogLogPlot",
+	  "ListLogPlot",
+	  "ListPicker",
+	  "ListPickerBox",
+	  "ListPickerBoxBackground",
+	  "ListPickerBoxOptions",
+	  "ListPlay",
+	  "ListPlot",
+	  "ListPlot3D",
+	  "ListPointPlot3D",
+	  "ListPolarPlot",
+	  "ListQ",
+	  "ListSliceContourPlot3D",
+	  "ListSliceDensityPlot3D",
+	  "ListSliceVectorPlot3D",
+	  "ListStepPlot",
+	  "ListStreamDensityPlot",
+	  "ListStreamPlot",
+	  "ListStreamPlot3D",
+	  "ListSurfacePlot3D",
+	  "ListVectorDensityPlot",
+	  "ListVectorDisplacementPlot",
+	  "ListVectorDisplacementPlot3D",
+	  "ListVectorPlot",
+	  "ListVectorPlot3D",
+	  "ListZTransform",
+	  "Literal",
+	  "LiteralSearch",
+	  "LiteralType",
+	  "LoadCompiledComponent",
+	  "LocalAdaptiveBinarize",
+	  "LocalCache",
+	  "LocalClusteringCoefficient",
+	  "LocalEvaluate",
+	  "LocalizeDefinitions",
+	  "LocalizeVariables",
+	  "LocalObject",
+	  "LocalObjects",
+	  "LocalResponseNormalizationLayer",
+	  "LocalSubmit",
+	  "LocalSymbol",
+	  "LocalTime",
+	  "LocalTimeZone",
+	  "LocationEquivalenceTest",
+	  "LocationTest",
+	  "Locator",
+	  "LocatorAutoCreate",
+	  "LocatorBox",
+	  "LocatorBoxOptions",
+	  "LocatorCentering",
+	  "LocatorPane",
+	  "LocatorPaneBox",
+	  "LocatorPaneBoxOptions",
+	  "LocatorRegion",
+	  "Locked",
+	  "Log",
+	  "Log10",
+	  "Log2",
+	  "LogBarnesG",
+	  "LogGamma",
+	  "LogGammaDistribution",
+	  "LogicalExpand",
+	  "LogIntegral",
+	  "LogisticDistribution",
+	  "LogisticSigmoid",
+	  "LogitModelFit",
+	  "LogLikelihood",
+	  "LogLinearPlot",
+	  "LogLogisticDistribution",
+	  "LogLogPlot",
+	  "LogMultinormalDistribution",
+	  "LogNormalDistribution",
+	  "LogPlot",
+	  "LogRankTest",
+	  "LogSeriesDistribution",
+	  "LongEqual",
+	  "Longest",
+	  "LongestCommonSequence",
+	  "LongestCommonSequencePositions",
+	  "LongestCommonSubsequence",
+	  "LongestCommonSubsequencePositions",
+	  "LongestMatch",
+	  "LongestOrderedSequence",
+	  "LongForm",
+	  "Longitude",
+	  "LongLeftArrow",
+	  "LongLeftRightArrow",
+	  "LongRightArrow",
+	  "LongShortTermMemoryLayer",
+	  "Lookup",
+	  "Loopback",
+	  "LoopFreeGraphQ",
+	  "Looping",
+	  "LossFunction",
+	  "LowerCaseQ",
+	  "LowerLeftArrow",
+	  "LowerRightArrow",
+	  "LowerTriangularize",
+	  "LowerTriangularMatrix",
+	  "LowerTriangularMatrixQ",
+	  "LowpassFilter",
+	  "LQEstimatorGains",
+	  "LQGRegulator",
+	  "LQOutputRegulatorGains",
+	  "LQRegulatorGains",
+	  "LUBackSubstitution",
+	  "LucasL",
+	  "LuccioSamiComponents",
+	  "LUDecomposition",
+	  "LunarEclipse",
+	  "LUVColor",
+	  "LyapunovSolve",
+	  "LyonsGroupLy",
+	  "MachineID",
+	  "MachineName",
+	  "MachineNumberQ",
+	  "MachinePrecision",
+	  "MacintoshSystemPageSetup",
+	  "Magenta",
+	  "Magnification",
+	  "Magnify",
+	  "MailAddressValidation",
+	  "MailExecute",
+	  "MailFolder",
+	  "MailItem",
+	  "MailReceiverFunction",
+	  "MailResponseFunction",
+	  "MailSearch",
+	  "MailServerConnect",
+	  "MailServerConnection",
+	  "MailSettings",
+	  "MainSolve",
+	  "MaintainDynamicCaches",
+	  "Majority",
+	  "MakeBoxes",
+	  "MakeExpression",
+	  "MakeRules",
+	  "ManagedLibraryExpressionID",
+	  "ManagedLibraryExpressionQ",
+	  "MandelbrotSetBoettcher",
+	  "MandelbrotSetDistance",
+	  "MandelbrotSetIterationCount",
+	  "MandelbrotSetMemberQ",
+	  "MandelbrotSetPlot",
+	  "MangoldtLambda",
+	  "ManhattanDistance",
+	  "Manipulate",
+	  "Manipulator",
+	  "MannedSpaceMissionData",
+	  "MannWhitneyTest",
+	  "MantissaExponent",
+	  "Manual",
+	  "Map",
+	  "MapAll",
+	  "MapApply",
+	  "MapAt",
+	  "MapIndexed",
+	  "MAProcess",
+	  "MapThread",
+	  "MarchenkoPasturDistribution",
+	  "MarcumQ",
+	  "MardiaCombinedTest",
+	  "MardiaKurtosisTest",
+	  "MardiaSkewnessTest",
+	  "MarginalDistribution",
+	  "MarkovProcessProperties",
+	  "Masking",
+	  "MassConcentrationCondition",
+	  "MassFluxValue",
+	  "MassImpermeableBoundaryValue",
+	  "MassOutflowValue",
+	  "MassSymmetryValue",
+	  "MassTransferValue",
+	  "MassTransportPDEComponent",
+	  "MatchingDissimilarity",
+	  "MatchLocalNameQ",
+	  "MatchLocalNames",
+	  "MatchQ",
+	  "Material",
+	  "MaterialShading",
+	  "MaternPointProcess",
+	  "MathematicalFunctionData",
+	  "MathematicaNotation",
+	  "MathieuC",
+	  "MathieuCharacteristicA",
+	  "MathieuCharacteristicB",
+	  "MathieuCharacteristicExponent",
+	  "MathieuCPrime",
+	  "MathieuGroupM11",
+	  "MathieuGroupM12",
+	  "MathieuGroupM22",
+	  "MathieuGroupM23",
+	  "MathieuGroupM24",
+	  "MathieuS",
+	  "MathieuSPrime",
+	  "MathMLForm",
+	  "MathMLText",
+	  "Matrices",
+	  "MatrixExp",
+	  "MatrixForm",
+	  "MatrixFunction",
+	  "MatrixLog",
+	  "MatrixNormalDistribution",
+	  "MatrixPlot",
+	  "MatrixPower",
+	  "MatrixPropertyDistribution",
+	  "MatrixQ",
+	  "MatrixRank",
+	  "MatrixTDistribution",
+	  "Max",
+	  "MaxBend",
+	  "MaxCellMeasure",
+	  "MaxColorDistance",
+	  "MaxDate",
+	  "MaxDetect",
+	  "MaxDisplayedChildren",
+	  "MaxDuration",
+	  "MaxExtraBandwidths",
+	  "MaxExtraConditions",
+	  "MaxFeatureDisplacement",
+	  "MaxFeatures",
+	  "MaxFilter",
+	  "MaximalBy",
+	  "Maximize",
+	  "MaxItems",
+	  "MaxIterations",
+	  "MaxLimit",
+	  "MaxMemoryUsed",
+	  "MaxMixtureKernels",
+	  "MaxOverlapFraction",
+	  "MaxPlotPoints",
+	  "MaxPoints",
+	  "MaxRecursion",
+	  "MaxStableDistribution",
+	  "MaxStepFraction",
+	  "MaxSteps",
+	  "MaxStepSize",
+	  "MaxTrainingRounds",
+	  "MaxValue",
+	  "MaxwellDistribution",
+	  "MaxWordGap",
+	  "McLaughlinGroupMcL",
+	  "Mean",
+	  "MeanAbsoluteLossLayer",
+	  "MeanAround",
+	  "MeanClusteringCoefficient",
+	  "MeanDegreeConnectivity",
+	  "MeanDeviation",
+	  "MeanFilter",
+	  "MeanGraphDistance",
+	  "MeanNeighborDegree",
+	  "MeanPointDensity",
+	  "MeanShift",
+	  "MeanShiftFilter",
+	  "MeanSquaredLossLayer",
+	  "Median",
+	  "MedianDeviation",
+	  "MedianFilter",
+	  "MedicalTestData",
+	  "Medium",
+	  "MeijerG",
+	  "MeijerGReduce",
+	  "MeixnerDistribution",
+	  "MellinConvolve",
+	  "MellinTransform",
+	  "MemberQ",
+	  "MemoryAvailable",
+	  "MemoryConstrained",
+	  "MemoryConstraint",
+	  "MemoryInUse",
+	  "MengerMesh",
+	  "Menu",
+	  "MenuAppearance",
+	  "MenuCommandKey",
+	  "MenuEvaluator",
+	  "MenuItem",
+	  "MenuList",
+	  "MenuPacket",
+	  "MenuSortingValue",
+	  "MenuStyle",
+	  "MenuView",
+	  "Merge",
+	  "MergeDifferences",
+	  "MergingFunction",
+	  "MersennePrimeExponent",
+	  "MersennePrimeExponentQ",
+	  "Mesh",
+	  "MeshCellCentroid",
+	  "MeshCellCount",
+	  "MeshCellHighlight",
+	  "MeshCellIndex",
+	  "MeshCellLabel",
+	  "MeshCellMarker",
+	  "MeshCellMeasure",
+	  "MeshCellQuality",
+	  "MeshCells",
+	  "MeshCellShapeFunction",
+	  "MeshCellStyle",
+	  "MeshConnectivityGraph",
+	  "MeshCoordinates",
+	  "MeshFunctions",
+	  "MeshPrimitives",
+	  "MeshQualityGoal",
+	  "MeshRange",
+	  "MeshRefinementFunction",
+	  "MeshRegion",
+	  "MeshRegionQ",
+	  "MeshShading",
+	  "MeshStyle",
+	  "Message",
+	  "MessageDialog",
+	  "MessageList",
+	  "MessageName",
+	  "MessageObject",
+	  "MessageOptions",
+	  "MessagePacket",
+	  "Messages",
+	  "MessagesNotebook",
+	  "MetaCharacters",
+	  "MetaInformation",
+	  "MeteorShowerData",
+	  "Method",
+	  "MethodOptions",
+	  "MexicanHatWavelet",
+	  "MeyerWavelet",
+	  "Midpoint",
+	  "MIMETypeToFormatList",
+	  "Min",
+	  "MinColorDistance",
+	  "MinDate",
+	  "MinDetect",
+	  "MineralData",
+	  "MinFilter",
+	  "MinimalBy",
+	  "MinimalPolynomial",
+	  "MinimalStateSpaceModel",
+	  "Minimize",
+	  "MinimumTimeIncrement",
+	  "MinIntervalSize",
+	  "MinkowskiQuestionMark",
+	  "MinLimit",
+	  "MinMax",
+	  "MinorPlanetData",
+	  "Minors",
+	  "MinPointSeparation",
+	  "MinRecursion",
+	  "MinSize",
+	  "MinStableDistribution",
+	  "Minus",
+	  "MinusPlus",
+	  "MinValue",
+	  "Missing",
+	  "MissingBehavior",
+	  "MissingDataMethod",
+	  "MissingDataRules",
+	  "MissingQ",
+	  "MissingString",
+	  "MissingStyle",
+	  "MissingValuePattern",
+	  "MissingValueSynthesis",
+	  "MittagLefflerE",
+	  "MixedFractionParts",
+	  "MixedGraphQ",
+	  "MixedMagnitude",
+	  "MixedRadix",
+	  "MixedRadixQuantity",
+	  "MixedUnit",
+	  "MixtureDistribution",
+	  "Mod",
+	  "Modal",
+	  "Mode",
+	  "ModelPredictiveController",
+	  "Modular",
+	  "ModularInverse",
+	  "ModularLambda",
+	  "Module",
+	  "Modulus",
+	  "MoebiusMu",
+	  "Molecule",
+	  "MoleculeAlign",
+	  "MoleculeContainsQ",
+	  "MoleculeDraw",
+	  "MoleculeEquivalentQ",
+	  "MoleculeFreeQ",
+	  "MoleculeGraph",
+	  "MoleculeMatchQ",
+	  "MoleculeMaximumCommonSubstructure",
+	  "MoleculeModify",
+	  "MoleculeName",
+	  "MoleculePattern",
+	  "MoleculePlot",
+	  "MoleculePlot3D",
+	  "MoleculeProperty",
+	  "MoleculeQ",
+	  "MoleculeRecognize",
+	  "MoleculeSubstructureCount",
+	  "MoleculeValue",
+	  "Moment",
+	  "MomentConvert",
+	  "MomentEvaluate",
+	  "MomentGeneratingFunction",
+	  "MomentOfInertia",
+	  "Monday",
+	  "Monitor",
+	  "MonomialList",
+	  "MonomialOrder",
+	  "MonsterGroupM",
+	  "MoonPhase",
+	  "MoonPosition",
+	  "MorletWavelet",
+	  "MorphologicalBinarize",
+	  "MorphologicalBranchPoints",
+	  "MorphologicalComponents",
+	  "MorphologicalEulerNumber",
+	  "MorphologicalGraph",
+	  "MorphologicalPerimeter",
+	  "MorphologicalTransform",
+	  "MortalityData",
+	  "Most",
+	  "MountainData",
+	  "MouseAnnotation",
+	  "MouseAppearance",
+	  "MouseAppearanceTag",
+	  "MouseButtons",
+	  "Mouseover",
+	  "MousePointerNote",
+	  "MousePosition",
+	  "MovieData",
+	  "MovingAverage",
+	  "MovingMap",
+	  "MovingMedian",
+	  "MoyalDistribution",
+	  "MultiaxisArrangement",
+	  "Multicolumn",
+	  "MultiedgeStyle",
+	  "MultigraphQ",
+	  "MultilaunchWarning",
+	  "MultiLetterItalics",
+	  "MultiLetterStyle",
+	  "MultilineFunction",
+	  "Multinomial",
+	  "MultinomialDistribution",
+	  "MultinormalDistribution",
+	  "MultiplicativeOrder",
+	  "Multiplicity",
+	  "MultiplySides",
+	  "MultiscriptBoxOptions",
+	  "Multiselection",
+	  "MultivariateHypergeometricDistribution",
+	  "MultivariatePoissonDistribution",
+	  "MultivariateTDistribution",
+	  "N",
+	  "NakagamiDistribution",
+	  "NameQ",
+	  "Names",
+	  "NamespaceBox",
+	  "NamespaceBoxOptions",
+	  "Nand",
+	  "NArgMax",
+	  "NArgMin",
+	  "NBernoulliB",
+	  "NBodySimulation",
+	  "NBodySimulationData",
+	  "NCache",
+	  "NCaputoD",
+	  "NDEigensystem",
+	  "NDEigenvalues",
+	  "NDSolve",
+	  "NDSolveValue",
+	  "Nearest",
+	  "NearestFunction",
+	  "NearestMeshCells",
+	  "NearestNeighborG",
+	  "NearestNeighborGraph",
+	  "NearestTo",
+	  "NebulaData",
+	  "NeedlemanWunschSimilarity",
+	  "Needs",
+	  "Negative",
+	  "NegativeBinomialDistribution",
+	  "NegativeDefiniteMatrixQ",
+	  "NegativeIntegers",
+	  "NegativelyOrientedPoints",
+	  "NegativeMultinomialDistribution",
+	  "NegativeRationals",
+	  "NegativeReals",
+	  "NegativeSemidefiniteMatrixQ",
+	  "NeighborhoodData",
+	  "NeighborhoodGraph",
+	  "Nest",
+	  "NestedGreaterGreater",
+	  "NestedLessLess",
+	  "NestedScriptRules",
+	  "NestGraph",
+	  "NestList",
+	  "NestTree",
+	  "NestWhile",
+	  "NestWhileList",
+	  "NetAppend",
+	  "NetArray",
+	  "NetArrayLayer",
+	  "NetBidirectionalOperator",
+	  "NetChain",
+	  "NetDecoder",
+	  "NetDelete",
+	  "NetDrop",
+	  "NetEncoder",
+	  "NetEvaluationMode",
+	  "NetExternalObject",
+	  "NetExtract",
+	  "NetFlatten",
+	  "NetFoldOperator",
+	  "NetGANOperator",
+	  "NetGraph",
+	  "NetInformation",
+	  "NetInitialize",
+	  "NetInsert",
+	  "NetInsertSharedArrays",
+	  "NetJoin",
+	  "NetMapOperator",
+	  "NetMapThreadOperator",
+	  "NetMeasurements",
+	  "NetModel",
+	  "NetNestOperator",
+	  "NetPairEmbeddingOperator",
+	  "NetPort",
+	  "NetPortGradient",
+	  "NetPrepend",
+	  "NetRename",
+	  "NetReplace",
+	  "NetReplacePart",
+	  "NetSharedArray",
+	  "NetStateObject",
+	  "NetTake",
+	  "NetTrain",
+	  "NetTrainResultsObject",
+	  "NetUnfold",
+	  "NetworkPacketCapture",
+	  "NetworkPacketRecording",
+	  "NetworkPacketRecordingDuring",
+	  "NetworkPacketTrace",
+	  "NeumannValue",
+	  "NevilleThetaC",
+	  "NevilleThetaD",
+	  "NevilleThetaN",
+	  "NevilleThetaS",
+	  "NewPrimitiveStyle",
+	  "NExpectation",
+	  "Next",
+	  "NextCell",
+	  "NextDate",
+	  "NextPrime",
+	  "NextScheduledTaskTime",
+	  "NeymanScottPointProcess",
+	  "NFractionalD",
+	  "NHoldAll",
+	  "NHoldFirst",
+	  "NHoldRest",
+	  "NicholsGridLines",
+	  "NicholsPlot",
+	  "NightHemisphere",
+	  "NIntegrate",
+	  "NMaximize",
+	  "NMaxValue",
+	  "NMinimize",
+	  "NMinValue",
+	  "NominalScale",
+	  "NominalVariables",
+	  "NonAssociative",
+	  "NoncentralBetaDistribution",
+	  "NoncentralChiSquareDistribution",
+	  "NoncentralFRatioDistribution",
+	  "NoncentralStudentTDistribution",
+	  "NonCommutativeMultiply",
+	  "NonConstants",
+	  "NondimensionalizationTransform",
+	  "None",
+	  "NoneTrue",
+	  "NonlinearModelFit",
+	  "NonlinearStateSpaceModel",
+	  "NonlocalMeansFilter",
+	  "NonNegative",
+	  "NonNegativeIntegers",
+	  "NonNegativeRationals",
+	  "NonNegativeReals",
+	  "NonPositive",
+	  "NonPositiveIntegers",
+	  "NonPositiveRationals",
+	  "NonPositiveReals",
+	  "Nor",
+	  "NorlundB",
+	  "Norm",
+	  "Normal",
+	  "NormalDistribution",
+	  "NormalGrouping",
+	  "NormalizationLayer",
+	  "Normalize",
+	  "Normalized",
+	  "NormalizedSquaredEuclideanDistance",
+	  "NormalMatrixQ",
+	  "NormalsFunction",
+	  "NormFunction",
+	  "Not",
+	  "NotCongruent",
+	  "NotCupCap",
+	  "NotDoubleVerticalBar",
+	  "Notebook",
+	  "NotebookApply",
+	  "NotebookAutoSave",
+	  "NotebookBrowseDirectory",
+	  "NotebookClose",
+	  "NotebookConvertSettings",
+	  "NotebookCreate",
+	  "NotebookDefault",
+	  "NotebookDelete",
+	  "NotebookDirectory",
+	  "NotebookDynamicExpression",
+	  "NotebookEvaluate",
+	  "NotebookEventActions",
+	  "NotebookFileName",
+	  "NotebookFind",
+	  "NotebookGet",
+	  "NotebookImport",
+	  "NotebookInformation",
+	  "NotebookInterfaceObject",
+	  "NotebookLocate",
+	  "NotebookObject",
+	  "NotebookOpen",
+	  "NotebookPath",
+	  "NotebookPrint",
+	  "NotebookPut",
+	  "NotebookRead",
+	  "Notebooks",
+	  "NotebookSave",
+	  "NotebookSelection",
+	  "NotebooksMenu",
+	  "NotebookTemplate",
+	  "NotebookWrite",
+	  "NotElement",
+	  "NotEqualTilde",
+	  "NotExists",
+	  "NotGreater",
+	  "NotGreaterEqual",
+	  "NotGreaterFullEqual",
+	  "NotGreaterGreater",
+	  "NotGreaterLess",
+	  "NotGreaterSlantEqual",
+	  "NotGreaterTilde",
+	  "Nothing",
+	  "NotHumpDownHump",
+	  "NotHumpEqual",
+	  "NotificationFunction",
+	  "NotLeftTriangle",
+	  "NotLeftTriangleBar",
+	  "NotLeftTriangleEqual",
+	  "NotLess",
+	  "NotLessEqual",
+	  "NotLessFullEqual",
+	  "NotLessGreater",
+	  "NotLessLess",
+	  "NotLessSlantEqual",
+	  "NotLessTilde",
+	  "NotNestedGreaterGreater",
+	  "NotNestedLessLess",
+	  "NotPrecedes",
+	  "NotPrecedesEqual",
+	  "NotPrecedesSlantEqual",
+	  "NotPrecedesTilde",
+	  "NotReverseElement",
+	  "NotRightTriangle",
+	  "NotRightTriangleBar",
+	  "NotRightTriangleEqual",
+	  "NotSquareSubset",
+	  "NotSquareSubsetEqual",
+	  "NotSquareSuperset",
+	  "NotSquareSupersetEqual",
+	  "NotSubset",
+	  "NotSubsetEqual",
+	  "NotSucceeds",
+	  "NotSucceedsEqual",
+	  "NotSucceedsSlantEqual",
+	  "NotSucceedsTilde",
+	  "NotSuperset",
+	  "NotSupersetEqual",
+	  "NotTilde",
+	  "NotTildeEqual",
+	  "NotTildeFullEqual",
+	  "NotTildeTilde",
+	  "NotVerticalBar",
+	  "Now",
+	  "NoWhitespace",
+	  "NProbability",
+	  "NProduct",
+	  "NProductFactors",
+	  "NRoots",
+	  "NSolve",
+	  "NSolveValues",
+	  "NSum",
+	  "NSumTerms",
+	  "NuclearExplosionData",
+	  "NuclearReactorData",
+	  "Null",
+	  "NullRecords",
+	  "NullSpace",
+	  "NullWords",
+	  "Number",
+	  "NumberCompose",
+	  "NumberDecompose",
+	  "NumberDigit",
+	  "NumberExpand",
+	  "NumberFieldClassNumber",
+	  "NumberFieldDiscriminant",
+	  "NumberFieldFundamentalUnits",
+	  "NumberFieldIntegralBasis",
+	  "NumberFieldNormRepresentatives",
+	  "NumberFieldRegulator",
+	  "NumberFieldRootsOfUnity",
+	  "NumberFieldSignature",
+	  "NumberForm",
+	  "NumberFormat",
+	  "NumberLinePlot",
+	  "NumberMarks",
+	  "NumberMultiplier",
+	  "NumberPadding",
+	  "NumberPoint",
+	  "NumberQ",
+	  "NumberSeparator",
+	  "NumberSigns",
+	  "NumberString",
+	  "Numerator",
+	  "NumeratorDenominator",
+	  "NumericalOrder",
+	  "NumericalSort",
+	  "NumericArray",
+	  "NumericArrayQ",
+	  "NumericArrayType",
+	  "NumericFunction",
+	  "NumericQ",
+	  "NuttallWindow",
+	  "NValues",
+	  "NyquistGridLines",
+	  "NyquistPlot",
+	  "O",
+	  "ObjectExistsQ",
+	  "ObservabilityGramian",
+	  "ObservabilityMatrix",
+	  "ObservableDecomposition",
+	  "ObservableModelQ",
+	  "OceanData",
+	  "Octahedron",
+	  "OddQ",
+	  "Off",
+	  "Offset",
+	  "OLEData",
+	  "On",
+	  "ONanGroupON",
+	  "Once",
+	  "OneIdentity",
+	  "Opacity",
+	  "OpacityFunction",
+	  "OpacityFunctionScaling",
+	  "Open",
+	  "OpenAppend",
+	  "Opener",
+	  "OpenerBox",
+	  "OpenerBoxOptions",
+	  "OpenerView",
+	  "OpenFunctionInspectorPacket",
+	  "Opening",
+	  "OpenRead",
+	  "OpenSpecialOptions",
+	  "OpenTemporary",
+	  "OpenWrite",
+	  "Operate",
+	  "OperatingSystem",
+	  "OperatorApplied",
+	  "OptimumFlowData",
+	  "Optional",
+	  "OptionalElement",
+	  "OptionInspectorSettings",
+	  "OptionQ",
+	  "Options",
+	  "OptionsPacket",
+	  "OptionsPattern",
+	  "OptionValue",
+	  "OptionValueBox",
+	  "OptionValueBoxOptions",
+	  "Or",
+	  "Orange",
+	  "Order",
+	  "OrderDistribution",
+	  "OrderedQ",
+	  "Ordering",
+	  "OrderingBy",
+	  "OrderingLayer",
+	  "Orderless",
+	  "OrderlessPatternSequence",
+	  "OrdinalScale",
+	  "OrnsteinUhlenbeckProcess",
+	  "Orthogonalize",
+	  "OrthogonalMatrixQ",
+	  "Out",
+	  "Outer",
+	  "OuterPolygon",
+	  "OuterPolyhedron",
+	  "OutputAutoOverwrite",
+	  "OutputControllabilityMatrix",
+	  "OutputControllableModelQ",
+	  "OutputForm",
+	  "OutputFormData",
+	  "OutputGrouping",
+	  "OutputMathEditExpression",
+	  "OutputNamePacket",
+	  "OutputPorts",
+	  "OutputResponse",
+	  "OutputSizeLimit",
+	  "OutputStream",
+	  "Over",
+	  "OverBar",
+	  "OverDot",
+	  "Overflow",
+	  "OverHat",
+	  "Overlaps",
+	  "Overlay",
+	  "OverlayBox",
+	  "OverlayBoxOptions",
+	  "OverlayVideo",
+	  "Overscript",
+	  "OverscriptBox",
+	  "OverscriptBoxOptions",
+	  "OverTilde",
+	  "OverVector",
+	  "OverwriteTarget",
+	  "OwenT",
+	  "OwnValues",
+	  "Package",
+	  "PackingMethod",
+	  "PackPaclet",
+	  "PacletDataRebuild",
+	  "PacletDirectoryAdd",
+	  "PacletDirectoryLoad",
+	  "PacletDirectoryRemove",
+	  "PacletDirectoryUnload",
+	  "PacletDisable",
+	  "PacletEnable",
+	  "PacletFind",
+	  "PacletFindRemote",
+	  "PacletInformation",
+	  "PacletInstall",
+	  "PacletInstallSubmit",
+	  "PacletNewerQ",
+	  "PacletObject",
+	  "PacletObjectQ",
+	  "PacletSite",
+	  "PacletSiteObject",
+	  "PacletSiteRegister",
+	  "PacletSites",
+	  "PacletSiteUnregister",
+	  "PacletSiteUpdate",
+	  "PacletSymbol",
+	  "PacletUninstall",
+	  "PacletUpdate",
+	  "PaddedForm",
+	  "Padding",
+	  "PaddingLayer",
+	  "PaddingSize",
+	  "PadeApproximant",
+	  "PadLeft",
+	  "PadRight",
+	  "PageBreakAbove",
+	  "PageBreakBelow",
+	  "PageBreakWithin",
+	  "PageFooterLines",
+	  "PageFooters",
+	  "PageHeaderLines",
+	  "PageHeaders",
+	  "PageHeight",
+	  "PageRankCentrality",
+	  "PageTheme",
+	  "PageWidth",
+	  "Pagination",
+	  "PairCorrelationG",
+	  "PairedBarChart",
+	  "PairedHistogram",
+	  "PairedSmoothHistogram",
+	  "PairedTTest",
+	  "PairedZTest",
+	  "PaletteNotebook",
+	  "PalettePath",
+	  "PalettesMenuSettings",
+	  "PalindromeQ",
+	  "Pane",
+	  "PaneBox",
+	  "PaneBoxOptions",
+	  "Panel",
+	  "PanelBox",
+	  "PanelBoxOptions",
+	  "Paneled",
+	  "PaneSelector",
+	  "PaneSelectorBox",
+	  "PaneSelectorBoxOptions",
+	  "PaperWidth",
+	  "ParabolicCylinderD",
+	  "ParagraphIndent",
+	  "ParagraphSpacing",
+	  "ParallelArray",
+	  "ParallelAxisPlot",
+	  "ParallelCombine",
+	  "ParallelDo",
+	  "Parallelepiped",
+	  "ParallelEvaluate",
+	  "Parallelization",
+	  "Parallelize",
+	  "ParallelKernels",
+	  "ParallelMap",
+	  "ParallelNeeds",
+	  "Parallelogram",
+	  "ParallelProduct",
+	  "ParallelSubmit",
+	  "ParallelSum",
+	  "ParallelTable",
+	  "ParallelTry",
+	  "Parameter",
+	  "ParameterEstimator",
+	  "ParameterMixtureDistribution",
+	  "ParameterVariables",
+	  "ParametricConvexOptimization",
+	  "ParametricFunction",
+	  "ParametricNDSolve",
+	  "ParametricNDSolveValue",
+	  "ParametricPlot",
+	  "ParametricPlot3D",
+	  "ParametricRampLayer",
+	  "ParametricRegion",
+	  "ParentBox",
+	  "ParentCell",
+	  "ParentConnect",
+	  "ParentDirectory",
+	  "ParentEdgeLabel",
+	  "ParentEdgeLabelFunction",
+	  "ParentEdgeLabelStyle",
+	  "ParentEdgeShapeFunction",
+	  "ParentEdgeStyle",
+	  "ParentEdgeStyleFunction",
+	  "ParentForm",
+	  "Parenthesize",
+	  "ParentList",
+	  "ParentNotebook",
+	  "ParetoDistribution",
+	  "ParetoPickandsDistribution",
+	  "ParkData",
+	  "Part",
+	  "PartBehavior",
+	  "PartialCorrelationFunction",
+	  "PartialD",
+	  "ParticleAcceleratorData",
+	  "ParticleData",
+	  "Partition",
+	  "PartitionGranularity",
+	  "PartitionsP",
+	  "PartitionsQ",
+	  "PartLayer",
+	  "PartOfSpeech",
+	  "PartProtection",
+	  "ParzenWindow",
+	  "PascalDistribution",
+	  "PassEventsDown",
+	  "PassEventsUp",
+	  "Paste",
+	  "PasteAutoQuoteCharacters",
+	  "PasteBoxFormInlineCells",
+	  "PasteButton",
+	  "Path",
+	  "PathGraph",
+	  "PathGraphQ",
+	  "Pattern",
+	  "PatternFilling",
+	  "PatternReaction",
+	  "PatternSequence",
+	  "PatternTest",
+	  "PauliMatrix",
+	  "PaulWavelet",
+	  "Pause",
+	  "PausedTime",
+	  "PDF",
+	  "PeakDetect",
+	  "PeanoCurve",
+	  "PearsonChiSquareTest",
+	  "PearsonCorrelationTest",
+	  "PearsonDistribution",
+	  "PenttinenPointProcess",
+	  "PercentForm",
+	  "PerfectNumber",
+	  "PerfectNumberQ",
+	  "PerformanceGoal",
+	  "Perimeter",
+	  "PeriodicBoundaryCondition",
+	  "PeriodicInterpolation",
+	  "Periodogram",
+	  "PeriodogramArray",
+	  "Permanent",
+	  "Permissions",
+	  "PermissionsGroup",
+	  "PermissionsGroupMemberQ",
+	  "PermissionsGroups",
+	  "PermissionsKey",
+	  "PermissionsKeys",
+	  "PermutationCycles",
+	  "PermutationCyclesQ",
+	  "PermutationGroup",
+	  "PermutationLength",
+	  "PermutationList",
+	  "PermutationListQ",
+	  "PermutationMatrix",
+	  "PermutationMax",
+	  "PermutationMin",
+	  "PermutationOrder",
+	  "PermutationPower",
+	  "PermutationProduct",
+	  "PermutationReplace",
+	  "Permutations",
+	  "PermutationSupport",
+	  "Permute",
+	  "PeronaMalikFilter",
+	  "Perpendicular",
+	  "PerpendicularBisector",
+	  "PersistenceLocation",
+	  "PersistenceTime",
+	  "PersistentObject",
+	  "PersistentObjects",
+	  "PersistentSymbol",
+	  "PersistentValue",
+	  "PersonData",
+	  "PERTDistribution",
+	  "PetersenGraph",
+	  "PhaseMargins",
+	  "PhaseRange",
+	  "PhongShading",
+	  "PhysicalSystemData",
+	  "Pi",
+	  "Pick",
+	  "PickedElements",
+	  "PickMode",
+	  "PIDData",
+	  "PIDDerivativeFilter",
+	  "PIDFeedforward",
+	  "PIDTune",
+	  "Piecewise",
+	  "PiecewiseExpand",
+	  "PieChart",
+	  "PieChart3D",
+	  "PillaiTrace",
+	  "PillaiTraceTest",
+	  "PingTime",
+	  "Pink",
+	  "PitchRecognize",
+	  "Pivoting",
+	  "PixelConstrained",
+	  "PixelValue",
+	  "PixelValuePositions",
+	  "Placed",
+	  "Placeholder",
+	  "PlaceholderLayer",
+	  "PlaceholderReplace",
+	  "Plain",
+	  "PlanarAngle",
+	  "PlanarFaceList",
+	  "PlanarGraph",
+	  "PlanarGraphQ",
+	  "PlanckRadiationLaw",
+	  "PlaneCurveData",
+	  "PlanetaryMoonData",
+	  "PlanetData",
+	  "PlantData",
+	  "Play",
+	  "PlaybackSettings",
+	  "PlayRange",
+	  "Plot",
+	  "Plot3D",
+	  "Plot3Matrix",
+	  "PlotDivision",
+	  "PlotJoined",
+	  "PlotLabel",
+	  "PlotLabels",
+	  "PlotLayout",
+	  "PlotLegends",
+	  "PlotMarkers",
+	  "PlotPoints",
+	  "PlotRange",
+	  "PlotRangeClipping",
+	  "PlotRangeClipPlanesStyle",
+	  "PlotRangePadding",
+	  "PlotRegion",
+	  "PlotStyle",
+	  "PlotTheme",
+	  "Pluralize",
+	  "Plus",
+	  "PlusMinus",
+	  "Pochhammer",
+	  "PodStates",
+	  "PodWidth",
+	  "Point",
+	  "Point3DBox",
+	  "Point3DBoxOptions",
+	  "PointBox",
+	  "PointBoxOptions",
+	  "PointCountDistribution",
+	  "PointDensity",
+	  "PointDensityFunction",
+	  "PointFigureChart",
+	  "PointLegend",
+	  "PointLight",
+	  "PointProcessEstimator",
+	  "PointProcessFitTest",
+	  "PointProcessParameterAssumptions",
+	  "PointProcessParameterQ",
+	  "PointSize",
+	  "PointStatisticFunction",
+	  "PointValuePlot",
+	  "PoissonConsulDistribution",
+	  "PoissonDistribution",
+	  "PoissonPDEComponent",
+	  "PoissonPointProcess",
+	  "PoissonProcess",
+	  "PoissonWindow",
+	  "PolarAxes",
+	  "PolarAxesOrigin",
+	  "PolarGridLines",
+	  "PolarPlot",
+	  "PolarTicks",
+	  "PoleZeroMarkers",
+	  "PolyaAeppliDistribution",
+	  "PolyGamma",
+	  "Polygon",
+	  "Polygon3DBox",
+	  "Polygon3DBoxOptions",
+	  "PolygonalNumber",
+	  "PolygonAngle",
+	  "PolygonBox",
+	  "PolygonBoxOptions",
+	  "PolygonCoordinates",
+	  "PolygonDecomposition",
+	  "PolygonHoleScale",
+	  "PolygonIntersections",
+	  "PolygonScale",
+	  "Polyhedron",
+	  "PolyhedronAngle",
+	  "PolyhedronBox",
+	  "PolyhedronBoxOptions",
+	  "PolyhedronCoordinates",
+	  "PolyhedronData",
+	  "PolyhedronDecomposition",
+	  "PolyhedronGenus",
+	  "PolyLog",
+	  "PolynomialExpressionQ",
+	  "PolynomialExtendedGCD",
+	  "PolynomialForm",
+	  "PolynomialGCD",
+	  "PolynomialLCM",
+	  "PolynomialMod",
+	  "PolynomialQ",
+	  "PolynomialQuotient",
+	  "PolynomialQuotientRemainder",
+	  "PolynomialReduce",
+	  "PolynomialRemainder",
+	  "Polynomials",
+	  "PolynomialSumOfSquaresList",
+	  "PoolingLayer",
+	  "PopupMenu",
+	  "PopupMenuBox",
+	  "PopupMenuBoxOptions",
+	  "PopupView",
+	  "PopupWindow",
+	  "Position",
+	  "PositionIndex",
+	  "PositionLargest",
+	  "PositionSmallest",
+	  "Positive",
+	  "PositiveDefiniteMatrixQ",
+	  "PositiveIntegers",
+	  "PositivelyOrientedPoints",
+	  "PositiveRationals",
+	  "PositiveReals",
+	  "PositiveSemidefiniteMatrixQ",
+	  "PossibleZeroQ",
+	  "Postfix",
+	  "PostScript",
+	  "Power",
+	  "PowerDistribution",
+	  "PowerExpand",
+	  "PowerMod",
+	  "PowerModList",
+	  "PowerRange",
+	  "PowerSpectralDensity",
+	  "PowersRepresentations",
+	  "PowerSymmetricPolynomial",
+	  "Precedence",
+	  "PrecedenceForm",
+	  "Precedes",
+	  "PrecedesEqual",
+	  "PrecedesSlantEqual",
+	  "PrecedesTilde",
+	  "Precision",
+	  "PrecisionGoal",
+	  "PreDecrement",
+	  "Predict",
+	  "PredictionRoot",
+	  "PredictorFunction",
+	  "PredictorInformation",
+	  "PredictorMeasurements",
+	  "PredictorMeasurementsObject",
+	  "PreemptProtect",
+	  "PreferencesPath",
+	  "PreferencesSettings",
+	  "Prefix",
+	  "PreIncrement",
+	  "Prepend",
+	  "PrependLayer",
+	  "PrependTo",
+	  "PreprocessingRules",
+	  "PreserveColor",
+	  "PreserveImageOptions",
+	  "Previous",
+	  "PreviousCell",
+	  "PreviousDate",
+	  "PriceGraphDistribution",
+	  "PrimaryPlaceholder",
+	  "Prime",
+	  "PrimeNu",
+	  "PrimeOmega",
+	  "PrimePi",
+	  "PrimePowerQ",
+	  "PrimeQ",
+	  "Primes",
+	  "PrimeZetaP",
+	  "PrimitivePolynomialQ",
+	  "PrimitiveRoot",
+	  "PrimitiveRootList",
+	  "PrincipalComponents",
+	  "PrincipalValue",
+	  "Print",
+	  "PrintableASCIIQ",
+	  "PrintAction",
+	  "PrintForm",
+	  "PrintingCopies",
+	  "PrintingOptions",
+	  "PrintingPageRange",
+	  "PrintingStartingPageNumber",
+	  "PrintingStyleEnvironment",
+	  "Printout3D",
+	  "Printout3DPreviewer",
+	  "PrintPrecision",
+	  "PrintTemporary",
+	  "Prism",
+	  "PrismBox",
+	  "PrismBoxOptions",
+	  "PrivateCellOptions",
+	  "PrivateEvaluationOptions",
+	  "PrivateFontOptions",
+	  "PrivateFrontEndOptions",
+	  "PrivateKey",
+	  "PrivateNotebookOptions",
+	  "PrivatePaths",
+	  "Probability",
+	  "ProbabilityDistribution",
+	  "ProbabilityPlot",
+	  "ProbabilityPr",
+	  "ProbabilityScalePlot",
+	  "ProbitModelFit",
+	  "ProcessConnection",
+	  "ProcessDirectory",
+	  "ProcessEnvironment",
+	  "Processes",
+	  "ProcessEstimator",
+	  "ProcessInformation",
+	  "ProcessObject",
+	  "ProcessParameterAssumptions",
+	  "ProcessParameterQ",
+	  "ProcessStateDomain",
+	  "ProcessStatus",
+	  "ProcessTimeDomain",
+	  "Product",
+	  "ProductDistribution",
+	  "ProductLog",
+	  "ProgressIndicator",
+	  "ProgressIndicatorBox",
+	  "ProgressIndicatorBoxOptions",
+	  "ProgressReporting",
+	  "Projection",
+	  "Prolog",
+	  "PromptForm",
+	  "ProofObject",
+	  "PropagateAborts",
+	  "Properties",
+	  "Property",
+	  "PropertyList",
+	  "PropertyValue",
+	  "Proportion",
+	  "Proportional",
+	  "Protect",
+	  "Protected",
+	  "ProteinData",
+	  "Pruning",
+	  "PseudoInverse",
+	  "PsychrometricPropertyData",
+	  "PublicKey",
+	  "PublisherID",
+	  "PulsarData",
+	  "PunctuationCharacter",
+	  "Purple",
+	  "Put",
+	  "PutAppend",
+	  "Pyramid",
+	  "PyramidBox",
+	  "PyramidBoxOptions",
+	  "QBinomial",
+	  "QFactorial",
+	  "QGamma",
+	  "QHypergeometricPFQ",
+	  "QnDispersion",
+	  "QPochhammer",
+	  "QPolyGamma",
+	  "QRDecomposition",
+	  "QuadraticIrrationalQ",
+	  "QuadraticOptimization",
+	  "Quantile",
+	  "QuantilePlot",
+	  "Quantity",
+	  "QuantityArray",
+	  "QuantityDistribution",
+	  "QuantityForm",
+	  "QuantityMagnitude",
+	  "QuantityQ",
+	  "QuantityUnit",
+	  "QuantityVariable",
+	  "QuantityVariableCanonicalUnit",
+	  "QuantityVariableDimensions",
+	  "QuantityVariableIdentifier",
+	  "QuantityVariablePhysicalQuantity",
+	  "Quartics",
+	  "QuartileDeviation",
+	  "Quartiles",
+	  "QuartileSkewness",
+	  "Query",
+	  "QuestionGenerator",
+	  "QuestionInterface",
+	  "QuestionObject",
+	  "QuestionSelector",
+	  "QueueingNetworkProcess",
+	  "QueueingProcess",
+	  "QueueProperties",
+	  "Quiet",
+	  "QuietEcho",
+	  "Quit",
+	  "Quotient",
+	  "QuotientRemainder",
+	  "RadialAxisPlot",
+	  "RadialGradientFilling",
+	  "RadialGradientImage",
+	  "RadialityCentrality",
+	  "RadicalBox",
+	  "RadicalBoxOptions",
+	  "RadioButton",
+	  "RadioButtonBar",
+	  "RadioButtonBox",
+	  "RadioButtonBoxOptions",
+	  "Radon",
+	  "RadonTransform",
+	  "RamanujanTau",
+	  "RamanujanTauL",
+	  "RamanujanTauTheta",
+	  "RamanujanTauZ",
+	  "Ramp",
+	  "Random",
+	  "RandomArrayLayer",
+	  "RandomChoice",
+	  "RandomColor",
+	  "RandomComplex",
+	  "RandomDate",
+	  "RandomEntity",
+	  "RandomFunction",
+	  "RandomGeneratorState",
+	  "RandomGeoPosition",
+	  "RandomGraph",
+	  "RandomImage",
+	  "RandomInstance",
+	  "RandomInteger",
+	  "RandomPermutation",
+	  "RandomPoint",
+	  "RandomPointConfiguration",
+	  "RandomPolygon",
+	  "RandomPolyhedron",
+	  "RandomPrime",
+	  "RandomReal",
+	  "RandomSample",
+	  "RandomSeed",
+	  "RandomSeeding",
+	  "RandomTime",
+	  "RandomTree",
+	  "RandomVariate",
+	  "RandomWalkProcess",
+	  "RandomWord",
+	  "Range",
+	  "RangeFilter",
+	  "RangeSpecification",
+	  "RankedMax",
+	  "RankedMin",
+	  "RarerProbability",
+	  "Raster",
+	  "Raster3D",
+	  "Raster3DBox",
+	  "Raster3DBoxOptions",
+	  "RasterArray",
+	  "RasterBox",
+	  "RasterBoxOptions",
+	  "Rasterize",
+	  "RasterSize",
+	  "Rational",
+	  "RationalExpressionQ",
+	  "RationalFunctions",
+	  "Rationalize",
+	  "Rationals",
+	  "Ratios",
+	  "RawArray",
+	  "RawBoxes",
+	  "RawData",
+	  "RawMedium",
+	  "RayleighDistribution",
+	  "Re",
+	  "ReactionBalance",
+	  "ReactionBalancedQ",
+	  "ReactionPDETerm",
+	  "Read",
+	  "ReadByteArray",
+	  "ReadLine",
+	  "ReadList",
+	  "ReadProtected",
+	  "ReadString",
+	  "Real",
+	  "RealAbs",
+	  "RealBlockDiagonalForm",
+	  "RealDigits",
+	  "RealExponent",
+	  "Reals",
+	  "RealSign",
+	  "Reap",
+	  "RebuildPacletData",
+	  "RecalibrationFunction",
+	  "RecognitionPrior",
+	  "RecognitionThreshold",
+	  "ReconstructionMesh",
+	  "Record",
+	  "RecordLists",
+	  "RecordSeparators",
+	  "Rectangle",
+	  "RectangleBox",
+	  "RectangleBoxOptions",
+	  "RectangleChart",
+	  "RectangleChart3D",
+	  "RectangularRepeatingElement",
+	  "RecurrenceFilter",
+	  "RecurrenceTable",
+	  "RecurringDigitsForm",
+	  "Red",
+	  "Reduce",
+	  "RefBox",
+	  "ReferenceLineStyle",
+	  "ReferenceMarkers",
+	  "ReferenceMarkerStyle",
+	  "Refine",
+	  "ReflectionMatrix",
+	  "ReflectionTransform",
+	  "Refresh",
+	  "RefreshRate",
+	  "Region",
+	  "RegionBinarize",
+	  "RegionBoundary",
+	  "RegionBoundaryStyle",
+	  "RegionBounds",
+	  "RegionCentroid",
+	  "RegionCongruent",
+	  "RegionConvert",
+	  "RegionDifference",
+	  "RegionDilation",
+	  "RegionDimension",
+	  "RegionDisjoint",
+	  "RegionDistance",
+	  "RegionDistanceFunction",
+	  "RegionEmbeddingDimension",
+	  "RegionEqual",
+	  "RegionErosion",
+	  "RegionFillingStyle",
+	  "RegionFit",
+	  "RegionFunction",
+	  "RegionImage",
+	  "RegionIntersection",
+	  "RegionMeasure",
+	  "RegionMember",
+	  "RegionMemberFunction",
+	  "RegionMoment",
+	  "RegionNearest",
+	  "RegionNearestFunction",
+	  "RegionPlot",
+	  "RegionPlot3D",
+	  "RegionProduct",
+	  "RegionQ",
+	  "RegionResize",
+	  "RegionSimilar",
+	  "RegionSize",
+	  "RegionSymmetricDifference",
+	  "RegionUnion",
+	  "RegionWithin",
+	  "RegisterExternalEvaluator",
+	  "RegularExpression",
+	  "Regularization",
+	  "RegularlySampledQ",
+	  "RegularPolygon",
+	  "ReIm",
+	  "ReImLabels",
+	  "ReImPlot",
+	  "ReImStyle",
+	  "Reinstall",
+	  "RelationalDatabase",
+	  "RelationGraph",
+	  "Release",
+	  "ReleaseHold",
+	  "ReliabilityDistribution",
+	  "ReliefImage",
+	  "ReliefPlot",
+	  "RemoteAuthorizationCaching",
+	  "RemoteBatchJobAbort",
+	  "RemoteBatchJobObject",
+	  "RemoteBatchJobs",
+	  "RemoteBatchMapSubmit",
+	  "RemoteBatchSubmissionEnvironment",
+	  "RemoteBatchSubmit",
+	  "RemoteConnect",
+	  "RemoteConnectionObject",
+	  "RemoteEvaluate",
+	  "RemoteFile",
+	  "RemoteInputFiles",
+	  "RemoteKernelObject",
+	  "RemoteProviderSettings",
+	  "RemoteRun",
+	  "RemoteRunProcess",
+	  "RemovalConditions",
+	  "Remove",
+	  "RemoveAlphaChannel",
+	  "RemoveAsynchronousTask",
+	  "RemoveAudioStream",
+	  "RemoveBackground",
+	  "RemoveChannelListener",
+	  "RemoveChannelSubscribers",
+	  "Removed",
+	  "RemoveDiacritics",
+	  "RemoveInputStreamMethod",
+	  "RemoveOutputStreamMethod",
+	  "RemoveProperty",
+	  "RemoveScheduledTask",
+	  "RemoveUsers",
+	  "RemoveVideoStream",
+	  "RenameDirectory",
+	  "RenameFile",
+	  "RenderAll",
+	  "RenderingOptions",
+	  "RenewalProcess",
+	  "RenkoChart",
+	  "RepairMesh",
+	  "Repeated",
+	  "RepeatedNull",
+	  "RepeatedString",
+	  "RepeatedTiming",
+	  "RepeatingElement",
+	  "Replace",
+	  "ReplaceAll",
+	  "ReplaceAt",
+	  "ReplaceHeldPart",
+	  "ReplaceImageValue",
+	  "ReplaceList",
+	  "ReplacePart",
+	  "ReplacePixelValue",
+	  "ReplaceRepeated",
+	  "ReplicateLayer",
+	  "RequiredPhysicalQuantities",
+	  "Resampling",
+	  "ResamplingAlgorithmData",
+	  "ResamplingMethod",
+	  "Rescale",
+	  "RescalingTransform",
+	  "ResetDirectory",
+	  "ResetScheduledTask",
+	  "ReshapeLayer",
+	  "Residue",
+	  "ResidueSum",
+	  "ResizeLayer",
+	  "Resolve",
+	  "ResolveContextAliases",
+	  "ResourceAcquire",
+	  "ResourceData",
+	  "ResourceFunction",
+	  "ResourceObject",
+	  "ResourceRegister",
+	  "ResourceRemove",
+	  "ResourceSearch",
+	  "ResourceSubmissionObject",
+	  "ResourceSubmit",
+	  "ResourceSystemBase",
+	  "ResourceSystemPath",
+	  "ResourceUpdate",
+	  "ResourceVersion",
+	  "ResponseForm",
+	  "Rest",
+	  "RestartInterval",
+	  "Restricted",
+	  "Resultant",
+	  "ResumePacket",
+	  "Return",
+	  "ReturnCreatesNewCell",
+	  "ReturnEntersInput",
+	  "ReturnExpressionPacket",
+	  "ReturnInputFormPacket",
+	  "ReturnPacket",
+	  "ReturnReceiptFunction",
+	  "ReturnTextPacket",
+	  "Reverse",
+	  "ReverseApplied",
+	  "ReverseBiorthogonalSplineWavelet",
+	  "ReverseElement",
+	  "ReverseEquilibrium",
+	  "ReverseGraph",
+	  "ReverseSort",
+	  "ReverseSortBy",
+	  "ReverseUpEquilibrium",
+	  "RevolutionAxis",
+	  "RevolutionPlot3D",
+	  "RGBColor",
+	  "RiccatiSolve",
+	  "RiceDistribution",
+	  "RidgeFilter",
+	  "RiemannR",
+	  "RiemannSiegelTheta",
+	  "RiemannSiegelZ",
+	  "RiemannXi",
+	  "Riffle",
+	  "Right",
+	  "RightArrow",
+	  "RightArrowBar",
+	  "RightArrowLeftArrow",
+	  "RightComposition",
+	  "RightCosetRepresentative",
+	  "RightDownTeeVector",
+	  "RightDownVector",
+	  "RightDownVectorBar",
+	  "RightTee",
+	  "RightTeeArrow",
+	  "RightTeeVector",
+	  "RightTriangle",
+	  "RightTriangleBar",
+	  "RightTriangleEqual",
+	  "RightUpDownVector",
+	  "RightUpTeeVector",
+	  "RightUpVector",
+	  "RightUpVectorBar",
+	  "RightVector",
+	  "RightVectorBar",
+	  "RipleyK",
+	  "RipleyRassonRegion",
+	  "RiskAchievementImportance",
+	  "RiskReductionImportance",
+	  "RobustConvexOptimization",
+	  "RogersTanimotoDissimilarity",
+	  "RollPitchYawAngles",
+	  "RollPitchYawMatrix",
+	  "RomanNumeral",
+	  "Root",
+	  "RootApproximant",
+	  "RootIntervals",
+	  "RootLocusPlot",
+	  "RootMeanSquare",
+	  "RootOfUnityQ",
+	  "RootReduce",
+	  "Roots",
+	  "RootSum",
+	  "RootTree",
+	  "Rotate",
+	  "RotateLabel",
+	  "RotateLeft",
+	  "RotateRight",
+	  "RotationAction",
+	  "RotationBox",
+	  "RotationBoxOptions",
+	  "RotationMatrix",
+	  "RotationTransform",
+	  "Round",
+	  "RoundImplies",
+	  "RoundingRadius",
+	  "Row",
+	  "RowAlignments",
+	  "RowBackgrounds",
+	  "RowBox",
+	  "RowHeights",
+	  "RowLines",
+	  "RowMinHeight",
+	  "RowReduce",
+	  "RowsEqual",
+	  "RowSpacings",
+	  "RSolve",
+	  "RSolveValue",
+	  "RudinShapiro",
+	  "RudvalisGroupRu",
+	  "Rule",
+	  "RuleCondition",
+	  "RuleDelayed",
+	  "RuleForm",
+	  "RulePlot",
+	  "RulerUnits",
+	  "RulesTree",
+	  "Run",
+	  "RunProcess",
+	  "RunScheduledTask",
+	  "RunThrough",
+	  "RuntimeAttributes",
+	  "RuntimeOptions",
+	  "RussellRaoDissimilarity",
+	  "SameAs",
+	  "SameQ",
+	  "SameTest",
+	  "SameTestProperties",
+	  "SampledEntityClass",
+	  "SampleDepth",
+	  "SampledSoundFunction",
+	  "SampledSoundList",
+	  "SampleRate",
+	  "SamplingPeriod",
+	  "SARIMAProcess",
+	  "SARMAProcess",
+	  "SASTriangle",
+	  "SatelliteData",
+	  "SatisfiabilityCount",
+	  "SatisfiabilityInstances",
+	  "SatisfiableQ",
+	  "Saturday",
+	  "Save",
+	  "Saveable",
+	  "SaveAutoDelete",
+	  "SaveConnection",
+	  "SaveDefinitions",
+	  "SavitzkyGolayMatrix",
+	  "SawtoothWave",
+	  "Scale",
+	  "Scaled",
+	  "ScaleDivisions",
+	  "ScaledMousePosition",
+	  "ScaleOrigin",
+	  "ScalePadding",
+	  "ScaleRanges",
+	  "ScaleRangeStyle",
+	  "ScalingFunctions",
+	  "ScalingMatrix",
+	  "ScalingTransform",
+	  "Scan",
+	  "ScheduledTask",
+	  "ScheduledTaskActiveQ",
+	  "ScheduledTaskInformation",
+	  "ScheduledTaskInformationData",
+	  "ScheduledTaskObject",
+	  "ScheduledTasks",
+	  "SchurDecomposition",
+	  "ScientificForm",
+	  "ScientificNotationThreshold",
+	  "ScorerGi",
+	  "ScorerGiPrime",
+	  "ScorerHi",
+	  "ScorerHiPrime",
+	  "ScreenRectangle",
+	  "ScreenStyleEnvironment",
+	  "ScriptBaselineShifts",
+	  "ScriptForm",
+	  "ScriptLevel",
+	  "ScriptMinSize",
+	  "ScriptRules",
+	  "ScriptSizeMultipliers",
+	  "Scrollbars",
+	  "ScrollingOptions",
+	  "ScrollPosition",
+	  "SearchAdjustment",
+	  "SearchIndexObject",
+	  "SearchIndices",
+	  "SearchQueryString",
+	  "SearchResultObject",
+	  "Sec",
+	  "Sech",
+	  "SechDistribution",
+	  "SecondOrderConeOptimization",
+	  "SectionGrouping",
+	  "SectorChart",
+	  "SectorChart3D",
+	  "SectorOrigin",
+	  "SectorSpacing",
+	  "SecuredAuthenticationKey",
+	  "SecuredAuthenticationKeys",
+	  "SecurityCertificate",
+	  "SeedRandom",
+	  "Select",
+	  "Selectable",
+	  "SelectComponents",
+	  "SelectedCells",
+	  "SelectedNotebook",
+	  "SelectFirst",
+	  "Selection",
+	  "SelectionAnimate",
+	  "SelectionCell",
+	  "SelectionCellCreateCell",
+	  "SelectionCellDefaultStyle",
+	  "SelectionCellParentStyle",
+	  "SelectionCreateCell",
+	  "SelectionDebuggerTag",
+	  "SelectionEvaluate",
+	  "SelectionEvaluateCreateCell",
+	  "SelectionMove",
+	  "SelectionPlaceholder",
+	  "SelectWithContents",
+	  "SelfLoops",
+	  "SelfLoopStyle",
+	  "SemanticImport",
+	  "SemanticImportString",
+	  "SemanticInterpretation",
+	  "SemialgebraicComponentInstances",
+	  "SemidefiniteOptimization",
+	  "SendMail",
+	  "SendMessage",
+	  "Sequence",
+	  "SequenceAlignment",
+	  "SequenceAttentionLayer",
+	  "SequenceCases",
+	  "SequenceCount",
+	  "SequenceFold",
+	  "SequenceFoldList",
+	  "SequenceForm",
+	  "SequenceHold",
+	  "SequenceIndicesLayer",
+	  "SequenceLastLayer",
+	  "SequenceMostLayer",
+	  "SequencePosition",
+	  "SequencePredict",
+	  "SequencePredictorFunction",
+	  "SequenceReplace",
+	  "SequenceRestLayer",
+	  "SequenceReverseLayer",
+	  "SequenceSplit",
+	  "Series",
+	  "SeriesCoefficient",
+	  "SeriesData",
+	  "SeriesTermGoal",
+	  "ServiceConnect",
+	  "ServiceDisconnect",
+	  "ServiceExecute",
+	  "ServiceObject",
+	  "ServiceRequest",
+	  "ServiceResponse",
+	  "ServiceSubmit",
+	  "SessionSubmit",
+	  "SessionTime",
+	  "Set",
+	  "SetAccuracy",
+	  "SetAlphaChannel",
+	  "SetAttributes",
+	  "Setbacks",
+	  "SetCloudDirectory",
+	  "SetCookies",
+	  "SetDelayed",
+	  "SetDirectory",
+	  "SetEnvironment",
+	  "SetFileDate",
+	  "SetFileFormatProperties",
+	  "SetOptions",
+	  "SetOptionsPacket",
+	  "SetPermissions",
+	  "SetPrecision",
+	  "SetProperty",
+	  "SetSecuredAuthenticationKey",
+	  "SetSelectedNotebook",
+	  "SetSharedFunction",
+	  "SetSharedVariable",
+	  "SetStreamPosition",
+	  "SetSystemModel",
+	  "SetSystemOptions",
+	  "Setter",
+	  "SetterBar",
+	  "SetterBox",
+	  "SetterBoxOptions",
+	  "Setting",
+	  "SetUsers",
+	  "Shading",
+	  "Shallow",
+	  "ShannonWavelet",
+	  "ShapiroWilkTest",
+	  "Share",
+	  "SharingList",
+	  "Sharpen",
+	  "ShearingMatrix",
+	  "ShearingTransform",
+	  "ShellRegion",
+	  "ShenCastanMatrix",
+	  "ShiftedGompertzDistribution",
+	  "ShiftRegisterSequence",
+	  "Short",
+	  "ShortDownArrow",
+	  "Shortest",
+	  "ShortestMatch",
+	  "ShortestPathFunction",
+	  "ShortLeftArrow",
+	  "ShortRightArrow",
+	  "ShortTimeFourier",
+	  "ShortTimeFourierData",
+	  "ShortUpArrow",
+	  "Show",
+	  "ShowAutoConvert",
+	  "ShowAutoSpellCheck",
+	  "ShowAutoStyles",
+	  "ShowCellBracket",
+	  "ShowCellLabel",
+	  "ShowCellTags",
+	  "ShowClosedCellArea",
+	  "ShowCodeAssist",
+	  "ShowContents",
+	  "ShowControls",
+	  "ShowCursorTracker",
+	  "ShowGroupOpenCloseIcon",
+	  "ShowGroupOpener",
+	  "ShowInvisibleCharacters",
+	  "ShowPageBreaks",
+	  "ShowPredictiveInterface",
+	  "ShowSelection",
+	  "ShowShortBoxForm",
+	  "ShowSpecialCharacters",
+	  "ShowStringCharacters",
+	  "ShowSyntaxStyles",
+	  "ShrinkingDelay",
+	  "ShrinkWrapBoundingBox",
+	  "SiderealTime",
+	  "SiegelTheta",
+	  "SiegelTukeyTest",
+	  "SierpinskiCurve",
+	  "SierpinskiMesh",
+	  "Sign",
+	  "Signature",
+	  "SignedRankTest",
+	  "SignedRegionDistance",
+	  "SignificanceLevel",
+	  "SignPadding",
+	  "SignTest",
+	  "SimilarityRules",
+	  "SimpleGraph",
+	  "SimpleGraphQ",
+	  "SimplePolygonQ",
+	  "SimplePolyhedronQ",
+	  "Simplex",
+	  "Simplify",
+	  "Sin",
+	  "Sinc",
+	  "SinghMaddalaDistribution",
+	  "SingleEvaluation",
+	  "SingleLetterItalics",
+	  "SingleLetterStyle",
+	  "SingularValueDecomposition",
+	  "SingularValueList",
+	  "SingularValuePlot",
+	  "SingularValues",
+	  "Sinh",
+	  "SinhIntegral",
+	  "SinIntegral",
+	  "SixJSymbol",
+	  "Skeleton",
+	  "SkeletonTransform",
+	  "SkellamDistribution",
+	  "Skewness",
+	  "SkewNormalDistribution",
+	  "SkinStyle",
+	  "Skip",
+	  "SliceContourPlot3D",
+	  "SliceDensityPlot3D",
+	  "SliceDistribution",
+	  "SliceVectorPlot3D",
+	  "Slider",
+	  "Slider2D",
+	  "Slider2DBox",
+	  "Slider2DBoxOptions",
+	  "SliderBox",
+	  "SliderBoxOptions",
+	  "SlideShowVideo",
+	  "SlideView",
+	  "Slot",
+	  "SlotSequence",
+	  "Small",
+	  "SmallCircle",
+	  "Smaller",
+	  "SmithDecomposition",
+	  "SmithDelayCompensator",
+	  "SmithWatermanSimilarity",
+	  "SmoothDensityHistogram",
+	  "SmoothHistogram",
+	  "SmoothHistogram3D",
+	  "SmoothKernelDistribution",
+	  "SmoothPointDensity",
+	  "SnDispersion",
+	  "Snippet",
+	  "SnippetsVideo",
+	  "SnubPolyhedron",
+	  "SocialMediaData",
+	  "Socket",
+	  "SocketConnect",
+	  "SocketListen",
+	  "SocketListener",
+	  "SocketObject",
+	  "SocketOpen",
+	  "SocketReadMessage",
+	  "SocketReadyQ",
+	  "Sockets",
+	  "SocketWaitAll",
+	  "SocketWaitNext",
+	  "SoftmaxLayer",
+	  "SokalSneathDissimilarity",
+	  "SolarEclipse",
+	  "SolarSystemFeatureData",
+	  "SolarTime",
+	  "SolidAngle",
+	  "SolidBoundaryLoadValue",
+	  "SolidData",
+	  "SolidDisplacementCondition",
+	  "SolidFixedCondition",
+	  "SolidMechanicsPDEComponent",
+	  "SolidMechanicsStrain",
+	  "SolidMechanicsStress",
+	  "SolidRegionQ",
+	  "Solve",
+	  "SolveAlways",
+	  "SolveDelayed",
+	  "SolveValues",
+	  "Sort",
+	  "SortBy",
+	  "SortedBy",
+	  "SortedEntityClass",
+	  "Sound",
+	  "SoundAndGraphics",
+	  "SoundNote",
+	  "SoundVolume",
+	  "SourceLink",
+	  "SourcePDETerm",
+	  "Sow",
+	  "Space",
+	  "SpaceCurveData",
+	  "SpaceForm",
+	  "Spacer",
+	  "Spacings",
+	  "Span",
+	  "SpanAdjustments",
+	  "SpanCharacterRounding",
+	  "SpanFromAbove",
+	  "SpanFromBoth",
+	  "SpanFromLeft",
+	  "SpanLineThickness",
+	  "SpanMaxSize",
+	  "SpanMinSize",
+	  "SpanningCharacters",
+	  "SpanSymmetric",
+	  "SparseArray",
+	  "SparseArrayQ",
+	  "SpatialBinnedPointData",
+	  "SpatialBoundaryCorrection",
+	  "SpatialEstimate",
+	  "SpatialEstimatorFunction",
+	  "SpatialGraphDistribution",
+	  "SpatialJ",
+	  "SpatialMedian",
+	  "SpatialNoiseLevel",
+	  "SpatialObservationRegionQ",
+	  "SpatialPointData",
+	  "SpatialPointSelect",
+	  "SpatialRandomnessTest",
+	  "SpatialTransformationLayer",
+	  "SpatialTrendFunction",
+	  "Speak",
+	  "SpeakerMatchQ",
+	  "SpearmanRankTest",
+	  "SpearmanRho",
+	  "SpeciesData",
+	  "SpecificityGoal",
+	  "SpectralLineData",
+	  "Spectrogram",
+	  "SpectrogramArray",
+	  "Specularity",
+	  "SpeechCases",
+	  "SpeechInterpreter",
+	  "SpeechRecognize",
+	  "SpeechSynthesize",
+	  "SpellingCorrection",
+	  "SpellingCorrectionList",
+	  "SpellingDictionaries",
+	  "SpellingDictionariesPath",
+	  "SpellingOptions",
+	  "Sphere",
+	  "SphereBox",
+	  "SphereBoxOptions",
+	  "SpherePoints",
+	  "SphericalBesselJ",
+	  "SphericalBesselY",
+	  "SphericalHankelH1",
+	  "SphericalHankelH2",
+	  "SphericalHarmonicY",
+	  "SphericalPlot3D",
+	  "SphericalRegion",
+	  "SphericalShell",
+	  "SpheroidalEigenvalue",
+	  "SpheroidalJoiningFactor",
+	  "SpheroidalPS",
+	  "SpheroidalPSPrime",
+	  "SpheroidalQS",
+	  "SpheroidalQSPrime",
+	  "SpheroidalRadialFactor",
+	  "SpheroidalS1",
+	  "SpheroidalS1Prime",
+	  "SpheroidalS2",
+	  "SpheroidalS2Prime",
+	  "Splice",
+	  "SplicedDistribution",
+	  "SplineClosed",
+	  "SplineDegree",
+	  "SplineKnots",
+	  "SplineWeights",
+	  "Split",
+	  "SplitBy",
+	  "SpokenString",
+	  "SpotLight",
+	  "Sqrt",
+	  "SqrtBox",
+	  "SqrtBoxOptions",
+	  "Square",
+	  "SquaredEuclideanDistance",
+	  "SquareFreeQ",
+	  "SquareIntersection",
+	  "SquareMatrixQ",
+	  "SquareRepeatingElement",
+	  "SquaresR",
+	  "SquareSubset",
+	  "SquareSubsetEqual",
+	  "SquareSuperset",
+	  "SquareSupersetEqual",
+	  "SquareUnion",
+	  "SquareWave",
+	  "SSSTriangle",
+	  "StabilityMargins",
+	  "StabilityMarginsStyle",
+	  "StableDistribution",
+	  "Stack",
+	  "StackBegin",
+	  "StackComplete",
+	  "StackedDateListPlot",
+	  "StackedListPlot",
+	  "StackInhibit",
+	  "StadiumShape",
+	  "StandardAtmosphereData",
+	  "StandardDeviation",
+	  "StandardDeviationFilter",
+	  "StandardForm",
+	  "Standardize",
+	  "Standardized",
+	  "StandardOceanData",
+	  "StandbyDistribution",
+	  "Star",
+	  "StarClusterData",
+	  "StarData",
+	  "StarGraph",
+	  "StartAsynchronousTask",
+	  "StartExternalSession",
+	  "StartingStepSize",
+	  "StartOfLine",
+	  "StartOfString",
+	  "StartProcess",
+	  "StartScheduledTask",
+	  "StartupSound",
+	  "StartWebSession",
+	  "StateDimensions",
+	  "StateFeedbackGains",
+	  "StateOutputEstimator",
+	  "StateResponse",
+	  "StateSpaceModel",
+	  "StateSpaceRealization",
+	  "StateSpaceTransform",
+	  "StateTransformationLinearize",
+	  "StationaryDistribution",
+	  "StationaryWaveletPacketTransform",
+	  "StationaryWaveletTransform",
+	  "StatusArea",
+	  "StatusCentrality",
+	  "StepMonitor",
+	  "StereochemistryElements",
+	  "StieltjesGamma",
+	  "StippleShading",
+	  "StirlingS1",
+	  "StirlingS2",
+	  "StopAsynchronousTask",
+	  "StoppingPowerData",
+	  "StopScheduledTask",
+	  "StrataVariables",
+	  "StratonovichProcess",
+	  "StraussHardcorePointProcess",
+	  "StraussPointProcess",
+	  "StreamColorFunction",
+	  "StreamColorFunctionScaling",
+	  "StreamDensityPlot",
+	  "StreamMarkers",
+	  "StreamPlot",
+	  "StreamPlot3D",
+	  "StreamPoints",
+	  "StreamPosition",
+	  "Streams",
+	  "StreamScale",
+	  "StreamStyle",
+	  "StrictInequalities",
+	  "String",
+	  "StringBreak",
+	  "StringByteCount",
+	  "StringCases",
+	  "StringContainsQ",
+	  "StringCount",
+	  "StringDelete",
+	  "StringDrop",
+	  "StringEndsQ",
+	  "StringExpression",
+	  "StringExtract",
+	  "StringForm",
+	  "StringFormat",
+	  "StringFormatQ",
+	  "StringFreeQ",
+	  "StringInsert",
+	  "StringJoin",
+	  "StringLength",
+	  "StringMatchQ",
+	  "StringPadLeft",
+	  "StringPadRight",
+	  "StringPart",
+	  "StringPartition",
+	  "StringPosition",
+	  "StringQ",
+	  "StringRepeat",
+	  "StringReplace",
+	  "StringReplaceList",
+	  "StringReplacePart",
+	  "StringReverse",
+	  "StringRiffle",
+	  "StringRotateLeft",
+	  "StringRotateRight",
+	  "StringSkeleton",
+	  "StringSplit",
+	  "StringStartsQ",
+	  "StringTake",
+	  "StringTakeDrop",
+	  "StringTemplate",
+	  "StringToByteArray",
+	  "StringToStream",
+	  "StringTrim",
+	  "StripBoxes",
+	  "StripOnInput",
+	  "StripStyleOnPaste",
+	  "StripWrapperBoxes",
+	  "StrokeForm",
+	  "Struckthrough",
+	  "StructuralImportance",
+	  "StructuredArray",
+	  "StructuredArrayHeadQ",
+	  "StructuredSelection",
+	  "StruveH",
+	  "StruveL",
+	  "Stub",
+	  "StudentTDistribution",
+	  "Style",
+	  "StyleBox",
+	  "StyleBoxAutoDelete",
+	  "StyleData",
+	  "StyleDefinitions",
+	  "StyleForm",
+	  "StyleHints",
+	  "StyleKeyMapping",
+	  "StyleMenuListing",
+	  "StyleNameDialogSettings",
+	  "StyleNames",
+	  "StylePrint",
+	  "StyleSheetPath",
+	  "Subdivide",
+	  "Subfactorial",
+	  "Subgraph",
+	  "SubMinus",
+	  "SubPlus",
+	  "SubresultantPolynomialRemainders",
+	  "SubresultantPolynomials",
+	  "Subresultants",
+	  "Subscript",
+	  "SubscriptBox",
+	  "SubscriptBoxOptions",
+	  "Subscripted",
+	  "Subsequences",
+	  "Subset",
+	  "SubsetCases",
+	  "SubsetCount",
+	  "SubsetEqual",
+	  "SubsetMap",
+	  "SubsetPosition",
+	  "SubsetQ",
+	  "SubsetReplace",
+	  "Subsets",
+	  "SubStar",
+	  "SubstitutionSystem",
+	  "Subsuperscript",
+	  "SubsuperscriptBox",
+	  "SubsuperscriptBoxOptions",
+	  "SubtitleEncoding",
+	  "SubtitleTrackSelection",
+	  "Subtract",
+	  "SubtractFrom",
+	  "SubtractSides",
+	  "SubValues",
+	  "Succeeds",
+	  "SucceedsEqual",
+	  "SucceedsSlantEqual",
+	  "SucceedsTilde",
+	  "Success",
+	  "SuchThat",
+	  "Sum",
+	  "SumConvergence",
+	  "SummationLayer",
+	  "Sunday",
+	  "SunPosition",
+	  "Sunrise",
+	  "Sunset",
+	  "SuperDagger",
+	  "SuperMinus",
+	  "SupernovaData",
+	  "SuperPlus",
+	  "Superscript",
+	  "SuperscriptBox",
+	  "SuperscriptBoxOptions",
+	  "Superset",
+	  "SupersetEqual",
+	  "SuperStar",
+	  "Surd",
+	  "SurdForm",
+	  "SurfaceAppearance",
+	  "SurfaceArea",
+	  "SurfaceColor",
+	  "SurfaceData",
+	  "SurfaceGraphics",
+	  "SurvivalDistribution",
+	  "SurvivalFunction",
+	  "SurvivalModel",
+	  "SurvivalModelFit",
+	  "SuspendPacket",
+	  "SuzukiDistribution",
+	  "SuzukiGroupSuz",
+	  "SwatchLegend",
+	  "Switch",
+	  "Symbol",
+	  "SymbolName",
+	  "SymletWavelet",
+	  "Symmetric",
+	  "SymmetricDifference",
+	  "SymmetricGroup",
+	  "SymmetricKey",
+	  "SymmetricMatrixQ",
+	  "SymmetricPolynomial",
+	  "SymmetricReduction",
+	  "Symmetrize",
+	  "SymmetrizedArray",
+	  "SymmetrizedArrayRules",
+	  "SymmetrizedDependentComponents",
+	  "SymmetrizedIndependentComponents",
+	  "SymmetrizedReplacePart",
+	  "SynchronousInitialization",
+	  "SynchronousUpdating",
+	  "Synonyms",
+	  "Syntax",
+	  "SyntaxForm",
+	  "SyntaxInformation",
+	  "SyntaxLength",
+	  "SyntaxPacket",
+	  "SyntaxQ",
+	  "SynthesizeMissingValues",
+	  "SystemCredential",
+	  "SystemCredentialData",
+	  "SystemCredentialKey",
+	  "SystemCredentialKeys",
+	  "SystemCredentialStoreObject",
+	  "SystemDialogInput",
+	  "SystemException",
+	  "SystemGet",
+	  "SystemHelpPath",
+	  "SystemInformation",
+	  "SystemInformationData",
+	  "SystemInstall",
+	  "SystemModel",
+	  "SystemModeler",
+	  "SystemModelExamples",
+	  "SystemModelLinearize",
+	  "SystemModelMeasurements",
+	  "SystemModelParametricSimulate",
+	  "SystemModelPlot",
+	  "SystemModelProgressReporting",
+	  "SystemModelReliability",
+	  "SystemModels",
+	  "SystemModelSimulate",
+	  "SystemModelSimulateSensitivity",
+	  "SystemModelSimulationData",
+	  "SystemOpen",
+	  "SystemOptions",
+	  "SystemProcessData",
+	  "SystemProcesses",
+	  "SystemsConnectionsModel",
+	  "SystemsModelControllerData",
+	  "SystemsModelDelay",
+	  "SystemsModelDelayApproximate",
+	  "SystemsModelDelete",
+	  "SystemsModelDimensions",
+	  "SystemsModelExtract",
+	  "SystemsModelFeedbackConnect",
+	  "SystemsModelLabels",
+	  "SystemsModelLinearity",
+	  "SystemsModelMerge",
+	  "SystemsModelOrder",
+	  "SystemsModelParallelConnect",
+	  "SystemsModelSeriesConnect",
+	  "SystemsModelStateFeedbackConnect",
+	  "SystemsModelVectorRelativeOrders",
+	  "SystemStub",
+	  "SystemTest",
+	  "Tab",
+	  "TabFilling",
+	  "Table",
+	  "TableAlignments",
+	  "TableDepth",
+	  "TableDirections",
+	  "TableForm",
+	  "TableHeadings",
+	  "TableSpacing",
+	  "TableView",
+	  "TableViewBox",
+	  "TableViewBoxAlignment",
+	  "TableViewBoxBackground",
+	  "TableViewBoxHeaders",
+	  "TableViewBoxItemSize",
+	  "TableViewBoxItemStyle",
+	  "TableViewBoxOptions",
+	  "TabSpacings",
+	  "TabView",
+	  "TabViewBox",
+	  "TabViewBoxOptions",
+	  "TagBox",
+	  "TagBoxNote",
+	  "TagBoxOptions",
+	  "TaggingRules",
+	  "TagSet",
+	  "TagSetDelayed",
+	  "TagStyle",
+	  "TagUnset",
+	  "Take",
+	  "TakeDrop",
+	  "TakeLargest",
+	  "TakeLargestBy",
+	  "TakeList",
+	  "TakeSmallest",
+	  "TakeSmallestBy",
+	  "TakeWhile",
+	  "Tally",
+	  "Tan",
+	  "Tanh",
+	  "TargetDevice",
+	  "TargetFunctions",
+	  "TargetSystem",
+	  "TargetUnits",
+	  "TaskAbort",
+	  "TaskExecute",
+	  "TaskObject",
+	  "TaskRemove",
+	  "TaskResume",
+	  "Tasks",
+	  "TaskSuspend",
+	  "TaskWait",
+	  "TautologyQ",
+	  "TelegraphProcess",
+	  "TemplateApply",
+	  "TemplateArgBox",
+	  "TemplateBox",
+	  "TemplateBoxOptions",
+	  "TemplateEvaluate",
+	  "TemplateExpression",
+	  "TemplateIf",
+	  "TemplateObject",
+	  "TemplateSequence",
+	  "TemplateSlot",
+	  "TemplateSlotSequence",
+	  "TemplateUnevaluated",
+	  "TemplateVerbatim",
+	  "TemplateWith",
+	  "TemporalData",
+	  "TemporalRegularity",
+	  "Temporary",
+	  "TemporaryVariable",
+	  "TensorContract",
+	  "TensorDimensions",
+	  "TensorExpand",
+	  "TensorProduct",
+	  "TensorQ",
+	  "TensorRank",
+	  "TensorReduce",
+	  "TensorSymmetry",
+	  "TensorTranspose",
+	  "TensorWedge",
+	  "TerminatedEvaluation",
+	  "TernaryListPlot",
+	  "TernaryPlotCorners",
+	  "TestID",
+	  "TestReport",
+	  "TestReportObject",
+	  "TestResultObject",
+	  "Tetrahedron",
+	  "TetrahedronBox",
+	  "TetrahedronBoxOptions",
+	  "TeXForm",
+	  "TeXSave",
+	  "Text",
+	  "Text3DBox",
+	  "Text3DBoxOptions",
+	  "TextAlignment",
+	  "TextBand",
+	  "TextBoundingBox",
+	  "TextBox",
+	  "TextCases",
+	  "TextCell",
+	  "TextClipboardType",
+	  "TextContents",
+	  "TextData",
+	  "TextElement",
+	  "TextForm",
+	  "TextGrid",
+	  "TextJustification",
+	  "TextLine",
+	  "TextPacket",
+	  "TextParagraph",
+	  "TextPosition",
+	  "TextRecognize",
+	  "TextSearch",
+	  "TextSearchReport",
+	  "TextSentences",
+	  "TextString",
+	  "TextStructure",
+	  "TextStyle",
+	  "TextTranslation",
+	  "Texture",
+	  "TextureCoordinateFunction",
+	  "TextureCoordinateScaling",
+	  "TextWords",
+	  "Therefore",
+	  "ThermodynamicData",
+	  "ThermometerGauge",
+	  "Thick",
+	  "Thickness",
+	  "Thin",
+	  "Thinning",
+	  "ThisLink",
+	  "ThomasPointProcess",
+	  "ThompsonGroupTh",
+	  "Thread",
+	  "Threaded",
+	  "ThreadingLayer",
+	  "ThreeJSymbol",
+	  "Threshold",
+	  "Through",
+	  "Throw",
+	  "ThueMorse",
+	  "Thumbnail",
+	  "Thursday",
+	  "TickDirection",
+	  "TickLabelOrientation",
+	  "TickLabelPositioning",
+	  "TickLabels",
+	  "TickLengths",
+	  "TickPositions",
+	  "Ticks",
+	  "TicksStyle",
+	  "TideData",
+	  "Tilde",
+	  "TildeEqual",
+	  "TildeFullEqual",
+	  "TildeTilde",
+	  "TimeConstrained",
+	  "TimeConstraint",
+	  "TimeDirection",
+	  "TimeFormat",
+	  "TimeGoal",
+	  "TimelinePlot",
+	  "TimeObject",
+	  "TimeObjectQ",
+	  "TimeRemaining",
+	  "Times",
+	  "TimesBy",
+	  "TimeSeries",
+	  "TimeSeriesAggregate",
+	  "TimeSeriesForecast",
+	  "TimeSeriesInsert",
+	  "TimeSeriesInvertibility",
+	  "TimeSeriesMap",
+	  "TimeSeriesMapThread",
+	  "TimeSeriesModel",
+	  "TimeSeriesModelFit",
+	  "TimeSeriesResample",
+	  "TimeSeriesRescale",
+	  "TimeSeriesShift",
+	  "TimeSeriesThread",
+	  "TimeSeriesWindow",
+	  "TimeSystem",
+	  "TimeSystemConvert",
+	  "TimeUsed",
+	  "TimeValue",
+	  "TimeWarpingCorrespondence",
+	  "TimeWarpingDistance",
+	  "TimeZone",
+	  "TimeZoneConvert",
+	  "TimeZoneOffset",
+	  "Timing",
+	  "Tiny",
+	  "TitleGrouping",
+	  "TitsGroupT",
+	  "ToBoxes",
+	  "ToCharacterCode",
+	  "ToColor",
+	  "ToContinuousTimeModel",
+	  "ToDate",
+	  "Today",
+	  "ToDiscreteTimeModel",
+	  "ToEntity",
+	  "ToeplitzMatrix",
+	  "ToExpression",
+	  "ToFileName",
+	  "Together",
+	  "Toggle",
+	  "ToggleFalse",
+	  "Toggler",
+	  "TogglerBar",
+	  "TogglerBox",
+	  "TogglerBoxOptions",
+	  "ToHeldExpression",
+	  "ToInvertibleTimeSeries",
+	  "TokenWords",
+	  "Tolerance",
+	  "ToLowerCase",
+	  "Tomorrow",
+	  "ToNumberField",
+	  "TooBig",
+	  "Tooltip",
+	  "TooltipBox",
+	  "TooltipBoxOptions",
+	  "TooltipDelay",
+	  "TooltipStyle",
+	  "ToonShading",
+	  "Top",
+	  "TopHatTransform",
+	  "ToPolarCoordinates",
+	  "TopologicalSort",
+	  "ToRadicals",
+	  "ToRawPointer",
+	  "ToRules",
+	  "Torus",
+	  "TorusGraph",
+	  "ToSphericalCoordinates",
+	  "ToString",
+	  "Total",
+	  "TotalHeight",
+	  "TotalLayer",
+	  "TotalVariationFilter",
+	  "TotalWidth",
+	  "TouchPosition",
+	  "TouchscreenAutoZoom",
+	  "TouchscreenControlPlacement",
+	  "ToUpperCase",
+	  "TourVideo",
+	  "Tr",
+	  "Trace",
+	  "TraceAbove",
+	  "TraceAction",
+	  "TraceBackward",
+	  "TraceDepth",
+	  "TraceDialog",
+	  "TraceForward",
+	  "TraceInternal",
+	  "TraceLevel",
+	  "TraceOff",
+	  "TraceOn",
+	  "TraceOriginal",
+	  "TracePrint",
+	  "TraceScan",
+	  "TrackCellChangeTimes",
+	  "TrackedSymbols",
+	  "TrackingFunction",
+	  "TracyWidomDistribution",
+	  "TradingChart",
+	  "TraditionalForm",
+	  "TraditionalFunctionNotation",
+	  "TraditionalNotation",
+	  "TraditionalOrder",
+	  "TrainImageContentDetector",
+	  "TrainingProgressCheckpointing",
+	  "TrainingProgressFunction",
+	  "TrainingProgressMeasurements",
+	  "TrainingProgressReporting",
+	  "TrainingStoppingCriterion",
+	  "TrainingUpdateSchedule",
+	  "TrainTextContentDetector",
+	  "TransferFunctionCancel",
+	  "TransferFunctionExpand",
+	  "TransferFunctionFactor",
+	  "TransferFunctionModel",
+	  "TransferFunctionPoles",
+	  "TransferFunctionTransform",
+	  "TransferFunctionZeros",
+	  "TransformationClass",
+	  "TransformationFunction",
+	  "TransformationFunctions",
+	  "TransformationMatrix",
+	  "TransformedDistribution",
+	  "TransformedField",
+	  "TransformedProcess",
+	  "TransformedRegion",
+	  "TransitionDirection",
+	  "TransitionDuration",
+	  "TransitionEffect",
+	  "TransitiveClosureGraph",
+	  "TransitiveReductionGraph",
+	  "Translate",
+	  "TranslationOptions",
+	  "TranslationTransform",
+	  "Transliterate",
+	  "Transparent",
+	  "TransparentColor",
+	  "Transpose",
+	  "TransposeLayer",
+	  "TrapEnterKey",
+	  "TrapSelection",
+	  "TravelDirections",
+	  "TravelDirectionsData",
+	  "TravelDistance",
+	  "TravelDistanceList",
+	  "TravelMethod",
+	  "TravelTime",
+	  "Tree",
+	  "TreeCases",
+	  "TreeChildren",
+	  "TreeCount",
+	  "TreeData",
+	  "TreeDelete",
+	  "TreeDepth",
+	  "TreeElementCoordinates",
+	  "TreeElementLabel",
+	  "TreeElementLabelFunction",
+	  "TreeElementLabelStyle",
+	  "TreeElementShape",
+	  "TreeElementShapeFunction",
+	  "TreeElementSize",
+	  "TreeElementSizeFunction",
+	  "TreeElementStyle",
+	  "TreeElementStyleFunction",
+	  "TreeExpression",
+	  "TreeExtract",
+	  "TreeFold",
+	  "TreeForm",
+	  "TreeGraph",
+	  "TreeGraphQ",
+	  "TreeInsert",
+	  "TreeLayout",
+	  "TreeLeafCount",
+	  "TreeLeafQ",
+	  "TreeLeaves",
+	  "TreeLevel",
+	  "TreeMap",
+	  "TreeMapAt",
+	  "TreeOutline",
+	  "TreePlot",
+	  "TreePosition",
+	  "TreeQ",
+	  "TreeReplacePart",
+	  "TreeRules",
+	  "TreeScan",
+	  "TreeSelect",
+	  "TreeSize",
+	  "TreeTraversalOrder",
+	  "TrendStyle",
+	  "Triangle",
+	  "TriangleCenter",
+	  "TriangleConstruct",
+	  "TriangleMeasurement",
+	  "TriangleWave",
+	  "TriangularDistribution",
+	  "TriangulateMesh",
+	  "Trig",
+	  "TrigExpand",
+	  "TrigFactor",
+	  "TrigFactorList",
+	  "Trigger",
+	  "TrigReduce",
+	  "TrigToExp",
+	  "TrimmedMean",
+	  "TrimmedVariance",
+	  "TropicalStormData",
+	  "True",
+	  "TrueQ",
+	  "TruncatedDistribution",
+	  "TruncatedPolyhedron",
+	  "TsallisQExponentialDistribution",
+	  "TsallisQGaussianDistribution",
+	  "TTest",
+	  "Tube",
+	  "TubeBezierCurveBox",
+	  "TubeBezierCurveBoxOptions",
+	  "TubeBox",
+	  "TubeBoxOptions",
+	  "TubeBSplineCurveBox",
+	  "TubeBSplineCurveBoxOptions",
+	  "Tuesday",
+	  "TukeyLambdaDistribution",
+	  "TukeyWindow",
+	  "TunnelData",
+	  "Tuples",
+	  "TuranGraph",
+	  "TuringMachine",
+	  "TuttePolynomial",
+	  "TwoWayRule",
+	  "Typed",
+	  "TypeDeclaration",
+	  "TypeEvaluate",
+	  "TypeHint",
+	  "TypeOf",
+	  "TypeSpecifier",
+	  "UnateQ",
+	  "Uncompress",
+	  "UnconstrainedParameters",
+	  "Undefined",
+	  "UnderBar",
+	  "Underflow",
+	  "Underlined",
+	  "Underoverscript",
+	  "UnderoverscriptBox",
+	  "UnderoverscriptBoxOptions",
+	  "Underscript",
+	  "UnderscriptBox",
+	  "UnderscriptBoxOptions",
+	  "UnderseaFeatureData",
+	  "UndirectedEdge",
+	  "UndirectedGraph",
+	  "UndirectedGraphQ",
+	  "UndoOptions",
+	  "UndoTrackedVariables",
+	  "Unequal",
+	  "UnequalTo",
+	  "Unevaluated",
+	  "UniformDistribution",
+	  "UniformGraphDistribution",
+	  "UniformPolyhedron",
+	  "UniformSumDistribution",
+	  "Uninstall",
+	  "Union",
+	  "UnionedEntityClass",
+	  "UnionPlus",
+	  "Unique",
+	  "UniqueElements",
+	  "UnitaryMatrixQ",
+	  "UnitBox",
+	  "UnitConvert",
+	  "UnitDimensions",
+	  "Unitize",
+	  "UnitRootTest",
+	  "UnitSimplify",
+	  "UnitStep",
+	  "UnitSystem",
+	  "UnitTriangle",
+	  "UnitVector",
+	  "UnitVectorLayer",
+	  "UnityDimensions",
+	  "UniverseModelData",
+	  "UniversityData",
+	  "UnixTime",
+	  "UnlabeledTree",
+	  "UnmanageObject",
+	  "Unprotect",
+	  "UnregisterExternalEvaluator",
+	  "UnsameQ",
+	  "UnsavedVariables",
+	  "Unset",
+	  "UnsetShared",
+	  "Until",
+	  "UntrackedVariables",
+	  "Up",
+	  "UpArrow",
+	  "UpArrowBar",
+	  "UpArrowDownArrow",
+	  "Update",
+	  "UpdateDynamicObjects",
+	  "UpdateDynamicObjectsSynchronous",
+	  "UpdateInterval",
+	  "UpdatePacletSites",
+	  "UpdateSearchIndex",
+	  "UpDownArrow",
+	  "UpEquilibrium",
+	  "UpperCaseQ",
+	  "UpperLeftArrow",
+	  "UpperRightArrow",
+	  "UpperTriangularize",
+	  "UpperTriangularMatrix",
+	  "UpperTriangularMatrixQ",
+	  "Upsample",
+	  "UpSet",
+	  "UpSetDelayed",
+	  "UpTee",
+	  "UpTeeArrow",
+	  "UpTo",
+	  "UpValues",
+	  "URL",
+	  "URLBuild",
+	  "URLDecode",
+	  "URLDispatcher",
+	  "URLDownload",
+	  "URLDownloadSubmit",
+	  "URLEncode",
+	  "URLExecute",
+	  "URLExpand",
+	  "URLFetch",
+	  "URLFetchAsynchronous",
+	  "URLParse",
+	  "URLQueryDecode",
+	  "URLQueryEncode",
+	  "URLRead",
+	  "URLResponseTime",
+	  "URLSave",
+	  "URLSaveAsynchronous",
+	  "URLShorten",
+	  "URLSubmit",
+	  "UseEmbeddedLibrary",
+	  "UseGraphicsRange",
+	  "UserDefinedWavelet",
+	  "Using",
+	  "UsingFrontEnd",
+	  "UtilityFunction",
+	  "V2Get",
+	  "ValenceErrorHandling",
+	  "ValenceFilling",
+	  "ValidationLength",
+	  "ValidationSet",
+	  "ValueBox",
+	  "ValueBoxOptions",
+	  "ValueDimensions",
+	  "ValueForm",
+	  "ValuePreprocessingFunction",
+	  "ValueQ",
+	  "Values",
+	  "ValuesData",
+	  "VandermondeMatrix",
+	  "Variables",
+	  "Variance",
+	  "VarianceEquivalenceTest",
+	  "VarianceEstimatorFunction",
+	  "VarianceGammaDistribution",
+	  "VarianceGammaPointProcess",
+	  "VarianceTest",
+	  "VariogramFunction",
+	  "VariogramModel",
+	  "VectorAngle",
+	  "VectorAround",
+	  "VectorAspectRatio",
+	  "VectorColorFunction",
+	  "VectorColorFunctionScaling",
+	  "VectorDensityPlot",
+	  "VectorDisplacementPlot",
+	  "VectorDisplacementPlot3D",
+	  "VectorGlyphData",
+	  "VectorGreater",
+	  "VectorGreaterEqual",
+	  "VectorLess",
+	  "VectorLessEqual",
+	  "VectorMarkers",
+	  "VectorPlot",
+	  "VectorPlot3D",
+	  "VectorPoints",
+	  "VectorQ",
+	  "VectorRange",
+	  "Vectors",
+	  "VectorScale",
+	  "VectorScaling",
+	  "VectorSizes",
+	  "VectorStyle",
+	  "Vee",
+	  "Verbatim",
+	  "Verbose",
+	  "VerificationTest",
+	  "VerifyConvergence",
+	  "VerifyDerivedKey",
+	  "VerifyDigitalSignature",
+	  "VerifyFileSignature",
+	  "VerifyInterpretation",
+	  "VerifySecurityCertificates",
+	  "VerifySolutions",
+	  "VerifyTestAssumptions",
+	  "VersionedPreferences",
+	  "VertexAdd",
+	  "VertexCapacity",
+	  "VertexChromaticNumber",
+	  "VertexColors",
+	  "VertexComponent",
+	  "VertexConnectivity",
+	  "VertexContract",
+	  "VertexCoordinateRules",
+	  "VertexCoordinates",
+	  "VertexCorrelationSimilarity",
+	  "VertexCosineSimilarity",
+	  "VertexCount",
+	  "VertexCoverQ",
+	  "VertexDataCoordinates",
+	  "VertexDegree",
+	  "VertexDelete",
+	  "VertexDiceSimilarity",
+	  "VertexEccentricity",
+	  "VertexInComponent",
+	  "VertexInComponentGraph",
+	  "VertexInDegree",
+	  "VertexIndex",
+	  "VertexJaccardSimilarity",
+	  "VertexLabeling",
+	  "VertexLabels",
+	  "VertexLabelStyle",
+	  "VertexList",
+	  "VertexNormals",
+	  "VertexOutComponent",
+	  "VertexOutComponentGraph",
+	  "VertexOutDegree",
+	  "VertexQ",
+	  "VertexRenderingFunction",
+	  "VertexReplace",
+	  "VertexShape",
+	  "VertexShapeFunction",
+	  "VertexSize",
+	  "VertexStyle",
+	  "VertexTextureCoordinates",
+	  "VertexTransitiveGraphQ",
+	  "VertexWeight",
+	  "VertexWeightedGraphQ",
+	  "Vertical",
+	  "VerticalBar",
+	  "VerticalForm",
+	  "VerticalGauge",
+	  "VerticalSeparator",
+	  "VerticalSlider",
+	  "VerticalTilde",
+	  "Video",
+	  "VideoCapture",
+	  "VideoCombine",
+	  "VideoDelete",
+	  "VideoEncoding",
+	  "VideoExtractFrames",
+	  "VideoFrameList",
+	  "VideoFrameMap",
+	  "VideoGenerator",
+	  "VideoInsert",
+	  "VideoIntervals",
+	  "VideoJoin",
+	  "VideoMap",
+	  "VideoMapList",
+	  "VideoMapTimeSeries",
+	  "VideoPadding",
+	  "VideoPause",
+	  "VideoPlay",
+	  "VideoQ",
+	  "VideoRecord",
+	  "VideoReplace",
+	  "VideoScreenCapture",
+	  "VideoSplit",
+	  "VideoStop",
+	  "VideoStream",
+	  "VideoStreams",
+	  "VideoTimeStretch",
+	  "VideoTrackSelection",
+	  "VideoTranscode",
+	  "VideoTransparency",
+	  "VideoTrim",
+	  "ViewAngle",
+	  "ViewCenter",
+	  "ViewMatrix",
+	  "ViewPoint",
+	  "ViewPointSelectorSettings",
+	  "ViewPort",
+	  "ViewProjection",
+	  "ViewRange",
+	  "ViewVector",
+	  "ViewVertical",
+	  "VirtualGroupData",
+	  "Visible",
+	  "VisibleCell",
+	  "VoiceStyleData",
+	  "VoigtDistribution",
+	  "VolcanoData",
+	  "Volume",
+	  "VonMisesDistribution",
+	  "VoronoiMesh",
+	  "WaitAll",
+	  "WaitAsynchronousTask",
+	  "WaitNext",
+	  "WaitUntil",
+	  "WakebyDistribution",
+	  "WalleniusHypergeometricDistribution",
+	  "WaringYuleDistribution",
+	  "WarpingCorrespondence",
+	  "WarpingDistance",
+	  "WatershedComponents",
+	  "WatsonUSquareTest",
+	  "WattsStrogatzGraphDistribution",
+	  "WaveletBestBasis",
+	  "WaveletFilterCoefficients",
+	  "WaveletImagePlot",
+	  "WaveletListPlot",
+	  "WaveletMapIndexed",
+	  "WaveletMatrixPlot",
+	  "WaveletPhi",
+	  "WaveletPsi",
+	  "WaveletScale",
+	  "WaveletScalogram",
+	  "WaveletThreshold",
+	  "WavePDEComponent",
+	  "WeaklyConnectedComponents",
+	  "WeaklyConnectedGraphComponents",
+	  "WeaklyConnectedGraphQ",
+	  "WeakStationarity",
+	  "WeatherData",
+	  "WeatherForecastData",
+	  "WebAudioSearch",
+	  "WebColumn",
+	  "WebElementObject",
+	  "WeberE",
+	  "WebExecute",
+	  "WebImage",
+	  "WebImageSearch",
+	  "WebItem",
+	  "WebPageMetaInformation",
+	  "WebRow",
+	  "WebSearch",
+	  "WebSessionObject",
+	  "WebSessions",
+	  "WebWindowObject",
+	  "Wedge",
+	  "Wednesday",
+	  "WeibullDistribution",
+	  "WeierstrassE1",
+	  "WeierstrassE2",
+	  "WeierstrassE3",
+	  "WeierstrassEta1",
+	  "WeierstrassEta2",
+	  "WeierstrassEta3",
+	  "WeierstrassHalfPeriods",
+	  "WeierstrassHalfPeriodW1",
+	  "WeierstrassHalfPeriodW2",
+	  "WeierstrassHalfPeriodW3",
+	  "WeierstrassInvariantG2",
+	  "WeierstrassInvariantG3",
+	  "WeierstrassInvariants",
+	  "WeierstrassP",
+	  "WeierstrassPPrime",
+	  "WeierstrassSigma",
+	  "WeierstrassZeta",
+	  "WeightedAdjacencyGraph",
+	  "WeightedAdjacencyMatrix",
+	  "WeightedData",
+	  "WeightedGraphQ",
+	  "Weights",
+	  "WelchWindow",
+	  "WheelGraph",
+	  "WhenEvent",
+	  "Which",
+	  "While",
+	  "White",
+	  "WhiteNoiseProcess",
+	  "WhitePoint",
+	  "Whitespace",
+	  "WhitespaceCharacter",
+	  "WhittakerM",
+	  "WhittakerW",
+	  "WholeCellGroupOpener",
+	  "WienerFilter",
+	  "WienerProcess",
+	  "WignerD",
+	  "WignerSemicircleDistribution",
+	  "WikidataData",
+	  "WikidataSearch",
+	  "WikipediaData",
+	  "WikipediaSearch",
+	  "WilksW",
+	  "WilksWTest",
+	  "WindDirectionData",
+	  "WindingCount",
+	  "WindingPolygon",
+	  "WindowClickSelect",
+	  "WindowElements",
+	  "WindowFloating",
+	  "WindowFrame",
+	  "WindowFrameElements",
+	  "WindowMargins",
+	  "WindowMovable",
+	  "WindowOpacity",
+	  "WindowPersistentStyles",
+	  "WindowSelected",
+	  "WindowSize",
+	  "WindowStatusArea",
+	  "WindowTitle",
+	  "WindowToolbars",
+	  "WindowWidth",
+	  "WindSpeedData",
+	  "WindVectorData",
+	  "WinsorizedMean",
+	  "WinsorizedVariance",
+	  "WishartMatrixDistribution",
+	  "With",
+	  "WithCleanup",
+	  "WithLock",
+	  "WolframAlpha",
+	  "WolframAlphaDate",
+	  "WolframAlphaQuantity",
+	  "WolframAlphaResult",
+	  "WolframCloudSettings",
+	  "WolframLanguageData",
+	  "Word",
+	  "WordBoundary",
+	  "WordCharacter",
+	  "WordCloud",
+	  "WordCount",
+	  "WordCounts",
+	  "WordData",
+	  "WordDefinition",
+	  "WordFrequency",
+	  "WordFrequencyData",
+	  "WordList",
+	  "WordOrientation",
+	  "WordSearch",
+	  "WordSelectionFunction",
+	  "WordSeparators",
+	  "WordSpacings",
+	  "WordStem",
+	  "WordTranslation",
+	  "WorkingPrecision",
+	  "WrapAround",
+	  "Write",
+	  "WriteLine",
+	  "WriteString",
+	  "Wronskian",
+	  "XMLElement",
+	  "XMLObject",
+	  "XMLTemplate",
+	  "Xnor",
+	  "Xor",
+	  "XYZColor",
+	  "Yellow",
+	  "Yesterday",
+	  "YuleDissimilarity",
+	  "ZernikeR",
+	  "ZeroSymmetric",
+	  "ZeroTest",
+	  "ZeroWidthTimes",
+	  "Zeta",
+	  "ZetaZero",
+	  "ZIPCodeData",
+	  "ZipfDistribution",
+	  "ZoomCenter",
+	  "ZoomFactor",
+	  "ZTest",
+	  "ZTransform",
+	  "$Aborted",
+	  "$ActivationGroupID",
+	  "$ActivationKey",
+	  "$ActivationUserRegistered",
+	  "$AddOnsDirectory",
+	  "$AllowDataUpdates",
+	  "$AllowExternalChannelFunctions",
+	  "$AllowInternet",
+	  "$AssertFunction",
+	  "$Assumptions",
+	  "$AsynchronousTask",
+	  "$AudioDecoders",
+	  "$AudioEncoders",
+	  "$AudioInputDevices",
+	  "$AudioOutputDevices",
+	  "$BaseDirectory",
+	  "$BasePacletsDirectory",
+	  "$BatchInput",
+	  "$BatchOutput",
+	  "$BlockchainBase",
+	  "$BoxForms",
+	  "$ByteOrdering",
+	  "$CacheBaseDirectory",
+	  "$Canceled",
+	  "$ChannelBase",
+	  "$CharacterEncoding",
+	  "$CharacterEncodings",
+	  "$CloudAccountName",
+	  "$CloudBase",
+	  "$CloudConnected",
+	  "$CloudConnection",
+	  "$CloudCreditsAvailable",
+	  "$CloudEvaluation",
+	  "$CloudExpressionBase",
+	  "$CloudObjectNameFormat",
+	  "$CloudObjectURLType",
+	  "$CloudRootDirectory",
+	  "$CloudSymbolBase",
+	  "$CloudUserID",
+	  "$CloudUserUUID",
+	  "$CloudVersion",
+	  "$CloudVersionNumber",
+	  "$CloudWolframEngineVersionNumber",
+	  "$CommandLine",
+	  "$CompilationTarget",
+	  "$CompilerEnvironment",
+	  "$ConditionHold",
+	  "$ConfiguredKernels",
+	  "$Context",
+	  "$ContextAliases",
+	  "$ContextPath",
+	  "$ControlActiveSetting",
+	  "$Cookies",
+	  "$CookieStore",
+	  "$CreationDate",
+	  "$CryptographicEllipticCurveNames",
+	  "$CurrentLink",
+	  "$CurrentTask",
+	  "$CurrentWebSession",
+	  "$DataStructures",
+	  "$DateStringFormat",
+	  "$DefaultAudioInputDevice",
+	  "$DefaultAudioOutputDevice",
+	  "$DefaultFont",
+	  "$DefaultFrontEnd",
+	  "$DefaultImagingDevice",
+	  "$DefaultKernels",
+	  "$DefaultLocalBase",
+	  "$DefaultLocalKernel",
+	  "$DefaultMailbox",
+	  "$DefaultNetworkInterface",
+	  "$DefaultPath",
+	  "$DefaultProxyRules",
+	  "$DefaultRemoteBatchSubmissionEnvironment",
+	  "$DefaultRemoteKernel",
+	  "$DefaultSystemCredentialStore",
+	  "$Display",
+	  "$DisplayFunction",
+	  "$DistributedContexts",
+	  "$DynamicEvaluation",
+	  "$Echo",
+	  "$EmbedCodeEnvironments",
+	  "$EmbeddableServices",
+	  "$EntityStores",
+	  "$Epilog",
+	  "$EvaluationCloudBase",
+	  "$EvaluationCloudObject",
+	  "$EvaluationEnvironment",
+	  "$ExportFormats",
+	  "$ExternalIdentifierTypes",
+	  "$ExternalStorageBase",
+	  "$Failed",
+	  "$FinancialDataSource",
+	  "$FontFamilies",
+	  "$FormatType",
+	  "$FrontEnd",
+	  "$FrontEndSession",
+	  "$GeneratedAssetLocation",
+	  "$GeoEntityTypes",
+	  "$GeoLocation",
+	  "$GeoLocationCity",
+	  "$GeoLocationCountry",
+	  "$GeoLocationPrecision",
+	  "$GeoLocationSource",
+	  "$HistoryLength",
+	  "$HomeDirectory",
+	  "$HTMLExportRules",
+	  "$HTTPCookies",
+	  "$HTTPRequest",
+	  "$IgnoreEOF",
+	  "$ImageFormattingWidth",
+	  "$ImageResolution",
+	  "$ImagingDevice",
+	  "$ImagingDevices",
+	  "$ImportFormats",
+	  "$IncomingMailSettings",
+	  "$InitialDirectory",
+	  "$Initialization",
+	  "$InitializationContexts",
+	  "$Input",
+	  "$InputFileName",
+	  "$InputStreamMethods",
+	  "$Inspector",
+	  "$InstallationDate",
+	  "$InstallationDirectory",
+	  "$InterfaceEnvironment",
+	  "$InterpreterTypes",
+	  "$IterationLimit",
+	  "$KernelCount",
+	  "$KernelID",
+	  "$Language",
+	  "$LaunchDirectory",
+	  "$LibraryPath",
+	  "$LicenseExpirationDate",
+	  "$LicenseID",
+	  "$LicenseProcesses",
+	  "$LicenseServer",
+	  "$LicenseSubprocesses",
+	  "$LicenseType",
+	  "$Line",
+	  "$Linked",
+	  "$LinkSupported",
+	  "$LoadedFiles",
+	  "$LocalBase",
+	  "$LocalSymbolBase",
+	  "$MachineAddresses",
+	  "$MachineDomain",
+	  "$MachineDomains",
+	  "$MachineEpsilon",
+	  "$MachineID",
+	  "$MachineName",
+	  "$MachinePrecision",
+	  "$MachineType",
+	  "$MaxDisplayedChildren",
+	  "$MaxExtraPrecision",
+	  "$MaxLicenseProcesses",
+	  "$MaxLicenseSubprocesses",
+	  "$MaxMachineNumber",
+	  "$MaxNumber",
+	  "$MaxPiecewiseCases",
+	  "$MaxPrecision",
+	  "$MaxRootDegree",
+	  "$MessageGroups",
+	  "$MessageList",
+	  "$MessagePrePrint",
+	  "$Messages",
+	  "$MinMachineNumber",
+	  "$MinNumber",
+	  "$MinorReleaseNumber",
+	  "$MinPrecision",
+	  "$MobilePhone",
+	  "$ModuleNumber",
+	  "$NetworkConnected",
+	  "$NetworkInterfaces",
+	  "$NetworkLicense",
+	  "$NewMessage",
+	  "$NewSymbol",
+	  "$NotebookInlineStorageLimit",
+	  "$Notebooks",
+	  "$NoValue",
+	  "$NumberMarks",
+	  "$Off",
+	  "$OperatingSystem",
+	  "$Output",
+	  "$OutputForms",
+	  "$OutputSizeLimit",
+	  "$OutputStreamMethods",
+	  "$Packages",
+	  "$ParentLink",
+	  "$ParentProcessID",
+	  "$PasswordFile",
+	  "$PatchLevelID",
+	  "$Path",
+	  "$PathnameSeparator",
+	  "$PerformanceGoal",
+	  "$Permissions",
+	  "$PermissionsGroupBase",
+	  "$PersistenceBase",
+	  "$PersistencePath",
+	  "$PipeSupported",
+	  "$PlotTheme",
+	  "$Post",
+	  "$Pre",
+	  "$PreferencesDirectory",
+	  "$PreInitialization",
+	  "$PrePrint",
+	  "$PreRead",
+	  "$PrintForms",
+	  "$PrintLiteral",
+	  "$Printout3DPreviewer",
+	  "$ProcessID",
+	  "$ProcessorCount",
+	  "$ProcessorType",
+	  "$ProductInformation",
+	  "$ProgramName",
+	  "$ProgressReporting",
+	  "$PublisherID",
+	  "$RandomGeneratorState",
+	  "$RandomState",
+	  "$RecursionLimit",
+	  "$RegisteredDeviceClasses",
+	  "$RegisteredUserName",
+	  "$ReleaseNumber",
+	  "$RequesterAddress",
+	  "$RequesterCloudUserID",
+	  "$RequesterCloudUserUUID",
+	  "$RequesterWolframID",
+	  "$RequesterWolframUUID",
+	  "$ResourceSystemBase",
+	  "$ResourceSystemPath",
+	  "$RootDirectory",
+	  "$ScheduledTask",
+	  "$ScriptCommandLine",
+	  "$ScriptInputString",
+	  "$SecuredAuthenticationKeyTokens",
+	  "$ServiceCreditsAvailable",
+	  "$Services",
+	  "$SessionID",
+	  "$SetParentLink",
+	  "$SharedFunctions",
+	  "$SharedVariables",
+	  "$SoundDisplay",
+	  "$SoundDisplayFunction",
+	  "$SourceLink",
+	  "$SSHAuthentication",
+	  "$SubtitleDecoders",
+	  "$SubtitleEncoders",
+	  "$SummaryBoxDataSizeLimit",
+	  "$SuppressInputFormHeads",
+	  "$SynchronousEvaluation",
+	  "$SyntaxHandler",
+	  "$System",
+	  "$SystemCharacterEncoding",
+	  "$SystemCredentialStore",
+	  "$SystemID",
+	  "$SystemMemory",
+	  "$SystemShell",
+	  "$SystemTimeZone",
+	  "$SystemWordLength",
+	  "$TargetSystems",
+	  "$TemplatePath",
+	  "$TemporaryDirectory",
+	  "$TemporaryPrefix",
+	  "$TestFileName",
+	  "$TextStyle",
+	  "$TimedOut",
+	  "$TimeUnit",
+	  "$TimeZone",
+	  "$TimeZoneEntity",
+	  "$TopDirectory",
+	  "$TraceOff",
+	  "$TraceOn",
+	  "$TracePattern",
+	  "$TracePostAction",
+	  "$TracePreAction",
+	  "$UnitSystem",
+	  "$Urgent",
+	  "$UserAddOnsDirectory",
+	  "$UserAgentLanguages",
+	  "$UserAgentMachine",
+	  "$UserAgentName",
+	  "$UserAgentOperatingSystem",
+	  "$UserAgentString",
+	  "$UserAgentVersion",
+	  "$UserBaseDirectory",
+	  "$UserBasePacletsDirectory",
+	  "$UserDocumentsDirectory",
+	  "$Username",
+	  "$UserName",
+	  "$UserURLBase",
+	  "$Version",
+	  "$VersionNumber",
+	  "$VideoDecoders",
+	  "$VideoEncoders",
+	  "$VoiceStyles",
+	  "$WolframDocumentsDirectory",
+	  "$WolframID",
+	  "$WolframUUID"
+	];
+
+	/*
+	Language: Wolfram Language
+	Description: The Wolfram Language is the programming language used in Wolfram Mathematica, a modern technical computing system spanning most areas of technical computing.
+	Authors: Patrick Scheibe <patrick@halirutan.de>, Robert Jacobson <robertjacobson@acm.org>
+	Website: https://www.wolfram.com/mathematica/
+	Category: scientific
+	*/
+
+
+	/** @type LanguageFn */
+	function mathematica(hljs) {
+	  const regex = hljs.regex;
+	  /*
+	  This rather scary looking matching of Mathematica numbers is carefully explained by Robert Jacobson here:
+	  https://wltools.github.io/LanguageSpec/Specification/Syntax/Number-representations/
+	   */
+	  const BASE_RE = /([2-9]|[1-2]\d|[3][0-5])\^\^/;
+	  const BASE_DIGITS_RE = /(\w*\.\w+|\w+\.\w*|\w+)/;
+	  const NUMBER_RE = /(\d*\.\d+|\d+\.\d*|\d+)/;
+	  const BASE_NUMBER_RE = regex.either(regex.concat(BASE_RE, BASE_DIGITS_RE), NUMBER_RE);
+
+	  const ACCURACY_RE = /``[+-]?(\d*\.\d+|\d+\.\d*|\d+)/;
+	  const PRECISION_RE = /`([+-]?(\d*\.\d+|\d+\.\d*|\d+))?/;
+	  const APPROXIMATE_NUMBER_RE = regex.either(ACCURACY_RE, PRECISION_RE);
+
+	  const SCIENTIFIC_NOTATION_RE = /\*\^[+-]?\d+/;
+
+	  const MATHEMATICA_NUMBER_RE = regex.concat(
+	    BASE_NUMBER_RE,
+	    regex.optional(APPROXIMATE_NUMBER_RE),
+	    regex.optional(SCIENTIFIC_NOTATION_RE)
+	  );
+
+	  const NUMBERS = {
+	    className: 'number',
+	    relevance: 0,
+	    begin: MATHEMATICA_NUMBER_RE
+	  };
+
+	  const SYMBOL_RE = /[a-zA-Z$][a-zA-Z0-9$]*/;
+	  const SYSTEM_SYMBOLS_SET = new Set(SYSTEM_SYMBOLS);
+	  /** @type {Mode} */
+	  const SYMBOLS = { variants: [
+	    {
+	      className: 'builtin-symbol',
+	      begin: SYMBOL_RE,
+	      // for performance out of fear of regex.either(...Mathematica.SYSTEM_SYMBOLS)
+	      "on:begin": (match, response) => {
+	        if (!SYSTEM_SYMBOLS_SET.has(match[0])) response.ignoreMatch();
+	      }
+	    },
+	    {
+	      className: 'symbol',
+	      relevance: 0,
+	      begin: SYMBOL_RE
+	    }
+	  ] };
+
+	  const NAMED_CHARACTER = {
+	    className: 'named-character',
+	    begin: /\\\[[$a-zA-Z][$a-zA-Z0-9]+\]/
+	  };
+
+	  const OPERATORS = {
+	    className: 'operator',
+	    relevance: 0,
+	    begin: /[+\-*/,;.:@~=><&|_`'^?!%]+/
+	  };
+	  const PATTERNS = {
+	    className: 'pattern',
+	    relevance: 0,
+	    begin: /([a-zA-Z$][a-zA-Z0-9$]*)?_+([a-zA-Z$][a-zA-Z0-9$]*)?/
+	  };
+
+	  const SLOTS = {
+	    className: 'slot',
+	    relevance: 0,
+	    begin: /#[a-zA-Z$][a-zA-Z0-9$]*|#+[0-9]?/
+	  };
+
+	  const BRACES = {
+	    className: 'brace',
+	    relevance: 0,
+	    begin: /[[\](){}]/
+	  };
+
+	  const MESSAGES = {
+	    className: 'message-name',
+	    relevance: 0,
+	    begin: regex.concat("::", SYMBOL_RE)
+	  };
+
+	  return {
+	    name: 'Mathematica',
+	    aliases: [
+	      'mma',
+	      'wl'
+	    ],
+	    classNameAliases: {
+	      brace: 'punctuation',
+	      pattern: 'type',
+	      slot: 'type',
+	      symbol: 'variable',
+	      'named-character': 'variable',
+	      'builtin-symbol': 'built_in',
+	      'message-name': 'string'
+	    },
+	    contains: [
+	      hljs.COMMENT(/\(\*/, /\*\)/, { contains: [ 'self' ] }),
+	      PATTERNS,
+	      SLOTS,
+	      MESSAGES,
+	      SYMBOLS,
+	      NAMED_CHARACTER,
+	      hljs.QUOTE_STRING_MODE,
+	      NUMBERS,
+	      OPERATORS,
+	      BRACES
+	    ]
+	  };
+	}
+
+	mathematica_1 = mathematica;
+	return mathematica_1;
+}
+
+var requireMathematicaExports = requireMathematica();
+
+export { requireMathematicaExports as default };
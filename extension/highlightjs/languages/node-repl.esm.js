@@ -0,0 +1,45 @@
+/*
+Language: Node REPL
+Requires: javascript.js
+Author: Marat Nagayev <nagaevmt@yandex.ru>
+Category: scripting
+*/
+
+var nodeRepl_1;
+var hasRequiredNodeRepl;
+
+function requireNodeRepl () {
+	if (hasRequiredNodeRepl) return nodeRepl_1;
+	hasRequiredNodeRepl = 1;
+	/** @type LanguageFn */
+	function nodeRepl(hljs) {
+	  return {
+	    name: 'Node REPL',
+	    contains: [
+	      {
+	        className: 'meta.prompt',
+	        starts: {
+	          // a space separates the REPL prefix from the actual code
+	          // this is purely for cleaner HTML output
+	          end: / |$/,
+	          starts: {
+	            end: '$',
+	            subLanguage: 'javascript'
+	          }
+	        },
+	        variants: [
+	          { begin: /^>(?=[ ]|$)/ },
+	          { begin: /^\.\.\.(?=[ ]|$)/ }
+	        ]
+	      }
+	    ]
+	  };
+	}
+
+	nodeRepl_1 = nodeRepl;
+	return nodeRepl_1;
+}
+
+var requireNodeReplExports = requireNodeRepl();
+
+export { requireNodeReplExports as default };
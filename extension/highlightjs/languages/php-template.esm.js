@@ -0,0 +1,66 @@
+/*
+Language: PHP Template
+Requires: xml.js, php.js
+Author: Josh Goebel <hello@joshgoebel.com>
+Website: https://www.php.net
+Category: common
+*/
+
+var phpTemplate_1;
+var hasRequiredPhpTemplate;
+
+function requirePhpTemplate () {
+	if (hasRequiredPhpTemplate) return phpTemplate_1;
+	hasRequiredPhpTemplate = 1;
+	function phpTemplate(hljs) {
+	  return {
+	    name: "PHP template",
+	    subLanguage: 'xml',
+	    contains: [
+	      {
+	        begin: /<\?(php|=)?/,
+	        end: /\?>/,
+	        subLanguage: 'php',
+	        contains: [
+	          // We don't want the php closing tag ?> to close the PHP block when
+	          // inside any of the following blocks:
+	          {
+	            begin: '/\\*',
+	            end: '\\*/',
+	            skip: true
+	          },
+	          {
+	            begin: 'b"',
+	            end: '"',
+	            skip: true
+	          },
+	          {
+	            begin: 'b\'',
+	            end: '\'',
+	            skip: true
+	          },
+	          hljs.inherit(hljs.APOS_STRING_MODE, {
+	            illegal: null,
+	            className: null,
+	            contains: null,
+	            skip: true
+	          }),
+	          hljs.inherit(hljs.QUOTE_STRING_MODE, {
+	            illegal: null,
+	            className: null,
+	            contains: null,
+	            skip: true
+	          })
+	        ]
+	      }
+	    ]
+	  };
+	}
+
+	phpTemplate_1 = phpTemplate;
+	return phpTemplate_1;
+}
+
+var requirePhpTemplateExports = requirePhpTemplate();
+
+export { requirePhpTemplateExports as default };
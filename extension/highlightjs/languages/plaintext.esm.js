@@ -0,0 +1,31 @@
+/*
+Language: Plain text
+Author: Egor Rogov (e.rogov@postgrespro.ru)
+Description: Plain text without any highlighting.
+Category: common
+*/
+
+var plaintext_1;
+var hasRequiredPlaintext;
+
+function requirePlaintext () {
+	if (hasRequiredPlaintext) return plaintext_1;
+	hasRequiredPlaintext = 1;
+	function plaintext(hljs) {
+	  return {
+	    name: 'Plain text',
+	    aliases: [
+	      'text',
+	      'txt'
+	    ],
+	    disableAutodetect: true
+	  };
+	}
+
+	plaintext_1 = plaintext;
+	return plaintext_1;
+}
+
+var requirePlaintextExports = requirePlaintext();
+
+export { requirePlaintextExports as default };
@@ -0,0 +1,44 @@
+/*
+Language: Python REPL
+Requires: python.js
+Author: Josh Goebel <hello@joshgoebel.com>
+Category: common
+*/
+
+var pythonRepl_1;
+var hasRequiredPythonRepl;
+
+function requirePythonRepl () {
+	if (hasRequiredPythonRepl) return pythonRepl_1;
+	hasRequiredPythonRepl = 1;
+	function pythonRepl(hljs) {
+	  return {
+	    aliases: [ 'pycon' ],
+	    contains: [
+	      {
+	        className: 'meta.prompt',
+	        starts: {
+	          // a space separates the REPL prefix from the actual code
+	          // this is purely for cleaner HTML output
+	          end: / |$/,
+	          starts: {
+	            end: '$',
+	            subLanguage: 'python'
+	          }
+	        },
+	        variants: [
+	          { begin: /^>>>(?=[ ]|$)/ },
+	          { begin: /^\.\.\.(?=[ ]|$)/ }
+	        ]
+	      }
+	    ]
+	  };
+	}
+
+	pythonRepl_1 = pythonRepl;
+	return pythonRepl_1;
+}
+
+var requirePythonReplExports = requirePythonRepl();
+
+export { requirePythonReplExports as default };
@@ -0,0 +1,36 @@
+/*
+Language: VBScript in HTML
+Requires: xml.js, vbscript.js
+Author: Ivan Sagalaev <maniac@softwaremaniacs.org>
+Description: "Bridge" language defining fragments of VBScript in HTML within <% .. %>
+Website: https://en.wikipedia.org/wiki/VBScript
+Category: scripting
+*/
+
+var vbscriptHtml_1;
+var hasRequiredVbscriptHtml;
+
+function requireVbscriptHtml () {
+	if (hasRequiredVbscriptHtml) return vbscriptHtml_1;
+	hasRequiredVbscriptHtml = 1;
+	function vbscriptHtml(hljs) {
+	  return {
+	    name: 'VBScript in HTML',
+	    subLanguage: 'xml',
+	    contains: [
+	      {
+	        begin: '<%',
+	        end: '%>',
+	        subLanguage: 'vbscript'
+	      }
+	    ]
+	  };
+	}
+
+	vbscriptHtml_1 = vbscriptHtml;
+	return vbscriptHtml_1;
+}
+
+var requireVbscriptHtmlExports = requireVbscriptHtml();
+
+export { requireVbscriptHtmlExports as default };
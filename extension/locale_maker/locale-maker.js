@@ -43,7 +43,12 @@ class LocaleMaker {
     if (!this.defaultLocale) {
       this.notify('"default_locale" is not set')
     } else {
-      fetch(`/_locales/${this.defaultLocale}/messages.json`)
+      // Packaged builds ship compact locales, the full default locale with its
+      // groups and descriptions is in ./messages.json.
+      fetch("messages.json")
+        .then((response) =>
+          response.ok ? response : fetch(`/_locales/${this.defaultLocale}/messages.json`)
+        )
         .then((response) => response.json())
         .then((data) => this.setDefault(data))
         .catch((error) =>
@@ -198,11 +203,25 @@ class LocaleMaker {
     const filename = `${folder}${this.defaultLocale}/messages.json`
     this.saveFile({ data, filename, saveAs: false }) // save default locale
 
+    // Packaged builds ship compact locales with only the messages and placeholder
+    // contents, the groups and descriptions come from the default locale.
     Object.entries(this.locales).forEach(([lang, thisLang]) => {
       let data = JSON.parse(defaultString) // deep clone
-      Object.entries(thisLang).forEach(
-        ([key, value]) => key !== "extensionName" && value && (data[key] = value)
-      )
+      Object.entries(thisLang).forEach(([key, value]) => {
+        if (key === "extensionName" || !value) {
+          return
+        }
+        if (!data[key]) {
+          data[key] = value
+          return
+        }
+        data[key].message = value.message
+        Object.entries(value.placeholders ?? {}).forEach(([name, placeholder]) => {
+          if (data[key].placeholders?.[name]) {
+            data[key].placeholders[name].content = placeholder.content
+          }
+        })
+      })
       const filename = `${folder}${lang}/messages.json`
       this.saveFile({ data, filename, saveAs: false })
     })
@@ -15,7 +15,7 @@
  */
 
 import { marked } from "./vendor/marked.esm.js"
-import hljs from "./highlightjs/highlightjs.esm.js"
+import hljs from "./highlightjs/core.esm.js"
 import { markedHighlight } from "./vendor/marked-highlight.esm.js"
 import markedExtendedTables from "./vendor/marked-extended-tables.esm.js"
 import markedLinkifyIt from "./vendor/marked-linkify-it.esm.js"
@@ -23,6 +23,122 @@ import { urlSchemify } from "./marked-link-scheme.esm.js"
 
 import OptionsStore from "./options/options-storage.js"
 
+// highlight.js grammars are loaded on first use, languages.json maps names and
+// aliases to their modules and lists the sub-languages each one embeds.
+// Generated by tools/highlightjs_split.py.
+let hljsManifest = null
+const hljsSubLanguageStarts = new Map()
+
+async function loadHljsManifest() {
+  if (!hljsManifest) {
+    hljsManifest = fetch(new URL("./highlightjs/languages.json", import.meta.url)).then((r) =>
+      r.json(),
+    )
+  }
+  return hljsManifest
+}
+
+function hljsName(manifest, lang) {
+  return Object.hasOwn(manifest.languages, lang) ? lang : manifest.aliases[lang]
+}
+
+async function registerHljsLanguage(manifest, name) {
+  if (!hljs.getLanguage(name)) {
+    const { default: grammar } = await import(`./highlightjs/${manifest.languages[name].file}`)
+    hljs.registerLanguage(name, grammar)
+  }
+}
+
+// The parts of the pattern a mode begins with, or null if it has none of its own.
+function modeBegin(mode) {
+  if (mode.begin ?? mode.match) {
+    return [mode.begin ?? mode.match].flat()
+  }
+  if (typeof mode.beginKeywords === "string") {
+    return [`\\b(${mode.beginKeywords.split(" ").join("|")})(?!\\.)(?=\\b|\\s)`]
+  }
+  return null
+}
+
+/*
+ * {sub-language: [RegExp or null]}: the patterns that start a mode embedding
+ * the sub-language in name's grammar, taken from the mode or the mode it follows.
+ * A sub-language whose patterns all miss a code block can't be used to highlight
+ * it. null means the start is unknown and the sub-language is always needed.
+ */
+function subLanguageStarts(name) {
+  if (hljsSubLanguageStarts.has(name)) {
+    return hljsSubLanguageStarts.get(name)
+  }
+  const language = hljs.getLanguage(name)
+  const flags = `m${language.case_insensitive ? "i" : ""}${language.unicodeRegex ? "u" : ""}`
+  const starts = {}
+  const seen = new Set()
+  const compile = (begin) => {
+    try {
+      return new RegExp(begin.map((part) => part.source ?? part).join(""), flags)
+    } catch {
+      return null
+    }
+  }
+  // Variants inherit the mode's subLanguage, each one starts it with its own begin.
+  const patterns = (mode, begin) => {
+    begin = modeBegin(mode) ?? begin
+    if (begin) {
+      return [compile(begin)]
+    }
+    if (mode.variants) {
+      return mode.variants.flatMap((variant) => patterns(variant, null))
+    }
+    return [null]
+  }
+  const walk = (mode, begin) => {
+    if (!mode || typeof mode !== "object" || seen.has(mode)) {
+      return
+    }
+    seen.add(mode)
+    if (mode.subLanguage) {
+      for (const sub of [mode.subLanguage].flat()) {
+        ;(starts[sub] ??= []).push(...patterns(mode, begin))
+      }
+    }
+    begin = modeBegin(mode) ?? begin
+    for (const child of [mode.contains, mode.variants].flat()) {
+      walk(child, null)
+    }
+    walk(mode.starts, begin)
+  }
+  walk(language, null)
+  hljsSubLanguageStarts.set(name, starts)
+  return starts
+}
+
+// Register the sub-languages of name, and theirs, that code could need.
+async function registerHljsSubLanguages(manifest, name, code, seen) {
+  for (const [sub, patterns] of Object.entries(subLanguageStarts(name))) {
+    const subName = hljsName(manifest, sub)
+    if (!subName || seen.has(subName)) {
+      continue
+    }
+    if (patterns.some((pattern) => pattern === null || pattern.test(code))) {
+      seen.add(subName)
+      await registerHljsLanguage(manifest, subName)
+      await registerHljsSubLanguages(manifest, subName, code, seen)
+    }
+  }
+}
+
+async function hljsLanguage(lang, code) {
+  const manifest = await loadHljsManifest()
+  const name = hljsName(manifest, lang)
+  if (!name) {
+    return null
+  }
+  await registerHljsLanguage(manifest, name)
+  await registerHljsSubLanguages(manifest, name, code, new Set([name]))
+  return name
+}
+
 const defaultMarkedOptions = Object.assign({}, marked.getDefaults(), {
   mangle: undefined,
   headerIds: undefined,
@@ -58,10 +174,12 @@ export async function resetMarked(userprefs) {
   }
   marked.use(
     markedHighlight({
+      async: true,
       langPrefix: "hljs language-",
-      highlight(code, lang) {
-        const lowerLang = lang.toLowerCase()
-        const language = hljs.getLanguage(lowerLang) ? lowerLang : "plaintext"
+      async highlight(code, lang) {
+        const language =
+          (await hljsLanguage(lang.toLowerCase(), code)) ??
+          (await hljsLanguage("plaintext", code))
         return hljs.highlight(code, { language }).value
       },
     }),
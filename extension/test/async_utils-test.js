@@ -9,6 +9,7 @@ import {
   HLJS_STYLES_PATH,
   sha256Digest,
   getHljsStylesheet,
+  getHljsStyleInfo,
   getHljsStyles,
   getMessage,
 } from "../async_utils.mjs"
@@ -41,6 +42,17 @@ describe("AsyncUtils", function () {
     })
   })
 
+  describe("getHljsStyleInfo", function () {
+    it("should return file, hash and size", async function () {
+      const style_info = await getHljsStyleInfo()
+      const { file, hash, size } = style_info["A11y Dark"]
+      expect(file).to.equal("a11y-dark.css")
+      const data = await getHljsStylesheet(file)
+      expect(hash).to.equal(await sha256Digest(data))
+      expect(size).to.equal(new TextEncoder().encode(data).length)
+    })
+  })
+
   describe("getHljsStylesheet", function () {
     it("should return some css", async function () {
       const KNOWN_PREFIX = "/*!\n  Theme: a11y-dark\n"
@@ -0,0 +1,43 @@
+/*
+ * Copyright JFX 2024
+ * MIT License
+ */
+/* global describe, expect, it, before */
+
+import { gatherCandidates } from "../auto-emoji.js"
+import { getEmojiPrefixIndex } from "../data/emoji_prefix.mjs"
+
+describe("auto-emoji gatherCandidates", function () {
+  let index
+  before(async function () {
+    index = await getEmojiPrefixIndex()
+  })
+
+  function prefixMatches(term) {
+    return index.lookup(term).map(([key, value]) => [key.replaceAll("_", " "), value])
+  }
+
+  it("should list the prefix matches alphabetically up to the limit", async function () {
+    expect(prefixMatches("s").length).to.be.above(10)
+    expect(await gatherCandidates("s")).to.deep.equal(prefixMatches("s").slice(0, 10))
+  })
+
+  it("should put prefix matches before fuzzy matches", async function () {
+    const expected = prefixMatches("smile")
+    expect(expected.length).to.be.within(1, 9)
+    const candidates = await gatherCandidates("smile")
+    expect(candidates.slice(0, expected.length)).to.deep.equal(expected)
+    // sweat_smile only matches fuzzily, it follows the prefix matches.
+    const keys = candidates.map(([key]) => key)
+    expect(keys.indexOf("sweat smile")).to.be.at.least(expected.length)
+    expect(new Set(keys).size).to.equal(keys.length)
+    expect(candidates.length).to.be.at.most(10)
+  })
+
+  it("should fall back to fuzzy matches without a prefix match", async function () {
+    expect(prefixMatches("smiel")).to.deep.equal([])
+    const candidates = await gatherCandidates("smiel")
+    expect(candidates.length).to.be.above(0)
+    expect(candidates.length).to.be.at.most(10)
+  })
+})
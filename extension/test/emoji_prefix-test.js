@@ -0,0 +1,45 @@
+/*
+ * Copyright JFX 2024
+ * MIT License
+ */
+/* global describe, expect, it, before */
+
+import { fetchExtFile } from "../async_utils.mjs"
+import { getEmojiPrefixIndex } from "../data/emoji_prefix.mjs"
+
+describe("EmojiPrefixIndex", function () {
+  let emoji_codes
+  let index
+  before(async function () {
+    emoji_codes = await fetchExtFile("/data/emoji_codes.json", true)
+    index = await getEmojiPrefixIndex()
+  })
+
+  function scan(prefix) {
+    return Object.keys(emoji_codes)
+      .filter((key) => key.startsWith(prefix))
+      .sort()
+      .map((key) => [key, emoji_codes[key]])
+  }
+
+  it("should hold every shortcode", function () {
+    expect(index.keys.length).to.equal(Object.keys(emoji_codes).length)
+  })
+
+  it("should match a full scan for every shortcode prefix", function () {
+    // Every prefix of every shortcode, plus some that match nothing.
+    const prefixes = new Set(["", "zz", "thumbsupp", "+", "-1_"])
+    for (const key of index.keys) {
+      for (let i = 1; i <= key.length; i++) {
+        prefixes.add(key.slice(0, i))
+      }
+    }
+    for (const prefix of prefixes) {
+      expect(index.lookup(prefix), prefix).to.deep.equal(scan(prefix))
+    }
+  })
+
+  it("should stop at the limit", function () {
+    expect(index.lookup("thu", 2)).to.deep.equal(scan("thu").slice(0, 2))
+  })
+})
@@ -0,0 +1,40 @@
+/*
+ * Copyright JFX 2024
+ * MIT License
+ */
+/* global describe, expect, it, before */
+
+import { fetchExtFile } from "../async_utils.mjs"
+import { getEmojiReverseIndex } from "../data/emoji_reverse.mjs"
+
+describe("EmojiReverseIndex", function () {
+  let emoji_codes
+  let index
+  before(async function () {
+    emoji_codes = await fetchExtFile("/data/emoji_codes.json", true)
+    index = await getEmojiReverseIndex()
+  })
+
+  it("should turn every emoji back into one of its shortcodes", function () {
+    for (const emoji of new Set(Object.values(emoji_codes))) {
+      const result = index.unrender(emoji)
+      expect(result, emoji).to.match(/^:[^:]+:$/)
+      expect(emoji_codes[result.slice(1, -1)], emoji).to.equal(emoji)
+    }
+  })
+
+  it("should prefer the longest sequence", function () {
+    const flag = emoji_codes["us"]
+    const family = emoji_codes["family_man_woman_girl"]
+    expect(index.unrender(`${flag}${family}`)).to.equal(":us::family_man_woman_girl:")
+  })
+
+  it("should leave other text alone", function () {
+    const text = "1 + 1 = 2 #hash *star* (a|b) $5"
+    expect(index.unrender(text)).to.equal(text)
+  })
+
+  it("should take a trailing variation selector", function () {
+    expect(index.unrender(`${emoji_codes["heart"]}\uFE0F!`)).to.equal(":heart:!")
+  })
+})
@@ -149,6 +149,14 @@ describe("Markdown-Render", function () {
       expect(await markdownRender(md)).to.equal(target)
     })
 
+    // Sub-languages are only loaded when a code block needs them.
+    it("should highlight languages embedded in a code block", async function () {
+      var md = "```html\n<style>a { color: red }</style>\n```"
+      var target =
+        '<pre><code class="hljs language-html"><span class="hljs-tag">&lt;<span class="hljs-name">style</span>&gt;</span><span class="language-css"><span class="hljs-selector-tag">a</span> { <span class="hljs-attribute">color</span>: red }</span><span class="hljs-tag">&lt;/<span class="hljs-name">style</span>&gt;</span>\n</code></pre>'
+      expect(await markdownRender(md)).to.equal(target)
+    })
+
     // Test issue #132: https://github.com/adam-p/markdown-here/issues/132
     // Smart arrow
     it("should render smart arrows", async function () {
@@ -0,0 +1,105 @@
+#!python
+"""
+Run any of the tools as a subcommand of one process.
+
+    python tools <command> [args...]
+    python tools ci
+
+A command's module, and whatever it imports, is only loaded when the command
+runs. Commands run together, like the steps of `ci`, share the manifest,
+changelog and version.env parsed by project.py.
+"""
+
+import argparse
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+
+HERE = Path(__file__).parent
+
+# Command: (module, how its main is called, help). main takes parse_args(argv) for
+# "args", the argument list for "argv" and nothing for "none".
+COMMANDS = {
+    "auto-i18n": ("auto_i18n", "args", "Translate the locales"),
+    "check-en": ("check_en", "args", "Find untranslated and near duplicate messages"),
+    "detranslate": ("detranslate", "args", "Translate the locales back to English"),
+    "emoji-grab": ("emoji-grab", "args", "Build the emoji shortcode data"),
+    "highlightjs-split": ("highlightjs_split", "argv", "Build highlight.js core and languages"),
+    "highlightjs-styles": ("highlightjs_styles", "args", "Copy the highlight.js styles"),
+    "i18n-bench": ("i18n_bench", "args", "Benchmark the i18n tools"),
+    "i18n-strings-used": ("i18n_strings_used", "args", "Check which messages are used"),
+    "locale-bundle": ("locale_bundle", "args", "Report or write compact production locales"),
+    "locale-index": ("locale_index", "argv", "Print the locale index summary"),
+    "migrate-sample": ("migrate_sample", "none", "Migrate the sample messages"),
+    "mk-vendored": ("mk-vendored", "args", "Write vendored.mk or build vendored libraries"),
+    "package-xpi": ("package_xpi", "args", "Build the XPI"),
+    "rel-notes": ("rel_notes", "none", "Write notes.md for the current version"),
+    "translate-server": ("translate_server", "argv", "Run a stand-in LibreTranslate server"),
+    "translation-memory": ("translation_memory", "argv", "Show translation memory stats"),
+    "updates": ("updates", "args", "Update updates.json"),
+    "version": ("version", "none", "Print the extension version"),
+    "version-env": ("version_env", "none", "Write version.env for GitLab CI"),
+}
+# The `make ci` steps, the arguments given to ci go to the last one.
+CI_STEPS = ["rel-notes", "version-env", "updates"]
+
+
+def load(module_name):
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    if module_name.isidentifier():
+        return importlib.import_module(module_name)
+    # mk-vendored.py and emoji-grab.py can't be imported by name.
+    spec = importlib.util.spec_from_file_location(
+        module_name.replace("-", "_"), HERE / f"{module_name}.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run(command, argv):
+    module_name, call, _ = COMMANDS[command]
+    module = load(module_name)
+    # For the command's own usage messages.
+    sys.argv = [f"tools {command}", *argv]
+    if call == "args":
+        return module.main(module.parse_args(argv))
+    if call == "argv":
+        return module.main(argv)
+    if argv:
+        sys.exit(f"{command} takes no arguments")
+    return module.main()
+
+
+def parse_args(argv):
+    width = max(len(command) for command in COMMANDS)
+    commands = "\n".join(
+        f"  {command:<{width}}  {help}" for command, (_, _, help) in COMMANDS.items()
+    )
+    parser = argparse.ArgumentParser(
+        prog="python tools",
+        description="Run one of the tools.",
+        epilog=f"commands:\n{commands}\n  {'ci':<{width}}  Run {', '.join(CI_STEPS)}",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("command", choices=[*COMMANDS, "ci"], metavar="command")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the command")
+    return parser.parse_args(argv)
+
+
+def main(args):
+    if args.command != "ci":
+        return run(args.command, args.args)
+    for step in CI_STEPS:
+        if result := run(step, args.args if step == CI_STEPS[-1] else []):
+            return result
+
+
+if __name__ == "__main__":
+    # Let the tools import each other by name with `python -m tools` too.
+    if str(HERE) not in sys.path:
+        sys.path.insert(0, str(HERE))
+    sys.exit(main(parse_args(sys.argv[1:])))
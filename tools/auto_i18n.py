@@ -1,28 +1,28 @@
 #!/usr/bin/env python
 
-import copy
+import argparse
 import json
+import os
+import re
 import sys
+import tempfile
+import time
 from pathlib import Path
-import argostranslate.package
-import mmh3
-from argostranslate.translate import get_installed_languages, ITranslation
+from locale_index import (
+    CACHE_FILE as INDEX_CACHE_FILE,
+    SOURCE_LANG,
+    WEBEXT_LOCALES,
+    LocaleIndex,
+    classify_messages,
+    mkHash,
+)
+from timing import Timings
+from translation_backends import BACKENDS, LIBRETRANSLATE_URL, get_backend
+from translation_memory import MAX_ENTRIES, TranslationMemory
+
+# argostranslate pulls in torch, ctranslate2 and stanza, which take tens of seconds
+# to import. They are only imported once a model is actually needed.
 
-SOURCE_LANG = "en"
-WEBEXT_LOCALES = [
-        "de",
-        "es",
-        "fr",
-        "it",
-        "ja",
-        "ko",
-        "pl",
-        "pt_BR",
-        "ru",
-        "tr",
-        "zh_CN",
-        "zh_TW",
-    ]
 ARGOS_LOCALES = [
         "de",
         "es",
@@ -39,23 +39,302 @@ ARGOS_LOCALES = [
     ]
 LOCALES = dict(zip(WEBEXT_LOCALES, ARGOS_LOCALES))
 print(LOCALES)
+BATCH_SIZE = 32
+# --watch polls the source file this often and waits until it has been quiet for
+# WATCH_DEBOUNCE seconds, so an editor's burst of saves is translated once.
+WATCH_INTERVAL = 0.25
+WATCH_DEBOUNCE = 0.5
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "i18n"
+PACKAGE_MANIFEST = CACHE_DIR / "argos-packages.json"
+BLANK_LINES_RE = re.compile(r"(\n[ \t]*\n\s*)")
+FENCE_RE = re.compile(r"^ {0,3}(```|~~~)", re.MULTILINE)
+
+
+def check_locales(locales_path: Path, cache_file: Path = INDEX_CACHE_FILE):
+    """
+    Report stale, missing and extra keys for every locale without loading
+    a model. Returns 1 when a translation run would change anything.
+    """
+    index = LocaleIndex(locales_path, cache_file=cache_file)
+    pending = 0
+    for locale in LOCALES:
+        states = {"stale": [], "missing": []}
+        for key, state, source_hash in index.classify(locale):
+            if state in states:
+                states[state].append(key)
+        extra = index.extra_keys(locale)
+
+        print(
+            f"{locale}: {len(states['stale'])} stale, {len(states['missing'])} missing, "
+            f"{len(extra)} extra"
+        )
+        for label, keys in (("stale", states["stale"]), ("missing", states["missing"]), ("extra", extra)):
+            for key in keys:
+                print(f"  {label}: {key}")
+        pending += len(states["stale"]) + len(states["missing"]) + len(extra)
+
+    return 1 if pending else 0
+
+
+def split_blocks(text: str):
+    """
+    Split Markdown text into blocks separated by blank lines. Returns a list
+    alternating block, separator, block, ... so "".join() gives text back.
+    Blank lines inside fenced code blocks do not start a new block.
+    """
+    parts = BLANK_LINES_RE.split(text)
+    merged = [parts[0]]
+    for i in range(1, len(parts), 2):
+        if len(FENCE_RE.findall(merged[-1])) % 2:
+            merged[-1] += parts[i] + parts[i + 1]
+        else:
+            merged.extend(parts[i : i + 2])
+    return merged
+
+
+def block_spans(parts):
+    """[start, end] offsets of the blocks in "".join(parts), parts as from split_blocks()."""
+    spans = []
+    pos = 0
+    for i, part in enumerate(parts):
+        if i % 2 == 0:
+            spans.append([pos, pos + len(part)])
+        pos += len(part)
+    return spans
+
+
+def load_package_manifest(manifest_file: Path = PACKAGE_MANIFEST):
+    """
+    Read the cached {argos_locale: {"package_path", "package_version"}} map written
+    by the last online run. Entries whose package directory is gone are dropped.
+    """
+    try:
+        with open(manifest_file, "r") as fp:
+            manifest = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+    return {
+        code: entry for code, entry in manifest.items() if Path(entry["package_path"]).is_dir()
+    }
+
+
+def write_package_manifest(installed_packages, manifest_file: Path = PACKAGE_MANIFEST):
+    manifest = {
+        p.to_code: {"package_path": str(p.package_path), "package_version": p.package_version}
+        for p in installed_packages
+        if p.type == "translate" and p.from_code == SOURCE_LANG and p.to_code in ARGOS_LOCALES
+    }
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_file, "w") as fp:
+        json.dump(manifest, fp, indent=2, sort_keys=True)
+    return manifest
+
+
+def translate_with_backend(translation, texts: list, timings: Timings, labels: list):
+    """
+    Hand all texts to a translation_backends Translation in one call, it does its
+    own batching. Per-message time is estimated from each text's share of the characters.
+    """
+    start = time.perf_counter()
+    results = translation.translate_batch(texts)
+    seconds = time.perf_counter() - start
+    timings.add("translate_batch", start, seconds, "batch", texts=len(texts))
+    total_chars = sum(len(text) for text in texts) or 1
+    for label, text in zip(labels, texts):
+        timings.add(
+            "translate",
+            start,
+            seconds * len(text) / total_chars,
+            "message",
+            message=label,
+            chars=len(text),
+            estimated=True,
+        )
+    return results
+
+
+def translate_each(translation, texts: list, timings: Timings, labels: list):
+    results = []
+    for label, text in zip(labels, texts):
+        with timings.span("translate", "message", message=label, chars=len(text)):
+            results.append(translation.translate(text))
+    return results
+
+
+def batch_translate(
+    translation, texts: list, batch_size: int = BATCH_SIZE, timings: Timings = None, labels=None
+):
+    """
+    Translate a list of strings with as few model calls as possible.
+
+    Texts are split into paragraphs and sentences the same way argostranslate
+    does for a single translate() call, then every sentence from every text goes
+    through the CTranslate2 model in length-sorted batches of batch_size.
+    Translations that are not backed by a single argos package (pivots, stubs)
+    fall back to one translate() call per text.
+
+    Per-message spans named by labels are added to timings. In batches, a message's
+    time is estimated from its share of the tokens in the batches it was part of.
+    """
+    timings = timings if timings is not None else Timings()
+    labels = labels if labels is not None else list(range(len(texts)))
+    if hasattr(translation, "translate_batch"):
+        return translate_with_backend(translation, texts, timings, labels)
+    package_translation = getattr(translation, "underlying", translation)
+    if not hasattr(package_translation, "pkg"):
+        return translate_each(translation, texts, timings, labels)
+
+    import ctranslate2
+    import stanza
+    from argostranslate import settings
+    from argostranslate.translate import ITranslation, PackageTranslation
+
+    if not isinstance(package_translation, PackageTranslation) or not settings.stanza_available:
+        return translate_each(translation, texts, timings, labels)
+
+    pkg = package_translation.pkg
+    if package_translation.translator is None:
+        with timings.span("load_model", package=str(pkg.package_path.name)):
+            model_path = str(pkg.package_path / "model")
+            package_translation.translator = ctranslate2.Translator(
+                model_path, device=settings.device
+            )
+    with timings.span("load_sentencizer", package=str(pkg.package_path.name)):
+        sentencizer = stanza.Pipeline(
+            lang=pkg.from_code,
+            dir=str(pkg.package_path / "stanza"),
+            processors="tokenize",
+            use_gpu=settings.device == "cuda",
+            logging_level="WARNING",
+        )
+
+    # Collect phase: each distinct paragraph maps to a range of sentence indexes in tokenized.
+    tokenized = []
+    paragraph_sentences = {}
+    text_paragraphs = []
+    for text in texts:
+        paragraphs = ITranslation.split_into_paragraphs(text)
+        for paragraph in paragraphs:
+            if paragraph in paragraph_sentences:
+                continue
+            start = len(tokenized)
+            for sentence in sentencizer(paragraph).sentences:
+                tokenized.append(pkg.tokenizer.encode(sentence.text))
+            paragraph_sentences[paragraph] = range(start, len(tokenized))
+        text_paragraphs.append(paragraphs)
+
+    # Translate phase: similar lengths share a batch to keep padding down.
+    translated = [None] * len(tokenized)
+    sentence_seconds = [0.0] * len(tokenized)
+    order = sorted(range(len(tokenized)), key=lambda i: len(tokenized[i]))
+    phase_start = time.perf_counter()
+    for start in range(0, len(order), batch_size):
+        batch = order[start : start + batch_size]
+        batch_tokens = sum(len(tokenized[i]) for i in batch) or 1
+        target_prefix = None
+        if pkg.target_prefix != "":
+            target_prefix = [[pkg.target_prefix]] * len(batch)
+        batch_start = time.perf_counter()
+        results = package_translation.translator.translate_batch(
+            [tokenized[i] for i in batch],
+            target_prefix=target_prefix,
+            replace_unknowns=True,
+            max_batch_size=batch_size,
+            beam_size=4,
+            num_hypotheses=1,
+            length_penalty=0.2,
+        )
+        batch_seconds = time.perf_counter() - batch_start
+        timings.add(
+            "translate_batch", batch_start, batch_seconds, "batch", sentences=len(batch), tokens=batch_tokens
+        )
+        for i, result in zip(batch, results):
+            translated[i] = result.hypotheses[0]
+            sentence_seconds[i] = batch_seconds * len(tokenized[i]) / batch_tokens
+
+    for label, text, paragraphs in zip(labels, texts, text_paragraphs):
+        seconds = sum(sentence_seconds[i] for p in paragraphs for i in paragraph_sentences[p])
+        timings.add(
+            "translate", phase_start, seconds, "message", message=label, chars=len(text), estimated=True
+        )
+
+    # Decode the same way argostranslate.translate.apply_packaged_translation does.
+    paragraph_values = {}
+    for paragraph, sentence_range in paragraph_sentences.items():
+        tokens = []
+        for i in sentence_range:
+            tokens += translated[i]
+        value = pkg.tokenizer.decode(tokens)
+        if pkg.target_prefix != "" and value.startswith(pkg.target_prefix):
+            value = value[len(pkg.target_prefix) :]
+        if len(value) > 0 and value[0] == " ":
+            value = value[1:]
+        paragraph_values[paragraph] = value
+
+    return [
+        "".join(["\n" + paragraph_values[p] for p in paragraphs]).lstrip("\n")
+        for paragraphs in text_paragraphs
+    ]
+
+
+def translate_locale_worker(backend, locales_path: Path, options: dict, locale: str):
+    """
+    Process pool entry point. Builds its own offline backend, so the worker
+    only loads the en->locale model it needs, and only if the locale is stale.
+    """
+    translator = backend(locales_path, offline=True, **options)
+    return translator.translate_locale_messages(locale), translator.timings.spans
 
-def mkHash(s):
-    a = mmh3.hash128(s, signed=False)
-    return hex(((a & 0xffffffffffffffff) << 64) + (a >> 64))[2:]
 
 class ArgosTranslate:
     SOURCE_LANG = "en"
 
-    def __init__(self, locales_path: Path):
+    def __init__(
+        self,
+        locales_path: Path,
+        batch_size: int = BATCH_SIZE,
+        offline: bool = None,
+        memory_size: int = MAX_ENTRIES,
+        blocks: bool = False,
+    ):
+        """
+        offline=None checks the cached package manifest and only goes online
+        to refresh the package index when a needed package is missing.
+        offline=True never touches the network, offline=False always refreshes.
+        memory_size=0 disables the translation memory.
+        blocks=True retranslates multi-block messages one Markdown block at a time.
+        """
         self.locales_path = locales_path
-        argostranslate.package.update_package_index()
-        self.available_packages = argostranslate.package.get_available_packages()
-        self.installed_packages = argostranslate.package.get_installed_packages()
+        self.batch_size = batch_size
+        self.blocks = blocks
+        self.options = {"batch_size": batch_size, "memory_size": memory_size, "blocks": blocks}
+        self.memory = TranslationMemory(max_entries=memory_size) if memory_size else None
+        self.timings = Timings()
+        self.index = LocaleIndex(locales_path, cache_file=None)
+        self.translations = {}
         self._installed_languages = []
         self._from_language = None
+        self.setup_packages(offline)
 
+    def setup_packages(self, offline: bool):
+        self.package_manifest = load_package_manifest()
+        if offline is None:
+            offline = all(code in self.package_manifest for code in ARGOS_LOCALES)
+        if not offline:
+            self.refresh_packages()
+
+    def refresh_packages(self):
+        import argostranslate.package
+
+        print("Refreshing argos package index.")
+        with self.timings.span("update_package_index"):
+            argostranslate.package.update_package_index()
+        with self.timings.span("get_available_packages"):
+            self.available_packages = argostranslate.package.get_available_packages()
+        with self.timings.span("get_installed_packages"):
+            self.installed_packages = argostranslate.package.get_installed_packages()
         self.update_packages()
+        self.package_manifest = write_package_manifest(self.installed_packages)
 
     @staticmethod
     def mk_package_map(package_list):
@@ -66,12 +345,14 @@ class ArgosTranslate:
         """
         Install/update argos packages
         """
+        import argostranslate.package
+
         available_packages = self.mk_package_map(self.available_packages)
         installed_packages = self.mk_package_map(self.installed_packages)
         install_packages = self.mk_package_map(
             list(
                 filter(
-                    lambda x: x.from_code == SOURCE_LANG and x.to_code in LOCALES,
+                    lambda x: x.from_code == SOURCE_LANG and x.to_code in ARGOS_LOCALES,
                     self.available_packages,
                 )
             )
@@ -82,17 +363,24 @@ class ArgosTranslate:
                     install_packages[package].package_version
                     > installed_packages[package].package_version
                 ):
-                    installed_packages[package].update()
-                    continue
-            download_path = available_packages[package].download()
-            argostranslate.package.install_from_path(download_path)
-        self.installed_packages = argostranslate.package.get_installed_packages()
+                    with self.timings.span("update_package", package=package):
+                        installed_packages[package].update()
+                continue
+            with self.timings.span("download_package", package=package):
+                download_path = available_packages[package].download()
+            with self.timings.span("install_package", package=package):
+                argostranslate.package.install_from_path(download_path)
+        with self.timings.span("get_installed_packages"):
+            self.installed_packages = argostranslate.package.get_installed_packages()
         self._installed_languages = []
 
     @property
     def installed_languages(self):
         if not self._installed_languages:
-            self._installed_languages = get_installed_languages()
+            from argostranslate.translate import get_installed_languages
+
+            with self.timings.span("get_installed_languages"):
+                self._installed_languages = get_installed_languages()
         return self._installed_languages
 
     @property
@@ -114,23 +402,166 @@ class ArgosTranslate:
         if input_code in LOCALES:
             return LOCALES[input_code]
 
-    def translate_all_locales(self):
-        result_paths = []
-        for locale in LOCALES:
-            result_paths.append(self.translate_single_locale(locale))
+    def get_translation(self, argos_locale: str):
+        """
+        Load the en->argos_locale translation. Packages in the manifest are loaded
+        directly, so only that one language pair is read from disk.
+        """
+        if (entry := self.package_manifest.get(argos_locale)) is None:
+            to_lang = list(filter(lambda x: x.code == argos_locale, self.installed_languages))[0]
+            with self.timings.span("get_translation", locale=argos_locale):
+                return self.from_lang.get_translation(to_lang)
+
+        with self.timings.span("get_translation", locale=argos_locale):
+            from argostranslate.package import Package
+            from argostranslate.translate import CachedTranslation, Language, PackageTranslation
+
+            pkg = Package(Path(entry["package_path"]))
+            from_lang = Language(pkg.from_code, pkg.from_name)
+            to_lang = Language(pkg.to_code, pkg.to_name)
+            return CachedTranslation(PackageTranslation(from_lang, to_lang, pkg))
+
+    def translation(self, argos_locale: str):
+        """get_translation(), loaded once per locale and kept for later calls."""
+        if argos_locale not in self.translations:
+            self.translations[argos_locale] = self.get_translation(argos_locale)
+        return self.translations[argos_locale]
+
+    def get_model_version(self, argos_locale: str):
+        if (entry := self.package_manifest.get(argos_locale)) is None:
+            return "installed"
+        return entry["package_version"]
 
-        self.print_results(result_paths)
+    def translate_all_locales(self, jobs: int = 1, changed_file: Path = None):
+        """
+        Translate every locale. Returns the list of locales whose messages.json
+        was rewritten, which is also written to changed_file if given.
+        """
+        if jobs > 1:
+            results = self.translate_locales_parallel(jobs)
+        else:
+            results = [self.translate_single_locale(locale) for locale in LOCALES]
+
+        self.print_results([dest_file for dest_file, count, skip, changed in results])
+        print(f"Total translated count: {sum(r[1] for r in results)}")
+        print(f"Total skipped count: {sum(r[2] for r in results)}")
+        if self.memory is not None:
+            print(f"Translation memory: {len(self.memory)} entries")
+
+        changed_locales = [dest_file.parent.name for dest_file, count, skip, changed in results if changed]
+        if changed_locales:
+            print(f"Changed locales: {' '.join(changed_locales)}")
+        else:
+            print("No locale files changed.")
+        if changed_file is not None:
+            with open(changed_file, "w") as fp:
+                fp.writelines(f"{locale}\n" for locale in changed_locales)
+        return changed_locales
+
+    def watch(self, interval: float = WATCH_INTERVAL, debounce: float = WATCH_DEBOUNCE):
+        """
+        Translate every locale, then keep retranslating whenever the source
+        messages.json is saved, until interrupted. Models stay loaded between
+        changes and only stale keys reach them.
+        """
+        import contextlib
+        import io
+
+        source_file = self.index.path(SOURCE_LANG)
+        print(f"Watching {source_file}, Ctrl-C to stop.")
+        stat = self.index.stat(SOURCE_LANG)
+        self.translate_all_locales()
+        try:
+            while True:
+                time.sleep(interval)
+                if self.index.stat(SOURCE_LANG) == stat:
+                    continue
+                # Wait for the editor to finish writing.
+                while True:
+                    stat = self.index.stat(SOURCE_LANG)
+                    time.sleep(debounce)
+                    if self.index.stat(SOURCE_LANG) == stat:
+                        break
+                if stat is None:
+                    continue
+
+                start = time.perf_counter()
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        results = [self.translate_single_locale(locale) for locale in LOCALES]
+                except ValueError as e:
+                    print(f"{time.strftime('%H:%M:%S')} {source_file} is not valid JSON: {e}")
+                    continue
+                done = time.time()
+                count = sum(count for dest_file, count, skip, changed in results)
+                changed = [dest_file.parent.name for dest_file, count, skip, changed in results if changed]
+                print(
+                    f"{time.strftime('%H:%M:%S')} {count} messages translated, "
+                    f"{len(changed)} locales written in {time.perf_counter() - start:.2f}s, "
+                    f"{done - stat[0] / 1e9:.2f}s after the save"
+                )
+        except KeyboardInterrupt:
+            pass
+
+    def write_timings(self, trace_file: Path):
+        """Print per-stage totals and slow messages, and write them with all spans to trace_file."""
+        stages = self.timings.totals()
+        print("Stage timings:")
+        for name, total in sorted(stages.items(), key=lambda item: -item[1]["seconds"]):
+            print(f"  {name:<24} {total['count']:>5}  {total['seconds']:9.3f}s")
+        slow_messages = [
+            {"message": span["args"]["message"], "seconds": span["dur"], "chars": span["args"]["chars"]}
+            for span in self.timings.outliers()
+        ]
+        if slow_messages:
+            print("Slow messages:")
+            for slow in slow_messages:
+                print(f"  {slow['message']:<60} {slow['seconds']:7.3f}s  {slow['chars']} chars")
+        self.timings.write(trace_file, stages=stages, slow_messages=slow_messages)
+        print(f"Wrote {trace_file}.")
+
+    def translate_locales_parallel(self, jobs: int):
+        """
+        Translate each locale in a worker process. Workers only return the new
+        messages, files are written here so output stays in one place.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        source_file = self.locales_path / "en" / "messages.json"
+        results = []
+        with ProcessPoolExecutor(max_workers=min(jobs, len(LOCALES))) as executor:
+            futures = {
+                locale: executor.submit(
+                    translate_locale_worker, type(self), self.locales_path, self.options, locale
+                )
+                for locale in LOCALES
+            }
+            for locale, future in futures.items():
+                (new_messages_dest, count, skip), spans = future.result()
+                self.timings.extend(spans)
+                dest_file = self.get_i18n_output_path(locale, source_file)
+                changed = self.write_messages(dest_file, new_messages_dest)
+                print(f"{locale}: translated {count}, skipped {skip}")
+                results.append((dest_file, count, skip, changed))
+        return results
 
     def translate_single_locale(self, locale: str):
         argos_locale = self.code2argos(locale)
         print(f"Translating {locale} ({argos_locale}).")
-        to_lang = list(filter(lambda x: x.code == argos_locale, self.installed_languages))[0]
-        translation = self.from_lang.get_translation(to_lang)
         source_file = self.locales_path / "en" / "messages.json"
         dest_file = self.get_i18n_output_path(locale, source_file)
-        self.i18n_translate(source_file, dest_file, translation)
+        with self.timings.span("locale", "locale", locale=locale):
+            result = self.i18n_translate(dest_file, argos_locale)
         print("")
-        return dest_file
+        return result
+
+    def translate_locale_messages(self, locale: str):
+        """Translate a locale in memory, returns (new_messages_dest, count, skip)."""
+        argos_locale = self.code2argos(locale)
+        print(f"Translating {locale} ({argos_locale}).")
+        with self.timings.span("locale", "locale", locale=locale):
+            messages_source, messages_dest = self.load_messages(locale)
+            return self.translate_messages(messages_source, messages_dest, argos_locale)
 
     def get_i18n_output_path(self, locale: str, file_path: Path):
         dir_path = file_path.parent.parent
@@ -139,71 +570,333 @@ class ArgosTranslate:
         out_path.parent.mkdir(parents=True, exist_ok=True)
         return out_path
 
-    def i18n_translate(self, source_file: Path, dest_file: Path, underlying_translation: ITranslation):
-        with open(source_file, "r") as fp:
-            messages_source = json.load(fp)
+    def i18n_translate(self, dest_file: Path, argos_locale: str):
+        messages_source, messages_dest = self.load_messages(dest_file.parent.name)
+        new_messages_dest, count, skip = self.translate_messages(
+            messages_source, messages_dest, argos_locale
+        )
+        changed = self.write_messages(dest_file, new_messages_dest)
+
+        print(f"Translated count: {count}")
+        print(f"Skipped count: {skip}")
+        return dest_file, count, skip, changed
 
-        if dest_file.exists() and dest_file.is_file():
-            with open(dest_file, "r") as fp:
+    def load_messages(self, locale: str):
+        """
+        Return (source messages, locale messages). The source is parsed once
+        through the locale index and shared by every locale, never modify it.
+        """
+        dest_file = self.index.path(locale)
+        with self.timings.span("load_messages", file=str(dest_file)):
+            messages_source = self.index.load(SOURCE_LANG)
+            if dest_file.is_file():
                 print("Existing messages.json file found. Updating.")
-                messages_dest = json.load(fp)
-        else:
-            print(f"Translating entire source file to {dest_file}.")
-            messages_dest = {}
+                messages_dest = self.index.load(locale)
+            else:
+                print(f"Translating entire source file to {dest_file}.")
+                messages_dest = {}
+        return messages_source, messages_dest
+
+    def write_messages(self, dest_file: Path, messages):
+        with self.timings.span("write_messages", file=str(dest_file)):
+            return self.write_messages_file(dest_file, messages)
+
+    @staticmethod
+    def write_messages_file(dest_file: Path, messages):
+        """
+        Write messages to dest_file unless it already holds exactly that content,
+        so unchanged locales keep their mtime. Returns True if the file changed.
+        The new file is written next to dest_file and renamed into place.
+        """
+        content = json.dumps(messages, ensure_ascii=False, indent=2).encode("utf-8")
+        mode = 0o644
+        if dest_file.exists():
+            if dest_file.read_bytes() == content:
+                return False
+            mode = dest_file.stat().st_mode & 0o777
+
+        fd, tmp_name = tempfile.mkstemp(dir=dest_file.parent, prefix=".messages.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(content)
+            os.chmod(tmp_name, mode)
+            os.replace(tmp_name, dest_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        return True
+
+    def translate_messages(self, messages_source, messages_dest, argos_locale: str):
         new_messages_dest = {}
+        stale_keys = {}
+        stale_blocks = {}
+        source_messages = {}
+        names = {}
 
-        count = 0
         skip = 0
 
-        # Iterate through messages by key from the source file. If the message key is present in the destination file
-        # and "hash" matches the source language hash, skip it. Otherwise, translate it.
         # Messages are added in order to new_messages_dest so order matches the source language,
-        # Extra keys in translated languages are dropped because we never iterate through messages_dest.
-        for key in messages_source.keys():
-            source_message = messages_source[key].get("message", "")
-            if source_message.startswith("__WET_GROUP__"):
-                new_messages_dest[key] = copy.deepcopy(messages_source[key])
+        # stale ones are queued for translation and filled in once the batch comes back.
+        for key, state, source_hash in classify_messages(messages_source, messages_dest):
+            if state == "group":
+                new_messages_dest[key] = messages_source[key]
                 skip += 1
                 continue
-            if source_message == "__WET_LOCALE__" and key in messages_dest.keys():
-                new_messages_dest[key] = copy.deepcopy(messages_dest[key])
+            if state in ("locale", "current"):
+                new_messages_dest[key] = messages_dest[key]
                 skip += 1
                 continue
 
-            source_hash = mkHash(source_message)
-            if key in messages_dest.keys():
-                dest_hash = messages_dest[key].get("hash")
-                if dest_hash is not None and source_hash == dest_hash:
-                    new_messages_dest[key] = copy.deepcopy(messages_dest[key])
-                    skip += 1
-                    continue
+            source_message = messages_source[key].get("message", "")
+            new_messages_dest[key] = None
+            stale_keys[key] = source_hash
+            if self.blocks and len(parts := split_blocks(source_message)) > 1:
+                stale_blocks[key] = parts, self.reusable_blocks(messages_dest.get(key))
+                for i, block in enumerate(parts[::2]):
+                    block_hash = mkHash(block)
+                    if block and block_hash not in stale_blocks[key][1]:
+                        source_messages[block_hash] = block
+                        names.setdefault(block_hash, f"{key}#{i}")
+            else:
+                source_messages[source_hash] = source_message
+                names.setdefault(source_hash, key)
 
-            new_message = copy.deepcopy(messages_source[key])
-            new_message["message"] = underlying_translation.translate(source_message)
-            new_message["hash"] = source_hash
+        if not stale_keys:
+            return new_messages_dest, 0, skip
 
+        translated = self.translate_hashed(source_messages, argos_locale, names)
+        for key, source_hash in stale_keys.items():
+            # Shallow copy, nested values like placeholders are never modified.
+            new_message = dict(messages_source[key])
+            if key in stale_blocks:
+                parts, reusable = stale_blocks[key]
+                block_hashes = [mkHash(block) for block in parts[::2]]
+                for i, block_hash in enumerate(block_hashes):
+                    if block_hash in reusable:
+                        parts[i * 2] = reusable[block_hash]
+                    elif parts[i * 2]:
+                        parts[i * 2] = translated[block_hash]
+                new_message["message"] = "".join(parts)
+                new_message["block_hashes"] = block_hashes
+                new_message["block_spans"] = block_spans(parts)
+            else:
+                new_message["message"] = translated[source_hash]
+            new_message["hash"] = source_hash
             new_messages_dest[key] = new_message
-            count += 1
+        count = len(stale_keys)
 
-        with open(dest_file, "w", encoding="utf-8") as fp:
-            json.dump(new_messages_dest, fp, ensure_ascii=False, indent=2)
+        return new_messages_dest, count, skip
 
-        print(f"Translated count: {count}")
-        print(f"Skipped count: {skip}")
-        return dest_file
+    @staticmethod
+    def reusable_blocks(dest_message):
+        """
+        Map block hash to translated block for a previous block-wise translation.
+        The blocks are cut from the translation at the recorded block_spans, the
+        translated text may not split the same way the source did. Only usable
+        when the spans still cover the message with only whitespace between them.
+        """
+        if dest_message is None or "block_spans" not in dest_message:
+            return {}
+        message = dest_message.get("message", "")
+        block_hashes, spans = dest_message.get("block_hashes", []), dest_message["block_spans"]
+        if len(spans) != len(block_hashes):
+            return {}
+        pos = 0
+        for start, end in spans:
+            if not pos <= start <= end <= len(message) or message[pos:start].strip():
+                return {}
+            pos = end
+        if message[pos:].strip():
+            return {}
+        return {
+            block_hash: message[start:end] for block_hash, (start, end) in zip(block_hashes, spans)
+        }
 
+    def translate_hashed(self, source_messages: dict, argos_locale: str, names: dict = None):
+        """
+        Translate {source_hash: message} to {source_hash: translation}. The
+        translation memory is consulted first, only misses reach the model.
+        names maps hashes to message keys for the timing report.
+        """
+        names = names or {}
+        model_version = self.get_model_version(argos_locale)
+        translated = {}
+        if self.memory is not None:
+            with self.timings.span("translation_memory", locale=argos_locale):
+                translated = self.memory.get_many(
+                    source_messages.keys(), argos_locale, model_version
+                )
+        missing = [h for h in source_messages if h not in translated]
+        if missing:
+            # The model is only loaded once we know there is something to translate.
+            translation = self.translation(argos_locale)
+            results = batch_translate(
+                translation,
+                [source_messages[h] for h in missing],
+                self.batch_size,
+                self.timings,
+                [f"{argos_locale}:{names.get(h, h)}" for h in missing],
+            )
+            new_translations = dict(zip(missing, results))
+            if self.memory is not None:
+                with self.timings.span("translation_memory", locale=argos_locale):
+                    self.memory.put_many(new_translations, argos_locale, model_version)
+            translated.update(new_translations)
+        if self.memory is not None:
+            print(f"Translation memory: {len(translated) - len(missing)} hits, {len(missing)} misses")
+        return translated
+
+
+class BackendTranslate(ArgosTranslate):
+    """
+    Translate through one of the translation_backends services (stub,
+    libretranslate, ...) instead of the argos packages managed by ArgosTranslate.
+    """
+
+    def __init__(self, locales_path: Path, backend: str = "stub", backend_options: dict = None, **kwargs):
+        self.backend = get_backend(backend, **(backend_options or {}))
+        super().__init__(locales_path, **kwargs)
+        self.options.update(backend=backend, backend_options=backend_options)
+
+    def setup_packages(self, offline: bool):
+        self.package_manifest = {}
+
+    def get_translation(self, argos_locale: str):
+        with self.timings.span("get_translation", locale=argos_locale):
+            return self.backend.get_translation(SOURCE_LANG, argos_locale)
 
-def main(locales_path: Path):
+    def get_model_version(self, argos_locale: str):
+        return self.backend.model_version(SOURCE_LANG, argos_locale)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Machine translate extension locales.")
+    parser.add_argument("locales_path", type=Path, help="Path to the _locales directory")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"Sentences per model call (default {BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Translate locales in this many worker processes (default 1)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS.keys(),
+        default="argos",
+        help="Translation backend, 'stub' needs no models (default argos)",
+    )
+    parser.add_argument(
+        "--backend-url",
+        default=LIBRETRANSLATE_URL,
+        help=f"LibreTranslate server for --backend libretranslate (default {LIBRETRANSLATE_URL})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Requests in flight per locale for --backend libretranslate (default 4)",
+    )
+    network = parser.add_mutually_exclusive_group()
+    network.add_argument(
+        "--offline",
+        dest="offline",
+        action="store_true",
+        default=None,
+        help="Never refresh the argos package index",
+    )
+    network.add_argument(
+        "--refresh",
+        dest="offline",
+        action="store_false",
+        help="Always refresh the argos package index and update packages",
+    )
+    parser.add_argument(
+        "--memory-size",
+        type=int,
+        default=MAX_ENTRIES,
+        help=f"Translation memory entries to keep, 0 disables it (default {MAX_ENTRIES})",
+    )
+    parser.add_argument(
+        "--blocks",
+        action="store_true",
+        help="Retranslate only the changed Markdown blocks of multi-block messages",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report stale, missing and extra keys, exit 1 if there is work to do",
+    )
+    parser.add_argument(
+        "--changed-file",
+        type=Path,
+        help="Write the names of locales whose messages.json changed to this file",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        help="Write per-stage and per-message timings to this file as a Chrome trace",
+    )
+    parser.add_argument("--profile", type=Path, help="Run under cProfile and save the stats here")
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep the models loaded and retranslate whenever the source messages.json is saved",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=WATCH_DEBOUNCE,
+        help=f"--watch waits until the source was unchanged this long (default {WATCH_DEBOUNCE}s)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(args):
+    locales_path = args.locales_path
     if not locales_path.is_dir():
         raise NotADirectoryError(locales_path)
-    translator = ArgosTranslate(locales_path)
-    translator.translate_all_locales()
+    if args.check:
+        return check_locales(locales_path)
+
+    if args.profile:
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    options = {
+        "batch_size": args.batch_size,
+        "offline": args.offline,
+        "memory_size": args.memory_size,
+        "blocks": args.blocks,
+    }
+    if args.backend == "argos":
+        translator = ArgosTranslate(locales_path, **options)
+    else:
+        backend_options = None
+        if args.backend == "libretranslate":
+            backend_options = {"url": args.backend_url, "concurrency": args.concurrency}
+        translator = BackendTranslate(
+            locales_path, backend=args.backend, backend_options=backend_options, **options
+        )
+    if args.watch:
+        # Models are kept warm in this process, so --jobs doesn't apply.
+        translator.watch(debounce=args.debounce)
+    else:
+        translator.translate_all_locales(jobs=args.jobs, changed_file=args.changed_file)
+    if args.profile:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+    if args.trace:
+        translator.write_timings(args.trace)
 
 
 if __name__ == "__main__":
-    try:
-        argv1 = Path(sys.argv[1])
-    except Exception as e:
-        print(f"Problem initializing {sys.argv[1]} for translations.")
-        raise
-    sys.exit(main(argv1))
+    sys.exit(main(parse_args(sys.argv[1:])))
@@ -1,44 +1,161 @@
 #!python3
 
+import argparse
 import os.path as osp
-import json
-
-WEBEXT_LOCALES = [
-        "de",
-        "es",
-        "fr",
-        "it",
-        "ja",
-        "ko",
-        "pl",
-        "pt_BR",
-        "ru",
-        "tr",
-        "zh_CN",
-        "zh_TW",
-    ]
-
-
-def main():
-    result = set()
-    src_root = osp.abspath(osp.join(osp.dirname(__file__), "..", "extension"))
-    with open(osp.join(src_root, "_locales/en/messages.json")) as fp:
-        source_strings_data = json.load(fp)
+import re
+import sys
+
+import mmh3
+
+from locale_index import CACHE_FILE, SOURCE_LANG, WEBEXT_LOCALES, LocaleIndex
+
+# Near-duplicates are found with MinHash over character n-grams of the normalized
+# messages. One-permutation hashing gives a NUM_BINS signature from one hash per
+# n-gram, and locality sensitive hashing over BANDS bands turns the signature into
+# bucket keys, so a translation is only compared with the sources sharing a bucket.
+NGRAM = 3
+NUM_BINS = 32
+BANDS = 8
+THRESHOLD = 0.8
+EMPTY_BIN = 1 << 32
+# Placeholders like $APPNAME$ and HTML tags, which stay the same in a translation.
+MARKUP_RE = re.compile(r"\$[A-Za-z0-9_@]+\$|<[^>]*>")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def find_untranslated(locales_path, cache_file=CACHE_FILE):
+    """Return {lang: [(key, message), ...]} for translations identical to the English source."""
+    return LocaleIndex(locales_path, cache_file=cache_file).untranslated(WEBEXT_LOCALES)
+
+
+def normalize(message):
+    """Case, whitespace, placeholders and tags don't make a translation."""
+    return WHITESPACE_RE.sub(" ", MARKUP_RE.sub(" ", message)).strip().casefold()
+
+
+def ngrams(text):
+    """Return the set of hashed character n-grams of text."""
+    if len(text) <= NGRAM:
+        return {mmh3.hash(text, signed=False)}
+    return {mmh3.hash(text[i : i + NGRAM], signed=False) for i in range(len(text) - NGRAM + 1)}
+
+
+def minhash(grams):
+    bins = [EMPTY_BIN] * NUM_BINS
+    for gram in grams:
+        value, b = divmod(gram, NUM_BINS)
+        if value < bins[b]:
+            bins[b] = value
+    return bins
+
+
+def band_keys(signature):
+    """Yield an LSH bucket key per band, skipping bands of empty bins."""
+    rows = NUM_BINS // BANDS
+    for band in range(BANDS):
+        values = tuple(signature[band * rows : (band + 1) * rows])
+        if any(value != EMPTY_BIN for value in values):
+            yield band, values
+
 
-    source_messages_items = [(key, source_strings_data[key]["message"]) for key in source_strings_data.keys() if not key.startswith("__WET")]
-    source_messages = dict(source_messages_items)
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
 
+
+class SourceIndex:
+    """MinHash LSH index over the source messages, built once."""
+
+    def __init__(self, source_messages):
+        self.grams = {}
+        self.exact = {}
+        self.buckets = {}
+        for key, message in source_messages.items():
+            text = normalize(message)
+            if not text:
+                continue
+            self.exact.setdefault(text, []).append(key)
+            self.grams[key] = grams = ngrams(text)
+            for bucket in band_keys(minhash(grams)):
+                self.buckets.setdefault(bucket, []).append(key)
+
+    def query(self, message, threshold=THRESHOLD):
+        """Return [(similarity, source key), ...] at or above threshold, most similar first."""
+        text = normalize(message)
+        if not text:
+            return []
+        matches = {key: 1.0 for key in self.exact.get(text, [])}
+        grams = ngrams(text)
+        # Sets this different in size can't reach the threshold, skip the intersection.
+        low, high = len(grams) * threshold, len(grams) / threshold if threshold else float("inf")
+        for bucket in band_keys(minhash(grams)):
+            for key in self.buckets.get(bucket, []):
+                if key not in matches:
+                    source_grams = self.grams[key]
+                    if low <= len(source_grams) <= high:
+                        matches[key] = jaccard(grams, source_grams)
+                    else:
+                        matches[key] = 0.0
+        return sorted(
+            ((similarity, key) for key, similarity in matches.items() if similarity >= threshold),
+            key=lambda match: (-match[0], match[1]),
+        )
+
+
+def find_near_duplicates(locales_path, threshold=THRESHOLD, cache_file=CACHE_FILE):
+    """
+    Return {lang: [(key, similarity, source key, message), ...]} for translations
+    that are near-identical to some source message. Exact copies of the key's own
+    source are left to find_untranslated().
+    """
+    index = LocaleIndex(locales_path, cache_file=cache_file)
+    source_messages = {
+        key: message
+        for key in index.keys(SOURCE_LANG)
+        if not key.startswith("__WET") and (message := index.message(SOURCE_LANG, key))
+    }
+    source_index = SourceIndex(source_messages)
+
+    result = {}
+    for lang in WEBEXT_LOCALES:
+        result[lang] = []
+        for key, source_message in source_messages.items():
+            tr_msg = index.message(lang, key)
+            if tr_msg is None or tr_msg == source_message:
+                continue
+            matches = source_index.query(tr_msg, threshold)
+            if matches:
+                similarity, source_key = matches[0]
+                result[lang].append((key, similarity, source_key, tr_msg))
+    return result
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Find translations that are still English.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help=f"Report translations at least this similar to a source message (default {THRESHOLD})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(args):
+    src_root = osp.abspath(osp.join(osp.dirname(__file__), "..", "extension"))
+    locales_path = osp.join(src_root, "_locales")
+    untranslated = find_untranslated(locales_path)
     for lang in WEBEXT_LOCALES:
-        with open(osp.join(src_root, f"_locales/{lang}/messages.json")) as fp:
-            lang_data = json.load(fp)
-
-        for key, msg in source_messages.items():
-            if key in lang_data:
-                tr_msg = lang_data[key]["message"]
-                if tr_msg == msg:
-                    print(f"{lang}: {key} is {tr_msg}")
+        for key, tr_msg in untranslated[lang]:
+            print(f"{lang}: {key} is {tr_msg}")
         print("\n")
 
+    near_duplicates = find_near_duplicates(locales_path, args.threshold)
+    print("Near-identical translations")
+    for lang in WEBEXT_LOCALES:
+        for key, similarity, source_key, tr_msg in near_duplicates[lang]:
+            like = "" if source_key == key else f" like {source_key}"
+            print(f"{lang}: {key} is {similarity:.0%}{like}: {tr_msg}")
+
 
 if __name__ == "__main__":
-    main()
+    main(parse_args(sys.argv[1:]))
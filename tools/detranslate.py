@@ -1,53 +1,161 @@
 #!/usr/bin/env python
+"""
+Round-trip QA: translate the locales back to English and compare with the source.
 
+Back-translations are kept in a translation memory keyed by the hash of the
+translated message, so only messages that changed since the last run are sent
+to the backend. Each locale is sent in batches of at most --batch-chars
+characters, a failed batch only loses its own messages, and --jobs locales
+run at once. The per-key report with the similarity of source and
+back-translation is written to --report.
+"""
+
+import argparse
 import json
-import os.path as osp
-from mintrans import GoogleTranslator
-
-SOURCE_LANG = "en"
-WEBEXT_LOCALES = [
-        # "de",
-        "es",
-        "fr",
-        "it",
-        "ja",
-        "ko",
-        "pl",
-        "pt_BR",
-        "ru",
-        "tr",
-        "zh_CN",
-        "zh_TW",
-    ]
-
-
-def main():
-    google_translator = GoogleTranslator()
-
-    src_root = osp.abspath(osp.join(osp.dirname(__file__), "..", "extension"))
-    with open(osp.join(src_root, "_locales/en/messages.json")) as fp:
-        source_strings_data = json.load(fp)
-
-    source_messages_items = [(key, source_strings_data[key]["message"]) for key in source_strings_data.keys() if not key.startswith("__WET")]
-    source_messages = dict(source_messages_items)
-
-    for lang in WEBEXT_LOCALES:
-        print(f"Translating {lang}.")
-        with open(osp.join(src_root, f"_locales/{lang}/messages.json")) as fp:
-            lang_data = json.load(fp)
-
-        dest_messages = [lang_data[key]["message"] for key in
-                                 lang_data.keys() if key in source_messages]
-
-        gt = google_translator.translate("\n".join(dest_messages), lang, "en-US")
-        print(gt)
-        for s in gt["sentences"]:
-            trans = s["trans"].strip()
-            orig = s["orig"].strip()
-            print(f"{trans:<70} {orig}")
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from check_en import jaccard, ngrams, normalize
+from locale_index import SOURCE_LANG, WEBEXT_LOCALES, LocaleIndex, mkHash
+from translation_backends import BACKENDS, LIBRETRANSLATE_URL, get_backend
+from translation_memory import TranslationMemory
+
+# de is left out.
+LOCALES = [lang for lang in WEBEXT_LOCALES if lang != "de"]
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "i18n"
+MEMORY_FILE = CACHE_DIR / "back-translations.sqlite3"
+REPORT_FILE = CACHE_DIR / "detranslate-report.json"
+BATCH_CHARS = 4000
+BATCH_SIZE = 50
+
+
+def similarity(a, b):
+    """Jaccard similarity of the normalized texts' character n-grams, as in check_en."""
+    return jaccard(ngrams(normalize(a)), ngrams(normalize(b)))
+
+
+def make_batches(messages, batch_chars=BATCH_CHARS, batch_size=BATCH_SIZE):
+    """Split [(hash, text)] into lists of at most batch_size texts and about batch_chars characters."""
+    batch = []
+    chars = 0
+    for item in messages:
+        if batch and (chars + len(item[1]) > batch_chars or len(batch) == batch_size):
+            yield batch
+            batch = []
+            chars = 0
+        batch.append(item)
+        chars += len(item[1])
+    if batch:
+        yield batch
+
 
+def back_translate(translation, messages, batch_chars=BATCH_CHARS):
+    """
+    Translate [(hash, text)] batch by batch. Returns ({hash: back-translation},
+    number of failed messages), a failed batch is reported and skipped.
+    """
+    translated = {}
+    failed = 0
+    for batch in make_batches(messages, batch_chars):
+        try:
+            results = translation.translate_batch([text for message_hash, text in batch])
+        except Exception as e:
+            print(f"{translation.source}: batch of {len(batch)} failed: {e}", file=sys.stderr)
+            failed += len(batch)
+            continue
+        for (message_hash, text), result in zip(batch, results):
+            translated[message_hash] = result.strip()
+    return translated, failed
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Translate the locales back to English.")
+    parser.add_argument("--backend", choices=BACKENDS.keys(), default="google")
+    parser.add_argument("--backend-url", default=LIBRETRANSLATE_URL)
+    parser.add_argument("--jobs", "-j", type=int, default=4, help="Locales translated at once (default 4)")
+    parser.add_argument(
+        "--batch-chars",
+        type=int,
+        default=BATCH_CHARS,
+        help=f"Characters per request (default {BATCH_CHARS})",
+    )
+    parser.add_argument("--report", type=Path, default=REPORT_FILE, help="Per-key JSON report")
+    parser.add_argument("--locales", nargs="*", default=LOCALES, help="Locales to check")
+    return parser.parse_args(argv)
+
+
+def main(args):
+    index = LocaleIndex()
+    source_keys = [key for key in index.keys(SOURCE_LANG) if not key.startswith("__WET")]
+    memory = TranslationMemory(MEMORY_FILE)
+
+    # Keyed by the backend's version_key, so the backend and its libraries are only
+    # set up when something actually needs translating.
+    options = {"url": args.backend_url} if args.backend == "libretranslate" else {}
+    model_version = BACKENDS[args.backend].version_key(**options)
+    pending = {}
+    backtranslations = {}
+    for lang in args.locales:
+        messages = {}
+        for key in source_keys:
+            if (message := index.message(lang, key)) is not None:
+                messages.setdefault(mkHash(message), message)
+        cached = memory.get_many(messages, f"{lang}>{SOURCE_LANG}", model_version)
+        backtranslations[lang] = cached
+        missing = [(h, message) for h, message in messages.items() if h not in cached]
+        if missing:
+            pending[lang] = missing
+    print(f"Back-translations: {memory.hits} cached, {memory.misses} to translate.")
+
+    failed = 0
+    if pending:
+        backend = get_backend(args.backend, **options)
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            futures = {
+                lang: executor.submit(
+                    back_translate,
+                    backend.get_translation(backend.language_code(lang), backend.language_code("en-US")),
+                    messages,
+                    args.batch_chars,
+                )
+                for lang, messages in pending.items()
+            }
+            for lang, future in futures.items():
+                translated, lang_failed = future.result()
+                failed += lang_failed
+                memory.put_many(translated, f"{lang}>{SOURCE_LANG}", model_version)
+                backtranslations[lang].update(translated)
+                print(f"{lang}: translated {len(translated)}, failed {lang_failed}")
+        backend.close()
+    memory.close()
+
+    report = {}
+    for lang in args.locales:
+        print(f"{lang}:")
+        report[lang] = {}
+        for key in source_keys:
+            message = index.message(lang, key)
+            back = backtranslations[lang].get(mkHash(message)) if message is not None else None
+            if back is None:
+                continue
+            source = index.message(SOURCE_LANG, key)
+            score = similarity(source, back)
+            report[lang][key] = {
+                "source": source,
+                "message": message,
+                "back_translation": back,
+                "similarity": round(score, 3),
+            }
+            print(f"  {score:4.0%} {back:<70} {message.strip()}")
         print("************")
 
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.report, "w") as fp:
+        json.dump(report, fp, ensure_ascii=False, indent=2)
+    print(f"Wrote {args.report}.")
+    return 1 if failed else 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(parse_args(sys.argv[1:])))
@@ -2,14 +2,39 @@
 """
 Build emoji_codes.json file for the marked-emoji plugin.
 Uses emojbase-data to get the Github shortcodes.
+
+Also writes emoji_prefix.json next to it for shortcode autocomplete, see
+prefix_index() and extension/data/emoji_prefix.mjs, and emoji_reverse.json
+for turning emoji back into shortcodes, see reverse_index() and
+extension/data/emoji_reverse.mjs.
 """
+import argparse
 import json
+import re
 import sys
+from pathlib import Path
+
+PREFIX_INDEX = "emoji_prefix.json"
+REVERSE_INDEX = "emoji_reverse.json"
+# Shortcode prefixes up to this length get a bucket of offsets into the sorted keys.
+PREFIX_LEN = 2
+# Characters with a meaning in a JavaScript regular expression with the u flag.
+REGEX_SYNTAX = set("^$\\.*+?()[]{}|/")
+VARIATION_SELECTOR = "\uFE0F"
+EMOJIBASE_CODE_RE = re.compile(r"[0-9A-Fa-f]+(?:-[0-9A-Fa-f]+)*")
 
 
 def get_data(source_file):
+    """
+    emojibase-data's shortcodes, keyed by hex code points. The preferred
+    shortcode of each emoji is the first one listed, so a {shortcode: emoji}
+    file such as emoji_codes.json, which has lost that order, is refused.
+    """
     with open(source_file) as f:
-        return json.load(f)
+        data = json.load(f)
+    if not all(EMOJIBASE_CODE_RE.fullmatch(code) for code in data):
+        sys.exit(f"{source_file} is not emojibase-data shortcodes keyed by code points.")
+    return data
 
 
 def gh_uni2entities(code):
@@ -30,7 +55,94 @@ def gh_uni2char(code):
     return char
 
 
-def main(source, dest):
+def prefix_index(emoji_shortcuts, prefix_len=PREFIX_LEN):
+    """
+    Sorted shortcodes and their characters as parallel arrays, plus buckets
+    mapping every prefix of up to prefix_len characters to the [start, end)
+    offsets of the shortcodes starting with it. Longer prefixes are found by a
+    binary search inside their bucket.
+    """
+    keys = sorted(emoji_shortcuts)
+    buckets = {}
+    for i, key in enumerate(keys):
+        for n in range(1, prefix_len + 1):
+            if len(key) < n:
+                break
+            bucket = buckets.setdefault(key[:n], [i, i])
+            bucket[1] = i + 1
+    return {
+        "prefix_len": prefix_len,
+        "keys": keys,
+        "values": [emoji_shortcuts[key] for key in keys],
+        "buckets": buckets,
+    }
+
+
+def regex_escape(char):
+    return f"\\{char}" if char in REGEX_SYNTAX else char
+
+
+def trie_pattern(node):
+    """
+    Regex source matching the strings in a trie of {char: node}, with "" marking
+    the end of a string. The optional groups are greedy, so the longest string
+    wins when one is a prefix of another.
+    """
+    alternatives = [
+        regex_escape(char) + trie_pattern(child) for char, child in sorted(node.items()) if char
+    ]
+    if not alternatives:
+        return ""
+    if "" in node:
+        return f"(?:{'|'.join(alternatives)})?"
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return f"(?:{'|'.join(alternatives)})"
+
+
+def reverse_index(emoji_shortcuts):
+    """
+    Map each emoji character sequence to its preferred shortcode, the first one
+    emojibase lists, and build one pattern matching any of them longest first.
+    A trailing variation selector is matched too, text often has one where the
+    GitHub code does not.
+    """
+    shortcodes = {}
+    for shortcut, chars in emoji_shortcuts.items():
+        shortcodes.setdefault(chars, shortcut)
+
+    trie = {}
+    for chars in shortcodes:
+        node = trie
+        for char in chars:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return {
+        "pattern": f"{trie_pattern(trie)}{VARIATION_SELECTOR}?",
+        "shortcodes": shortcodes,
+    }
+
+
+def write_json(data, dest):
+    with open(dest, "w") as fp:
+        json.dump(
+            data,
+            fp,
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Build emoji_codes.json and its indexes.")
+    parser.add_argument("source", help="emojibase-data's en/shortcodes/github.json")
+    parser.add_argument("dest", help="Where to write emoji_codes.json")
+    return parser.parse_args(argv)
+
+
+def main(args):
+    source, dest = args.source, args.dest
     emoji_data = get_data(source)
     emoji_shortcuts = {}
     for gh_code, shortcuts in emoji_data.items():
@@ -40,15 +152,10 @@ def main(source, dest):
         for s in shortcuts:
             emoji_shortcuts[s] = entities
 
-    with open(dest, "w") as fp:
-        json.dump(
-            emoji_shortcuts,
-            fp,
-            sort_keys=True,
-            ensure_ascii=False,
-            separators=(",", ":"),
-        )
+    write_json(emoji_shortcuts, dest)
+    write_json(prefix_index(emoji_shortcuts), Path(dest).with_name(PREFIX_INDEX))
+    write_json(reverse_index(emoji_shortcuts), Path(dest).with_name(REVERSE_INDEX))
 
 
 if __name__ == "__main__":
-    main(sys.argv[1], sys.argv[2])
+    main(parse_args(sys.argv[1:]))
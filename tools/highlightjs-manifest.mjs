@@ -0,0 +1,47 @@
+// Print the language manifest of a split highlight.js build as JSON.
+//   node tools/highlightjs-manifest.mjs extension/highlightjs
+// Each language file is registered with the core module so its name, aliases and
+// the sub-languages it embeds (e.g. xml in markdown) come from highlight.js itself.
+import { readdirSync } from "node:fs"
+import path from "node:path"
+import { pathToFileURL } from "node:url"
+
+const outDir = path.resolve(process.argv[2])
+const { default: hljs } = await import(pathToFileURL(path.join(outDir, "core.esm.js")))
+
+function subLanguages(mode, found = new Set(), seen = new Set()) {
+  if (!mode || typeof mode !== "object" || seen.has(mode)) {
+    return found
+  }
+  seen.add(mode)
+  for (const name of [mode.subLanguage ?? []].flat()) {
+    found.add(name)
+  }
+  for (const child of [mode.contains, mode.variants, mode.starts, mode.end]) {
+    for (const item of [child ?? []].flat()) {
+      subLanguages(item, found, seen)
+    }
+  }
+  return found
+}
+
+const languages = {}
+const aliases = {}
+// rollup's shared-<hash>.esm.js chunks hold code common to several languages.
+const files = readdirSync(path.join(outDir, "languages"))
+  .filter((file) => file.endsWith(".esm.js") && !file.startsWith("shared-"))
+  .sort()
+for (const file of files) {
+  const name = file.replace(/\.esm\.js$/, "")
+  const { default: grammar } = await import(pathToFileURL(path.join(outDir, "languages", file)))
+  hljs.registerLanguage(name, grammar)
+  const language = hljs.getLanguage(name)
+  languages[name] = {
+    file: `languages/${file}`,
+    requires: [...subLanguages(language)].filter((sub) => sub !== name).sort(),
+  }
+  for (const alias of language.aliases ?? []) {
+    aliases[alias.toLowerCase()] = name
+  }
+}
+console.log(JSON.stringify({ languages, aliases }, null, 2))
@@ -0,0 +1,111 @@
+#!python
+#  Copyright JFX 2021-2023
+#  MIT License
+#  https://gitlab.com/jfx2006
+
+"""
+Build highlight.js as a core module plus one module per language.
+
+    python tools/highlightjs_split.py node_modules/highlight.js extension/highlightjs
+
+Writes core.esm.js, languages/<name>.esm.js and languages.json, which maps
+language names to their file and the sub-languages they embed, and aliases to
+language names. markdown-render.js uses it to import only the languages a
+message needs. Bundle sizes before and after the split are printed.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+ROLLUP = "./node_modules/.bin/rollup"
+FULL_BUNDLE = "highlightjs.esm.js"
+# A code block in a message typically needs a language or two on top of the core.
+TYPICAL_LANGUAGES = ["javascript", "python"]
+
+
+def build(hljs_pkg, dest_dir):
+    """Bundle es/core.js and es/languages/*.js in one rollup run."""
+    inputs = [f"core={hljs_pkg / 'es' / 'core.js'}"]
+    for language in sorted((hljs_pkg / "es" / "languages").glob("*.js")):
+        # Skip minified copies and the <name>.js.js builds some releases ship alongside.
+        if ".min" in language.suffixes or language.name.endswith(".js.js"):
+            continue
+        inputs.append(f"languages/{language.name[:-3]}={language}")
+
+    shutil.rmtree(dest_dir / "languages", ignore_errors=True)
+    cmd = [
+        ROLLUP,
+        "--format",
+        "es",
+        "--dir",
+        str(dest_dir),
+        "--entryFileNames",
+        "[name].esm.js",
+        "--chunkFileNames",
+        "languages/shared-[hash].esm.js",
+        "-p",
+        "@rollup/plugin-node-resolve",
+        "-p",
+        "@rollup/plugin-commonjs",
+    ]
+    for item in inputs:
+        cmd.extend(["-i", item])
+    subprocess.run(cmd, check=True)
+
+
+def write_manifest(dest_dir):
+    result = subprocess.run(
+        ["node", str(Path(__file__).parent / "highlightjs-manifest.mjs"), str(dest_dir)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    manifest = json.loads(result.stdout)
+    with open(dest_dir / "languages.json", "w") as fp:
+        json.dump(manifest, fp, indent=2, sort_keys=True)
+    return manifest
+
+
+def kib(size):
+    return f"{size / 1024:8.1f} KiB"
+
+
+def report_sizes(dest_dir, manifest, before):
+    core = (dest_dir / "core.esm.js").stat().st_size
+    sizes = {
+        name: (dest_dir / entry["file"]).stat().st_size
+        for name, entry in manifest["languages"].items()
+    }
+    everything = core + sum(sizes.values())
+    typical = core + sum(sizes.get(name, 0) for name in TYPICAL_LANGUAGES)
+    print(f"{len(sizes)} languages, {len(manifest['aliases'])} aliases")
+    if before is not None:
+        print(f"Before, single bundle:      {kib(before)}")
+    print(f"After, core only:           {kib(core)}")
+    print(f"After, core + {'/'.join(TYPICAL_LANGUAGES)}: {kib(typical)}")
+    print(f"After, all languages:       {kib(everything)}  (what the single bundle held)")
+    largest = sorted(sizes.items(), key=lambda item: -item[1])[:5]
+    print(
+        "Largest languages: " + ", ".join(f"{name} {size // 1024} KiB" for name, size in largest)
+    )
+
+
+def main(args):
+    hljs_pkg, dest_dir = [Path(a) for a in args]
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    full_bundle = dest_dir / FULL_BUNDLE
+    before = full_bundle.stat().st_size if full_bundle.exists() else None
+
+    build(hljs_pkg, dest_dir)
+    manifest = write_manifest(dest_dir)
+    if full_bundle.exists():
+        os.unlink(full_bundle)
+    report_sizes(dest_dir, manifest, before)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
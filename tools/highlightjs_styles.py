@@ -3,12 +3,23 @@
 #  MIT License
 #  https://gitlab.com/jfx2006
 
+import argparse
+import hashlib
 import os
 import json
-import shutil
+import re
 import sys
 from pathlib import Path
 
+# Strings and /*! */ comments are kept as they are, other comments are dropped.
+CSS_TOKEN_RE = re.compile(
+    r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'|/\*!.*?\*/)|/\*.*?\*/", re.DOTALL
+)
+CSS_SPACE_RE = re.compile(r"\s+")
+# No space is needed around these, or after a colon. Space before a colon can be a
+# descendant combinator ("pre :hover"), and + needs its spaces inside calc().
+CSS_PUNCT_RE = re.compile(r" ?([{};,>]) ?|: ")
+
 
 def mkname(n):
     n = os.path.splitext(n)[0]
@@ -18,34 +29,94 @@ def mkname(n):
     return n
 
 
-def styles_json(hljs, css_files):
+def minify_css(css):
+    """
+    Strings and /*! */ comments are kept as they are, other comments are dropped
+    and the code around them minified as one.
+    """
+    parts = []
+    code = []
+    pos = 0
+    for match in CSS_TOKEN_RE.finditer(css):
+        code.append(css[pos : match.start()])
+        if match.group(1):
+            parts.append(minify_css_code(" ".join(code)))
+            parts.append(match.group(1))
+            code = []
+        pos = match.end()
+    code.append(css[pos:])
+    parts.append(minify_css_code(" ".join(code)))
+    return "".join(parts).strip()
+
+
+def minify_css_code(code):
+    code = CSS_SPACE_RE.sub(" ", code)
+    code = CSS_PUNCT_RE.sub(lambda m: m.group(1) or ":", code)
+    return code.replace(";}", "}")
+
+
+def styles_json(hljs, styles):
+    """
+    Write styles.json, mapping each style's display name to its file, the
+    SHA-256 of its contents and its size in bytes.
+    """
     res = {}
-    for c in css_files:
-        css_file = str(c.name)
+    for css_file, digest, size in styles:
         name = mkname(css_file)
-        res[name] = css_file
+        res[name] = {"file": css_file, "hash": digest, "size": size}
 
+    content = json.dumps(res, indent=2, sort_keys=True)
     styles_json = hljs / "styles.json"
-    with open(styles_json, "w") as fp:
-        json.dump(res, fp, indent=2, sort_keys=True)
+    if not styles_json.exists() or styles_json.read_text() != content:
+        styles_json.write_text(content)
 
 
-def copy_css(source_dir, dest_dir):
-    if os.path.exists(dest_dir):
-        shutil.rmtree(dest_dir)
-    dest_dir.mkdir(exist_ok=True)
-    source_css_files = [css_file for css_file in source_dir.glob("*.css") if
-                        ".min" not in css_file.suffixes]
+def copy_css(source_dir, dest_dir, minify=False):
+    """
+    Sync the non-minified stylesheets in source_dir to dest_dir, minifying them
+    if asked. Only files whose content changed are written, stylesheets no longer
+    in source_dir are removed. Yields (file name, SHA-256, size) for each one.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    source_css_files = sorted(
+        css_file for css_file in source_dir.glob("*.css") if ".min" not in css_file.suffixes
+    )
+    written = 0
+    size_in = size_out = 0
     for css_file in source_css_files:
-        shutil.copy2(css_file, dest_dir)
-        yield css_file
+        css = css_file.read_bytes()
+        size_in += len(css)
+        if minify:
+            css = minify_css(css.decode("utf-8")).encode("utf-8")
+        size_out += len(css)
+        dest = dest_dir / css_file.name
+        if not dest.exists() or dest.read_bytes() != css:
+            dest.write_bytes(css)
+            written += 1
+        yield css_file.name, hashlib.sha256(css).hexdigest(), len(css)
+
+    names = {css_file.name for css_file in source_css_files}
+    removed = [dest for dest in dest_dir.glob("*.css") if dest.name not in names]
+    for dest in removed:
+        dest.unlink()
+    print(
+        f"{len(source_css_files)} styles, {written} written, {len(removed)} removed, "
+        f"{size_in} -> {size_out} bytes"
+    )
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Copy the highlight.js styles into the extension.")
+    parser.add_argument("source_dir", type=Path)
+    parser.add_argument("dest_dir", type=Path)
+    parser.add_argument("--minify", action="store_true", help="Minify the stylesheets")
+    return parser.parse_args(argv)
 
 
 def main(args):
-    source_dir, dest_dir = [Path(a) for a in args]
-    css_files = copy_css(source_dir, dest_dir)
-    styles_json(dest_dir, css_files)
+    styles = list(copy_css(args.source_dir, args.dest_dir, args.minify))
+    styles_json(args.dest_dir, styles)
 
 
 if __name__ == "__main__":
-    main(sys.argv[1:])
+    main(parse_args(sys.argv[1:]))
@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+"""
+Benchmark the i18n tools against synthetic _locales trees.
+
+Trees are generated from extension/_locales with the requested number of keys
+and share of stale translations. auto_i18n runs with a deterministic stub
+translator, so only the pipeline itself is measured. Results are printed as
+JSON.
+
+Timings depend on the machine, so the baseline is recorded locally:
+
+    python tools/i18n_bench.py --update-baseline    # before a change
+    python tools/i18n_bench.py --compare            # after it
+
+--compare fails the run when a case is more than --tolerance slower than its
+baseline in .cache/i18n/bench-baseline.json.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import check_en
+
+HERE = Path(__file__).parent
+EXTENSION = HERE.parent / "extension"
+LOCALES_DIR = EXTENSION / "_locales"
+BASELINE_FILE = HERE.parent / ".cache" / "i18n" / "bench-baseline.json"
+KEYS = [71, 1000, 10000]
+STALE_RATIO = 0.1
+TOLERANCE = 0.25
+# Cases this fast are mostly interpreter noise, allow this much on top of the tolerance.
+SLACK_SECONDS = 0.05
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import auto_i18n
+
+
+def make_corpus(dest: Path, keys: int, stale_ratio: float, seed: int = 0):
+    """
+    Write a _locales tree with `keys` source messages to dest. Keys past the real
+    ones are numbered copies. About stale_ratio of each locale's entries get a
+    hash that no longer matches the source.
+    """
+    with open(LOCALES_DIR / "en" / "messages.json") as fp:
+        source = json.load(fp)
+    base_keys = list(source)
+
+    messages_source = {}
+    bases = {}
+    for i in range(keys):
+        base = base_keys[i % len(base_keys)]
+        copy_no = i // len(base_keys)
+        key = f"{base}_{copy_no}" if copy_no else base
+        entry = dict(source[base])
+        if copy_no and not entry["message"].startswith("__WET_"):
+            entry["message"] = f"{entry['message']} ({copy_no})"
+        messages_source[key] = entry
+        bases[key] = base, copy_no
+
+    (dest / "en").mkdir(parents=True, exist_ok=True)
+    with open(dest / "en" / "messages.json", "w", encoding="utf-8") as fp:
+        json.dump(messages_source, fp, ensure_ascii=False, indent=2)
+
+    rng = random.Random(seed)
+    for locale in auto_i18n.LOCALES:
+        with open(LOCALES_DIR / locale / "messages.json") as fp:
+            real = json.load(fp)
+        messages_dest = {}
+        for key, source_entry in messages_source.items():
+            base, copy_no = bases[key]
+            entry = dict(real.get(base, source_entry))
+            if copy_no and not entry["message"].startswith("__WET_"):
+                entry["message"] = f"{entry['message']} ({copy_no})"
+            if rng.random() < stale_ratio:
+                entry["hash"] = "stale"
+            else:
+                entry["hash"] = auto_i18n.mkHash(source_entry["message"])
+            messages_dest[key] = entry
+        (dest / locale).mkdir(parents=True, exist_ok=True)
+        with open(dest / locale / "messages.json", "w", encoding="utf-8") as fp:
+            json.dump(messages_dest, fp, ensure_ascii=False, indent=2)
+
+
+class BenchTranslate(auto_i18n.BackendTranslate):
+    """Stub backed BackendTranslate that records time spent on JSON I/O and per locale."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.io_seconds = 0.0
+        self.locale_seconds = {}
+
+    def load_messages(self, locale: str):
+        start = time.perf_counter()
+        try:
+            return super().load_messages(locale)
+        finally:
+            self.io_seconds += time.perf_counter() - start
+
+    def write_messages(self, dest_file: Path, messages):
+        start = time.perf_counter()
+        try:
+            return super().write_messages(dest_file, messages)
+        finally:
+            self.io_seconds += time.perf_counter() - start
+
+    def translate_single_locale(self, locale: str):
+        start = time.perf_counter()
+        try:
+            return super().translate_single_locale(locale)
+        finally:
+            self.locale_seconds[locale] = round(time.perf_counter() - start, 4)
+
+
+def bench_auto_i18n(locales_path: Path, keys: int, latency: float, jobs: int):
+    translator = BenchTranslate(
+        locales_path,
+        backend="stub",
+        backend_options={"latency": latency},
+        memory_size=0,
+        offline=True,
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        translator.translate_all_locales(jobs=jobs)
+        seconds = time.perf_counter() - start
+    total_keys = keys * len(auto_i18n.LOCALES)
+    result = {"seconds": seconds, "keys": total_keys, "keys_per_sec": total_keys / seconds}
+    if jobs == 1:
+        # With --jobs the I/O and translation happen in the workers.
+        result["io_seconds"] = translator.io_seconds
+        result["locale_seconds"] = translator.locale_seconds
+    return result
+
+
+def bench_auto_i18n_check(locales_path: Path, keys: int):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        auto_i18n.check_locales(locales_path, cache_file=None)
+        seconds = time.perf_counter() - start
+    total_keys = keys * len(auto_i18n.LOCALES)
+    return {"seconds": seconds, "keys": total_keys, "keys_per_sec": total_keys / seconds}
+
+
+def bench_check_en(locales_path: Path, keys: int):
+    start = time.perf_counter()
+    check_en.find_untranslated(locales_path, cache_file=None)
+    seconds = time.perf_counter() - start
+    total_keys = keys * len(check_en.WEBEXT_LOCALES)
+    return {"seconds": seconds, "keys": total_keys, "keys_per_sec": total_keys / seconds}
+
+
+def bench_i18n_strings_used(src_root: Path):
+    import i18n_strings_used
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        found = i18n_strings_used.scan_strings(src_root, cache_file=None)
+        seconds = time.perf_counter() - start
+    return {"seconds": seconds, "keys": len(found), "keys_per_sec": len(found) / seconds}
+
+
+def run_case(name: str, keys: int, stale_ratio: float, latency: float, jobs: int):
+    """Run one case in this (fresh) process and add its peak RSS."""
+    with tempfile.TemporaryDirectory() as tmp:
+        locales_path = Path(tmp) / "_locales"
+        if name != "i18n_strings_used":
+            make_corpus(locales_path, keys, stale_ratio)
+        if name == "auto_i18n":
+            result = bench_auto_i18n(locales_path, keys, latency, jobs)
+        elif name == "auto_i18n_check":
+            result = bench_auto_i18n_check(locales_path, keys)
+        elif name == "check_en":
+            result = bench_check_en(locales_path, keys)
+        else:
+            result = bench_i18n_strings_used(EXTENSION)
+    result["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+
+def case_name(name: str, keys: int):
+    return name if name == "i18n_strings_used" else f"{name}[keys={keys}]"
+
+
+def compare(results: dict, baseline: dict, tolerance: float):
+    """Return a list of regression messages."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        allowed = baseline[name]["seconds"] * (1 + tolerance) + SLACK_SECONDS
+        if result["seconds"] > allowed:
+            regressions.append(
+                f"{name}: {result['seconds']:.3f}s, baseline {baseline[name]['seconds']:.3f}s"
+            )
+    return regressions
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark the i18n tools.")
+    parser.add_argument(
+        "--keys",
+        type=lambda v: [int(k) for k in v.split(",")],
+        default=KEYS,
+        help=f"Comma separated source key counts (default {','.join(map(str, KEYS))})",
+    )
+    parser.add_argument(
+        "--stale",
+        type=float,
+        default=STALE_RATIO,
+        help=f"Share of stale translations per locale (default {STALE_RATIO})",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Stub translator seconds per call (default 0)"
+    )
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="auto_i18n worker processes")
+    parser.add_argument("--output", type=Path, help="Also write the results to this file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument(
+        "--compare", action="store_true", help="Fail on regressions against the baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        help=f"Allowed slowdown against the baseline (default {TOLERANCE})",
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Write the results as the new baseline"
+    )
+    return parser.parse_args(argv)
+
+
+def main(args):
+    cases = [("i18n_strings_used", 0)]
+    for keys in args.keys:
+        cases.extend((name, keys) for name in ("auto_i18n", "auto_i18n_check", "check_en"))
+
+    results = {}
+    for name, keys in cases:
+        # A fresh process per case keeps peak RSS and import state separate.
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(run_case, name, keys, args.stale, args.latency, args.jobs)
+            results[case_name(name, keys)] = future.result()
+
+    report = {
+        "python": sys.version.split()[0],
+        "stale_ratio": args.stale,
+        "latency": args.latency,
+        "jobs": args.jobs,
+        "cases": results,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2)
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, "w") as fp:
+            json.dump(report, fp, indent=2, sort_keys=True)
+            fp.write("\n")
+        print(f"Wrote {args.baseline}.")
+        return 0
+
+    if not args.compare:
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, record one with --update-baseline.")
+        return 1
+    with open(args.baseline) as fp:
+        baseline = json.load(fp)
+    for param in ("stale_ratio", "latency", "jobs"):
+        if baseline[param] != report[param]:
+            print(f"Baseline was recorded with {param}={baseline[param]}, not comparing.")
+            return 0
+    regressions = compare(results, baseline["cases"], args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args(sys.argv[1:])))
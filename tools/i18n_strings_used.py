@@ -4,55 +4,176 @@
 #  MIT License
 #  https://gitlab.com/jfx2006
 
+import argparse
+import hashlib
+import json
 import os
 import os.path as osp
-import json
 import re
+import sys
+import tempfile
 
-from blessings import Terminal
+from locale_index import SOURCE_LANG, LocaleIndex
 # from bs4 import BeautifulSoup
 
-HTML_RE = re.compile(r'data-i18n="([a-z0-9_]+)"')
-JS_RE = re.compile(r'getMessage\("([a-z0-9_]+)"(,.+)?\)')
-MANIFEST_RE = re.compile(r"__MSG_([a-z0-9_]+)__")
+# HTML data-i18n attributes, JS getMessage() calls and manifest __MSG_ references in
+# one pass over the raw bytes, the group that matched says which kind it is.
+STRINGS_RE = re.compile(
+    rb'data-i18n="(?P<html>[a-z0-9_]+)"'
+    rb'|getMessage\("(?P<js>[a-z0-9_]+)"'
+    rb"|__MSG_(?P<manifest>[a-z0-9_]+)__"
+)
+MARKERS = (b"data-i18n", b"getMessage", b"__MSG_")
+
+CACHE_FILE = osp.join(osp.dirname(__file__), "..", ".cache", "i18n", "strings-used.json")
+# Bump when the patterns change so cached key sets are recomputed.
+CACHE_VERSION = 1
+# Below this many files to (re)scan a process pool costs more than it saves.
+PARALLEL_MIN_FILES = 32
+
+
+def file_kind(name):
+    """Return which group of STRINGS_RE counts in this file, or None to skip it."""
+    if name == "manifest.json":
+        return "manifest"
+    ext = osp.splitext(name)[1]
+    if ext == ".html":
+        return "html"
+    if ext in (".js", ".mjs"):
+        return "js"
+    return None
 
 
-def get_strings_from_file(path, ext):
+def get_strings_from_bytes(data, kind):
     rv = set()
-    print(f"Checking {path}")
-    with open(path) as fp:
-        for line in fp:
-            match = None
-            if ext == "html":
-                if "data-i18n" in line:
-                    match = HTML_RE.search(line)
-            elif ext in "mjs, js":
-                if "getMessage" in line:
-                    match = JS_RE.search(line)
-            elif os.path.basename(path) == "manifest.json":
-                if "__MSG" in line:
-                    match = MANIFEST_RE.search(line)
-            if match:
-                match_text = match.group(1)
-                if ext == "html":
-                    match_text = "options_page__" + match_text
-                rv.add(match_text)
+    if not any(marker in data for marker in MARKERS):
+        return rv
+    for match in STRINGS_RE.finditer(data):
+        match_text = match.group(kind)
+        if match_text is None:
+            continue
+        match_text = match_text.decode("ascii")
+        if kind == "html":
+            match_text = "options_page__" + match_text
+        rv.add(match_text)
     return rv
 
 
-def main():
-    T = Terminal()
+def get_strings_from_file(path, kind=None):
+    """Return (content hash, message keys) for one file."""
+    with open(path, "rb") as fp:
+        data = fp.read()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    return digest, get_strings_from_bytes(data, kind or file_kind(osp.basename(path)))
 
-    result = set()
-    src_root = osp.abspath(osp.join(osp.dirname(__file__), "..", "extension"))
+
+def _scan_one(args):
+    path, kind = args
+    return get_strings_from_file(path, kind)
+
+
+def find_source_files(src_root):
+    """Yield (path relative to src_root, kind, os.stat_result) for the files to scan."""
     for root, dirs, files in os.walk(src_root):
-        for name in files:
-            a, ext = osp.splitext(name)
-            if ext in (".html", ".js", ".mjs") or name == "manifest.json":
+        dirs.sort()
+        for name in sorted(files):
+            kind = file_kind(name)
+            if kind:
                 path = osp.join(root, name)
-                result.update(get_strings_from_file(path, ext[1:]))
+                yield osp.relpath(path, src_root), kind, os.stat(path)
+
+
+def load_cache(cache_file):
+    try:
+        with open(cache_file) as fp:
+            cache = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def write_cache(cache_file, files):
+    os.makedirs(osp.dirname(cache_file), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=osp.dirname(cache_file), suffix=".tmp")
+    with os.fdopen(fd, "w") as fp:
+        json.dump({"version": CACHE_VERSION, "files": files}, fp)
+    os.replace(tmp_path, cache_file)
+
+
+def scan_files(src_root, jobs=None, cache_file=CACHE_FILE, verbose=False):
+    """
+    Return {relative path: set of message keys} for every source file under src_root.
 
-    result = list(result)
+    Files whose mtime and size match the cache are not read. Changed files are
+    read and hashed, and only rescanned if the content hash changed too. With
+    more than PARALLEL_MIN_FILES to scan they are spread over `jobs` processes.
+    Pass cache_file=None to scan everything without a cache.
+    """
+    cached = load_cache(cache_file) if cache_file else {}
+    entries = {}
+    to_scan = []
+    for relpath, kind, stat in find_source_files(src_root):
+        entry = cached.get(relpath)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            entries[relpath] = entry
+        else:
+            to_scan.append((relpath, kind, stat))
+
+    paths = [(osp.join(src_root, relpath), kind) for relpath, kind, stat in to_scan]
+    if jobs != 1 and len(paths) >= PARALLEL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            scanned = list(executor.map(_scan_one, paths, chunksize=8))
+    else:
+        scanned = [_scan_one(args) for args in paths]
+
+    rescanned = 0
+    for (relpath, kind, stat), (digest, keys) in zip(to_scan, scanned):
+        entry = cached.get(relpath)
+        if not (entry and entry["hash"] == digest):
+            rescanned += 1
+            if verbose:
+                print(f"Checking {osp.join(src_root, relpath)}")
+        entries[relpath] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": digest,
+            "keys": sorted(keys),
+        }
+
+    if cache_file and (to_scan or len(entries) != len(cached)):
+        write_cache(cache_file, entries)
+    if verbose:
+        print(f"{len(entries)} files, {rescanned} scanned, {len(entries) - rescanned} unchanged.")
+    return {relpath: set(entry["keys"]) for relpath, entry in entries.items()}
+
+
+def scan_strings(src_root, jobs=None, cache_file=CACHE_FILE, verbose=False):
+    """Return the set of message keys referenced anywhere under src_root."""
+    result = set()
+    for keys in scan_files(src_root, jobs, cache_file, verbose).values():
+        result.update(keys)
+    return result
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="List used, unused and missing message keys.")
+    parser.add_argument("--jobs", "-j", type=int, help="Scanner processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Rescan every file")
+    return parser.parse_args(argv)
+
+
+def main(args):
+    from blessings import Terminal
+
+    T = Terminal()
+
+    src_root = osp.abspath(osp.join(osp.dirname(__file__), "..", "extension"))
+    cache_file = None if args.no_cache else CACHE_FILE
+    result = list(scan_strings(src_root, args.jobs, cache_file, verbose=True))
     result.sort()
     print("\n\n")
     print(T.bold_blue("Used strings"))
@@ -60,10 +181,7 @@ def main():
         print(_string)
 
     print("\n\n")
-    with open(osp.join(src_root, "_locales/en/messages.json")) as fp:
-        source_strings_data = json.load(fp)
-
-    string_keys = set(source_strings_data.keys())
+    string_keys = set(LocaleIndex(osp.join(src_root, "_locales")).keys(SOURCE_LANG))
     unused_strings = string_keys - set(result)
     print(T.bold_red("Unused source strings"))
     for _string in unused_strings:
@@ -81,4 +199,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(parse_args(sys.argv[1:]))
@@ -0,0 +1,95 @@
+#!python
+"""
+Compact production copies of the locales' messages.json.
+
+    python tools/locale_bundle.py [--out DIR]
+
+Only each message's "message" and the placeholders' "content" are kept, the
+__WET_* entries, descriptions and the hashes auto_i18n.py adds are dropped, and
+the JSON is written without whitespace. The files in extension/_locales stay as
+they are, package_xpi.py puts the bundles in the XPI. The byte and parse time
+savings are reported per locale, parse time as json.loads' best of --repeat runs.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+LOCALES_PATH = Path(__file__).parent.parent / "extension" / "_locales"
+MESSAGES_FILE = "messages.json"
+# The locale maker page shows the default locale's groups and descriptions, the
+# packager ships the full file for it here.
+LOCALE_MAKER_SOURCE = "locale_maker/messages.json"
+
+
+def minify_messages(messages):
+    bundle = {}
+    for key, entry in messages.items():
+        if key.startswith("__WET_"):
+            continue
+        bundle[key] = {"message": entry["message"]}
+        if placeholders := entry.get("placeholders"):
+            bundle[key]["placeholders"] = {
+                name: {"content": placeholder["content"]}
+                for name, placeholder in placeholders.items()
+            }
+    return bundle
+
+
+def bundle(data):
+    """The production copy of a messages.json file's bytes."""
+    messages = minify_messages(json.loads(data))
+    return json.dumps(messages, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def parse_time(data, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        json.loads(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Build compact production locale files.")
+    parser.add_argument("locales_path", nargs="?", type=Path, default=LOCALES_PATH)
+    parser.add_argument("--out", type=Path, help="Write the bundles to OUT/<locale>/messages.json")
+    parser.add_argument(
+        "--repeat", type=int, default=200, help="Parse runs per file (default 200)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(args):
+    total_before = total_after = 0
+    time_before = time_after = 0.0
+    print(f"{'locale':<8} {'bytes':>8} {'bundled':>8} {'saved':>6} {'parse':>8} {'bundled':>8}")
+    for source in sorted(args.locales_path.glob(f"*/{MESSAGES_FILE}")):
+        locale = source.parent.name
+        data = source.read_bytes()
+        minified = bundle(data)
+        if args.out:
+            dest = args.out / locale / MESSAGES_FILE
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(minified)
+
+        before, after = parse_time(data, args.repeat), parse_time(minified, args.repeat)
+        total_before += len(data)
+        total_after += len(minified)
+        time_before += before
+        time_after += after
+        print(
+            f"{locale:<8} {len(data):>8} {len(minified):>8} {1 - len(minified) / len(data):>6.0%} "
+            f"{before * 1e6:>6.0f}us {after * 1e6:>6.0f}us"
+        )
+    print(
+        f"{'total':<8} {total_before:>8} {total_after:>8} {1 - total_after / total_before:>6.0%} "
+        f"{time_before * 1e6:>6.0f}us {time_after * 1e6:>6.0f}us"
+    )
+
+
+if __name__ == "__main__":
+    main(parse_args(sys.argv[1:]))
@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+"""
+One index over every _locales/*/messages.json for the locale tools.
+
+The message text and stored hash of each key are kept in a key by locale
+table, along with mkHash() of every source message once something compares
+hashes. The table is saved to
+.cache/i18n/locale-index.json and a locale is only parsed again when its
+file's mtime or size changed. Full messages.json contents are parsed at most
+once per change through load().
+
+    index = LocaleIndex()
+    index.untranslated()            # {locale: [(key, message)]} equal to the source
+    index.stale_keys("de")          # keys whose translation is out of date
+    index.values("reset_preview")   # {locale: message}
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+SOURCE_LANG = "en"
+WEBEXT_LOCALES = [
+    "de",
+    "es",
+    "fr",
+    "it",
+    "ja",
+    "ko",
+    "pl",
+    "pt_BR",
+    "ru",
+    "tr",
+    "zh_CN",
+    "zh_TW",
+]
+ALL_LOCALES = [SOURCE_LANG, *WEBEXT_LOCALES]
+LOCALES_PATH = Path(__file__).parent.parent / "extension" / "_locales"
+CACHE_FILE = Path(__file__).parent.parent / ".cache" / "i18n" / "locale-index.json"
+# Bump when the cached columns change shape.
+CACHE_VERSION = 1
+
+
+def mkHash(s):
+    # Imported here so the tools that only read the index don't need mmh3.
+    import mmh3
+
+    a = mmh3.hash128(s, signed=False)
+    return hex(((a & 0xFFFFFFFFFFFFFFFF) << 64) + (a >> 64))[2:]
+
+
+def classify_messages(messages_source, messages_dest, source_hashes=None):
+    """
+    Decide what i18n_translate does with each source key. Yields
+    (key, state, source_hash) in source order, state is one of:
+      "group"   - __WET_GROUP__ marker, copied from the source
+      "locale"  - __WET_LOCALE__ value already set by the locale, kept
+      "current" - destination hash matches the source, kept
+      "missing" - not in the destination yet, needs translating
+      "stale"   - destination hash is absent or out of date, needs translating
+    Extra keys in translated languages are never yielded, they get dropped.
+    source_hashes may hold precomputed mkHash() values of the source messages.
+    """
+    for key in messages_source.keys():
+        source_message = messages_source[key].get("message", "")
+        if source_message.startswith("__WET_GROUP__"):
+            yield key, "group", None
+            continue
+        if source_message == "__WET_LOCALE__" and key in messages_dest.keys():
+            yield key, "locale", None
+            continue
+
+        source_hash = source_hashes[key] if source_hashes else mkHash(source_message)
+        if key not in messages_dest.keys():
+            yield key, "missing", source_hash
+            continue
+        dest_hash = messages_dest[key].get("hash")
+        if dest_hash is not None and source_hash == dest_hash:
+            yield key, "current", source_hash
+        else:
+            yield key, "stale", source_hash
+
+
+class LocaleIndex:
+    def __init__(
+        self, locales_path: Path = LOCALES_PATH, locales=ALL_LOCALES, cache_file=CACHE_FILE
+    ):
+        """cache_file=None always builds the table from the messages.json files."""
+        self.locales_path = Path(locales_path)
+        self.locales = list(locales)
+        self.column_no = {locale: i for i, locale in enumerate(self.locales)}
+        self.cache_file = cache_file
+        self._raw = {}
+        self._columns = None
+
+    def path(self, locale: str) -> Path:
+        return self.locales_path / locale / "messages.json"
+
+    def stat(self, locale: str):
+        """[mtime_ns, size] of the locale's messages.json, None if it doesn't exist."""
+        try:
+            st = os.stat(self.path(locale))
+        except FileNotFoundError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
+    def load(self, locale: str) -> dict:
+        """
+        Return the parsed messages.json of locale, {} if there is none. The
+        result is shared between callers and must not be modified.
+        """
+        stat = self.stat(locale)
+        if stat is None:
+            return {}
+        cached = self._raw.get(locale)
+        if cached is not None and cached[0] == stat:
+            return cached[1]
+        with open(self.path(locale), "r") as fp:
+            data = json.load(fp)
+        self._raw[locale] = (stat, data)
+        return data
+
+    def read_cache(self):
+        if self.cache_file is None:
+            return {}
+        try:
+            with open(self.cache_file) as fp:
+                cache = json.load(fp)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != CACHE_VERSION or cache.get("path") != str(
+            self.locales_path.resolve()
+        ):
+            return {}
+        return cache["columns"]
+
+    def write_cache(self, columns):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as fp:
+            json.dump(
+                {
+                    "version": CACHE_VERSION,
+                    "path": str(self.locales_path.resolve()),
+                    "columns": columns,
+                },
+                fp,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_name, self.cache_file)
+
+    def build_column(self, locale: str, stat):
+        data = self.load(locale) if stat is not None else {}
+        column = {
+            "stat": stat,
+            "messages": {key: entry.get("message", "") for key, entry in data.items()},
+            "hashes": {key: entry["hash"] for key, entry in data.items() if "hash" in entry},
+        }
+        return column
+
+    def columns(self):
+        """Return {locale: column}, rebuilding only the locales whose file changed."""
+        if self._columns is not None and all(
+            column["stat"] == self.stat(locale) for locale, column in self._columns.items()
+        ):
+            return self._columns
+
+        cached = self.read_cache()
+        columns = {}
+        changed = False
+        for locale in self.locales:
+            stat = self.stat(locale)
+            column = cached.get(locale)
+            if column is None or column["stat"] != stat:
+                column = self.build_column(locale, stat)
+                changed = True
+            columns[locale] = column
+        if changed and self.cache_file is not None:
+            self.write_cache(columns)
+        self.build_table(columns)
+        self._columns = columns
+        return columns
+
+    def build_table(self, columns):
+        """Fill keys_order and messages, key -> tuple of per-locale messages."""
+        keys = {}
+        for column in columns.values():
+            keys.update(dict.fromkeys(column["messages"]))
+        self.keys_order = [sys.intern(key) for key in keys]
+        self.messages = {
+            key: tuple(
+                None if (m := columns[locale]["messages"].get(key)) is None else sys.intern(m)
+                for locale in self.locales
+            )
+            for key in self.keys_order
+        }
+
+    def source_hashes(self):
+        """
+        mkHash() of every source message. Computed on first use after the source
+        file changes and kept in the cache, so only the tools that compare hashes
+        need mmh3.
+        """
+        columns = self.columns()
+        column = columns[SOURCE_LANG]
+        if "source_hashes" not in column:
+            column["source_hashes"] = {
+                key: mkHash(message) for key, message in column["messages"].items()
+            }
+            if self.cache_file is not None:
+                self.write_cache(columns)
+        return column["source_hashes"]
+
+    def table(self):
+        """
+        The key -> per-locale messages table. Unlike columns() this doesn't check
+        the files for changes once built, so it is cheap enough for per-key lookups.
+        """
+        if self._columns is None:
+            self.columns()
+        return self.messages
+
+    def keys(self, locale: str = SOURCE_LANG):
+        """Keys present in locale, in file order."""
+        return list(self.columns()[locale]["messages"])
+
+    def message(self, locale: str, key: str):
+        row = self.table().get(key)
+        return None if row is None else row[self.column_no[locale]]
+
+    def values(self, key: str):
+        """Return {locale: message} for every locale that has key."""
+        row = self.table().get(key, ())
+        return {
+            locale: message for locale, message in zip(self.locales, row) if message is not None
+        }
+
+    def entries(self, locale: str):
+        """{key: {"message", "hash"}} for locale, enough for classify_messages()."""
+        column = self.columns()[locale]
+        hashes = column["hashes"]
+        return {
+            key: (
+                {"message": message, "hash": hashes.get(key)}
+                if key in hashes
+                else {"message": message}
+            )
+            for key, message in column["messages"].items()
+        }
+
+    def classify(self, locale: str):
+        """classify_messages() for locale, using the precomputed source hashes."""
+        self.columns()
+        return list(
+            classify_messages(
+                self.entries(SOURCE_LANG), self.entries(locale), self.source_hashes()
+            )
+        )
+
+    def stale_keys(self, locale: str):
+        return [key for key, state, source_hash in self.classify(locale) if state == "stale"]
+
+    def missing_keys(self, locale: str):
+        return [key for key, state, source_hash in self.classify(locale) if state == "missing"]
+
+    def extra_keys(self, locale: str):
+        columns = self.columns()
+        source = columns[SOURCE_LANG]["messages"]
+        return [key for key in columns[locale]["messages"] if key not in source]
+
+    def untranslated(self, locales=None):
+        """Return {locale: [(key, message), ...]} for translations identical to the source."""
+        self.columns()
+        source_column = self.column_no[SOURCE_LANG]
+        result = {}
+        for locale in locales or [locale for locale in self.locales if locale != SOURCE_LANG]:
+            column = self.column_no[locale]
+            result[locale] = [
+                (key, row[column])
+                for key, row in self.messages.items()
+                if not key.startswith("__WET")
+                and row[source_column] is not None
+                and row[column] == row[source_column]
+            ]
+        return result
+
+
+def main(args):
+    index = LocaleIndex(Path(args[0]) if args else LOCALES_PATH)
+    for locale in index.locales:
+        line = f"{locale}: {len(index.keys(locale))} keys"
+        if locale != SOURCE_LANG:
+            line += (
+                f", {len(index.stale_keys(locale))} stale, {len(index.missing_keys(locale))} missing,"
+                f" {len(index.extra_keys(locale))} extra"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
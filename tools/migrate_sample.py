@@ -1,30 +1,15 @@
 #!python
 
 import os.path as osp
-import json
+
+from locale_index import ALL_LOCALES, LocaleIndex
 
 LOCALES = "/home/rob/projects/mdhr-l10n/_locales"
-LANGS = (
-    "de",
-    "en",
-    "es",
-    "fr",
-    "it",
-    "ja",
-    "ko",
-    "pl",
-    "pt_BR",
-    "ru",
-    "tr",
-    "zh_CN",
-    "zh_TW",
-)
-
-
-def load_messages(lang_code):
-    msg_file = osp.join(LOCALES, lang_code, "messages.json")
-    data = json.load(open(msg_file))
-    return data
+LANGS = ALL_LOCALES
+
+
+def load_messages(index, lang_code):
+    return index.load(lang_code)
 
 
 def write_preview(lang_code, text):
@@ -33,8 +18,9 @@ def write_preview(lang_code, text):
 
 
 def main():
+    index = LocaleIndex(LOCALES, cache_file=None)
     for lang in LANGS:
-        messages = load_messages(lang)
+        messages = load_messages(index, lang)
         preview_md = messages.get("options_page__preview_markdown").get("message")
         write_preview(lang, preview_md)
 
@@ -4,12 +4,29 @@
 #  MIT License
 #  https://gitlab.com/jfx2006
 
+import argparse
+import hashlib
+import json
 import os
-from ruamel.yaml import YAML
+import re
+import shutil
+import subprocess
+import tempfile
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 HERE = os.path.abspath(os.path.dirname(__file__))
+TOP = os.path.dirname(HERE)
 DATA = os.path.join(HERE, "vendored.yml")
 OUT = os.path.join(HERE, "..", "vendored.mk")
+EXTENSION = "extension"
+STAMPS = os.path.join(TOP, ".cache", "vendored", "stamps.json")
+LOCKFILE = os.path.join(TOP, "pnpm-lock.yaml")
+ARTIFACTS = os.path.join(TOP, ".cache", "vendored", "artifacts")
+ARTIFACTS_MAX_MB = 200
+# Scripts from this repo named in a rule's commands are inputs of the rule too.
+TOOL_RE = re.compile(r"(?:\./)?tools/[\w./-]+")
 
 CMDS_v1 = {
     "copy": "cp -v $< $@",
@@ -20,6 +37,8 @@ CMDS_v1 = {
 
 class MkVendored:
     def __init__(self):
+        from ruamel.yaml import YAML
+
         yaml = YAML(typ="safe")
         yaml_data = yaml.load(open(DATA))
         if yaml_data["version"] == 2:
@@ -28,7 +47,7 @@ class MkVendored:
         else:
             self.commands = CMDS_v1
             self.vendored = yaml_data
-        self.out = open(OUT, "w")
+        self.out = None
 
     def mk_header(self):
         self.out.writelines(
@@ -41,7 +60,7 @@ class MkVendored:
     def mk_rules(self):
         clean_cmds = []
         for lib, data in sorted(self.vendored.items()):
-            clean_cmds.extend(self.mk_rule(lib, data))
+            clean_cmds.extend(self.mk_rule(lib, dict(data)))
 
         self.out.writelines([
             "clean:\n",
@@ -93,13 +112,354 @@ class MkVendored:
         libs = " ".join(self.vendored.keys())
         self.out.writelines([f"\nall: {libs}\n"])
 
+    def targets(self, lib, context):
+        """
+        Return [(dest, source, shell commands)] for lib, the same rules mk_rule
+        writes for make with $<, $@ and $(EXTENSION) filled in.
+        """
+        context = dict(context)
+        vendor_prefix = context.pop("vendor_prefix", "vendor")
+        context["vendor_prefix"] = vendor_prefix
+        context.setdefault("node_pkg", lib)
+        context["lib"] = lib
+
+        if path := context.pop("path", None):
+            paths = {f"{lib}.esm.js": path}
+        else:
+            paths = context.pop("paths")
+
+        method = context.pop("method")
+        if method == "bash":
+            cmds = context.pop("cmds")
+        else:
+            cmds = [self.commands[method].format(**context)]
+
+        targets = []
+        for dest, src in paths.items():
+            context.update({"dest": f"{EXTENSION}/{vendor_prefix}/{dest}", "src": src})
+            source = "node_modules/{node_pkg}/{src}".format(**context)
+            commands = []
+            for cmd in cmds:
+                line = cmd.format(**context)
+                line = line.replace("$(EXTENSION)", EXTENSION)
+                line = line.replace("$<", source).replace("$@", context["dest"])
+                # Backslash continued lines are one command, as in make.
+                if commands and commands[-1].endswith("\\"):
+                    commands[-1] = f"{commands[-1][:-1]}{line}"
+                else:
+                    commands.append(line)
+            targets.append((context["dest"], source, commands))
+        return targets
+
+    def outputs(self, lib):
+        """Every file or directory lib's rule writes: the targets and what its clean removes."""
+        context = self.vendored[lib]
+        outputs = [dest for dest, source, commands in self.targets(lib, context)]
+        if clean := context.get("clean"):
+            clean = clean.format(vendor_prefix=context.get("vendor_prefix", "vendor"), lib=lib)
+            args = clean.replace("$(EXTENSION)", EXTENSION).split()
+            outputs.extend(arg for arg in args[1:] if not arg.startswith("-"))
+        return list(dict.fromkeys(outputs))
+
+
+def package_version(node_pkg):
+    """The installed version of node_pkg, or of each package in a scope like @textcomplete."""
+    pkg_dir = os.path.join(TOP, "node_modules", node_pkg)
+    pkg_json = os.path.join(pkg_dir, "package.json")
+    if os.path.isfile(pkg_json):
+        with open(pkg_json) as fp:
+            return json.load(fp).get("version")
+    if os.path.isdir(pkg_dir):
+        return {name: package_version(f"{node_pkg}/{name}") for name in sorted(os.listdir(pkg_dir))}
+    return None
+
+
+def hash_file(path):
+    with open(path, "rb") as fp:
+        return hashlib.file_digest(fp, "blake2b").hexdigest()
+
+
+def hash_output(path):
+    """Hash of a file, or of the names and contents of the files in a directory. None if missing."""
+    if os.path.isfile(path):
+        return hash_file(path)
+    if not os.path.isdir(path):
+        return None
+    h = hashlib.blake2b()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file = os.path.join(root, name)
+            h.update(f"{os.path.relpath(file, path)}:{hash_file(file)}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def output_hashes(outputs):
+    return {output: hash_output(os.path.join(TOP, output)) for output in outputs}
+
+
+def inputs_hash(source, commands, version):
+    """Hash of what a target is built from: source, commands, package version and tool scripts."""
+    h = hashlib.blake2b()
+    h.update(json.dumps({"commands": commands, "version": version}).encode("utf-8"))
+    h.update(hash_file(os.path.join(TOP, source)).encode("ascii"))
+    for tool in sorted(set(TOOL_RE.findall(" ".join(commands)))):
+        tool_path = os.path.join(TOP, tool)
+        if os.path.isfile(tool_path):
+            h.update(f"{tool}:{hash_file(tool_path)}".encode("utf-8"))
+    return h.hexdigest()
 
-def main():
+
+def locked_versions(lockfile=LOCKFILE):
+    """{package: version} of the project's dependencies as resolved in pnpm-lock.yaml."""
+    try:
+        with open(lockfile) as fp:
+            text = fp.read()
+    except FileNotFoundError:
+        return {}
+    from ruamel.yaml import YAML
+
+    # Only the importers section is needed, skip parsing the much larger rest.
+    text = text.split("\npackages:", 1)[0]
+    importer = YAML(typ="safe").load(text)["importers"]["."]
+    versions = {}
+    for section in ("dependencies", "devDependencies"):
+        for name, entry in importer.get(section, {}).items():
+            # Drop the peer dependency suffix, "1.4.2(marked@14.1.3)" -> "1.4.2".
+            versions[name] = entry["version"].split("(", 1)[0]
+    return versions
+
+
+def cache_key(vendored, lib, locked):
+    """
+    Key for lib's outputs: its vendored.yml entry, the commands they expand to, the tool
+    scripts they run and the locked versions of node_pkg and of packages the commands
+    mention, such as rollup. None when node_pkg isn't in the lockfile.
+    """
+    rule = vendored.vendored[lib]
+    node_pkg = rule.get("node_pkg", lib)
+    targets = vendored.targets(lib, rule)
+    text = " ".join(command for dest, source, commands in targets for command in commands)
+    tools = {}
+    for tool in sorted(set(TOOL_RE.findall(text))):
+        tool_path = os.path.join(TOP, tool)
+        if os.path.isfile(tool_path):
+            tools[tool] = hash_file(tool_path)
+            with open(tool_path, errors="replace") as fp:
+                text += fp.read()
+    packages = {
+        name: version
+        for name, version in locked.items()
+        if name == node_pkg
+        or name.startswith(f"{node_pkg}/")
+        or re.search(rf"(?<![\w@.-]){re.escape(name)}(?![\w-])", text)
+    }
+    if not any(name == node_pkg or name.startswith(f"{node_pkg}/") for name in packages):
+        return None
+    key = {"lib": lib, "rule": rule, "targets": targets, "tools": tools, "packages": packages}
+    return hashlib.blake2b(json.dumps(key, sort_keys=True).encode("utf-8"), digest_size=20).hexdigest()
+
+
+class ArtifactCache:
+    """
+    Vendored outputs stored by cache_key(), one directory per key. A directory's
+    mtime records its last use; past max_bytes the least recently used are evicted.
+    """
+
+    def __init__(self, path=ARTIFACTS, max_bytes=ARTIFACTS_MAX_MB * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+
+    def restore(self, key, outputs):
+        """Copy the outputs stored under key into place, return False if not cached."""
+        entry = os.path.join(self.path, key)
+        if not os.path.isdir(entry):
+            return False
+        for output in outputs:
+            cached = os.path.join(entry, output)
+            dest = os.path.join(TOP, output)
+            if os.path.isdir(cached):
+                shutil.rmtree(dest, ignore_errors=True)
+                shutil.copytree(cached, dest)
+            elif os.path.isfile(cached):
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                shutil.copy2(cached, dest)
+        os.utime(entry)
+        return True
+
+    def store(self, key, outputs):
+        os.makedirs(self.path, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=self.path, prefix=".tmp-")
+        for output in outputs:
+            src = os.path.join(TOP, output)
+            cached = os.path.join(tmp, output)
+            if os.path.isdir(src):
+                shutil.copytree(src, cached)
+            elif os.path.isfile(src):
+                os.makedirs(os.path.dirname(cached), exist_ok=True)
+                shutil.copy2(src, cached)
+        entry = os.path.join(self.path, key)
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp, entry)
+
+    def evict(self):
+        """Remove the least recently used entries until the cache fits in max_bytes."""
+        if not os.path.isdir(self.path):
+            return
+        entries = []
+        for name in os.listdir(self.path):
+            entry = os.path.join(self.path, name)
+            size = sum(
+                os.path.getsize(os.path.join(root, f)) for root, dirs, files in os.walk(entry) for f in files
+            )
+            entries.append((os.path.getmtime(entry), size, entry))
+        total = sum(size for mtime, size, entry in entries)
+        for mtime, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+
+def load_stamps():
+    try:
+        with open(STAMPS) as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_stamps(stamps):
+    os.makedirs(os.path.dirname(STAMPS), exist_ok=True)
+    with open(f"{STAMPS}.tmp", "w") as fp:
+        json.dump(stamps, fp, indent=2, sort_keys=True)
+    os.replace(f"{STAMPS}.tmp", STAMPS)
+
+
+def build_lib(vendored, lib, stamps, force=False, cache=None, locked=None):
+    """
+    Bring lib's outputs up to date. Returns (status, seconds, {lib: stamp}),
+    status is "cached", "restored" from the artifact cache, "built" or an error message.
+
+    The stamp holds the inputs hash of each target and the hash of every output,
+    the files a rule writes besides its target included. Targets whose inputs or
+    output changed are rebuilt, all of them if one of the other outputs did.
+    """
+    start = time.perf_counter()
+    version = package_version(vendored.vendored[lib].get("node_pkg", lib))
+    targets = vendored.targets(lib, vendored.vendored[lib])
+    outputs = vendored.outputs(lib)
+    inputs = {}
+    for dest, source, commands in targets:
+        if not os.path.isfile(os.path.join(TOP, source)):
+            return f"missing {source}", time.perf_counter() - start, {}
+        inputs[dest] = inputs_hash(source, commands, version)
+    stamp = stamps.get(lib)
+    current = output_hashes(outputs)
+    if force or stamp is None:
+        stale = targets
+    elif any(current[output] != stamp["outputs"].get(output) for output in outputs if output not in inputs):
+        stale = targets
+    else:
+        stale = [
+            (dest, source, commands)
+            for dest, source, commands in targets
+            if stamp["inputs"].get(dest) != inputs[dest]
+            or current[dest] is None
+            or current[dest] != stamp["outputs"].get(dest)
+        ]
+    if not stale:
+        return "cached", time.perf_counter() - start, {}
+
+    key = cache_key(vendored, lib, locked) if cache is not None else None
+    if key is not None and not force and cache.restore(key, outputs):
+        status = "restored"
+        stale = [target for target in targets if not os.path.isfile(os.path.join(TOP, target[0]))]
+    else:
+        status = "built"
+    for dest, source, commands in stale:
+        status = "built"
+        for command in commands:
+            result = subprocess.run(command, shell=True, cwd=TOP, capture_output=True, text=True)
+            if result.returncode != 0:
+                print(f"{lib}: {command}\n{result.stdout}{result.stderr}", file=sys.stderr)
+                return f"failed ({result.returncode})", time.perf_counter() - start, {}
+    if status == "built" and key is not None:
+        cache.store(key, outputs)
+
+    new_stamps = {lib: {"inputs": inputs, "outputs": output_hashes(outputs)}}
+    return status, time.perf_counter() - start, new_stamps
+
+
+def run(vendored, libs=None, jobs=None, force=False, cache=None):
+    """
+    Build the vendored libraries without make. Libraries whose inputs and
+    outputs match the stamp manifest are skipped. The others are restored
+    from the artifact cache if given, or built concurrently and added to it.
+    Returns 1 if any library failed.
+    """
+    libs = libs or sorted(vendored.vendored)
+    stamps = load_stamps()
+    locked = locked_versions() if cache is not None else None
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            lib: executor.submit(build_lib, vendored, lib, stamps, force, cache, locked) for lib in libs
+        }
+        results = {lib: future.result() for lib, future in futures.items()}
+
+    failed = 0
+    for lib, (status, seconds, new_stamps) in results.items():
+        stamps.update(new_stamps)
+        if status not in ("cached", "restored", "built"):
+            failed += 1
+        print(f"{lib:<24} {status:<12} {seconds:7.2f}s")
+    print(f"{len(libs)} libraries in {time.perf_counter() - start:.2f}s")
+    write_stamps(stamps)
+    if cache is not None:
+        cache.evict()
+    return 1 if failed else 0
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Build the libraries in vendored.yml.")
+    parser.add_argument(
+        "--run",
+        nargs="*",
+        metavar="LIB",
+        help="Build the given libraries (default all) here instead of writing vendored.mk",
+    )
+    parser.add_argument("--jobs", "-j", type=int, help="Libraries built at once (default CPU count)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if up to date")
+    parser.add_argument(
+        "--cache-dir",
+        default=os.environ.get("VENDORED_CACHE", ARTIFACTS),
+        help="Artifact cache for --run, keyed by pnpm-lock.yaml versions (default $VENDORED_CACHE "
+        "or .cache/vendored/artifacts)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=ARTIFACTS_MAX_MB,
+        help=f"Artifact cache size limit in MB (default {ARTIFACTS_MAX_MB})",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Don't use the artifact cache")
+    return parser.parse_args(argv)
+
+
+def main(args):
     vendored = MkVendored()
-    vendored.mk_header()
-    vendored.mk_rules()
-    vendored.mk_footer()
+    if args.run is not None:
+        cache = None
+        if not args.no_cache:
+            cache = ArtifactCache(args.cache_dir, args.cache_size * 1024 * 1024)
+        return run(vendored, args.run, args.jobs, args.force, cache)
+
+    with open(OUT, "w") as vendored.out:
+        vendored.mk_header()
+        vendored.mk_rules()
+        vendored.mk_footer()
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(parse_args(sys.argv[1:])))
@@ -0,0 +1,265 @@
+#!python
+"""
+Build the XPI from extension/, reproducibly and incrementally.
+
+    python tools/package_xpi.py [--out web-ext-artifacts/markdown-here-revival.xpi]
+
+Entries are sorted and carry fixed timestamps and permissions, so the same tree
+always gives the same archive. Changed members are deflated in parallel, members
+whose content hash matches the previous archive are copied from it still
+compressed. The hashes are kept in .cache/xpi. Paths web-ext ignores and the
+dev-only ones in EXCLUDE_DIRS are left out. Per-member sizes are printed.
+
+The locales' messages.json files are replaced by the compact bundles from
+locale_bundle.py unless --full-locales is given, the full default locale goes
+to locale_maker/messages.json for the locale maker.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from locale_bundle import LOCALE_MAKER_SOURCE, MESSAGES_FILE, bundle
+
+TOP = Path(__file__).parent.parent
+SOURCE_DIR = TOP / "extension"
+OUT_FILE = TOP / "web-ext-artifacts" / "markdown-here-revival.xpi"
+CACHE_DIR = TOP / ".cache" / "xpi"
+# Directories under extension/ that are only used in development, see web-ext-config.js.
+EXCLUDE_DIRS = {"test", "node_modules"}
+EXCLUDE_SUFFIXES = {".xpi", ".zip"}
+
+# 1980-01-01 00:00:00, the earliest time a zip entry can have.
+DOS_DATE = (0 << 9) | (1 << 5) | 1
+DOS_TIME = 0
+# Regular file, rw-r--r--.
+EXTERNAL_ATTR = 0o100644 << 16
+VERSION = 20
+VERSION_MADE_BY = (3 << 8) | VERSION  # Unix
+STORED = 0
+DEFLATED = 8
+UTF8_FLAG = 0x800
+
+LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+CENTRAL_HEADER = struct.Struct("<4s6H3L5H2L")
+END_OF_CENTRAL_DIR = struct.Struct("<4s4H2LH")
+
+
+class Member:
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+        self.digest = hashlib.sha256(self.data).hexdigest()
+        self.size = len(self.data)
+        self.crc = zlib.crc32(self.data)
+        self.method = None
+        self.compressed = None
+        self.reused = False
+
+    def compress(self):
+        deflate = zlib.compressobj(9, zlib.DEFLATED, -15)
+        compressed = deflate.compress(self.data) + deflate.flush()
+        if len(compressed) < self.size:
+            self.method, self.compressed = DEFLATED, compressed
+        else:
+            self.method, self.compressed = STORED, self.data
+        return self
+
+
+def find_members(source_dir, full_locales=False):
+    """Members in archive order, web-ext's ignored paths and EXCLUDE_DIRS left out."""
+    with open(source_dir / "manifest.json") as f:
+        default_locale = json.load(f).get("default_locale")
+    members = []
+    for root, dirs, files in os.walk(source_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d not in EXCLUDE_DIRS)
+        for file in sorted(files):
+            path = Path(root) / file
+            if file.startswith(".") or path.suffix in EXCLUDE_SUFFIXES:
+                continue
+            name = path.relative_to(source_dir).as_posix()
+            data = path.read_bytes()
+            if not full_locales and is_messages_file(name):
+                if name == f"_locales/{default_locale}/{MESSAGES_FILE}":
+                    members.append(Member(LOCALE_MAKER_SOURCE, data))
+                data = bundle(data)
+            members.append(Member(name, data))
+    return sorted(members, key=lambda member: member.name)
+
+
+def is_messages_file(name):
+    parts = name.split("/")
+    return len(parts) == 3 and parts[0] == "_locales" and parts[2] == MESSAGES_FILE
+
+
+def cache_file(out_file):
+    return CACHE_DIR / f"{out_file.name}.json"
+
+
+def read_previous(out_file):
+    """
+    {name: (sha256, method, crc, compressed bytes)} from the previous archive, if
+    it is the one the cache describes.
+    """
+    try:
+        with open(cache_file(out_file)) as f:
+            cache = json.load(f)
+        stat = out_file.stat()
+    except (OSError, ValueError):
+        return {}
+    if cache.get("archive") != [stat.st_size, stat.st_mtime_ns]:
+        return {}
+
+    previous = {}
+    with open(out_file, "rb") as f:
+        for name, (digest, offset) in cache["members"].items():
+            f.seek(offset)
+            header = LOCAL_HEADER.unpack(f.read(LOCAL_HEADER.size))
+            method, crc, compress_size, name_len, extra_len = (
+                header[3],
+                header[6],
+                header[7],
+                header[9],
+                header[10],
+            )
+            f.seek(name_len + extra_len, os.SEEK_CUR)
+            previous[name] = (digest, method, crc, f.read(compress_size))
+    return previous
+
+
+def write_archive(out_file, members):
+    """Write members to out_file atomically, returns {name: (sha256, local header offset)}."""
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    offsets = {}
+    central_dir = []
+    fd, tmp_name = tempfile.mkstemp(dir=out_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for member in members:
+                name = member.name.encode("utf-8")
+                flags = 0 if member.name.isascii() else UTF8_FLAG
+                offset = f.tell()
+                offsets[member.name] = (member.digest, offset)
+                fields = (
+                    flags,
+                    member.method,
+                    DOS_TIME,
+                    DOS_DATE,
+                    member.crc,
+                    len(member.compressed),
+                    member.size,
+                    len(name),
+                )
+                f.write(LOCAL_HEADER.pack(b"PK\x03\x04", VERSION, *fields, 0))
+                f.write(name)
+                f.write(member.compressed)
+                central_dir.append(
+                    CENTRAL_HEADER.pack(
+                        b"PK\x01\x02",
+                        VERSION_MADE_BY,
+                        VERSION,
+                        *fields,
+                        0,
+                        0,
+                        0,
+                        0,
+                        EXTERNAL_ATTR,
+                        offset,
+                    )
+                    + name
+                )
+            central_dir_offset = f.tell()
+            f.write(b"".join(central_dir))
+            central_dir_size = f.tell() - central_dir_offset
+            f.write(
+                END_OF_CENTRAL_DIR.pack(
+                    b"PK\x05\x06",
+                    0,
+                    0,
+                    len(members),
+                    len(members),
+                    central_dir_size,
+                    central_dir_offset,
+                    0,
+                )
+            )
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, out_file)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return offsets
+
+
+def write_cache(out_file, offsets):
+    stat = out_file.stat()
+    cache = {"archive": [stat.st_size, stat.st_mtime_ns], "members": offsets}
+    cache_file(out_file).parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_file(out_file), "w") as f:
+        json.dump(cache, f)
+
+
+def package(source_dir, out_file, jobs=None, use_cache=True, full_locales=False):
+    members = find_members(source_dir, full_locales)
+    previous = read_previous(out_file) if use_cache else {}
+    changed = []
+    for member in members:
+        digest, method, crc, compressed = previous.get(member.name, (None, None, None, None))
+        if digest == member.digest and crc == member.crc:
+            member.method, member.compressed, member.reused = method, compressed, True
+        else:
+            changed.append(member)
+    # zlib releases the GIL while compressing.
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        list(executor.map(Member.compress, changed))
+
+    write_cache(out_file, write_archive(out_file, members))
+    return members
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Build the XPI from extension/.")
+    parser.add_argument("--source-dir", type=Path, default=SOURCE_DIR)
+    parser.add_argument("--out", type=Path, default=OUT_FILE)
+    parser.add_argument("--jobs", "-j", type=int, help="Members compressed at once")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Compress every member, reusing none"
+    )
+    parser.add_argument(
+        "--full-locales", action="store_true", help="Ship messages.json files as they are"
+    )
+    parser.add_argument("--quiet", "-q", action="store_true", help="Only print the totals")
+    return parser.parse_args(argv)
+
+
+def main(args):
+    start = time.perf_counter()
+    members = package(args.source_dir, args.out, args.jobs, not args.no_cache, args.full_locales)
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        for member in members:
+            status = "reused" if member.reused else "stored" if member.method == STORED else ""
+            print(
+                f"{member.size:>10} {len(member.compressed):>10} "
+                f"{len(member.compressed) / max(member.size, 1):6.1%}  {member.name} {status}"
+            )
+    size = sum(member.size for member in members)
+    compressed = sum(len(member.compressed) for member in members)
+    reused = sum(member.reused for member in members)
+    print(
+        f"{args.out}: {len(members)} members, {reused} reused, {size} -> {compressed} bytes, "
+        f"{args.out.stat().st_size} bytes on disk, {elapsed:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main(parse_args(sys.argv[1:]))
@@ -0,0 +1,61 @@
+#!python
+"""
+Project metadata shared by the tools: the manifest, the changelog and version.env.
+
+Each file is parsed once per process, so the steps `python tools ci` runs
+together read them once.
+"""
+
+import functools
+import json
+from pathlib import Path
+
+TOP = Path(__file__).parent.parent
+MANIFEST_FILE = TOP / "extension/manifest.json"
+CHANGELOG = TOP / "CHANGELOG.md"
+VERSION_ENV = TOP / "version.env"
+
+_version_env = {}
+
+
+@functools.cache
+def manifest():
+    with open(MANIFEST_FILE, "r") as f:
+        return json.load(f)
+
+
+def manifest_version():
+    return manifest()["version"]
+
+
+@functools.cache
+def changelog_sections():
+    """
+    CHANGELOG.md split before each "## " heading. The first item is the text
+    before the first heading, the next one the current version's notes.
+    """
+    sections = [[]]
+    with open(CHANGELOG, "r") as f:
+        for line in f:
+            if line[:3] == "## ":
+                sections.append([])
+            sections[-1].append(line)
+    return ["".join(lines) for lines in sections]
+
+
+def version_env():
+    """The variables in version.env, as written by write_version_env() or read from the file."""
+    if not _version_env:
+        with open(VERSION_ENV, "r") as f:
+            for line in f:
+                key, value = line.split("=", 1)
+                _version_env[key] = value.strip('"\n')
+    return _version_env
+
+
+def write_version_env(**variables):
+    with open(VERSION_ENV, "w") as f:
+        for key, value in variables.items():
+            f.write(f"{key}={value}\n")
+    _version_env.clear()
+    _version_env.update(variables)
@@ -0,0 +1,60 @@
+"""
+Tests for auto_i18n's block-wise retranslation, run with
+
+    python -m pytest tools
+"""
+
+from pathlib import Path
+
+import auto_i18n
+
+LOCALES_PATH = Path(__file__).parent.parent / "extension" / "_locales"
+SOURCE = "Para one.\n\nPara two\nline.\n\n```\ncode\n\nmore\n```\n\nPara four."
+
+
+class RecordingTranslate(auto_i18n.BackendTranslate):
+    """The stub backend, remembering which texts reached it."""
+
+    def __init__(self):
+        super().__init__(LOCALES_PATH, memory_size=0, blocks=True)
+        self.sent = []
+
+    def translate_hashed(self, source_messages, argos_locale, names=None):
+        self.sent.extend(source_messages.values())
+        return super().translate_hashed(source_messages, argos_locale, names)
+
+
+def test_fenced_block_with_blank_line_is_one_block():
+    assert auto_i18n.split_blocks(SOURCE)[::2] == [
+        "Para one.",
+        "Para two\nline.",
+        "```\ncode\n\nmore\n```",
+        "Para four.",
+    ]
+
+
+def test_changed_block_reuses_the_others():
+    translate = RecordingTranslate()
+    first, count, skip = translate.translate_messages({"k": {"message": SOURCE}}, {}, "de")
+    assert count == 1
+
+    # The translated fence no longer starts a line, so the translation doesn't
+    # split into the source's blocks. The recorded spans still find them.
+    translate.sent.clear()
+    edited = SOURCE.replace("Para four.", "Para 4.")
+    second, count, skip = translate.translate_messages({"k": {"message": edited}}, first, "de")
+    assert translate.sent == ["Para 4."]
+    assert second["k"]["message"] == (
+        "[de] Para one.\n\n[de] Para two\nline.\n\n[de] ```\ncode\n\nmore\n```\n\n[de] Para 4."
+    )
+
+
+def test_edited_translation_is_not_reused():
+    translate = RecordingTranslate()
+    first, count, skip = translate.translate_messages({"k": {"message": SOURCE}}, {}, "de")
+    first["k"] = dict(first["k"], message="Ein Absatz.")
+
+    translate.sent.clear()
+    edited = SOURCE.replace("Para four.", "Para 4.")
+    translate.translate_messages({"k": {"message": edited}}, first, "de")
+    assert sorted(translate.sent) == sorted(auto_i18n.split_blocks(edited)[::2])
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Span timings for the build tools.
+
+Spans are written as a Chrome trace, which loads in chrome://tracing or
+https://ui.perfetto.dev and is plain JSON for scripts. perf_counter() is
+system wide on Linux, so spans recorded in worker processes line up with
+the parent's.
+"""
+
+import json
+import os
+import statistics
+import time
+from contextlib import contextmanager
+
+
+class Timings:
+    def __init__(self):
+        self.spans = []
+
+    @contextmanager
+    def span(self, name: str, cat: str = "stage", **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter() - start, cat, **args)
+
+    def add(self, name: str, start: float, duration: float, cat: str = "stage", **args):
+        self.spans.append(
+            {
+                "name": name,
+                "cat": cat,
+                "start": start,
+                "dur": duration,
+                "pid": os.getpid(),
+                "args": args,
+            }
+        )
+
+    def extend(self, spans):
+        self.spans.extend(spans)
+
+    def totals(self, cat: str = "stage"):
+        """Return {name: {"count", "seconds"}} for the spans in cat."""
+        totals = {}
+        for span in self.spans:
+            if span["cat"] != cat:
+                continue
+            total = totals.setdefault(span["name"], {"count": 0, "seconds": 0.0})
+            total["count"] += 1
+            total["seconds"] += span["dur"]
+        return totals
+
+    def outliers(self, cat: str = "message", factor: float = 3.0, limit: int = 10):
+        """
+        Return the slowest spans in cat that took more than factor times the
+        median, slowest first.
+        """
+        spans = [span for span in self.spans if span["cat"] == cat]
+        if not spans:
+            return []
+        threshold = statistics.median(span["dur"] for span in spans) * factor
+        slow = sorted((s for s in spans if s["dur"] > threshold), key=lambda s: -s["dur"])
+        return slow[:limit]
+
+    def chrome_trace(self, **other_data):
+        origin = min((span["start"] for span in self.spans), default=0.0)
+        events = [
+            {
+                "name": span["name"],
+                "cat": span["cat"],
+                "ph": "X",
+                "ts": round((span["start"] - origin) * 1e6),
+                "dur": round(span["dur"] * 1e6),
+                "pid": span["pid"],
+                "tid": span["pid"],
+                "args": span["args"],
+            }
+            for span in self.spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": other_data}
+
+    def write(self, path, **other_data):
+        with open(path, "w") as fp:
+            json.dump(self.chrome_trace(**other_data), fp, indent=1, ensure_ascii=False)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""
+Local stand-in for a LibreTranslate server.
+
+Answers POST /translate like LibreTranslate does, tagging each text with the
+target code the way the stub backend does. Response latency and a failure rate
+can be set to tune and check the HTTP backend's batching, pooling and retries
+offline. GET /stats returns request and connection counts.
+
+    python tools/translate_server.py --port 5000 --latency 0.2
+    python tools/auto_i18n.py extension/_locales --backend libretranslate
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class TranslateHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so the client's connection pool can be observed in /stats.
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.stats["connections"] += 1
+
+    def send_json(self, status: int, data):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            with self.server.lock:
+                self.send_json(200, self.server.stats)
+        elif self.path == "/languages":
+            self.send_json(200, [{"code": "en", "name": "English", "targets": []}])
+        else:
+            self.send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if self.path != "/translate":
+            self.send_json(404, {"error": "Not found"})
+            return
+
+        with self.server.lock:
+            self.server.stats["requests"] += 1
+            request_no = self.server.stats["requests"]
+        if self.server.fail_every and request_no % self.server.fail_every == 0:
+            with self.server.lock:
+                self.server.stats["failed"] += 1
+            self.send_json(503, {"error": "Simulated failure"})
+            return
+
+        q = payload.get("q", "")
+        texts = q if isinstance(q, list) else [q]
+        time.sleep(self.server.latency)
+        translated = [f"[{payload.get('target')}] {text}" for text in texts]
+        with self.server.lock:
+            self.server.stats["texts"] += len(texts)
+        self.send_json(
+            200, {"translatedText": translated if isinstance(q, list) else translated[0]}
+        )
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class TranslateServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency: float = 0.0, fail_every: int = 0, verbose: bool = False):
+        super().__init__(address, TranslateHandler)
+        self.latency = latency
+        self.fail_every = fail_every
+        self.verbose = verbose
+        self.lock = threading.Lock()
+        self.stats = {"connections": 0, "requests": 0, "failed": 0, "texts": 0}
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def serve_in_thread(port: int = 0, **options):
+    """Start a server on localhost in a daemon thread, port 0 picks a free port."""
+    server = TranslateServer(("127.0.0.1", port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Stand-in LibreTranslate server.")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per request")
+    parser.add_argument(
+        "--fail-every", type=int, default=0, help="Answer every Nth request with a 503"
+    )
+    parser.add_argument("--verbose", "-v", action="store_true")
+    args = parser.parse_args(argv)
+
+    server = TranslateServer(
+        ("127.0.0.1", args.port),
+        latency=args.latency,
+        fail_every=args.fail_every,
+        verbose=args.verbose,
+    )
+    print(f"Serving on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+"""
+Machine translation backends shared by auto_i18n and detranslate.
+
+A Backend hands out Translation objects for a (source, target) language pair.
+Translations translate one string with translate() or a list of strings with
+translate_batch(), which is what the tools use so a backend can send as few
+requests or model calls as it likes.
+
+    backend = get_backend("libretranslate", url="http://localhost:5000")
+    translation = backend.get_translation("en", "de")
+    translation.translate_batch(["Hello", "World"])
+"""
+
+import json
+import time
+
+# WebExtension locale names that differ from the argos/LibreTranslate codes.
+ARGOS_CODES = {
+    "en-US": "en",
+    "pt_BR": "pt",
+    "zh_CN": "zh",
+    "zh_TW": "zt",
+}
+LIBRETRANSLATE_URL = "http://localhost:5000"
+# What mintrans' GoogleTranslator calls.
+GOOGLE_ENDPOINT = "https://translate.googleapis.com/translate_a/single"
+# Responses worth retrying: rate limited, or the server is overloaded/restarting.
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class Translation:
+    """A source->target language pair of a backend."""
+
+    def __init__(self, backend, source: str, target: str):
+        self.backend = backend
+        self.source = source
+        self.target = target
+
+    def translate(self, text: str) -> str:
+        return self.translate_batch([text])[0]
+
+    def translate_batch(self, texts: list) -> list:
+        raise NotImplementedError
+
+
+class Backend:
+    name = None
+    # The constructor options that change what the backend translates to.
+    options = {}
+
+    def language_code(self, locale: str) -> str:
+        """Map a WebExtension locale name to this backend's language code."""
+        return ARGOS_CODES.get(locale, locale)
+
+    def get_translation(self, source: str, target: str) -> Translation:
+        raise NotImplementedError
+
+    @classmethod
+    def version_key(cls, **options) -> str:
+        """
+        The model version of a backend created with these options, known without
+        creating it so translation memories can be checked first.
+        """
+        return cls.name
+
+    def model_version(self, source: str, target: str) -> str:
+        """Identifies the model, translation memories are keyed by it."""
+        return self.version_key(**self.options)
+
+    def close(self):
+        pass
+
+
+class StubTranslation(Translation):
+    """
+    Deterministic stand-in, tags text with the target code.
+    latency seconds are spent per translate_batch() call to mimic request cost.
+    """
+
+    def translate_batch(self, texts: list) -> list:
+        if self.backend.latency:
+            time.sleep(self.backend.latency)
+        return [f"[{self.target}] {text}" for text in texts]
+
+
+class StubBackend(Backend):
+    name = "stub"
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def get_translation(self, source: str, target: str) -> Translation:
+        return StubTranslation(self, source, target)
+
+
+class ArgosTranslation(Translation):
+    def __init__(self, backend, source: str, target: str):
+        super().__init__(backend, source, target)
+        from argostranslate.translate import get_translation_from_codes
+
+        self.underlying = get_translation_from_codes(source, target)
+
+    def translate_batch(self, texts: list) -> list:
+        return [self.underlying.translate(text) for text in texts]
+
+
+class ArgosBackend(Backend):
+    """Installed argos packages. auto_i18n has its own package management for these."""
+
+    name = "argos"
+
+    def get_translation(self, source: str, target: str) -> Translation:
+        return ArgosTranslation(self, source, target)
+
+
+class LibreTranslation(Translation):
+    def translate_batch(self, texts: list) -> list:
+        import asyncio
+
+        return asyncio.run(self.backend.translate_many(texts, self.source, self.target))
+
+
+class LibreTranslateBackend(Backend):
+    """
+    A LibreTranslate compatible HTTP service, such as a self-hosted server or
+    tools/translate_server.py.
+
+    Texts are posted in batches of batch_size with up to `concurrency` requests
+    in flight over a pooled keep-alive session. Connection errors and
+    RETRY_STATUS responses are retried `retries` times with exponential backoff.
+    """
+
+    name = "libretranslate"
+
+    def __init__(
+        self,
+        url: str = LIBRETRANSLATE_URL,
+        api_key: str = None,
+        concurrency: int = 4,
+        batch_size: int = 16,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 120,
+    ):
+        import requests
+
+        self.url = url.rstrip("/")
+        self.options = {"url": self.url}
+        self.api_key = api_key
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get_translation(self, source: str, target: str) -> Translation:
+        return LibreTranslation(self, source, target)
+
+    @classmethod
+    def version_key(cls, url: str = LIBRETRANSLATE_URL, **options) -> str:
+        return f"{cls.name} {url.rstrip('/')}"
+
+    def post(self, payload: dict):
+        import requests
+
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.post(
+                    f"{self.url}/translate", json=payload, timeout=self.timeout
+                )
+                if response.status_code not in RETRY_STATUS:
+                    response.raise_for_status()
+                    return response.json()["translatedText"]
+                error = requests.HTTPError(f"{response.status_code} from {self.url}")
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            if attempt < self.retries:
+                time.sleep(self.backoff * 2**attempt)
+        raise error
+
+    async def translate_many(self, texts: list, source: str, target: str) -> list:
+        import asyncio
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def post_batch(batch):
+            payload = {"q": batch, "source": source, "target": target, "format": "text"}
+            if self.api_key:
+                payload["api_key"] = self.api_key
+            async with semaphore:
+                # requests is blocking, the session's connection pool is shared by the threads.
+                return await asyncio.to_thread(self.post, payload)
+
+        batches = [texts[i : i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        results = await asyncio.gather(*(post_batch(batch) for batch in batches))
+        return [text for batch in results for text in batch]
+
+    def close(self):
+        self.session.close()
+
+
+class GoogleTranslation(Translation):
+    def translate_batch(self, texts: list) -> list:
+        """
+        Send all texts as one newline separated request, falling back to one
+        request per text if the lines don't come back one to one.
+        """
+        result = self.backend.translate_lines("\n".join(texts), self.source, self.target)
+        if len(result) == len(texts):
+            return result
+        return [
+            "\n".join(self.backend.translate_lines(text, self.source, self.target))
+            for text in texts
+        ]
+
+
+class GoogleBackend(Backend):
+    """Google Translate through mintrans."""
+
+    name = "google"
+
+    def __init__(self, **options):
+        from mintrans import GoogleTranslator
+
+        self.options = options
+        self.translator = GoogleTranslator(**options)
+
+    @classmethod
+    def version_key(cls, **options) -> str:
+        """The endpoint, the mintrans version and GoogleTranslator's options."""
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            mintrans_version = version("mintrans")
+        except PackageNotFoundError:
+            mintrans_version = None
+        return (
+            f"{cls.name} {GOOGLE_ENDPOINT} mintrans {mintrans_version} "
+            f"{json.dumps(options, sort_keys=True)}"
+        )
+
+    def language_code(self, locale: str) -> str:
+        return locale.replace("_", "-")
+
+    def get_translation(self, source: str, target: str) -> Translation:
+        return GoogleTranslation(self, source, target)
+
+    def translate_lines(self, text: str, source: str, target: str) -> list:
+        result = self.translator.translate(text, source, target)
+        translated = "".join(s.get("trans", "") for s in result["sentences"])
+        return [line.strip() for line in translated.split("\n")]
+
+
+BACKENDS = {
+    "stub": StubBackend,
+    "argos": ArgosBackend,
+    "libretranslate": LibreTranslateBackend,
+    "google": GoogleBackend,
+}
+
+
+def get_backend(name: str, **options) -> Backend:
+    return BACKENDS[name](**options)
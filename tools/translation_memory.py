@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+On-disk translation memory for auto_i18n.
+
+Translations are keyed by (source hash, argos locale, model version), so a string
+that moves to another key, appears under two keys, or belongs to a locale file
+that was regenerated from scratch is only sent through the model once.
+"""
+
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+MEMORY_FILE = Path(__file__).parent.parent / ".cache" / "i18n" / "translation-memory.sqlite3"
+MAX_ENTRIES = 50000
+
+
+class TranslationMemory:
+    def __init__(self, path: Path = MEMORY_FILE, max_entries: int = MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Several --jobs workers may share the file, wait for their locks.
+        self.db = sqlite3.connect(path, timeout=60)
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS memory (
+                source_hash TEXT NOT NULL,
+                locale TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                message TEXT NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (source_hash, locale, model_version)
+            )"""
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS memory_last_used ON memory (last_used)")
+        self.db.commit()
+
+    def get_many(self, source_hashes, locale: str, model_version: str):
+        """Return {source_hash: message} for the hashes found, and mark them used."""
+        source_hashes = list(dict.fromkeys(source_hashes))
+        found = {}
+        for start in range(0, len(source_hashes), 500):
+            chunk = source_hashes[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.db.execute(
+                f"""SELECT source_hash, message FROM memory
+                WHERE locale = ? AND model_version = ? AND source_hash IN ({placeholders})""",
+                [locale, model_version, *chunk],
+            )
+            found.update(rows)
+        if found:
+            now = time.time()
+            self.db.executemany(
+                "UPDATE memory SET last_used = ? WHERE source_hash = ? AND locale = ? AND model_version = ?",
+                [(now, h, locale, model_version) for h in found],
+            )
+            self.db.commit()
+        self.hits += len(found)
+        self.misses += len(source_hashes) - len(found)
+        return found
+
+    def put_many(self, messages, locale: str, model_version: str):
+        """Store {source_hash: message} and evict the oldest entries past max_entries."""
+        now = time.time()
+        self.db.executemany(
+            "INSERT OR REPLACE INTO memory VALUES (?, ?, ?, ?, ?)",
+            [(h, locale, model_version, message, now) for h, message in messages.items()],
+        )
+        self.evict()
+        self.db.commit()
+
+    def evict(self):
+        (size,) = self.db.execute("SELECT COUNT(*) FROM memory").fetchone()
+        if size > self.max_entries:
+            self.db.execute(
+                """DELETE FROM memory WHERE rowid IN (
+                    SELECT rowid FROM memory ORDER BY last_used LIMIT ?
+                )""",
+                (size - self.max_entries,),
+            )
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM memory").fetchone()[0]
+
+    def stats(self):
+        return f"{self.hits} hits, {self.misses} misses, {len(self)} entries"
+
+    def clear(self):
+        self.db.execute("DELETE FROM memory")
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+
+def main(args):
+    memory = TranslationMemory(Path(args[0]) if args else MEMORY_FILE)
+    print(f"{memory.path}: {len(memory)} entries")
+    for locale, model_version, count in memory.db.execute(
+        "SELECT locale, model_version, COUNT(*) FROM memory GROUP BY locale, model_version"
+    ):
+        print(f"  {locale} ({model_version}): {count}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,50 +1,155 @@
 #!python
-"""Update updates.json for auto updates."""
+"""
+Update updates.json for auto updates.
 
+Every file in web-ext-artifacts/ is hashed in parallel, the XPI and the
+mdhr-source.tar.gz from gen-src.sh included, and the hashes are written to
+release-manifest.json next to them. The previous updates.json is fetched with
+If-None-Match against a local copy in .cache/updates, with a timeout and
+retries. --updates-url (or $UPDATES_URL) points it at another server.
+"""
+
+import argparse
 import hashlib
 import json
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import requests
+from project import TOP, VERSION_ENV, version_env
 
-TOP = Path(__file__).parent.parent
 UPDATES_FILE = TOP / "updates.json"
-VERSION_ENV = TOP / "version.env"
-RELEASE_FILE = TOP / "web-ext-artifacts/markdown-here-revival.xpi"
+ARTIFACTS_DIR = TOP / "web-ext-artifacts"
+RELEASE_FILE = "markdown-here-revival.xpi"
+RELEASE_MANIFEST = "release-manifest.json"
+CACHE_FILE = TOP / ".cache" / "updates" / "updates.json"
 ADDON_ID = "markdown-here-revival@xul.calypsoblue.org"
 UPDATES_URL = "https://gitlab.com/jfx2006/markdown-here-revival/-/releases/permalink/latest/downloads/updates.json"
 XPI_URL = "https://gitlab.com/jfx2006/markdown-here-revival/-/releases/v{version}/downloads/markdown_here_revival-{version}.xpi"
+RETRY_STATUS = {429, 500, 502, 503, 504}
 
 
 def hash_file(path):
+    """SHA-256 of a file, hashed straight from a memory map of it."""
     h = hashlib.sha256()
     with open(path, "rb") as fh:
-        while True:
-            data = fh.read(8192)
-            if not len(data):
-                break
-            h.update(data)
-
+        if os.fstat(fh.fileno()).st_size:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                h.update(data)
     return h.hexdigest()
 
 
-def main():
-    sha256sum = hash_file(RELEASE_FILE)
+def hash_artifacts(artifacts_dir, jobs=None):
+    """{file name: {"sha256", "size"}} for the files in artifacts_dir, hashed in threads."""
+    paths = sorted(
+        path for path in artifacts_dir.iterdir() if path.is_file() and path.name != RELEASE_MANIFEST
+    )
+    # hashlib releases the GIL while hashing large buffers.
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        digests = executor.map(hash_file, paths)
+        return {
+            path.name: {"sha256": digest, "size": path.stat().st_size}
+            for path, digest in zip(paths, digests)
+        }
+
 
-    version = None
-    with open(VERSION_ENV, "r") as f:
-        for line in f:
-            key, value = line.split("=", 1)
-            if key == "PACKAGE_VERSION":
-                version = value
-                break
-    if version is None:
+def get_version():
+    if (version := version_env().get("PACKAGE_VERSION")) is None:
         raise Exception(f"PACKAGE_VERSION not found in {VERSION_ENV}.")
-    version = version.strip('"\n')
+    return version
+
+
+def read_cache(cache_file, url):
+    try:
+        with open(cache_file) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cached if cached.get("url") == url else None
+
+
+def write_cache(cache_file, url, etag, updates):
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(".tmp")
+    with open(tmp_file, "w") as f:
+        json.dump({"url": url, "etag": etag, "updates": updates}, f)
+    os.replace(tmp_file, cache_file)
+
+
+def fetch_updates(url, cache_file=CACHE_FILE, timeout=30, retries=3, backoff=0.5):
+    """
+    The previous updates.json. With a cache_file, a 304 Not Modified answer to
+    If-None-Match returns the cached copy. Connection errors, timeouts and
+    RETRY_STATUS responses are retried with exponential backoff.
+    """
+    import requests
+
+    cached = read_cache(cache_file, url) if cache_file else None
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    with requests.Session() as session:
+        for attempt in range(retries + 1):
+            try:
+                response = session.get(url, headers=headers, timeout=timeout)
+                if response.status_code not in RETRY_STATUS:
+                    break
+                error = requests.HTTPError(f"{response.status_code} from {url}")
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            if attempt == retries:
+                raise error
+            time.sleep(backoff * 2**attempt)
+
+    if response.status_code == 304 and cached:
+        print(f"{url} not modified, using {cache_file}.")
+        return cached["updates"]
+    response.raise_for_status()
+    updates = response.json()
+    if cache_file:
+        write_cache(cache_file, url, response.headers.get("ETag"), updates)
+    return updates
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Update updates.json for auto updates.")
+    parser.add_argument("--artifacts-dir", type=Path, default=ARTIFACTS_DIR)
+    parser.add_argument(
+        "--updates-url",
+        default=os.environ.get("UPDATES_URL", UPDATES_URL),
+        help="Where to get the previous updates.json (default $UPDATES_URL or the latest release)",
+    )
+    parser.add_argument("--jobs", "-j", type=int, help="Files hashed at once")
+    parser.add_argument("--timeout", type=float, default=30, help="Seconds per request (default 30)")
+    parser.add_argument("--retries", type=int, default=3, help="Retries per request (default 3)")
+    parser.add_argument("--no-cache", action="store_true", help="Don't use the cached updates.json")
+    return parser.parse_args(argv)
+
+
+def main(args):
+    artifacts = hash_artifacts(args.artifacts_dir, args.jobs)
+    if RELEASE_FILE not in artifacts:
+        raise Exception(f"{RELEASE_FILE} not found in {args.artifacts_dir}.")
+    version = get_version()
+
+    release_manifest = args.artifacts_dir / RELEASE_MANIFEST
+    with open(release_manifest, "w") as f:
+        json.dump({"version": version, "artifacts": artifacts}, f, indent=2, sort_keys=True)
+    for name, artifact in artifacts.items():
+        print(f"{artifact['sha256']}  {artifact['size']:>10}  {name}")
 
-    req = requests.get(UPDATES_URL)
-    updates = req.json()
+    updates = fetch_updates(
+        args.updates_url,
+        cache_file=None if args.no_cache else CACHE_FILE,
+        timeout=args.timeout,
+        retries=args.retries,
+    )
 
+    sha256sum = artifacts[RELEASE_FILE]["sha256"]
     update = {"version": version, "update_link": XPI_URL.format(version=version), "update_hash": f"sha256:{sha256sum}"}
     updates["addons"][ADDON_ID]["updates"].append(update)
 
@@ -55,4 +160,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(parse_args(sys.argv[1:]))
@@ -1,22 +1,12 @@
 #!python
-"""Write the version info to an environment file for Gitlab CI."""
+"""Print the extension's version from manifest.json."""
 
-import json
-import os
-import sys
-from pathlib import Path
+from project import manifest_version
 
-TOP = Path(__file__).parent.parent
-MANIFEST_FILE = TOP / "extension/manifest.json"
-PACKAGES_FILE = TOP / "packages.json"
 
 def main():
-    with open(MANIFEST_FILE, "r") as f:
-        manifest = json.load(f)
-        version = manifest["version"]
+    print(manifest_version())
 
-    print(version)
 
 if __name__ == "__main__":
     main()
-
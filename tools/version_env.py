@@ -1,23 +1,16 @@
 #!python
 """Write the version info to an environment file for Gitlab CI."""
 
-import json
 import os
 import sys
-from pathlib import Path
 
-TOP = Path(__file__).parent.parent
-MANIFEST_FILE = TOP / "extension/manifest.json"
-VERSION_ENV = TOP / "version.env"
+from project import VERSION_ENV, manifest_version, write_version_env
 
 
 def main():
     if not (ref := os.environ.get("CI_COMMIT_SHA")):
         return
-    with open(MANIFEST_FILE, "r") as f:
-        manifest = json.load(f)
-
-    version = manifest["version"]
+    version = manifest_version()
     if CI_TAG := os.environ.get("CI_COMMIT_TAG"):
         if not CI_TAG.startswith(f"v{version}"):
             print(f"Tag and manifest version mismatch! {version} != {CI_TAG}")
@@ -26,9 +19,7 @@ def main():
         version = f"{version}+{ref[:12]}"
 
     release_name = version.replace("3.999.", "4.0 beta ")
-    with open(VERSION_ENV, "w") as f:
-        f.write(f"PACKAGE_VERSION={version}\n")
-        f.write(f"RELEASE_NAME={release_name}\n")
+    write_version_env(PACKAGE_VERSION=version, RELEASE_NAME=release_name)
 
     print(f"Version {version} written to {VERSION_ENV}.")
 
@@ -15,15 +15,11 @@ emoji_codes: $(EXTENSION)/data/emoji_codes.json
 $(EXTENSION)/data/emoji_codes.json: node_modules/emojibase-data/en/shortcodes/github.json
 	python ./tools/emoji-grab.py $< $@
 
-highlightjs: $(EXTENSION)/highlightjs/highlightjs.esm.js
+highlightjs: $(EXTENSION)/highlightjs/core.esm.js
 
-$(EXTENSION)/highlightjs/highlightjs.esm.js: node_modules/highlight.js/es/index.js
-	./node_modules/.bin/rollup --format es \
-	--file "$(EXTENSION)/highlightjs/highlightjs.esm.js" \
-	-p @rollup/plugin-node-resolve \
-	-p @rollup/plugin-commonjs \
-	$<
-	python ./tools/highlightjs_styles.py node_modules/highlight.js/styles $(EXTENSION)/highlightjs/styles
+$(EXTENSION)/highlightjs/core.esm.js: node_modules/highlight.js/es/core.js
+	python ./tools/highlightjs_split.py node_modules/highlight.js $(EXTENSION)/highlightjs
+	python ./tools/highlightjs_styles.py --minify node_modules/highlight.js/styles $(EXTENSION)/highlightjs/styles
 
 marked: $(EXTENSION)/vendor/marked.esm.js
 
@@ -65,8 +61,9 @@ clean:
 	rm -f $(EXTENSION)/vendor/degausser.esm.js
 	rm -f $(EXTENSION)/vendor/dentity.esm.js
 	rm -f $(EXTENSION)/data/emoji_codes.json
-	rm -f $(EXTENSION)/highlightjs/highlightjs.esm.js
-	rm -rf $(EXTENSION)/highlightjs/styles
+	rm -f $(EXTENSION)/data/emoji_codes.json $(EXTENSION)/data/emoji_prefix.json $(EXTENSION)/data/emoji_reverse.json
+	rm -f $(EXTENSION)/highlightjs/core.esm.js
+	rm -rf $(EXTENSION)/highlightjs/styles $(EXTENSION)/highlightjs/languages $(EXTENSION)/highlightjs/languages.json
 	rm -f $(EXTENSION)/vendor/marked.esm.js
 	rm -f $(EXTENSION)/vendor/marked-emoji.esm.js
 	rm -f $(EXTENSION)/vendor/marked-extended-tables.esm.js